@@ -860,3 +860,464 @@ def STEP_slow_ahp_time(t, v, thresh=None, time_scale=5, start=1):
     d = np.array(d)
     return d
 
+
+
+#####################################
+# batched feature extraction
+#####################################
+
+
+def find_crossing_batch(v, thresh):
+    """Batched version of :py:meth:`find_crossing` for many voltage traces.
+
+    Args:
+        v (numpy.ndarray): Voltage traces of shape ``(n_traces, n_timepoints)``.
+        thresh (float | numpy.ndarray): Threshold voltage (mV). Either one threshold for all traces, or one per trace.
+
+    Returns:
+        tuple: Trace indices and time indices of the upcrossings, followed by trace indices and time indices of the downcrossings.
+        Crossings are sorted by trace, then by time.
+        As in :py:meth:`find_crossing`, downcrossings before the first upcrossing of a trace are discarded.
+    """
+    v = np.atleast_2d(v)
+    thresh = np.asarray(thresh, dtype=float)
+    if thresh.ndim == 1:
+        thresh = thresh[:, np.newaxis]
+    above = v > thresh
+    up_rows, up = np.nonzero(~above[:, :-1] & above[:, 1:])
+    down_rows, down = np.nonzero(above[:, :-1] & ~above[:, 1:])
+    up += 1
+    down += 1
+    first_up = np.full(v.shape[0], v.shape[1])
+    rows, first = np.unique(up_rows, return_index=True)
+    first_up[rows] = up[first]
+    keep = down > first_up[down_rows]
+    return up_rows, up, down_rows[keep], down[keep]
+
+
+class RaggedFeature(object):
+    """A feature with a variable number of values per voltage trace, e.g. one value per action potential.
+
+    Attributes:
+        values (numpy.ndarray): The values of all traces, sorted by trace.
+        rows (numpy.ndarray): The trace index of each value.
+        n_traces (int): The number of traces.
+        invalid (numpy.ndarray): Boolean mask of the traces for which the feature is not defined,
+            i.e. for which the corresponding function in :py:mod:`~biophysics_fitting.ephys` raises an error.
+    """
+
+    def __init__(self, values, rows, n_traces, invalid=None):
+        self.values = np.asarray(values, dtype=float)
+        self.rows = np.asarray(rows)
+        self.n_traces = n_traces
+        self.invalid = np.zeros(n_traces, dtype=bool) if invalid is None else invalid
+
+    def count(self):
+        """Number of values per trace."""
+        return np.bincount(self.rows, minlength=self.n_traces)
+
+    def mean_abs_deviation(self, mean):
+        """Mean absolute deviation of the values of each trace from :paramref:`mean`.
+
+        Args:
+            mean (float | numpy.ndarray): The reference value, either one for all traces, or one per trace.
+
+        Returns:
+            numpy.ndarray: The mean absolute deviation per trace. NaN for traces without values, and for invalid traces.
+        """
+        if np.ndim(mean) == 1:
+            mean = mean[self.rows]
+        sums = np.bincount(self.rows, weights=np.abs(self.values - mean), minlength=self.n_traces)
+        count = self.count()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out = sums / count
+        out[count == 0] = np.nan
+        out[self.invalid] = np.nan
+        return out
+
+    def to_object_array(self):
+        """Split the values per trace.
+
+        Returns:
+            numpy.ndarray: Object array with an array of values for each trace, or NaN for invalid traces.
+        """
+        out = np.empty(self.n_traces, dtype=object)
+        out[:] = np.split(self.values, np.cumsum(self.count())[:-1])
+        out[self.invalid] = np.nan
+        return out
+
+
+class _Crossings(object):
+    """Threshold crossings of a batch of voltage traces, see :py:meth:`find_crossing_batch`."""
+
+    def __init__(self, n_traces, up_rows, up, down_rows, down):
+        self.n_traces = n_traces
+        self.up_rows, self.up = up_rows, up
+        self.down_rows, self.down = down_rows, down
+        self.n_up = np.bincount(up_rows, minlength=n_traces)
+        self.n_down = np.bincount(down_rows, minlength=n_traces)
+        self.up_offsets = np.cumsum(self.n_up) - self.n_up
+        self.up_rank = np.arange(len(up)) - self.up_offsets[up_rows]
+        self.down_rank = np.arange(len(down)) - (np.cumsum(self.n_down) - self.n_down)[down_rows]
+        # the n-th upcrossing is paired with the n-th downcrossing of the same trace, as in zip(*find_crossing(v, thresh))
+        self.n_pairs = np.minimum(self.n_up, self.n_down)
+        self.pair_offsets = np.cumsum(self.n_pairs) - self.n_pairs
+        select_up = self.up_rank < self.n_pairs[up_rows]
+        select_down = self.down_rank < self.n_pairs[down_rows]
+        self.pair_rows = up_rows[select_up]
+        self.pair_up = up[select_up]
+        self.pair_down = down[select_down]
+
+    def nth_up(self, n):
+        """Time index of the n-th upcrossing of each trace, or -1 if it does not exist. Negative n count from the last upcrossing."""
+        out = np.full(self.n_traces, -1)
+        if n >= 0:
+            valid = self.n_up > n
+            out[valid] = self.up[self.up_offsets[valid] + n]
+        else:
+            valid = self.n_up >= -n
+            out[valid] = self.up[self.up_offsets[valid] + self.n_up[valid] + n]
+        return out
+
+    def first_up_after(self, t, t0):
+        """Index of the first upcrossing at or after :paramref:`t0` within the upcrossings of each trace, or -1."""
+        out = np.full(self.n_traces, -1)
+        select = t[self.up] >= t0
+        rows, first = np.unique(self.up_rows[select], return_index=True)
+        out[rows] = self.up_rank[select][first]
+        return out
+
+    def consecutive_up(self, start=0):
+        """Pairs of consecutive upcrossings, starting with the upcrossing with index :paramref:`start`.
+
+        Returns:
+            tuple: Trace indices, time indices of the first upcrossings and of the second upcrossings.
+        """
+        select = (self.up_rank >= start) & (self.up_rank < self.n_up[self.up_rows] - 1)
+        i = np.flatnonzero(select)
+        return self.up_rows[i], self.up[i], self.up[i + 1]
+
+
+def _gather_segments(v, rows, begin, end):
+    """Gather the segments ``v[rows[i], begin[i]:end[i]]`` into one flat array.
+
+    All segments must be non-empty.
+
+    Returns:
+        tuple: The flat array of values, the offset of each segment within it, and the segment index of each value.
+    """
+    end = np.minimum(end, v.shape[1])
+    lengths = end - begin
+    offsets = np.cumsum(lengths) - lengths
+    idx = np.repeat(rows * v.shape[1] + begin - offsets, lengths) + np.arange(lengths.sum())
+    segment = np.repeat(np.arange(len(lengths)), lengths)
+    return v.ravel()[idx], offsets, segment
+
+
+def _segment_min(v, rows, begin, end):
+    if len(rows) == 0:
+        return np.zeros(0)
+    values, offsets, _ = _gather_segments(v, rows, begin, end)
+    return np.minimum.reduceat(values, offsets)
+
+
+def _segment_max(v, rows, begin, end):
+    if len(rows) == 0:
+        return np.zeros(0)
+    values, offsets, _ = _gather_segments(v, rows, begin, end)
+    return np.maximum.reduceat(values, offsets)
+
+
+def _segment_argmin(v, rows, begin, end):
+    """First index of the minimum within each segment, relative to the start of the segment."""
+    if len(rows) == 0:
+        return np.zeros(0, dtype=int)
+    values, offsets, segment = _gather_segments(v, rows, begin, end)
+    hits = np.flatnonzero(values == np.minimum.reduceat(values, offsets)[segment])
+    _, first = np.unique(segment[hits], return_index=True)
+    return hits[first] - offsets
+
+
+class VoltageTraceBatch(object):
+    """Many voltage traces on a shared time axis, for batched feature extraction.
+
+    The methods of this class are batched versions of the functions of :py:mod:`~biophysics_fitting.ephys`.
+    Instead of one value per trace, they return an array with one value per trace, 
+    or a :py:class:`RaggedFeature` for features with one value per action potential.
+    Where the single-trace function raises an error, the batched version returns NaN.
+    Threshold crossings are computed only once per threshold.
+
+    Voltage traces must not contain NaN.
+
+    Example:
+
+        >>> traces = VoltageTraceBatch(t, v)  # v.shape == (n_traces, len(t))
+        >>> traces.spike_count(-30)
+        array([1, 3, 0, ...])
+        >>> traces.AP_height(-30).mean_abs_deviation(25.0)
+        array([2.1, 4.3, nan, ...])
+
+    Attributes:
+        t (numpy.ndarray): Time array (ms), shared by all traces.
+        v (numpy.ndarray): Voltage traces (mV) of shape ``(n_traces, len(t))``.
+        n_traces (int): Number of traces.
+    """
+
+    def __init__(self, t, v):
+        self.t = np.asarray(t, dtype=float)
+        self.v = np.atleast_2d(np.asarray(v, dtype=float))
+        assert self.v.shape[1] == len(self.t), "Voltage traces must be of shape (n_traces, len(t))"
+        self.n_traces = self.v.shape[0]
+        self._crossings = {}
+
+    def crossings(self, thresh):
+        """Threshold crossings of all traces.
+
+        Args:
+            thresh (float | numpy.ndarray): Threshold voltage (mV). Either one threshold for all traces, or one per trace.
+
+        Returns:
+            _Crossings: The threshold crossings.
+        """
+        if np.ndim(thresh) == 0 and float(thresh) in self._crossings:
+            return self._crossings[float(thresh)]
+        crossings = _Crossings(self.n_traces, *find_crossing_batch(self.v, thresh))
+        if np.ndim(thresh) == 0:
+            self._crossings[float(thresh)] = crossings
+        return crossings
+
+    def _t_at(self, idx):
+        """Time at the given time indices, NaN where the index is -1."""
+        return np.where(idx >= 0, self.t[idx], np.nan)
+
+    def voltage_base(self, stim_delay):
+        """See :py:meth:`~biophysics_fitting.ephys.voltage_base`."""
+        ta = np.nonzero(self.t >= 0.5 * stim_delay)[0]
+        ts = np.nonzero(self.t >= 0.75 * stim_delay)[0]
+        if len(ta) == 0 or len(ts) == 0:
+            return self.v[:, 0].copy()
+        return self.v[:, ta[0]:ts[0] + 1].mean(axis=1)
+
+    def spike_count(self, thresh):
+        """See :py:meth:`~biophysics_fitting.ephys.spike_count`."""
+        return self.crossings(thresh).n_up
+
+    def AP_height(self, thresh):
+        """See :py:meth:`~biophysics_fitting.ephys.AP_height`."""
+        c = self.crossings(thresh)
+        return RaggedFeature(
+            _segment_max(self.v, c.pair_rows, c.pair_up, c.pair_down),
+            c.pair_rows, self.n_traces)
+
+    def AP_width(self, thresh):
+        """See :py:meth:`~biophysics_fitting.ephys.AP_width`."""
+        c = self.crossings(thresh)
+        return RaggedFeature(self.t[c.pair_down] - self.t[c.pair_up], c.pair_rows, self.n_traces)
+
+    def AHP_depth_abs(self, thresh):
+        """See :py:meth:`~biophysics_fitting.ephys.AHP_depth_abs`."""
+        c = self.crossings(thresh)
+        # the single-trace version fails if the last AP does not cross the threshold downwards again
+        invalid = c.n_up != c.n_down
+        select_down = ~invalid[c.down_rows] & (c.down_rank < c.n_down[c.down_rows] - 1)
+        select_up = ~invalid[c.up_rows] & (c.up_rank >= 1)
+        rows = c.down_rows[select_down]
+        return RaggedFeature(
+            _segment_min(self.v, rows, c.down[select_down], c.up[select_up]),
+            rows, self.n_traces, invalid=invalid)
+
+    def trace_check_err(self, stim_onset=None, stim_duration=None, punish=250):
+        """See :py:meth:`~biophysics_fitting.ephys.trace_check_err`."""
+        select = (self.t >= stim_onset - 100) & (self.t <= stim_onset + stim_duration / 2.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            err = punish - np.var(self.v[:, select], axis=1) * 1e-1
+        return np.where(err > 75, err, 75)
+
+    def trace_check(
+        self,
+        stim_onset=None,
+        stim_duration=None,
+        minspikenum=None,
+        soma_threshold=None,
+        returning_to_rest=2,
+        max_prestim_dendrite_depo=-50,
+        vmax=None,
+        name=""):
+        """See :py:meth:`~biophysics_fitting.ephys.trace_check`.
+
+        Args:
+            vmax (numpy.ndarray, optional): The voltage maximum over all dendrites of each trace, of shape ``(n_traces, len(t))``.
+
+        Returns:
+            dict: Dictionary containing an array with the results of each check.
+        """
+        c = self.crossings(soma_threshold)
+        out = {}
+        out[name + ".check_minspikenum"] = c.n_up >= minspikenum
+        b = self.voltage_base(stim_onset)
+        out[name + ".check_returning_to_rest"] = self.v[:, -1] < b + returning_to_rest
+        no_spikes = c.n_up == 0
+        out[name + ".check_no_spike_before_stimulus"] = no_spikes | (self._t_at(c.nth_up(0)) >= stim_onset)
+        deadline = stim_duration * 1.05 + stim_onset
+        out[name + ".check_last_spike_before_deadline"] = no_spikes | (deadline >= self._t_at(c.nth_up(-1)))
+        if vmax is None:
+            out[name + ".check_max_prestim_dendrite_depo"] = np.full(self.n_traces, np.nan)
+        else:
+            vmax = np.atleast_2d(vmax)
+            out[name + ".check_max_prestim_dendrite_depo"] = \
+                vmax[:, self.t < stim_onset].max(axis=1) <= max_prestim_dendrite_depo
+        return out
+
+    def BAC_ISI(self, thresh=None):
+        """See :py:meth:`~biophysics_fitting.ephys.BAC_ISI`."""
+        c = self.crossings(thresh)
+        t0, t1, t2 = [self._t_at(c.nth_up(n)) for n in range(3)]
+        ISI_1 = t1 - t0
+        ISI_2 = np.where(c.n_up == 3, t2 - t1, ISI_1)
+        return 0.5 * (ISI_1 + ISI_2)
+
+    def BAC_ISI_check_repolarization(self, stim_end=None, repolarization=None):
+        """See :py:meth:`~biophysics_fitting.ephys.BAC_ISI_check_repolarization`."""
+        i = np.nonzero(self.t >= stim_end)[0]
+        if len(i) == 0:
+            return np.full(self.n_traces, np.nan)
+        return self.v[:, i[0]] < repolarization
+
+    def _AP_height_of_first_AP_after(self, thresh, t0):
+        """Height of the first AP that crosses :paramref:`thresh` at or after :paramref:`t0`, or NaN."""
+        c = self.crossings(thresh)
+        heights = self.AP_height(thresh).values
+        i = c.first_up_after(self.t, t0)
+        valid = (i >= 0) & (i < c.n_pairs)
+        out = np.full(self.n_traces, np.nan)
+        out[valid] = heights[c.pair_offsets[valid] + i[valid]]
+        return out
+
+    def BAC_caSpike_height(self, ca_thresh=-55, tstim=295):
+        """See :py:meth:`~biophysics_fitting.ephys.BAC_caSpike_height`. This batch contains the dendritic voltage traces."""
+        return self._AP_height_of_first_AP_after(ca_thresh, tstim)
+
+    def BAC_caSpike_width(self, thresh=None):
+        """See :py:meth:`~biophysics_fitting.ephys.BAC_caSpike_width`. This batch contains the dendritic voltage traces."""
+        c = self.crossings(thresh)
+        out = np.full(self.n_traces, np.nan)
+        valid = c.n_pairs > 0
+        first = c.pair_offsets[valid]
+        out[valid] = self.t[c.pair_down[first]] - self.t[c.pair_up[first]]
+        return out
+
+    def BAC_caSpike_height_check_Ca_spikes_after_Na_spike(self, v_dend, n=2, thresh=None):
+        """See :py:meth:`~biophysics_fitting.ephys.BAC_caSpike_height_check_Ca_spikes_after_Na_spike`.
+
+        Args:
+            v_dend (:py:class:`VoltageTraceBatch`): The dendritic voltage traces. This batch contains the somatic voltage traces.
+        """
+        t_max_Ca = self.t[np.argmax(v_dend.v, axis=1)]
+        t_nth_spike = self._t_at(self.crossings(thresh).nth_up(n - 1))
+        return np.where(np.isnan(t_nth_spike), np.nan, t_max_Ca >= t_nth_spike)
+
+    def BPAPatt(self, thresh="+2mV", stim_onset=None):
+        """See :py:meth:`~biophysics_fitting.ephys.BPAPatt`."""
+        b2 = self.voltage_base(stim_onset)
+        if thresh == "+2mV":
+            thresh = b2 + 2
+        return self._AP_height_of_first_AP_after(thresh, stim_onset) - b2
+
+    def BPAPatt_check_relative_height(self, v_dend, bAP_thresh=None, stim_onset=None):
+        """See :py:meth:`~biophysics_fitting.ephys.BPAPatt_check_relative_height`.
+
+        Args:
+            v_dend (:py:class:`VoltageTraceBatch`): The dendritic voltage traces. This batch contains the somatic voltage traces.
+        """
+        att_soma = self.BPAPatt(bAP_thresh, stim_onset)
+        att_dend = v_dend.BPAPatt(bAP_thresh, stim_onset)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            relative_height = att_soma / att_dend > 1
+        return np.where(np.isnan(att_soma) | np.isnan(att_dend), np.nan, relative_height)
+
+    def STEP_mean_frequency(self, stim_duration=2000, thresh=None):
+        """See :py:meth:`~biophysics_fitting.ephys.STEP_mean_frequency`."""
+        return 1000 * self.spike_count(thresh) / (stim_duration)
+
+    def _STEP_ISIs(self, stim_end, thresh):
+        """ISIs as used in :py:meth:`~biophysics_fitting.ephys.STEP_adaptation_index` and :py:meth:`~biophysics_fitting.ephys.STEP_coef_var`.
+
+        The first spike is ignored, and the time between the last spike and the end of the stimulus is added as an ISI
+        if it is longer than the last ISI. Traces with less than 3 spikes are invalid.
+
+        Returns:
+            RaggedFeature: The ISIs of each trace.
+        """
+        c = self.crossings(thresh)
+        rows, t1, t2 = c.consecutive_up(start=1)
+        isi = self.t[t2] - self.t[t1]
+        invalid = c.n_up < 3
+        t_last = self._t_at(c.nth_up(-1))
+        vt_tail = stim_end - t_last
+        last_isi = np.full(self.n_traces, np.nan)
+        last_isi[rows] = isi  # rows are sorted, so the last ISI of each trace is assigned last
+        append = ~invalid & (vt_tail > 0) & (vt_tail > last_isi)
+        tail_rows = np.flatnonzero(append)
+        rows = np.concatenate([rows, tail_rows])
+        order = np.argsort(rows, kind='stable')
+        isi = np.concatenate([isi, vt_tail[tail_rows]])[order]
+        return RaggedFeature(isi, rows[order], self.n_traces, invalid=invalid)
+
+    def STEP_adaptation_index(self, stim_end=2000, thresh=None):
+        """See :py:meth:`~biophysics_fitting.ephys.STEP_adaptation_index`."""
+        isi = self._STEP_ISIs(stim_end, thresh)
+        same = isi.rows[1:] == isi.rows[:-1]
+        a, b = isi.values[:-1][same], isi.values[1:][same]
+        n = np.bincount(isi.rows[1:][same], minlength=self.n_traces)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out = np.bincount(isi.rows[1:][same], weights=(b - a) / (b + a), minlength=self.n_traces) / n
+        out[(n == 0) | isi.invalid] = np.nan
+        return out
+
+    def STEP_coef_var(self, stim_end, thresh=None):
+        """See :py:meth:`~biophysics_fitting.ephys.STEP_coef_var`."""
+        isi = self._STEP_ISIs(stim_end, thresh)
+        n = isi.count()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.bincount(isi.rows, weights=isi.values, minlength=self.n_traces) / n
+            var = np.bincount(isi.rows, weights=(isi.values - mean[isi.rows])**2, minlength=self.n_traces) / (n - 1)
+            out = np.sqrt(var) / mean
+        out[(n < 2) | isi.invalid] = np.nan
+        return out
+
+    def STEP_initial_ISI(self, thresh=None):
+        """See :py:meth:`~biophysics_fitting.ephys.STEP_initial_ISI`."""
+        c = self.crossings(thresh)
+        return self._t_at(c.nth_up(1)) - self._t_at(c.nth_up(0))
+
+    def STEP_time_to_first_spike(self, stim_onset, thresh=None):
+        """See :py:meth:`~biophysics_fitting.ephys.STEP_time_to_first_spike`."""
+        return self._t_at(self.crossings(thresh).nth_up(0)) - stim_onset
+
+    def _STEP_ahp_segments(self, thresh, time_scale, start, fast):
+        """Segments in which the fast or slow AHP is searched, see :py:meth:`~biophysics_fitting.ephys.STEP_fast_ahp_depth`."""
+        rows, i1, i2 = self.crossings(thresh).consecutive_up(start=start)
+        t1, t2 = self.t[i1], self.t[i2]
+        close = (t2 - t1) <= time_scale
+        after_time_scale = np.searchsorted(self.t, t1 + time_scale)
+        if fast:
+            begin, end = i1, np.where(close, i2, after_time_scale) + 1
+        else:
+            begin, end = np.where(close, i1, after_time_scale), i2 + 1
+        return rows, begin, end, t1, t2
+
+    def STEP_fast_ahp_depth(self, thresh=None, time_scale=5, start=1):
+        """See :py:meth:`~biophysics_fitting.ephys.STEP_fast_ahp_depth`."""
+        rows, begin, end, _, _ = self._STEP_ahp_segments(thresh, time_scale, start, fast=True)
+        return RaggedFeature(_segment_min(self.v, rows, begin, end), rows, self.n_traces)
+
+    def STEP_slow_ahp_depth(self, thresh=None, time_scale=5, start=1):
+        """See :py:meth:`~biophysics_fitting.ephys.STEP_slow_ahp_depth`."""
+        rows, begin, end, _, _ = self._STEP_ahp_segments(thresh, time_scale, start, fast=False)
+        return RaggedFeature(_segment_min(self.v, rows, begin, end), rows, self.n_traces)
+
+    def STEP_slow_ahp_time(self, thresh=None, time_scale=5, start=1):
+        """See :py:meth:`~biophysics_fitting.ephys.STEP_slow_ahp_time`."""
+        rows, begin, end, t1, t2 = self._STEP_ahp_segments(thresh, time_scale, start, fast=False)
+        t_sahp = self.t[begin + _segment_argmin(self.v, rows, begin, end)]
+        return RaggedFeature((t_sahp - t1) / (t2 - t1), rows, self.n_traces)
@@ -116,6 +116,82 @@ def nan_if_error(fun):
     return helper
 
 
+def normalize_batch(raw, mean, std):
+    """Batched version of :py:meth:`normalize`.
+
+    Args:
+        raw (numpy.ndarray | :py:class:`~biophysics_fitting.ephys.RaggedFeature`): raw value of each voltage trace
+        mean (float | numpy.ndarray): mean value, either one for all voltage traces, or one per voltage trace
+        std: standard deviation
+
+    Returns:
+        numpy.ndarray: normalized value of each voltage trace
+    """
+    if isinstance(raw, RaggedFeature):
+        return raw.mean_abs_deviation(mean) / std
+    return np.abs(raw - mean) / std
+
+
+def _passes(check):
+    """Evaluate checks of many voltage traces the way :py:func:`all` evaluates the check of a single one.
+
+    Counts pass if they are nonzero, NaN passes.
+    """
+    return np.asarray(check) != 0
+
+
+def _get_trace_batches(voltage_traces):
+    """Wrap the voltage traces of each recording site in a :py:class:`~biophysics_fitting.ephys.VoltageTraceBatch`.
+
+    Args:
+        voltage_traces (dict):
+            Dictionary with the time array ``tVec`` shared by all voltage traces,
+            and ``vList``, containing an array of shape ``(n_traces, len(tVec))`` for each recording site.
+
+    Returns:
+        list: A :py:class:`~biophysics_fitting.ephys.VoltageTraceBatch` per recording site.
+    """
+    t = voltage_traces["tVec"]
+    return [VoltageTraceBatch(t, v) for v in voltage_traces["vList"]]
+
+
+def _evaluate_batch(definitions, metrics, punish_value, means=None):
+    """Batched version of the loop over evaluation metrics in e.g. :py:meth:`BAC.get`.
+
+    Args:
+        definitions (dict): The definitions of the evaluation metrics.
+        metrics (callable): Returns the raw values and checks of an evaluation metric, given its name.
+        punish_value (float): The value of a metric if one of its checks fails.
+        means (dict, optional): Means that deviate from the definitions, e.g. one per voltage trace.
+
+    Returns:
+        dict: dictionary with the evaluation metrics, containing an array of raw values, normalized values, and checks.
+    """
+    out = {}
+    for name, (_, mean, std) in iteritems(definitions):
+        if means is not None and name in means:
+            mean = means[name]
+        out_current = metrics(name)
+        raw = out_current[".raw"]
+        out_current[".normalized"] = normalize_batch(raw, mean, std)
+        checks = [_passes(v) for k, v in iteritems(out_current) if "check" in k]
+        passed = np.logical_and.reduce(checks) if checks else True
+        out_current[""] = np.where(passed, out_current[".normalized"], punish_value)
+        if isinstance(raw, RaggedFeature):
+            out_current[".raw"] = raw.to_object_array()
+        out.update({name + k: v for k, v in iteritems(out_current)})
+    return out
+
+
+def _punish_batch(out, names, err, relevant_err_flags, punish):
+    """Batched version of replacing metrics by the error value in e.g. :py:meth:`BAC.check`."""
+    failed = ~np.logical_and.reduce([_passes(v) for v in relevant_err_flags.values()])
+    for name in names:
+        out[name] = np.where(
+            failed, err, np.where(out[name] > punish, punish * 0.75, out[name])
+        )
+
+
 class BAC:
     r"""Evaluate the :math:`BAC` stimulus protocol.
 
@@ -304,6 +380,116 @@ class BAC:
         out = {self.prefix + k: out[k] for k in out.keys()}
         return out
 
+    def get_batch(self, **voltage_traces):
+        """Batched version of :py:meth:`get` for many simulations of the same stimulus protocol.
+
+        Threshold crossings are computed once per voltage trace and threshold, and shared by all evaluation metrics.
+
+        Args:
+            voltage_traces:
+                dictionary with the time array ``tVec`` shared by all simulations,
+                and ``vList``, containing an array of shape ``(n_traces, len(tVec))`` for the soma and the dendrite.
+
+        Returns:
+            dict: The same keys as :py:meth:`get`, mapped to an array with one value per voltage trace.
+                Raw values of metrics that are computed per action potential are object arrays of arrays.
+        """
+        traces = _get_trace_batches(voltage_traces)
+        soma = traces[0]
+        spikecount = soma.spike_count(self.soma_thresh)
+        means = {}
+        if "BAC_caSpike_width" in self.definitions:
+            # special case in the original code were in the case of two somatic spikes
+            # 7 is substracted from the mean
+            mean = self.definitions["BAC_caSpike_width"][1]
+            means["BAC_caSpike_width"] = np.where(spikecount == 2, mean - 7.0, mean)
+        out = _evaluate_batch(
+            self.definitions, lambda name: self._get_batch_metric(name, traces), 20.0, means=means
+        )
+        return self.check_batch(out, traces)
+
+    def check_batch(self, out, traces):
+        """Batched version of :py:meth:`check`.
+
+        Args:
+            out: dictionary with the evaluation metrics of all voltage traces
+            traces (list): A :py:class:`~biophysics_fitting.ephys.VoltageTraceBatch` per recording site.
+
+        Returns:
+            dict: dictionary with the evaluation metrics, containing an array of raw values, normalized values, and checks.
+        """
+        soma = traces[0]
+        err = soma.trace_check_err(
+            stim_onset=self.stim_onset,
+            stim_duration=self.stim_duration,
+            punish=self.punish,
+        )
+        err_flags = soma.trace_check(
+            stim_onset=self.stim_onset,
+            stim_duration=self.stim_duration,
+            minspikenum=self.punish_minspikenum,
+            soma_threshold=self.soma_thresh,
+            returning_to_rest=self.punish_returning_to_rest_tolerance,
+            name="BAC",
+        )
+        relevant_err_flags = {
+            k: v
+            for k, v in six.iteritems(err_flags)
+            if self.punish_last_spike_after_deadline or not "last_spike_before_deadline" in k
+        }
+        _punish_batch(out, list(self.definitions.keys()), err, relevant_err_flags, self.punish)
+        prestim_depo = ~_passes(err_flags["BAC.check_max_prestim_dendrite_depo"])
+        for evaluation_metric_name in list(self.definitions.keys()):
+            out[evaluation_metric_name] = np.where(prestim_depo, self.punish, out[evaluation_metric_name])
+        out["BAC.err"] = err
+        out.update(err_flags)
+        out = {self.prefix + k: out[k] for k in out.keys()}
+        return out
+
+    def _get_batch_metric(self, name, traces):
+        """Batched version of the evaluation metric :paramref:`name`, e.g. :py:meth:`BAC_ISI`."""
+        soma = traces[0]
+        n = soma.spike_count(self.soma_thresh)
+        if name == "BAC_spikecount":
+            return {".raw": n}
+        if name == "BAC_APheight":
+            return {
+                ".check_1AP": np.ones(soma.n_traces, dtype=bool),
+                ".raw": soma.AP_height(self.soma_thresh),
+            }
+        if name == "BAC_ISI":
+            return {
+                ".check_2_or_3_APs": (n == 2) | (n == 3),
+                ".check_repolarization": soma.BAC_ISI_check_repolarization(
+                    stim_end=self.stim_onset + self.stim_duration,
+                    repolarization=self.repolarization,
+                ),
+                ".raw": soma.BAC_ISI(self.soma_thresh),
+            }
+        if name == "BAC_ahpdepth":
+            return {
+                ".check_2AP": n >= 2,
+                ".raw": soma.AHP_depth_abs(self.soma_thresh),
+            }
+        dend = traces[1]
+        if name == "BAC_caSpike_height":
+            return {
+                ".check_1_Ca_AP": dend.spike_count(self.hot_zone_thresh) == 1,
+                ".check_>=2_Na_AP": n >= 2,
+                ".check_ca_max_after_nth_somatic_spike": soma.BAC_caSpike_height_check_Ca_spikes_after_Na_spike(
+                    dend, n=self.ca_max_after_nth_somatic_spike, thresh=self.soma_thresh
+                ),
+                ".raw": dend.BAC_caSpike_height(
+                    ca_thresh=self.hot_zone_thresh, tstim=self.stim_onset
+                ),
+            }
+        if name == "BAC_caSpike_width":
+            return {
+                ".check_1_Ca_AP": dend.spike_count(self.hot_zone_thresh) == 1,
+                ".raw": dend.BAC_caSpike_width(self.hot_zone_thresh),
+            }
+        raise ValueError("No batched version of the evaluation metric {}".format(name))
+
     def BAC_spikecount(self, voltage_traces):
         """Get the number of spikes in the somatic voltage trace.
 
@@ -597,6 +783,89 @@ class bAP:
         out.update(err_flags)
         return out
 
+    def get_batch(self, **voltage_traces):
+        """Batched version of :py:meth:`get` for many simulations of the same stimulus protocol.
+
+        Threshold crossings are computed once per voltage trace and threshold, and shared by all evaluation metrics.
+
+        Args:
+            voltage_traces:
+                dictionary with the time array ``tVec`` shared by all simulations,
+                and ``vList``, containing an array of shape ``(n_traces, len(tVec))`` for the soma and each dendritic recording site.
+
+        Returns:
+            dict: The same keys as :py:meth:`get`, mapped to an array with one value per voltage trace.
+                Raw values of metrics that are computed per action potential are object arrays of arrays.
+        """
+        traces = _get_trace_batches(voltage_traces)
+        out = _evaluate_batch(
+            self.definitions, lambda name: self._get_batch_metric(name, traces), 20
+        )
+        return self.check_batch(out, traces)
+
+    def check_batch(self, out, traces):
+        """Batched version of :py:meth:`check`.
+
+        Args:
+            out: dictionary with the evaluation metrics of all voltage traces
+            traces (list): A :py:class:`~biophysics_fitting.ephys.VoltageTraceBatch` per recording site.
+
+        Returns:
+            dict: dictionary with the evaluation metrics, containing an array of raw values, normalized values, and checks.
+        """
+        soma = traces[0]
+        err = soma.trace_check_err(
+            stim_onset=self.stim_onset,
+            stim_duration=self.stim_duration,
+            punish=self.punish,
+        )
+        err_flags = soma.trace_check(
+            stim_onset=self.stim_onset,
+            stim_duration=self.stim_duration,
+            minspikenum=self.punish_minspikenum,
+            soma_threshold=self.soma_thresh,
+            returning_to_rest=self.punish_returning_to_rest_tolerance,
+            name="bAP",
+        )
+        relevant_err_flags = {
+            k: v
+            for k, v in iteritems(err_flags)
+            if self.punish_last_spike_after_deadline or not "last_spike_before_deadline" in k
+        }
+        _punish_batch(out, list(self.definitions.keys()), err, relevant_err_flags, self.punish)
+        prestim_depo = ~_passes(err_flags["bAP.check_max_prestim_dendrite_depo"])
+        for name in list(self.definitions.keys()):
+            out[name] = np.where(prestim_depo, self.punish, out[name])
+        out["bAP.err"] = err
+        out.update(err_flags)
+        return out
+
+    def _get_batch_metric(self, name, traces):
+        """Batched version of the evaluation metric :paramref:`name`, e.g. :py:meth:`bAP_APheight`."""
+        soma = traces[0]
+        if name == "bAP_spikecount":
+            return {".raw": soma.spike_count(self.soma_thresh)}
+        if name == "bAP_APheight":
+            return {
+                ".check_1AP": np.ones(soma.n_traces, dtype=bool),
+                ".raw": soma.AP_height(self.soma_thresh),
+            }
+        if name == "bAP_APwidth":
+            return {
+                ".check_1AP": np.ones(soma.n_traces, dtype=bool),
+                ".raw": soma.AP_width(self.soma_thresh),
+            }
+        if name in ("bAP_att2", "bAP_att3"):
+            dend = traces[1 if name == "bAP_att2" else 2]
+            return {
+                ".raw": dend.BPAPatt(self.bAP_thresh, self.stim_onset),
+                ".check_1_AP": soma.spike_count(self.soma_thresh) == 1,
+                ".check_relative_height": soma.BPAPatt_check_relative_height(
+                    dend, self.bAP_thresh, self.stim_onset
+                ),
+            }
+        raise ValueError("No batched version of the evaluation metric {}".format(name))
+
     def bAP_APheight(self, voltage_traces):
         """Get the height of the first action potential in the somatic voltage trace.
 
@@ -842,6 +1111,86 @@ class _Step:
         out.update(err_flags)
         return out
 
+    def get_batch(self, **voltage_traces):
+        """Batched version of :py:meth:`get` for many simulations of the same stimulus protocol.
+
+        Threshold crossings are computed once per voltage trace, and shared by all evaluation metrics.
+
+        Args:
+            voltage_traces:
+                dictionary with the time array ``tVec`` shared by all simulations,
+                and ``vList``, containing an array of shape ``(n_traces, len(tVec))`` for the soma.
+
+        Returns:
+            dict: The same keys as :py:meth:`get`, mapped to an array with one value per voltage trace.
+                Raw values of metrics that are computed per action potential are object arrays of arrays.
+        """
+        traces = _get_trace_batches(voltage_traces)
+        out = _evaluate_batch(
+            self.definitions, lambda name: self._get_batch_metric(name, traces), 20
+        )
+        return self.check_batch(out, traces)
+
+    def check_batch(self, out, traces):
+        """Batched version of :py:meth:`check`.
+
+        Args:
+            out: dictionary with the evaluation metrics of all voltage traces
+            traces (list): A :py:class:`~biophysics_fitting.ephys.VoltageTraceBatch` per recording site.
+
+        Returns:
+            dict: dictionary with the evaluation metrics, containing an array of raw values, normalized values, and checks.
+        """
+        soma = traces[0]
+        err = soma.trace_check_err(
+            stim_onset=self.stim_onset,
+            stim_duration=self.stim_duration,
+            punish=self.punish,
+        )
+        err_flags = soma.trace_check(
+            stim_onset=self.stim_onset,
+            stim_duration=self.stim_duration,
+            minspikenum=self.punish_minspikenum,
+            soma_threshold=self.soma_thresh,
+            returning_to_rest=self.punish_returning_to_rest_tolerance,
+            name=self.name,
+        )
+        _punish_batch(out, list(self.definitions.keys()), err, err_flags, self.punish)
+        out["{}.err".format(self.name)] = err
+        out.update(err_flags)
+        return out
+
+    def _get_batch_metric(self, name, traces):
+        """Batched version of the evaluation metric :paramref:`name`, e.g. :py:meth:`mf`."""
+        soma = traces[0]
+        thresh = self.soma_thresh
+        n = soma.spike_count(thresh)
+        stim_end = self.stim_onset + self.stim_duration
+        name = name.rstrip(str(self.step_index))
+        if name == "mf":
+            return {".check_1AP": n, ".raw": soma.STEP_mean_frequency(self.stim_duration, thresh=thresh)}
+        if name == "AI":
+            return {".check_2ISI": n, ".raw": soma.STEP_adaptation_index(stim_end=stim_end, thresh=thresh)}
+        if name == "ISIcv":
+            return {".check_2ISI": n, ".raw": soma.STEP_coef_var(stim_end=stim_end, thresh=thresh)}
+        if name == "DI":
+            return {".check_2ISI": n, ".raw": soma.STEP_initial_ISI(thresh=thresh)}
+        if name == "TTFS":
+            return {".check_1AP": n, ".raw": soma.STEP_time_to_first_spike(self.stim_onset, thresh=thresh)}
+        if name == "AHP_depth_abs":
+            return {".check_2AP": n >= 2, ".raw": soma.AHP_depth_abs(thresh)}
+        if name == "APh":
+            return {".check_1AP": np.ones(soma.n_traces, dtype=bool), ".raw": soma.AP_height(thresh)}
+        if name == "fAHPd":
+            return {".check_2AP": n >= 2, ".raw": soma.STEP_fast_ahp_depth(thresh=thresh)}
+        if name == "sAHPd":
+            return {".check_2AP": n >= 2, ".raw": soma.STEP_slow_ahp_depth(thresh=thresh)}
+        if name == "sAHPt":
+            return {".check_2AP": n >= 2, ".raw": soma.STEP_slow_ahp_time(thresh=thresh)}
+        if name == "APw":
+            return {".check_1AP": np.ones(soma.n_traces, dtype=bool), ".raw": soma.AP_width(thresh)}
+        raise ValueError("No batched version of the evaluation metric {}".format(name))
+
     def mf(self, voltage_traces):
         """Get the mean frequency of the somatic voltage trace.
 
@@ -43,6 +43,7 @@ Note:
     51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """
 import time
+from functools import partial
 
 import bluepyopt as bpop
 import deap
@@ -61,6 +62,7 @@ from data_base.IO.LoaderDumper import \
     pandas_to_parquet as dumper_pandas_to_parquet
 from data_base.IO.LoaderDumper import to_pickle as dumper_to_pickle
 from data_base.utils import wait_until_key_removed
+from .worker_pool import get_worker_pool, get_worker_pool_key
 
 
 def robust_int(x):
@@ -166,7 +168,105 @@ def get_objective_function(db_setup):
     return objective_function
 
 
-def get_mymap(db_setup, db_run, c, satisfactory_boundary_dict=None, n_reschedule_on_runtime_error = 3):
+def get_batch_objective_function(db_setup, worker_pool_kwargs=None):
+    """Get an objective function that evaluates a batch of parameter vectors.
+    
+    Args:
+        db_setup (data_base.DataBase): The database containing the setup of the optimization.
+        worker_pool_kwargs (dict | None): 
+            If not None, the batch is distributed over a :py:class:`~biophysics_fitting.worker_pool.SimulationWorkerPool`
+            that is kept alive in the process calling the objective function (e.g. a dask worker),
+            such that the Simulator and Evaluator only need to be set up once per worker process.
+            The dict contains the keyword arguments for :py:meth:`~biophysics_fitting.worker_pool.get_worker_pool`, e.g. ``{'n_workers': 4}``.
+        
+    Returns:
+        function: Takes a list of parameter values, and returns the list of evaluations."""
+    if worker_pool_kwargs is not None:
+        objective_function_factory = partial(get_objective_function, db_setup)
+        # serializing the factory is expensive, so the key of the pool is only computed once
+        key = get_worker_pool_key(objective_function_factory, **worker_pool_kwargs)
+
+        def batch_objective_function(param_values_list):
+            pool = get_worker_pool(objective_function_factory, key=key, **worker_pool_kwargs)
+            return pool.map(param_values_list)
+
+        return batch_objective_function
+
+    objective_function = get_objective_function(db_setup)
+
+    def batch_objective_function(param_values_list):
+        return [objective_function(param_values) for param_values in param_values_list]
+
+    return batch_objective_function
+
+
+def _evaluate_in_batches(c, batch_objective_fun, params_pd, batch_size, n_retries):
+    """Evaluate a population in batches, and reschedule only the failed individuals.
+    
+    Each batch of :paramref:`batch_size` individuals is evaluated in one task on the cluster.
+    Results are collected as soon as their batch is done.
+    Individuals of failed batches are rescheduled individually, at most :paramref:`n_retries` times.
+    
+    Args:
+        c (:py:class:`~dask.distributed.Client`): The distributed client.
+        batch_objective_fun (callable): See :py:meth:`get_batch_objective_function`.
+        params_pd (pd.DataFrame): The population, one individual per row.
+        batch_size (int): Number of individuals per task.
+        n_retries (int): How often failed individuals are rescheduled.
+        
+    Returns:
+        list: The evaluation of each individual.
+        
+    Raises:
+        ValueError: If individuals still fail after :paramref:`n_retries` retries.
+    """
+    params_list = params_pd.values.tolist()
+    features_dicts = [None] * len(params_list)
+    pending = [
+        list(range(lv, min(lv + batch_size, len(params_list))))
+        for lv in range(0, len(params_list), batch_size)
+        ]
+    for n_attempt in range(n_retries + 1):
+        futures = {
+            c.submit(batch_objective_fun, [params_list[i] for i in batch], pure=False): batch
+            for batch in pending
+            }
+        failed = []
+        for future in distributed.as_completed(futures):
+            batch = futures[future]
+            try:
+                batch_features_dicts = future.result()
+            except (Exception, CancelledError) as e:
+                failed.append((batch, e))
+                continue
+            for i, features_dict in zip(batch, batch_features_dicts):
+                features_dicts[i] = features_dict
+        del futures
+        if not failed:
+            return features_dicts
+        if n_attempt == n_retries:
+            break
+        # reschedule the individuals of failed batches one by one, such that one failing individual does not fail the others
+        pending = [[i] for batch, _ in failed for i in batch]
+        print('{} of {} individuals failed. Remaining attempts: {}. Rescheduling ...'.format(
+            len(pending), len(params_list), n_retries - n_attempt - 1))
+    errstr = ''
+    for batch, e in failed:
+        errstr += 'Problem with individual number {}\n'.format(batch[0])
+        errstr += 'Exception: {}:{}\n'.format(type(e), e)
+        errstr += 'Parameters are: {}\n'.format(dict(params_pd.iloc[batch[0]]))
+    raise ValueError(errstr)
+
+
+def get_mymap(
+        db_setup,
+        db_run,
+        c,
+        satisfactory_boundary_dict=None,
+        n_reschedule_on_runtime_error = 3,
+        worker_pool_kwargs=None,
+        batch_size=None
+        ):
     """Get a map function for evaluating the parameters.
     
     This function is a hook into BluePyOpt's optimization.
@@ -180,6 +280,15 @@ def get_mymap(db_setup, db_run, c, satisfactory_boundary_dict=None, n_reschedule
         c (:py:class:`~dask.distributed.Client`): The distributed client.
         satisfactory_boundary_dict (dict | None): A dictionary with the boundaries for the objectives. If a model is found, that has all objectives below the boundary, the optimization is stopped.
         n_reschedule_on_runtime_error (int): The number of times the optimization is rescheduled if a runtime error occurs.
+        worker_pool_kwargs (dict | None): 
+            Run the simulations in persistent worker processes. See :py:meth:`get_batch_objective_function`.
+            If :paramref:`batch_size` is None, the whole population is evaluated in one task by the worker pool.
+        batch_size (int | None): 
+            If not None, evaluate the population in tasks of :paramref:`batch_size` individuals,
+            collect the results as soon as each task is done, and only reschedule failed individuals 
+            (at most :paramref:`n_reschedule_on_runtime_error` times). See :py:meth:`_evaluate_in_batches`.
+            If None and no :paramref:`worker_pool_kwargs` are given, one task is submitted per individual 
+            and the whole population is rescheduled on failure.
         
     Returns:
         Callable: The map function for evaluating the parameters. this function is passed to the :py:class:`bluepyopt.optimisations.DEAPOptimisation` object.    
@@ -196,11 +305,13 @@ def get_mymap(db_setup, db_run, c, satisfactory_boundary_dict=None, n_reschedule
     #   db_setup[str(n)] then contains all the saved results    objective_fun = get_objective_function(db_setup)
     combiner = db_setup['get_Combiner'](db_setup)
     params = db_setup['params'].index
-    objective_fun = get_objective_function(db_setup)
+    evaluate_in_batches = batch_size is not None or worker_pool_kwargs is not None
+    if evaluate_in_batches:
+        batch_objective_fun = get_batch_objective_function(db_setup, worker_pool_kwargs=worker_pool_kwargs)
+    else:
+        objective_fun = get_objective_function(db_setup)
 
-    def mymap(func, iterable):
-        params_list = list(map(list, iterable))
-        params_pd = pd.DataFrame(params_list, columns=params)
+    def evaluate(params_list, params_pd, remaining=n_reschedule_on_runtime_error):
         futures = c.map(objective_fun, params_list, pure=False)
         try:
             features_dicts = c.gather(futures)
@@ -209,14 +320,14 @@ def get_mymap(db_setup, db_run, c, satisfactory_boundary_dict=None, n_reschedule
             del futures
             time.sleep(3 * 60)
             print('Rescheduling ...')
-            return mymap(func, iterable)
+            return evaluate(params_list, params_pd, remaining)
         except RuntimeError:
-            if reschedule_on_runtime_error >= 0:
+            if remaining > 0:
                 print(
                     'Got a RuntimeError while gathering futures. This may be dask related, or it may be a RuntimeError raised by the' + 
-                    'Evaluator. Remaining attempts: {}. Waiting for 3 Minutes, then reschedule.'.format(reschedule_on_runtime_error)
+                    'Evaluator. Remaining attempts: {}. Rescheduling ...'.format(remaining - 1)
                 )
-                return mymap(func, iterable, n_reschedule_on_runtime_error = n_reschedule_on_runtime_error - 1)
+                return evaluate(params_list, params_pd, remaining - 1)
             else:
                 raise 
         except:
@@ -231,7 +342,18 @@ def get_mymap(db_setup, db_run, c, satisfactory_boundary_dict=None, n_reschedule
                     raise ValueError(errstr)
         
         # features_dicts = map(objective_fun, params_list) # temp rieke
-        features_dicts = c.gather(futures)  #temp rieke
+        return c.gather(futures)  #temp rieke
+
+    def mymap(func, iterable):
+        params_list = list(map(list, iterable))
+        params_pd = pd.DataFrame(params_list, columns=params)
+        if evaluate_in_batches:
+            # without batch_size, the worker pool evaluates the whole population at once
+            features_dicts = _evaluate_in_batches(
+                c, batch_objective_fun, params_pd, batch_size or max(len(params_list), 1), 
+                n_reschedule_on_runtime_error)
+        else:
+            features_dicts = evaluate(params_list, params_pd)
         features_pd = pd.DataFrame(features_dicts)
         
         # save the parameters and the features in the database
@@ -564,7 +686,9 @@ def start_run(
         mutpb=0.3,
         cxpb=0.7,
         max_ngen=600,
-        satisfactory_boundary_dict=None
+        satisfactory_boundary_dict=None,
+        worker_pool_kwargs=None,
+        batch_size=None
         ):
     '''
     Start an optimization run as specified in db_setup.
@@ -592,6 +716,8 @@ def start_run(
         cxpb (float): The crossover probability.
         max_ngen (int): The maximum number of generations.
         satisfactory_boundary_dict (dict | None): A dictionary with the boundaries for the objectives. If a model is found, that has all objectives below the boundary, the optimization is stopped.
+        worker_pool_kwargs (dict | None): Run the simulations in persistent worker processes. See :py:meth:`get_mymap`.
+        batch_size (int | None): Evaluate the population in tasks of :paramref:`batch_size` individuals. See :py:meth:`get_mymap`.
     
         
     For an exemplary setup of a Simulator, Evaluator and Combiner object, see 
@@ -633,7 +759,9 @@ def start_run(
             db_setup,
             db_run,
             client,
-            satisfactory_boundary_dict=satisfactory_boundary_dict),
+            satisfactory_boundary_dict=satisfactory_boundary_dict,
+            worker_pool_kwargs=worker_pool_kwargs,
+            batch_size=batch_size),
         seed=n)
 
     if continue_cp == True:
@@ -476,10 +476,14 @@ class Simulator:
     
     Attributes:
         setup (:py:class:`~biophysics_fitting.simulator.Simulator_Setup`): A Simulator_Setup object that keeps track of the simulation setup.
+        reuse_cell (bool): 
+            Default for :paramref:`reuse_cell` in :py:meth:`run`. 
+            If True, the cell is only set up once per parameter vector and reset between stimuli.
     '''
 
-    def __init__(self):
+    def __init__(self, reuse_cell=False):
         self.setup = Simulator_Setup()
+        self.reuse_cell = reuse_cell
 
     def get_simulated_cell(self, params, stim, simulate = True): 
         '''Get the simulated cell.
@@ -496,6 +500,23 @@ class Simulator:
         t = time.time()
         # get cell object with biophysics
         cell, params = self.setup.get(params)
+        cell = self._simulate_stim(cell, params, stim, simulate=simulate)
+        if simulate:
+            logger.info("simulating {} took {} seconds".format(stim, time.time()-t))
+        return cell, params
+
+    def _simulate_stim(self, cell, params, stim, simulate=True):
+        '''Set up a stimulus on a cell with biophysics and run the simulation.
+        
+        Args:
+            cell (:py:class:`~single_cell_parser.cell.Cell`): The cell object, as returned by :py:meth:`Simulator_Setup.get`.
+            params (pd.Series): The parameter vector, as returned by :py:meth:`Simulator_Setup.get`.
+            stim (str): The stimulus to apply.
+            simulate (bool): Whether to run the simulation (True), or only set up the simulation (False).
+            
+        Returns:
+            :py:class:`~single_cell_parser.cell.Cell`: The cell object.
+        '''
         # set up stimulus
         name, fun = self.setup.get_stim_setup_fun_by_stim(stim)
         #print name, param_selector(params, name)
@@ -505,15 +526,42 @@ class Simulator:
         #print name,param_selector(params, name)
         if simulate:
             cell = fun(cell, params = param_selector(params, name))
-            logger.info("simulating {} took {} seconds".format(stim, time.time()-t))
-        return cell, params
+        return cell
+
+    @staticmethod
+    def _reset_cell(cell, attributes):
+        '''Reset a simulated cell, such that the next stimulus can be simulated on it.
+        
+        Removes all attributes that have been added to the cell after it has been set up, 
+        i.e. the stimuli added by the stim_setup_funs (e.g. the ``iclamp`` and ``epsp`` pipettes of :py:mod:`~biophysics_fitting.setup_stim`).
+        Once no reference to them is left, NEURON removes the corresponding point processes.
+        The recorded traces are cleared with :py:meth:`~single_cell_parser.cell.Cell.re_init_cell`.
+        The cell state itself is reset by ``finitialize`` at the start of the next simulation run.
+        
+        Args:
+            cell (:py:class:`~single_cell_parser.cell.Cell`): The cell object.
+            attributes (set): The names of the attributes of the cell right after it has been set up.
+            
+        Returns:
+            None
+        '''
+        for name in set(vars(cell)) - attributes:
+            delattr(cell, name)
+        cell.re_init_cell(disconnect_synapses=False)
 
-    def run(self, params, stims=None):
+    def run(self, params, stims=None, reuse_cell=None):
         '''Simulates all stimuli for a given parameter vector.
         
         Args:
             params: The parameter vector.
             stims (str | [str]): which sitmuli to run. Either a str (for one stimulus) or a list of str.
+            reuse_cell (bool, optional): 
+                If True, the cell is set up only once, and reset between stimuli (see :py:meth:`_reset_cell`),
+                instead of being set up from scratch for each stimulus.
+                This saves parsing the morphology and inserting the biophysics for every stimulus.
+                Requires that the stim_setup_funs only add stimuli as new attributes to the cell, 
+                and do not modify the cell otherwise.
+                Defaults to :paramref:`Simulator.reuse_cell`.
             
         Returns: 
             dict: Dictionary where stim_response_measure_funs names are keys, 
@@ -524,7 +572,11 @@ class Simulator:
             stims = self.setup.get_stims()
         if isinstance(stims, str):
             stims = [stims]
+        if reuse_cell is None:
+            reuse_cell = getattr(self, 'reuse_cell', False)  # Simulators pickled before reuse_cell existed
         self.setup.check()
+        if reuse_cell:
+            return self._run_reusing_cell(params, stims)
         out = {}
         for stim in stims:
             cell, params = self.get_simulated_cell(params, stim)
@@ -535,6 +587,37 @@ class Simulator:
             del cell
         return out
 
+    def _run_reusing_cell(self, params, stims):
+        '''Simulates all stimuli for a given parameter vector on a single cell.
+        
+        See :py:meth:`run` with ``reuse_cell=True``.
+        
+        Args:
+            params: The parameter vector.
+            stims ([str]): which sitmuli to run.
+            
+        Returns:
+            dict: Dictionary where stim_response_measure_funs names are keys, 
+            return values of the stim_response_measure_funs (usually voltage traces) are values.
+        '''
+        out = {}
+        t = time.time()
+        cell, params = self.setup.get(params)
+        logger.info("setting up the cell took {} seconds".format(time.time()-t))
+        attributes = set(vars(cell))
+        for lv, stim in enumerate(stims):
+            if lv > 0:
+                self._reset_cell(cell, attributes)
+            t = time.time()
+            cell = self._simulate_stim(cell, params, stim)
+            logger.info("simulating {} took {} seconds".format(stim, time.time()-t))
+            # extract result
+            for name, fun in self.setup.get_stim_response_measure_fun(stim):
+                result = fun(cell, params=param_selector(params, name))
+                out.update({name: result})
+        del cell
+        return out
+
 
 def run_fun(
     cell,
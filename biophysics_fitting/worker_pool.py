@@ -0,0 +1,344 @@
+# In Silico Framework
+# Copyright (C) 2025  Max Planck Institute for Neurobiology of Behavior - CAESAR
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# The full license text is also available in the LICENSE file in the root of this repository.
+'''Long-lived worker processes to evaluate parameter vectors.
+
+:py:meth:`~biophysics_fitting.utils.execute_in_child_process` starts a new process for every call.
+Each call thus pays for loading the NEURON mechanisms, parsing the morphology and setting up
+the :py:class:`~biophysics_fitting.simulator.Simulator` and :py:class:`~biophysics_fitting.evaluator.Evaluator` objects.
+
+A :py:class:`SimulationWorkerPool` instead keeps its worker processes alive.
+Each worker sets up the objective function once, and then evaluates batches of parameter vectors.
+Parsed input files stay in the in-process cache of the worker (see :py:mod:`~single_cell_parser.parsed_file_cache`).
+If NEURON crashes a worker (e.g. with a segmentation fault), only that worker is lost:
+it is restarted, and the parameter vectors it was evaluating are scheduled again.
+
+Example:
+
+    >>> def get_objective_function():
+    ...     import mechanisms.l5pt
+    ...     s = get_Simulator(fixed_params)
+    ...     e = get_Evaluator()
+    ...     return lambda p: e.evaluate(s.run(pd.Series(p, index=param_names)))
+    >>> with SimulationWorkerPool(get_objective_function, n_workers=4, batch_size=8) as pool:
+    ...     features = pool.map(params_list)
+'''
+
+import multiprocessing
+import multiprocessing.connection
+import threading
+import traceback
+import hashlib
+from collections import deque
+import cloudpickle
+from .utils import Undemonize
+import logging
+logger = logging.getLogger("ISF").getChild(__name__)
+
+
+def _worker_loop(conn, objective_function_factory):
+    """Main loop of a worker process.
+
+    Sets up the objective function, then evaluates batches of parameter vectors received on :paramref:`conn`
+    until it receives None.
+
+    Args:
+        conn (multiprocessing.connection.Connection): Connection to the parent process.
+        objective_function_factory (bytes): The cloudpickled factory of the objective function.
+
+    Returns:
+        None
+    """
+    try:
+        objective_function = cloudpickle.loads(objective_function_factory)()
+    except Exception:
+        conn.send(('setup_error', traceback.format_exc()))
+        return
+    while True:
+        try:
+            batch = conn.recv()
+        except EOFError:
+            return
+        if batch is None:
+            return
+        try:
+            results = [objective_function(params) for params in batch]
+        except Exception:
+            conn.send(('error', traceback.format_exc()))
+        else:
+            conn.send(('done', results))
+
+
+class SimulationWorkerPool(object):
+    '''Pool of long-lived worker processes that evaluate parameter vectors.
+
+    Each worker process calls :paramref:`objective_function_factory` once when it is started.
+    The returned objective function is then used to evaluate all parameter vectors sent to this worker.
+    Parameter vectors are sent to the workers in batches of :paramref:`batch_size`.
+
+    Workers that die while evaluating a batch (e.g. due to a NEURON segmentation fault) are restarted.
+    The parameter vectors of the lost batch are evaluated again one by one, so that a crashing parameter vector
+    does not take down the other parameter vectors of its batch.
+    A parameter vector that crashes a worker more than :paramref:`max_retries` times raises a RuntimeError.
+    Python exceptions raised by the objective function are not retried, but re-raised as RuntimeError in the parent process.
+
+    The pool must only be used by one thread at a time.
+    Use :py:meth:`get_worker_pool` to get a pool per thread, e.g. on a dask worker.
+
+    Args:
+        objective_function_factory (callable):
+            Function without arguments that returns the objective function.
+            Serialized with cloudpickle, so it can be e.g. a closure or a partial.
+        n_workers (int): Number of worker processes.
+        batch_size (int): Number of parameter vectors that are sent to a worker at once.
+        max_retries (int): How often a parameter vector is evaluated again, if it crashes the worker.
+        mp_context (str, optional):
+            The multiprocessing start method, e.g. 'fork', 'forkserver' or 'spawn'.
+            Defaults to the default start method of the platform.
+
+    Attributes:
+        n_workers (int): Number of worker processes.
+        batch_size (int): Number of parameter vectors that are sent to a worker at once.
+        max_retries (int): How often a parameter vector is evaluated again, if it crashes the worker.
+    '''
+
+    def __init__(
+        self,
+        objective_function_factory,
+        n_workers=1,
+        batch_size=1,
+        max_retries=2,
+        mp_context=None):
+        assert n_workers >= 1
+        assert batch_size >= 1
+        self._objective_function_factory = cloudpickle.dumps(objective_function_factory)
+        self._context = multiprocessing.get_context(mp_context)
+        self.n_workers = n_workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self._workers = [None] * n_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        raise TypeError('A SimulationWorkerPool can not be pickled. Use get_worker_pool to create one in each process.')
+
+    def _start_worker(self, lv):
+        """Start the worker process :paramref:`lv`."""
+        parent_conn, child_conn = self._context.Pipe()
+        p = self._context.Process(
+            target=_worker_loop,
+            args=(child_conn, self._objective_function_factory))
+        p.daemon = True
+        with Undemonize():
+            p.start()
+        child_conn.close()
+        self._workers[lv] = (p, parent_conn)
+
+    def _stop_worker(self, lv, timeout=None):
+        """Stop the worker process :paramref:`lv`.
+
+        Args:
+            lv (int): Index of the worker.
+            timeout (float, optional):
+                Time to wait for the worker to finish its current batch and exit.
+                If None, the worker is terminated immediately.
+        """
+        if self._workers[lv] is None:
+            return
+        p, conn = self._workers[lv]
+        if timeout is not None and p.is_alive():
+            try:
+                conn.send(None)
+            except (OSError, ValueError):
+                pass
+            p.join(timeout)
+        if p.is_alive():
+            p.terminate()
+        p.join()
+        conn.close()
+        self._workers[lv] = None
+
+    def _is_alive(self, lv):
+        return self._workers[lv] is not None and self._workers[lv][0].is_alive()
+
+    def close(self, timeout=10):
+        """Stop all worker processes.
+
+        Args:
+            timeout (float): Time to wait for each worker to exit before it is terminated.
+        """
+        for lv in range(self.n_workers):
+            self._stop_worker(lv, timeout=timeout)
+
+    def imap_unordered(self, params_list):
+        """Evaluate parameter vectors, yielding the results as soon as their batch is done.
+
+        Args:
+            params_list (list): The parameter vectors.
+
+        Yields:
+            tuple: The index of the parameter vector in :paramref:`params_list`, and the return value of the objective function.
+
+        Raises:
+            RuntimeError: If the objective function raises an exception, or a parameter vector crashes the worker too often.
+        """
+        params_list = list(params_list)
+        pending = deque(
+            list(range(lv, min(lv + self.batch_size, len(params_list))))
+            for lv in range(0, len(params_list), self.batch_size))
+        n_crashes = {}
+        busy = {}
+        try:
+            while pending or busy:
+                for lv in range(self.n_workers):
+                    if lv in busy or not pending:
+                        continue
+                    if not self._is_alive(lv):
+                        self._stop_worker(lv)
+                        self._start_worker(lv)
+                    batch = pending.popleft()
+                    try:
+                        self._workers[lv][1].send([params_list[i] for i in batch])
+                    except (OSError, ValueError):
+                        # the worker died right after it has been started, e.g. in the objective function factory
+                        pass
+                    busy[lv] = batch
+                ready = multiprocessing.connection.wait(
+                    [self._workers[lv][1] for lv in busy] + [self._workers[lv][0].sentinel for lv in busy])
+                for lv in list(busy):
+                    p, conn = self._workers[lv]
+                    if not (conn in ready or p.sentinel in ready):
+                        continue
+                    batch = busy.pop(lv)
+                    try:
+                        status, payload = conn.recv()
+                    except (EOFError, OSError):
+                        self._handle_crash(lv, batch, pending, n_crashes, params_list)
+                        continue
+                    if status == 'done':
+                        for i, result in zip(batch, payload):
+                            yield i, result
+                    elif status == 'setup_error':
+                        raise RuntimeError('Could not set up the objective function in a worker process:\n' + payload)
+                    else:
+                        raise RuntimeError('The objective function raised an exception in a worker process:\n' + payload)
+        finally:
+            # workers that are still busy would send their results to the next call
+            for lv in busy:
+                self._stop_worker(lv)
+
+    def _handle_crash(self, lv, batch, pending, n_crashes, params_list):
+        """Restart a crashed worker and reschedule its batch.
+
+        Args:
+            lv (int): Index of the worker.
+            batch (list): Indices of the parameter vectors that the worker was evaluating.
+            pending (collections.deque): Batches that still need to be evaluated.
+            n_crashes (dict): How often each parameter vector crashed a worker.
+            params_list (list): The parameter vectors.
+        """
+        p = self._workers[lv][0]
+        p.join(1)
+        exitcode = p.exitcode
+        self._stop_worker(lv)
+        logger.warning('Worker process {} died with exit code {} while evaluating {} parameter vector(s). Restarting it.'.format(
+            lv, exitcode, len(batch)))
+        if len(batch) > 1:
+            # isolate the parameter vector that crashed the worker
+            pending.extendleft([i] for i in reversed(batch))
+            return
+        i = batch[0]
+        n_crashes[i] = n_crashes.get(i, 0) + 1
+        if n_crashes[i] > self.max_retries:
+            raise RuntimeError('Parameter vector {} crashed the worker process {} times (last exit code: {}). Parameters are: {}'.format(
+                i, n_crashes[i], exitcode, params_list[i]))
+        pending.appendleft(batch)
+
+    def map(self, params_list):
+        """Evaluate parameter vectors.
+
+        Args:
+            params_list (list): The parameter vectors.
+
+        Returns:
+            list: The return values of the objective function, in the order of :paramref:`params_list`.
+        """
+        params_list = list(params_list)
+        out = [None] * len(params_list)
+        for i, result in self.imap_unordered(params_list):
+            out[i] = result
+        return out
+
+
+_worker_pools = {}
+_worker_pools_lock = threading.Lock()
+
+
+def get_worker_pool_key(objective_function_factory, n_workers=1, **kwargs):
+    """Get the key under which :py:meth:`get_worker_pool` caches a pool.
+
+    Computing the key serializes :paramref:`objective_function_factory`.
+    If the same pool is requested repeatedly, compute the key once and pass it to :py:meth:`get_worker_pool`.
+
+    Args:
+        objective_function_factory (callable): See :py:class:`SimulationWorkerPool`.
+        n_workers (int): Number of worker processes.
+        **kwargs: Additional keyword arguments for :py:class:`SimulationWorkerPool`.
+
+    Returns:
+        str: The key.
+    """
+    return hashlib.sha1(cloudpickle.dumps(
+        (objective_function_factory, n_workers, sorted(kwargs.items())))).hexdigest()
+
+
+def get_worker_pool(objective_function_factory, n_workers=1, key=None, **kwargs):
+    """Get a :py:class:`SimulationWorkerPool` that is kept alive for the lifetime of the current thread.
+
+    Pools are cached per process, thread, objective function factory and configuration.
+    This allows to reuse the worker processes across e.g. dask tasks that run on the same dask worker.
+
+    Args:
+        objective_function_factory (callable): See :py:class:`SimulationWorkerPool`.
+        n_workers (int): Number of worker processes.
+        key (str, optional): 
+            The key of the pool, see :py:meth:`get_worker_pool_key`.
+            If None, it is computed from :paramref:`objective_function_factory`, :paramref:`n_workers` and :paramref:`kwargs`.
+        **kwargs: Additional keyword arguments for :py:class:`SimulationWorkerPool`.
+
+    Returns:
+        :py:class:`SimulationWorkerPool`: The worker pool.
+    """
+    if key is None:
+        key = get_worker_pool_key(objective_function_factory, n_workers=n_workers, **kwargs)
+    key = (multiprocessing.current_process().pid, threading.get_ident(), key)
+    with _worker_pools_lock:
+        if key not in _worker_pools:
+            _worker_pools[key] = SimulationWorkerPool(objective_function_factory, n_workers=n_workers, **kwargs)
+        return _worker_pools[key]
+
+
+def close_worker_pools():
+    """Stop all worker pools created with :py:meth:`get_worker_pool` in this process."""
+    with _worker_pools_lock:
+        for pool in _worker_pools.values():
+            pool.close()
+        _worker_pools.clear()
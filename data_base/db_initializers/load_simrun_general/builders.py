@@ -22,7 +22,8 @@ from .data_parsing import (
     load_dendritic_voltage_traces,
     read_voltage_traces_by_filenames,
 )
-from .file_handling import get_max_commas, make_filelist
+from .data_parsing import read_synapse_activation_from_npz as read_sa_npz
+from .file_handling import get_max_commas, get_max_commas_from_npz, make_filelist
 from .metadata_utils import create_metadata, get_voltage_traces_divisions_by_metadata
 from .param_file_parser import (
     _delayed_copy_transform_paramfiles_to_db,
@@ -108,9 +109,9 @@ def _build_synapse_activation(db, repartition=False, n_chunks=5000):
         None
     """
 
-    def template(key, paths, file_reader_fun, dumper):
+    def template(key, paths, file_reader_fun, dumper, max_commas_fun=get_max_commas):
         logging.info("counting commas")
-        max_commas = get_max_commas(paths) + 1
+        max_commas = max_commas_fun(paths) + 1
         # print max_commas
         logging.info("generate dataframe")
         path_sti_tuples = list(zip(paths, list(db["sim_trial_index"])))
@@ -142,12 +143,23 @@ def _build_synapse_activation(db, repartition=False, n_chunks=5000):
     if "synapses_file_name" in m.columns:
         logging.info("---building synapse activation dataframe---")
         paths = list(simresult_path + "/" + m.path + "/" + m.synapses_file_name)
-        template(
-            "synapse_activation",
-            paths,
-            dask.delayed(read_sa, traverse=False),
-            DEFAULT_DUMPER,
-        )
+        sidecar_paths = [scp.writer.get_synapse_activation_sidecar_path(p) for p in paths]
+        if all(os.path.exists(p) for p in sidecar_paths):
+            logging.info("reading binary synapse activation sidecars")
+            template(
+                "synapse_activation",
+                sidecar_paths,
+                dask.delayed(read_sa_npz, traverse=False),
+                DEFAULT_DUMPER,
+                max_commas_fun=get_max_commas_from_npz,
+            )
+        else:
+            template(
+                "synapse_activation",
+                paths,
+                dask.delayed(read_sa, traverse=False),
+                DEFAULT_DUMPER,
+            )
     if "cells_file_name" in m.columns:
         logging.info("---building cell activation dataframe---")
         paths = list(simresult_path + "/" + m.path + "/" + m.cells_file_name)
@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 
 from data_base.utils import chunkIt, unique
+from single_cell_parser.reader import read_synapse_activation_arrays
 
 
 @dask.delayed
@@ -121,6 +122,10 @@ def read_voltage_traces_from_csv(prefix, fname):
 def read_voltage_traces_from_npz(prefix, fname):
     """Reads a single :ref:`voltage_traces_npz_format` file as generated by the simrun package.
 
+    Files written by :py:meth:`~single_cell_parser.writer.write_all_traces_npz` contain the exact time axis
+    under the key ``t``, which is used as column labels.
+    Older files without this key are assumed to have been simulated with a fixed stepsize of 0.025 ms.
+
     Args:
         prefix (str): Path to the directory containing the simulation results.
         fname (str): Filename pointing to a voltage trace file. The file is expected to be in ``.npz`` format.
@@ -128,13 +133,16 @@ def read_voltage_traces_from_npz(prefix, fname):
     See also:
         :py:meth:`~data_base.db_initializers.load_simrun_general.read_voltage_traces_from_file`
     """
-    warnings.warn(
-        "You are loading voltage traces from npz files. This only works, if you are using a fixed stepsize of 0.025 ms"
-    )
-    data = np.load(os.path.join(prefix, fname))["arr_0"]
+    with np.load(os.path.join(prefix, fname)) as npz:
+        data = npz["arr_0"]
+        t = npz["t"] if "t" in npz.files else None
     data = np.transpose(data)
     vt = data[1:, :]
-    t = np.array([0.025 * n for n in range(data.shape[1])])
+    if t is None:
+        warnings.warn(
+            "You are loading voltage traces from npz files. This only works, if you are using a fixed stepsize of 0.025 ms"
+        )
+        t = np.array([0.025 * n for n in range(data.shape[1])])
     sim_trial_index_base = os.path.dirname(
         fname
     )  # os.path.dirname(os.path.relpath(prefix, fname))
@@ -189,34 +197,18 @@ def read_voltage_traces_by_filenames(prefix, fnames, divisions=None, repartition
     return ddf
 
 
-def load_dendritic_voltage_traces_helper(db, suffix, divisions=None, repartition=None):
-    """Read the dendritic voltage traces of a single recording site across multiple simulation trials.
-
-    This method constructs a list of all filenames corresponding to a single recording site and reads them in
-    using :py:meth:`~data_base.db_initializers.load_simrun_general.read_voltage_traces_by_filenames`.
+def _get_example_dendritic_voltage_traces_paths(db, suffix):
+    """Construct the path to the dendritic voltage traces of the first simulation run for all naming conventions.
 
     Args:
         db (:py:class:`~data_base.isf_data_base.isf_data_base.ISFDataBase`):
             The target database that should contain the parsed simulation results.
-        suffix (str):
-            The suffix of the dendritic voltage trace files.
-            This suffix is used to construct the filenames of the dendritic voltage trace files.
-        divisions (list):
-            List of divisions for the dask dataframe.
-            Default is ``None``, letting Dask handle it.
-        repartition (bool):
-            If True, the dask dataframe is repartitioned to 5000 partitions (only if it contains over :math:`10000` entries).
+        suffix (str): The suffix of the dendritic voltage trace files, including the file extension.
 
     Returns:
-        dask.DataFrame: A dask dataframe containing the dendritic voltage traces.
+        tuple: Example paths for the old, new-ish and brand new naming conventions, in that order.
     """
-    assert repartition is not None
     metadata = db["metadata"]
-    if not suffix.endswith(".csv"):
-        suffix = suffix + ".csv"
-    if not suffix.startswith("_"):
-        suffix = "_" + suffix
-    # print os.path.join(db['simresult_path'], m.iloc[0].path, m.iloc[0].path.split('_')[-1] + suffix)
     absolute_simresult_path = db['simresult_path']
     relative_simresult_path = metadata.iloc[0].path                 # e.g. results/20250101-1553_seed123456_pid0001
     example_pid = relative_simresult_path.split("_")[-1]            # e.g. pid7896
@@ -246,6 +238,54 @@ def load_dendritic_voltage_traces_helper(db, suffix, divisions=None, repartition
         + example_pid
         + suffix,
     )
+    return example_old_path, example_new_path, example_brand_new_path
+
+
+def _dendritic_voltage_traces_exist(db, suffix):
+    """Check if dendritic voltage traces with :paramref:`suffix` exist under any naming convention.
+
+    :skip-doc:
+    """
+    return any(
+        os.path.exists(p)
+        for p in _get_example_dendritic_voltage_traces_paths(db, suffix)
+    )
+
+
+def load_dendritic_voltage_traces_helper(db, suffix, divisions=None, repartition=None):
+    """Read the dendritic voltage traces of a single recording site across multiple simulation trials.
+
+    This method constructs a list of all filenames corresponding to a single recording site and reads them in
+    using :py:meth:`~data_base.db_initializers.load_simrun_general.read_voltage_traces_by_filenames`.
+
+    Args:
+        db (:py:class:`~data_base.isf_data_base.isf_data_base.ISFDataBase`):
+            The target database that should contain the parsed simulation results.
+        suffix (str):
+            The suffix of the dendritic voltage trace files.
+            This suffix is used to construct the filenames of the dendritic voltage trace files.
+        divisions (list):
+            List of divisions for the dask dataframe.
+            Default is ``None``, letting Dask handle it.
+        repartition (bool):
+            If True, the dask dataframe is repartitioned to 5000 partitions (only if it contains over :math:`10000` entries).
+
+    Returns:
+        dask.DataFrame: A dask dataframe containing the dendritic voltage traces.
+    """
+    assert repartition is not None
+    metadata = db["metadata"]
+    if not suffix.endswith((".csv", ".npz")):
+        suffix = suffix + ".csv"
+    if not suffix.startswith("_"):
+        suffix = "_" + suffix
+    # simulations may have written binary dendritic traces (see simrun's trace_format)
+    if suffix.endswith(".csv") and not _dendritic_voltage_traces_exist(db, suffix):
+        binary_suffix = suffix[: -len(".csv")] + ".npz"
+        if _dendritic_voltage_traces_exist(db, binary_suffix):
+            suffix = binary_suffix
+    example_old_path, example_new_path, example_brand_new_path = \
+        _get_example_dendritic_voltage_traces_paths(db, suffix)
 
     if os.path.exists(example_old_path):
         fnames = [
@@ -309,3 +349,69 @@ def load_dendritic_voltage_traces(db, suffix_key_dict, repartition=None):
             db, dend_vt_fn, divisions=divisions, repartition=repartition
         )
     return recsite_dendvt_dict
+
+
+def read_synapse_activation_from_npz(
+    path, 
+    sim_trial_index="no_sim_trial_assigned", 
+    max_commas=None, 
+    set_index=True
+    ):
+    """Reads binary synapse activation sidecars and parses them to a single pandas dataframe.
+
+    Binary counterpart of :py:meth:`~data_base.IO.roberts_formats.read_pandas_synapse_activation_from_roberts_format`.
+    The sidecars are written by :py:meth:`~single_cell_parser.writer.write_synapse_activation_file` if ``binary_sidecar=True``.
+    The resulting dataframe has the same layout as if the corresponding text files were parsed, but no text parsing is involved.
+
+    Args:
+        path (str | list): Path to a binary ``.npz`` synapse activation file, or a list of such paths.
+        sim_trial_index (str | list): The simulation trial index of each path.
+        max_commas (int): 
+            Maximum amount of delimiters across all files, plus one (see :py:meth:`~data_base.db_initializers.load_simrun_general.file_handling.get_max_commas_from_npz`). 
+            Determines the amount of activation time columns. 
+            Inferred from the data if not provided.
+        set_index (bool): If True, ``sim_trial_index`` is set as the index of the dataframe.
+
+    Returns:
+        pd.DataFrame: A :ref:`syn_activation_format` dataframe.
+    """
+    if isinstance(path, (list, tuple)):
+        assert isinstance(sim_trial_index, (list, tuple))
+    else:
+        path = [path]
+        sim_trial_index = [sim_trial_index]
+
+    arrays = [read_synapse_activation_arrays(p) for p in path]
+    if max_commas is None:
+        max_spikes = max(
+            [int(np.max(np.diff(a["activation_offsets"]), initial=0)) for a in arrays]
+        )
+        max_commas = max(7, 6 + max_spikes) + 1
+    n_time_columns = max_commas - 6
+
+    dfs = []
+    for a, sti in zip(arrays, sim_trial_index):
+        offsets = a["activation_offsets"]
+        n_spikes = np.diff(offsets)
+        times = np.full((len(n_spikes), n_time_columns), np.nan)
+        rows = np.repeat(np.arange(len(n_spikes)), n_spikes)
+        columns = np.arange(len(a["activation_times"])) - np.repeat(offsets[:-1], n_spikes)
+        times[rows, columns] = a["activation_times"]
+        df = pd.DataFrame(
+            {
+                "synapse_type": a["synapse_types"][a["synapse_type_codes"]].astype(object),
+                "synapse_ID": a["synapse_IDs"],
+                "soma_distance": a["soma_distances"],
+                "section_ID": a["section_IDs"],
+                "section_pt_ID": a["section_pt_IDs"],
+                "dendrite_label": a["dendrite_labels"][a["dendrite_label_codes"]].astype(object),
+            }
+        )
+        times = pd.DataFrame(times, columns=[str(c) for c in range(n_time_columns)])
+        df = pd.concat([df, times], axis=1)
+        df["sim_trial_index"] = sti
+        dfs.append(df)
+    df = pd.concat(dfs)
+    if set_index:
+        df.set_index("sim_trial_index", inplace=True)
+    return df
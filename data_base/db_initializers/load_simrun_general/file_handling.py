@@ -3,6 +3,7 @@ import logging
 import os
 
 import dask
+import numpy as np
 import scandir
 
 from data_base.IO.roberts_formats import _max_commas
@@ -112,3 +113,34 @@ def get_max_commas(paths):
     max_commas = [max_commas_in_chunk(chunk) for chunk in filepath_chunks]
     max_commas = dask.delayed(max_commas).compute()
     return max(max_commas)
+
+
+def get_max_commas_from_npz(paths):
+    """Get the maximum amount of delimiters across many synapse activation files from their binary sidecars.
+
+    Equivalent to :py:meth:`get_max_commas` for :ref:`syn_activation_format` files, but infers the amount of delimiters
+    from the activation offsets saved in the binary sidecars (see :py:meth:`~single_cell_parser.writer.write_synapse_activation_file`),
+    rather than counting them in the text files.
+
+    Args:
+        paths (list): List of paths to the binary ``.npz`` synapse activation sidecars.
+
+    Returns:
+        int: The maximum amount of delimiters across all files.
+    """
+
+    @dask.delayed
+    def max_spikes_in_chunk(filepaths):
+        n = 0
+        for path in filepaths:
+            with np.load(path) as npz:
+                offsets = npz["activation_offsets"]
+            if len(offsets) > 1:
+                n = max(n, int(np.max(np.diff(offsets))))
+        return n
+
+    filepath_chunks = chunkIt(paths, 3000)
+    max_spikes = [max_spikes_in_chunk(chunk) for chunk in filepath_chunks]
+    max_spikes = max(dask.delayed(max_spikes).compute())
+    # 6 tab delimiters and one comma per spike. The header line has 7 delimiters.
+    return max(7, 6 + max_spikes)
@@ -23,6 +23,7 @@ See also:
 
 import os
 # import cloudpickle
+import numpy as np
 import pandas as pd
 import dask
 import json
@@ -49,7 +50,7 @@ def check(obj):
 
 
 @dask.delayed
-def load_helper(savedir, n_partitions, partition, meta=None, columns=None):
+def load_helper(savedir, n_partitions, partition, meta=None, columns=None, filters=None):
     """Load a single partition of a dask dataframe from a parquet file
     
     Args:
@@ -58,18 +59,106 @@ def load_helper(savedir, n_partitions, partition, meta=None, columns=None):
         partition (int): Partition number
         meta (pandas.DataFrame): Meta information for the dask dataframe
         columns (list): Columns to load
+        filters (list): 
+            Row filters in the ``pyarrow`` format, e.g. ``[('sim_trial_index', 'in', [...])]``.
+            Row groups whose statistics can not match the filters are not read.
         
     Returns:
         dask.dataframe: Dask dataframe
     """
-    obj = pd.read_parquet(
-        os.path.join(savedir, 'pandas_to_parquet.{}.{}.parquet'.format(n_partitions, partition)),
-        columns=columns)
+    fname = os.path.join(savedir, 'pandas_to_parquet.{}.{}.parquet'.format(n_partitions, partition))
+    if filters:
+        obj = pd.read_parquet(fname, columns=columns, engine=ENGINE, filters=filters)
+    else:
+        obj = pd.read_parquet(fname, columns=columns)
     if meta is not None:
         set_object_meta(obj, meta = meta)
     return obj
 
 
+def _normalize_filters(filters):
+    """Convert filters to disjunctive normal form, i.e. a list of lists of ``(column, op, value)`` tuples."""
+    if not filters:
+        return []
+    if all(isinstance(f, tuple) for f in filters):
+        return [list(filters)]
+    return [list(conjunction) for conjunction in filters]
+
+
+def _sort_in_values(filters):
+    """Sort the values of ``in`` predicates, such that they can be matched against a partition with a binary search.
+    
+    Values that can not be sorted are kept as they are.
+    """
+    out = []
+    for conjunction in filters:
+        sorted_conjunction = []
+        for column, op, value in conjunction:
+            if op == 'in':
+                try:
+                    value = np.asarray(sorted(value))
+                except TypeError:
+                    pass
+            sorted_conjunction.append((column, op, value))
+        out.append(sorted_conjunction)
+    return out
+
+
+def _predicate_may_match(op, value, lower, upper):
+    """Check whether any index value within ``[lower, upper]`` can satisfy a predicate.
+    
+    The values of ``in`` predicates are expected to be sorted numpy arrays (see :py:meth:`_sort_in_values`).
+    Unknown operators and incomparable values are assumed to match.
+    """
+    try:
+        if op in ('=', '=='):
+            return lower <= value <= upper
+        if op == 'in':
+            if isinstance(value, np.ndarray):
+                # the smallest value that is >= lower must also be <= upper
+                i = np.searchsorted(value, lower, side='left')
+                return bool(i < len(value) and value[i] <= upper)
+            return any(lower <= v <= upper for v in value)
+        if op == '<':
+            return lower < value
+        if op == '<=':
+            return lower <= value
+        if op == '>':
+            return upper > value
+        if op == '>=':
+            return upper >= value
+    except TypeError:
+        pass
+    return True
+
+
+def _select_partitions(divisions, filters, index_name):
+    """Select the partitions that may contain rows matching the filters on the index.
+    
+    Partition ``i`` contains index values between ``divisions[i]`` and ``divisions[i+1]``.
+    Filters on other columns than the index are ignored here, as they can not be resolved with the divisions.
+    
+    Args:
+        divisions (tuple): Divisions of the dask dataframe.
+        filters (list): Row filters in disjunctive normal form.
+        index_name (str): Name of the index.
+        
+    Returns:
+        list: Indices of the partitions that may contain matching rows.
+    """
+    filters = _sort_in_values(filters)
+    selected = []
+    for partition in range(len(divisions) - 1):
+        lower, upper = divisions[partition], divisions[partition + 1]
+        if any(
+            all(
+                _predicate_may_match(op, value, lower, upper)
+                for column, op, value in conjunction
+                if column == index_name)
+            for conjunction in filters):
+            selected.append(partition)
+    return selected
+
 @dask.delayed
 def save_helper(savedir, delayed_df, n_partitions, partition):
     """Save a single partition of a dask dataframe to a parquet file
@@ -113,12 +202,21 @@ class Loader(parent_classes.Loader):
             "No meta information provided. \
             Column names, index labels, and index name (if it exists) will be inferred and in string format.")
         
-    def get(self, savedir, columns=None):
+    def get(self, savedir, columns=None, filters=None):
         """Load a dask dataframe from one or more parquet files.
         
+        Filters are pushed down to the parquet files:
+        if the divisions of the dataframe are known, partitions whose index range can not match filters on the index are skipped entirely.
+        Within the remaining partitions, only row groups whose statistics may match the filters are read.
+        
         Args:
             savedir (str): Directory where the parquet files are stored
             columns (list): Columns to load
+            filters (list): 
+                Row filters in the ``pyarrow`` format: a list of ``(column, op, value)`` tuples that are combined with AND,
+                or a list of such lists that are combined with OR.
+                Supported operators are ``==``, ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in`` and ``not in``.
+                The index can be filtered by its name, e.g. ``[('sim_trial_index', 'in', sim_trial_indices)]``.
             
         Returns:
             dask.dataframe: The loaded dask dataframe
@@ -129,18 +227,31 @@ class Loader(parent_classes.Loader):
         fnames = os.listdir(savedir)
         fnames = [f for f in fnames if 'pandas_to_parquet' in f]
         n_partitions = int(fnames[0].split('.')[1])
+        divisions = None
+        if os.path.exists(os.path.join(savedir, 'divisions.json')):
+            with open(os.path.join(savedir, 'divisions.json')) as f:
+                divisions = tuple(json.load(f))  # tuple for py3.9
+        
+        partitions = list(range(n_partitions))
+        filters = _normalize_filters(filters)
+        if filters and divisions is not None and None not in divisions:
+            index_name = self.meta.index.name if self.meta is not None else None
+            partitions = _select_partitions(divisions, filters, index_name) if index_name is not None else partitions
+            logger.info('Filters select {} of {} partitions'.format(len(partitions), n_partitions))
+            if not partitions:
+                # keep one partition, such that the filtered, empty dataframe has the correct columns and dtypes
+                partitions = [0]
+            # partition i contains index values between its own and the next selected partition's lower division
+            divisions = tuple(divisions[p] for p in partitions) + (divisions[partitions[-1] + 1],)
+        
         delayeds = [
-            load_helper(savedir, n_partitions, partition, meta=self.meta, columns=columns)
-            for partition in range(n_partitions)
+            load_helper(savedir, n_partitions, partition, meta=self.meta, columns=columns, filters=filters or None)
+            for partition in partitions
         ]
         ddf = dask.dataframe.from_delayed(delayeds, meta=self.meta)
-        if os.path.exists(os.path.join(savedir, 'divisions.json')):
-            with open(os.path.join(savedir, 'divisions.json')) as f:
-                divisions = json.load(f)
-                if isinstance(divisions, list):
-                    divisions = tuple(divisions)  # for py3.9
-                ddf.divisions = divisions
-                logger.info('Load dask dataframe with known divisions')
+        if divisions is not None:
+            ddf.divisions = divisions
+            logger.info('Load dask dataframe with known divisions')
         
         return ddf
 
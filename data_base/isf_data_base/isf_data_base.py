@@ -740,10 +740,18 @@ class ISFDataBase:
         Args:
             key (str): The key to get from the database.
             lock (Lock, optional): If you use file locking, provide the lock that grants access. Defaults to None.
-            **kwargs: Additional arguments to pass to the Loader.
+            **kwargs: 
+                Additional arguments to pass to the Loader.
+                E.g. dataframes saved with :py:mod:`~data_base.isf_data_base.IO.LoaderDumper.dask_to_parquet` accept
+                ``columns`` and ``filters``, which are pushed down to the parquet files,
+                such that only the requested columns and matching partitions and row groups are read.
 
         Returns:
             object: The object saved under ``db[key]``
+            
+        Example:
+        
+            >>> db.get('synapse_activation', filters=[('sim_trial_index', 'in', sim_trial_indices)], columns=['synapse_type', 'soma_distance'])
         """
         # this looks into the metadata.json, gets the name of the dumper, and loads this module form IO.LoaderDumper
         if self._is_legacy:
@@ -35,6 +35,7 @@ Example:
 '''
 
 from .data_extractor import (
+    ChunkedSpatiotemporalInput,
     DataExtractor_categorizedTemporalSynapseActivation,
     DataExtractor_spatiotemporalSynapseActivation,
     DataExtractor_daskDataframeColumn,
@@ -46,18 +47,23 @@ from .data_extractor import (
 
 from .solver import (
     _Solver,
-    Solver_COBYLA
+    Solver_COBYLA,
+    Solver_LBFGSB,
+    Solver_trustConstr,
+    Solver_Adam
 )
 
 from .reduced_model import (
-    RaisedCosineBasis,
     Rm,
     DataView,
     DataSplitEvaluation,
     get_n_workers_per_ip    
 )
 
+from .scheduler import optimize_all_splits_remote
+
 from .strategy import (
+    RaisedCosineBasis,
     Strategy_categorizedTemporalRaisedCosine,
     Strategy_spatiotemporalRaisedCosine,
     Strategy_ISIcutoff,
@@ -22,6 +22,9 @@ Depending on the reduced model object, the data extractors fetch data from the d
 These data extractors are specific to match a :py:class:`simrun.modular_reduced_model_inference.Strategy` object.
 For example, the spatiotemporal raised cosine strategy requires to bin the synapse activations spatiotemporally.
 This is then handled with the :py:class:`DataExtractor_spatiotemporalSynapseActivation` class.
+
+Data sets that do not fit in memory can be read in chunks of trials,
+see :py:class:`ChunkedSpatiotemporalInput`.
 """
 
 
@@ -49,20 +52,97 @@ class _DataExtractor(object):
         pass
 
 
+class ChunkedSpatiotemporalInput(object):
+    '''Spatiotemporal input patterns of the shape ``(trial, time, space)``, read in chunks of trials.
+    
+    The input patterns are never held in memory all at once. 
+    Instead, :py:meth:`iter_chunks` reads :paramref:`chunk_size` trials at a time from the underlying arrays.
+    This is only memory efficient if the underlying arrays are memory maps, 
+    e.g. ``.npy`` files loaded with ``numpy.load(path, mmap_mode='r')``, or arrays loaded from a 
+    :py:class:`~data_base.isf_data_base.IO.LoaderDumper.shared_numpy_store.SharedNumpyStore` with ``mode='memmap'``.
+    
+    :py:class:`~simrun.modular_reduced_model_inference.strategy.Strategy_spatiotemporalRaisedCosine` supports chunked input:
+    it projects each chunk onto its basis functions, so that only the projections need to fit in memory.
+    Other strategies raise a ``NotImplementedError`` for chunked input.
+    
+    Example:
+
+        >>> arrays = [numpy.load(f, mmap_mode='r') for f in files_sorted_by_soma_distance]  # each of shape (trial, time)
+        >>> sa = ChunkedSpatiotemporalInput([(arrays, None)], tmin=250, tmax=330, chunk_size=10000)
+        >>> sa.shape
+        (1000000, 80, 5)
+        >>> for chunk in sa.iter_chunks():
+        ...     chunk.shape
+        (10000, 80, 5)
+        ...
+    
+    Attributes:
+        sources (list): 
+            List of tuples ``(arrays, rows)``, one per database. 
+            ``arrays`` is a list of array-likes of shape ``(trial, time)``, one per spatial bin, sorted by soma distance.
+            ``rows`` are the selected trials, or None to select all trials.
+        tmin (int): First time bin.
+        tmax (int): Last time bin (exclusive).
+        chunk_size (int): Number of trials per chunk.
+    '''
+
+    def __init__(self, sources, tmin, tmax, chunk_size=10000):
+        self.sources = sources
+        self.tmin = tmin
+        self.tmax = tmax
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def _get_n_rows(arrays, rows):
+        return len(arrays[0]) if rows is None else len(rows)
+
+    @property
+    def shape(self):
+        """tuple: The shape ``(trial, time, space)`` of the input patterns."""
+        n_trials = sum(self._get_n_rows(arrays, rows) for arrays, rows in self.sources)
+        return n_trials, self.tmax - self.tmin, len(self.sources[0][0])
+
+    def __len__(self):
+        return self.shape[0]
+
+    def iter_chunks(self):
+        """Iterate over the input patterns in chunks of trials.
+        
+        Yields:
+            numpy.ndarray: Input patterns of the shape ``(chunk_size, time, space)``. The last chunk of each database may be smaller.
+        """
+        for arrays, rows in self.sources:
+            n_rows = self._get_n_rows(arrays, rows)
+            for start in range(0, n_rows, self.chunk_size):
+                stop = min(start + self.chunk_size, n_rows)
+                if rows is None:
+                    chunk = [a[start:stop, self.tmin:self.tmax] for a in arrays]
+                else:
+                    chunk = [a[rows[start:stop], self.tmin:self.tmax] for a in arrays]
+                yield numpy.dstack(chunk)
+
+
 class DataExtractor_spatiotemporalSynapseActivation(_DataExtractor):
     '''Extracts matrix of the shape ``(trial, time, space)`` from spatiotemporal synapse activation binning
     
     Attributes:
         key (tuple|str): key to access the data in the :py:class:`DataBase`
+        chunk_size (int):
+            If set, the input patterns are not loaded into memory, but read in chunks of this many trials.
+            See :py:class:`ChunkedSpatiotemporalInput`.
         data (dict): dictionary with groups as keys and spatiotemporal inputpatterns as keys.
     '''
 
-    def __init__(self, key):
+    def __init__(self, key, chunk_size=None):
         """
         Args:
             key (tuple|str): key to access the data in the :py:class:`DataBase`
+            chunk_size (int, optional):
+                If set, the input patterns are not loaded into memory, but read in chunks of this many trials.
+                See :py:class:`ChunkedSpatiotemporalInput`.
         """
         self.key = key
+        self.chunk_size = chunk_size
         self.data = None
 
     def setup(self, Rm):
@@ -168,6 +248,17 @@ class DataExtractor_spatiotemporalSynapseActivation(_DataExtractor):
         #         out = [db[key][k][:,self.tmax-self.width:self.tmax] for k in keys]
         #         out = numpy.dstack(out)
 
+        if self.chunk_size is not None:
+            sources = []
+            for m, single_db in enumerate(db):
+                keys = self.get_sorted_keys_by_group(group, db=single_db)
+                rows = self.selected_indices[m] if self.selected_indices is not None else None
+                sources.append(([single_db[key][k] for k in keys], rows))
+            out = ChunkedSpatiotemporalInput(
+                sources, self.tmax - self.width, self.tmax, chunk_size=self.chunk_size)
+            logger.info(out.shape)
+            return out
+
         outs = []
         for m, single_db in enumerate(db):
             keys = self.get_sorted_keys_by_group(group, db=single_db)
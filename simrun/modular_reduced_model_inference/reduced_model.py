@@ -32,6 +32,7 @@ Both the cost function and the free parameters are defined in the :py:class:`~si
 import numpy as np
 import pandas as pd
 from config.isf_logging import logger
+from .scheduler import optimize_all_splits_remote
 
 
 def get_n_workers_per_ip(workers, n):
@@ -181,15 +182,20 @@ class Rm(object):
         Each strategy implements different cost functions, depending on what to optimize for.
         However, they all implement a :py:meth:`get_score` method to evaluate the performance of the optimization.
         
+        With a dask client, all combinations of strategies, solvers and splits are submitted at once.
+        The data of each strategy is scattered to the workers only once, and the dask scheduler balances
+        the optimizations across the workers (see :py:meth:`~simrun.modular_reduced_model_inference.scheduler.optimize_all_splits_remote`).
+        
         Args:
             client (:py:class:`~dask.distributed.Client`): Dask client for remote optimization
-            n_workers (int): Amount of workers to use for remote optimization
+            n_workers (int): Amount of workers per machine to use for remote optimization. If None, use all workers.
             strategy_selection (list): List of strategy names to run. If None, run all strategies.
             
         See also:
             :py:mod:`simrun.modular_reduced_model_inference.strategy` for available strategies.
         
         """
+        solvers = []
         for strategy_name in sorted(self.strategies.keys()):
 
             # 1. Extract the strategy to apply
@@ -203,16 +209,21 @@ class Rm(object):
                 solver = strategy.solvers[solver_name]
                 if client is not None:
                     logger.info(
-                        'Starting remote optimization: strategy {} with solver {}'.format(strategy_name, solver_name))
-                    workers = client.scheduler_info()['workers'].keys()
-                    workers = get_n_workers_per_ip(workers, n_workers)
-                    solver.optimize_all_splits(client, workers=workers)
-                    self.results_remote = True
+                        'Scheduling remote optimization: strategy {} with solver {}'.format(strategy_name, solver_name))
+                    solvers.append(solver)
                 else:
                     logger.info(
                         'Starting local optimization: strategy {} with solver {}'.format(strategy_name, solver_name))
                     solver.optimize_all_splits()
 
+        if client is not None and solvers:
+            workers = list(client.scheduler_info()['workers'].keys())
+            workers = get_n_workers_per_ip(workers, n_workers)
+            results = optimize_all_splits_remote(client, solvers, workers=workers)
+            for solver, out in zip(solvers, results):
+                self.DataSplitEvaluation.add_result(solver, out)
+            self.results_remote = True
+
     def _gather_results(self, client):
         """Fetch the solver results from the dask scheduler.
         
@@ -437,9 +448,9 @@ class DataSplitEvaluation(object):
         runs_index = []
         
         for k, solver, x in zip(self.optimizer_results_keys, self.solvers, self.optimizer_results):
-            for split_name, xx in x.iteritems():
+            for split_name, xx in x.items():
                 split = self.splits[split_name]
-                for subsplit_name, subsplit in split.iteritems():
+                for subsplit_name, subsplit in split.items():
                     runs_index.append(k[2])
                     x_index.append(xx.x)
                     success_index.append(xx.success)
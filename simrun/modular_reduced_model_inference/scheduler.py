@@ -0,0 +1,151 @@
+# In Silico Framework
+# Copyright (C) 2025  Max Planck Institute for Neurobiology of Behavior - CAESAR
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# The full license text is also available in the LICENSE file in the root of this repository.
+
+"""Schedule the optimization of many strategies, solvers and splits on a dask cluster.
+
+Submitting :py:meth:`~simrun.modular_reduced_model_inference.solver._Solver.optimize` to a dask client
+serializes the data of the strategy (e.g. the basis vectors of :py:class:`~simrun.modular_reduced_model_inference.strategy.Strategy_spatiotemporalRaisedCosine`)
+with every single task.
+:py:meth:`optimize_all_splits_remote` instead scatters the data of each strategy once to all workers.
+Each task then only consists of the split indices, the initial guess and the solver configuration.
+All combinations of strategies, solvers and splits are submitted at once, so that the dask scheduler
+can balance them across all workers.
+"""
+
+import copy
+import numpy as np
+from .strategy import _Strategy
+
+
+class _RemoteStrategy(_Strategy):
+    """Lightweight copy of a strategy that only holds its score functions and labels.
+
+    Strategies reference their :py:class:`~simrun.modular_reduced_model_inference.reduced_model.DataView`,
+    and thus all data of the reduced model. This class only holds what is needed to optimize the strategy on a split,
+    see :py:meth:`_get_strategy_payload`.
+
+    Attributes:
+        name (str): The name of the original strategy.
+        y (array): The labels.
+    """
+
+    def __init__(self, name, _get_score, _get_score_and_vjp, y):
+        """
+        Args:
+            name (str): The name of the original strategy.
+            _get_score (callable): The ``_get_score`` method of the original strategy.
+            _get_score_and_vjp (callable | None): The ``_get_score_and_vjp`` method of the original strategy.
+            y (array): The labels.
+        """
+        _Strategy.__init__(self, name)
+        self._get_score = _get_score
+        self._get_score_and_vjp = _get_score_and_vjp
+        self.y = y
+        self.setup_done = True
+
+
+def _get_strategy_payload(strategy):
+    """Get the data that is needed to optimize a strategy.
+
+    The score functions do not depend on the split the strategy is currently set to,
+    as the split is sent along with each task (see :py:meth:`_optimize_split`).
+
+    Args:
+        strategy (:py:class:`~simrun.modular_reduced_model_inference.strategy._Strategy`): The strategy. Must be set up.
+
+    Returns:
+        tuple: The arguments of :py:class:`_RemoteStrategy`.
+    """
+    return strategy.name, strategy._get_score, strategy._get_score_and_vjp, strategy.y
+
+
+def _detach_solver(solver):
+    """Copy a solver without its strategy, so that it can be sent to a worker on its own.
+
+    Args:
+        solver (:py:class:`~simrun.modular_reduced_model_inference.solver._Solver`): The solver.
+
+    Returns:
+        :py:class:`~simrun.modular_reduced_model_inference.solver._Solver`: A shallow copy of the solver, without strategy.
+    """
+    solver = copy.copy(solver)
+    solver.strategy = None
+    solver.optimize = None
+    return solver
+
+
+def _optimize_split(payload, solver, split, x0):
+    """Optimize a strategy on a single split.
+
+    This function runs on the dask workers.
+
+    Args:
+        payload (tuple): The data of the strategy, see :py:meth:`_get_strategy_payload`.
+        solver (:py:class:`~simrun.modular_reduced_model_inference.solver._Solver`): A detached solver, see :py:meth:`_detach_solver`.
+        split (array): The indices of the training trials.
+        x0 (array): The initial guess.
+
+    Returns:
+        scipy.optimize.OptimizeResult: The optimization result.
+    """
+    strategy = _RemoteStrategy(*payload)
+    strategy.set_split(split, setup=False)
+    solver.strategy = strategy
+    solver._setup_optimizer()
+    return solver.optimize(x0=x0)
+
+
+def optimize_all_splits_remote(client, solvers, workers=None):
+    """Optimize the cost functions of all solvers on all splits on a dask cluster.
+
+    The data of each strategy is scattered to all :paramref:`workers` once.
+    Then, one task per combination of solver and split is submitted.
+
+    Args:
+        client (:py:class:`dask.distributed.Client`): A dask client object.
+        solvers (list):
+            List of :py:class:`~simrun.modular_reduced_model_inference.solver._Solver` objects.
+            Their strategies must be set up.
+        workers (list, optional): List of worker names. Tasks and data are restricted to these workers.
+
+    Returns:
+        list:
+            One dictionary per solver, with the split names as keys and futures of the optimization results as values.
+            This is the same format as the return value of :py:meth:`~simrun.modular_reduced_model_inference.solver._Solver.optimize_all_splits`.
+    """
+    workers = list(workers) if workers is not None else None
+    payloads = {}
+    out = []
+    for solver in solvers:
+        strategy = solver.strategy
+        if id(strategy) not in payloads:
+            # scatter a list, as tuples would be scattered element-wise
+            payloads[id(strategy)] = client.scatter(
+                [_get_strategy_payload(strategy)], broadcast=True, workers=workers, hash=False)[0]
+        detached_solver = _detach_solver(solver)
+        futures = {}
+        for name, split in sorted(strategy.DataSplitEvaluation.splits.items()):
+            futures[name] = client.submit(
+                _optimize_split,
+                payloads[id(strategy)],
+                detached_solver,
+                np.asarray(split['train']),
+                strategy._get_x0(),
+                workers=workers,
+                pure=False)
+        out.append(futures)
+    return out
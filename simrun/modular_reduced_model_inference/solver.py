@@ -21,12 +21,19 @@ This module implements solvers that can optimize a given cost function by adapti
 The cost function is usually defined by a :py:class:`~simrun.modular_reduced_model_inference.strategy._Strategy` object.
 
 Different solvers can be defined here, to provide different optimization schemes.
-Currently, we provide a :cite:t:`COBYLA` solver.
+Currently, we provide a :cite:t:`COBYLA` solver, which only needs the value of the objective function,
+and the gradient-based solvers :py:class:`Solver_LBFGSB` and :py:class:`Solver_trustConstr`.
+Gradient-based solvers need far fewer evaluations of the objective function, but only work with strategies that
+provide the gradient of their objective function (see :py:meth:`~simrun.modular_reduced_model_inference.strategy._Strategy._objective_and_gradient_static`).
+For very many trials, :py:class:`Solver_Adam` only evaluates the gradient on minibatches of trials.
 """
 
 
 from functools import partial
+import numpy
 import scipy.optimize
+from .strategy import convert_to_numpy
+from .scheduler import optimize_all_splits_remote
 
 class _Solver(object):
     """Solver base class
@@ -76,6 +83,9 @@ class _Solver(object):
     def optimize_all_splits(self, client=None, workers=None):
         """Optimize the cost function for all splits of the strategy.
         
+        If a dask client is given, the data of the strategy is scattered to the workers once,
+        and only the splits are sent with each task (see :py:meth:`~simrun.modular_reduced_model_inference.scheduler.optimize_all_splits_remote`).
+        
         Args:
             client (:py:class:`dask.distributed.Client`): A dask client object.
             workers (list): List of worker names. Passed to :py:meth:`dask.distributed.Client.submit`
@@ -86,13 +96,13 @@ class _Solver(object):
         See also:
             :py:meth:`~simrun.modular_reduced_model_inference.solver._Solver.optimize_one_split`
         """
-        out = {}
-        for name, split in self.strategy.DataSplitEvaluation.splits.iteritems():
-            x0 = self.strategy._get_x0()
-            self.strategy.set_split(split['train'])
-            if client:
-                out[name] = client.submit(self.optimize, x0=x0, workers=workers)
-            else:
+        if client:
+            out = optimize_all_splits_remote(client, [self], workers=workers)[0]
+        else:
+            out = {}
+            for name, split in self.strategy.DataSplitEvaluation.splits.items():
+                x0 = self.strategy._get_x0()
+                self.strategy.set_split(split['train'])
                 out[name] = self.optimize(x0=x0)
         self.strategy.DataSplitEvaluation.add_result(self, out)
         return out
@@ -182,3 +192,246 @@ class Solver_COBYLA(_Solver):
             method='COBYLA',
             options=dict(maxiter=maxiter, disp=True))
         return out
+
+
+class _GradientSolver(_Solver):
+    """Base class of solvers that use the gradient of the objective function.
+    
+    The strategy must provide its objective function and gradient in one pass,
+    see :py:meth:`~simrun.modular_reduced_model_inference.strategy._Strategy._objective_and_gradient_static`.
+    This objective function is a smooth surrogate of the AUROC score, which additionally depends on an intercept.
+    The intercept is optimized along with the parameters of the strategy, and is removed from the parameters ``x`` 
+    of the optimization result afterwards, so that results can be evaluated like those of :py:class:`Solver_COBYLA`.
+    It is available as the ``intercept`` attribute of the optimization result.
+    
+    Each child must set the :py:attr:`method` used by :py:meth:`scipy.optimize.minimize`.
+    
+    Attributes:
+        name (str): name of the solver
+        method (str): The optimization method, passed to :py:meth:`scipy.optimize.minimize`.
+        maxiter (int): Maximum number of iterations.
+        tol (float): Tolerance for termination, passed to :py:meth:`scipy.optimize.minimize`.
+        options (dict): Additional solver options, passed to :py:meth:`scipy.optimize.minimize`.
+        optimize (callable): The optimization function.
+    """
+    method = None
+
+    def __init__(self, name, maxiter=1000, tol=None, options=None):
+        """
+        Args:
+            name (str): name of the solver
+            maxiter (int): Maximum number of iterations. Default: 1000.
+            tol (float, optional): Tolerance for termination.
+            options (dict, optional): Additional solver options.
+        """
+        self.name = name
+        self.maxiter = maxiter
+        self.tol = tol
+        self.options = options
+
+        # set by _setup
+        self.strategy = None
+        self.optimize = None
+
+    def _setup_optimizer(self):
+        """Set up the optimization strategy.
+        
+        Raises:
+            ValueError: If the strategy does not provide the gradient of its objective function.
+        """
+        if self.strategy._objective_and_gradient is None:
+            raise ValueError(
+                "Strategy {} does not provide the gradient of its objective function. "
+                "Use a derivative-free solver such as Solver_COBYLA instead.".format(self.strategy.name))
+        self.optimize = partial(
+            self._optimize,
+            self.strategy._objective_and_gradient,
+            method=self.method,
+            maxiter=self.maxiter,
+            tol=self.tol,
+            options=self.options)
+
+    @staticmethod
+    def _optimize(_objective_and_gradient, method=None, maxiter=1000, tol=None, options=None, x0=None):
+        """Static optimization method.
+        
+        This method is the core optimizer. It minimizes :paramref:`_objective_and_gradient` using
+        :py:meth:`scipy.optimize.minimize` with the given :paramref:`method`.
+        
+        Args:
+            _objective_and_gradient (callable): 
+                A strategy-specific function returning the objective value and its gradient.
+            method (str): The optimization method.
+            maxiter (int): Maximum number of iterations.
+            tol (float, optional): Tolerance for termination.
+            options (dict, optional): Additional solver options.
+            x0 (array): The initial parameters of the strategy.
+            
+        Returns:
+            scipy.optimize.OptimizeResult: The optimization result, with the additional attribute ``intercept``.
+        """
+        # the intercept is initialized with 0
+        x0 = numpy.append(numpy.asarray(convert_to_numpy(x0), dtype='f8'), 0.)
+        options = dict(options or {}, maxiter=maxiter)
+        kwargs = {}
+        if method == 'trust-constr':
+            # approximate the Hessian from the gradients
+            kwargs['hess'] = scipy.optimize.BFGS()
+        out = scipy.optimize.minimize(
+            _objective_and_gradient,
+            x0,
+            jac=True,
+            method=method,
+            tol=tol,
+            options=options,
+            **kwargs)
+        out.intercept = out.x[-1]
+        out.x = out.x[:-1]
+        return out
+
+
+class Solver_LBFGSB(_GradientSolver):
+    """A limited-memory BFGS solver for reduced models.
+    
+    Uses :py:meth:`scipy.optimize.minimize` with ``method='L-BFGS-B'``.
+    
+    See also:
+        :py:class:`_GradientSolver` for the requirements on the strategy.
+    """
+    method = 'L-BFGS-B'
+
+
+class Solver_trustConstr(_GradientSolver):
+    """A trust-region solver for reduced models.
+    
+    Uses :py:meth:`scipy.optimize.minimize` with ``method='trust-constr'``,
+    and a BFGS approximation of the Hessian.
+    
+    See also:
+        :py:class:`_GradientSolver` for the requirements on the strategy.
+    """
+    method = 'trust-constr'
+
+
+class Solver_Adam(_GradientSolver):
+    """A minibatch solver for reduced models with many trials.
+    
+    Minimizes the objective function of :py:class:`_GradientSolver` with the Adam update rule :cite:`Kingma_Ba_2014`.
+    Each step only evaluates the objective function and its gradient on a minibatch of trials of the current split,
+    so that the cost of a step does not grow with the number of trials.
+    Trials are shuffled at the start of each epoch.
+    
+    See also:
+        :py:class:`_GradientSolver` for the requirements on the strategy.
+    
+    Attributes:
+        name (str): name of the solver
+        batch_size (int): Number of trials per minibatch.
+        n_epochs (int): Number of passes over all trials of the split.
+        learning_rate (float): Step size of the Adam update rule.
+        seed (int): Seed of the random number generator that shuffles the trials.
+        optimize (callable): The optimization function.
+    """
+
+    def __init__(self, name, batch_size=10000, n_epochs=10, learning_rate=0.01, seed=None):
+        """
+        Args:
+            name (str): name of the solver
+            batch_size (int): Number of trials per minibatch. Default: 10000.
+            n_epochs (int): Number of passes over all trials of the split. Default: 10.
+            learning_rate (float): Step size of the Adam update rule. Default: 0.01.
+            seed (int, optional): Seed of the random number generator that shuffles the trials.
+        """
+        self.name = name
+        self.batch_size = batch_size
+        self.n_epochs = n_epochs
+        self.learning_rate = learning_rate
+        self.seed = seed
+
+        # set by _setup
+        self.strategy = None
+        self.optimize = None
+
+    def _setup_optimizer(self):
+        """Set up the optimization strategy.
+        
+        Raises:
+            ValueError: If the strategy does not provide the gradient of its objective function.
+        """
+        if self.strategy._objective_and_gradient is None:
+            raise ValueError(
+                "Strategy {} does not provide the gradient of its objective function. "
+                "Use a derivative-free solver such as Solver_COBYLA instead.".format(self.strategy.name))
+        self.optimize = partial(
+            self._optimize,
+            self.strategy._objective_and_gradient,
+            n_trials=len(self.strategy.get_y()),
+            batch_size=self.batch_size,
+            n_epochs=self.n_epochs,
+            learning_rate=self.learning_rate,
+            seed=self.seed)
+
+    @staticmethod
+    def _optimize(
+        _objective_and_gradient, 
+        n_trials=None, 
+        batch_size=10000, 
+        n_epochs=10, 
+        learning_rate=0.01, 
+        seed=None, 
+        x0=None,
+        beta1=0.9, 
+        beta2=0.999, 
+        eps=1e-8):
+        """Static optimization method.
+        
+        Args:
+            _objective_and_gradient (callable): 
+                A strategy-specific function returning the objective value and its gradient.
+                Takes the keyword argument ``batch``, the indices of the trials of the current minibatch.
+            n_trials (int): Number of trials in the current split.
+            batch_size (int): Number of trials per minibatch.
+            n_epochs (int): Number of passes over all trials.
+            learning_rate (float): Step size.
+            seed (int, optional): Seed of the random number generator that shuffles the trials.
+            x0 (array): The initial parameters of the strategy.
+            beta1 (float): Decay rate of the first moment estimate.
+            beta2 (float): Decay rate of the second moment estimate.
+            eps (float): Regularization of the second moment estimate.
+            
+        Returns:
+            scipy.optimize.OptimizeResult: 
+                The optimization result, with the additional attributes ``intercept`` and ``loss_per_epoch``,
+                the mean minibatch loss of each epoch.
+        """
+        rng = numpy.random.default_rng(seed)
+        # the intercept is initialized with 0
+        x = numpy.append(numpy.asarray(convert_to_numpy(x0), dtype='f8'), 0.)
+        m = numpy.zeros_like(x)
+        v = numpy.zeros_like(x)
+        n_steps = 0
+        loss_per_epoch = []
+        for _ in range(n_epochs):
+            permutation = rng.permutation(n_trials)
+            losses = []
+            for start in range(0, n_trials, batch_size):
+                # sorted indices keep the memory access of the strategies contiguous
+                batch = numpy.sort(permutation[start:start + batch_size])
+                loss, gradient = _objective_and_gradient(x, batch=batch)
+                n_steps += 1
+                m = beta1 * m + (1 - beta1) * gradient
+                v = beta2 * v + (1 - beta2) * gradient**2
+                m_hat = m / (1 - beta1**n_steps)
+                v_hat = v / (1 - beta2**n_steps)
+                x = x - learning_rate * m_hat / (numpy.sqrt(v_hat) + eps)
+                losses.append(loss * len(batch))
+            loss_per_epoch.append(sum(losses) / n_trials)
+        out = scipy.optimize.OptimizeResult(
+            x=x[:-1],
+            intercept=x[-1],
+            fun=loss_per_epoch[-1] if loss_per_epoch else None,
+            nit=n_steps,
+            success=True,
+            message='Maximum number of epochs reached.',
+            loss_per_epoch=loss_per_epoch)
+        return out
@@ -131,6 +131,12 @@ class _Strategy(object):
     These are used here to construct :py:meth:`~simrun.modular_reduced_model_inference._Strategy.get_score`.
     It is this `get_score` method that is optimized during optimization.
     
+    Child classes whose score is differentiable with respect to :math:`\mathbf{x}` can additionally implement 
+    a ``_get_score_and_vjp`` method. It returns the score, and a function that multiplies a vector with the transposed
+    Jacobian of the score (vector-Jacobian product). Such strategies provide a smooth objective function and its gradient
+    in one pass (see :py:meth:`_objective_and_gradient_static`), which is used by gradient-based solvers
+    such as :py:class:`~simrun.modular_reduced_model_inference.solver.Solver_LBFGSB`.
+    
     As a function of the parameters, compute a value for each trial.
     The optimizer will optimize for this value (highest AUROC score)
     
@@ -158,6 +164,9 @@ class _Strategy(object):
         self.get_y = None
         self.get_score = None
         self._objective_function = None
+        self._get_score_and_vjp = None
+        self.get_score_and_vjp = None
+        self._objective_and_gradient = None
         
     def _get_score(self, x):
         """Compute the score for the given parameters x.
@@ -193,6 +202,10 @@ class _Strategy(object):
         self.get_y = partial(self.get_y_static, self.y)
         self.get_score = partial(self.get_score_static, self._get_score)
         self._objective_function = partial(self._objective_function_static, self.get_score, self.get_y)
+        if self._get_score_and_vjp is not None:
+            self.get_score_and_vjp = partial(self.get_score_and_vjp_static, self._get_score_and_vjp)
+            self._objective_and_gradient = partial(
+                self._objective_and_gradient_static, self.get_score_and_vjp, self.get_y)
         self.setup_done = True
 
     def _setup(self):
@@ -246,9 +259,18 @@ class _Strategy(object):
             self._objective_function_static,
             self.get_score, 
             self.get_y)
+        if self._get_score_and_vjp is not None:
+            self.get_score_and_vjp = partial(
+                self.get_score_and_vjp_static,
+                self._get_score_and_vjp,
+                cupy_split=cupy_split)
+            self._objective_and_gradient = partial(
+                self._objective_and_gradient_static,
+                self.get_score_and_vjp,
+                self.get_y)
         if setup:
             for solver in self.solvers.values():
-                solver._setup()
+                solver._setup_optimizer()
         return self
 
     @staticmethod
@@ -307,6 +329,76 @@ class _Strategy(object):
         y = get_y()
         return -1 * sklearn.metrics.roc_auc_score(y, convert_to_numpy(s))
 
+    @staticmethod
+    def get_score_and_vjp_static(_get_score_and_vjp, x, cupy_split=None, batch=None):
+        """Convert the strategy-specific ``_get_score_and_vjp`` method to a static method.
+        
+        Args:
+            _get_score_and_vjp (callable): 
+                The strategy-specific ``_get_score_and_vjp`` method.
+                Takes the keyword argument ``trials``, to only compute the score of a subset of trials.
+            x (array): The input array.
+            cupy_split (array): The array splits.
+            batch (array, optional): 
+                Only compute the score of these trials, e.g. for a minibatch. 
+                Indices refer to the trials of the split, not to all trials.
+            
+        Returns:
+            tuple: The score, and the vector-Jacobian product of the score with respect to :paramref:`x`.
+        """
+        x = np.array(x).astype('f4')
+        if batch is not None:
+            batch = np.asarray(batch)
+            trials = batch if cupy_split is None else dereference(cupy_split)[batch]
+            return _get_score_and_vjp(x, trials=trials)
+        score, vjp = _get_score_and_vjp(x)
+        if cupy_split is None:
+            return score, vjp
+        split = dereference(cupy_split)
+
+        def vjp_split(r):
+            r_all = np.zeros(len(score), dtype=r.dtype)
+            r_all[split] = r
+            return vjp(r_all)
+
+        return score[split], vjp_split
+
+    @staticmethod
+    def _objective_and_gradient_static(get_score, get_y, x, batch=None):
+        """Compute a smooth objective value and its gradient for the given parameters x.
+        
+        The AUROC score of :py:meth:`_objective_function_static` is piecewise constant in :math:`\mathbf{x}`.
+        Gradient-based solvers instead minimize the mean logistic loss of predicting the labels from the score:
+        
+        .. math::
+        
+            L(\mathbf{x}, b) = \frac{1}{N} \sum_n \log(1 + e^{s_n(\mathbf{x}) + b}) - y_n (s_n(\mathbf{x}) + b)
+        
+        where :math:`b` is an intercept. 
+        As the AUROC score does not change if a constant is added to the score, the intercept is only needed during optimization.
+        
+        Args:
+            get_score (callable): Returns the score and its vector-Jacobian product, see :py:meth:`get_score_and_vjp_static`.
+            get_y (callable): Returns the labels.
+            x (array): The parameters of the strategy, followed by the intercept :math:`b`.
+            batch (array, optional): 
+                Only evaluate the objective function on these trials of the split, e.g. for minibatch optimization.
+            
+        Returns:
+            tuple: The objective value, and its gradient with respect to :paramref:`x`.
+        """
+        s, vjp = get_score(x[:-1], batch=batch)
+        y = get_y()
+        if batch is not None:
+            y = y[batch]
+        y = np.array(y).astype('f8')
+        z = s.astype('f8') + float(x[-1])
+        loss = np.mean(np.logaddexp(0, z) - y * z)
+        # derivative of the loss with respect to the score: sigmoid(z) - y
+        r = ((0.5 * (1 + np.tanh(0.5 * z)) - y) / len(z)).astype('f4')
+        gradient = np.concatenate([vjp(r).ravel(), r.sum().reshape(1)])
+        return float(loss), convert_to_numpy(gradient).astype('f8')
+
 
     def add_solver(self, solver, setup=True):
         """Add a solver to the strategy.
@@ -338,10 +430,13 @@ class Strategy_categorizedTemporalRaisedCosine(_Strategy):
     def _setup(self):
         self.compute_basis()
         self.groups = sorted(self.base_vectors_arrays_dict.keys())
-        self.len_t, self.len_trials = self.base_vectors_arrays_dict.values()[0].shape
+        self.len_t, self.len_trials = list(self.base_vectors_arrays_dict.values())[0].shape
         self._get_score = partial(
             self._get_score_static,
             self.base_vectors_arrays_dict)
+        self._get_score_and_vjp = partial(
+            self._get_score_and_vjp_static,
+            self.base_vectors_arrays_dict)
 
     def compute_basis(self):
         '''computes_base_vector_array with shape (spatial, temporal, trials)'''
@@ -349,7 +444,7 @@ class Strategy_categorizedTemporalRaisedCosine(_Strategy):
         stSa_dict = self.data['categorizedTemporalSa']
         base_vectors_arrays_dict = {}
 
-        for group, tSa in stSa_dict.iteritems():
+        for group, tSa in stSa_dict.items():
             len_trials, len_t = tSa.shape
             base_vector_rows = []
             for t in self.RaisedCosineBasis_temporal.compute(len_t).get():
@@ -374,6 +469,23 @@ class Strategy_categorizedTemporalRaisedCosine(_Strategy):
             outs.append(out)
         return np.vstack(outs).sum(axis=0)
 
+    @staticmethod
+    def _get_score_and_vjp_static(base_vectors_arrays_dict, x, trials=None):
+        keys = sorted(base_vectors_arrays_dict.keys())
+        if trials is not None:
+            base_vectors_arrays_dict = {
+                group: dereference(array)[:, trials]
+                for group, array in base_vectors_arrays_dict.items()}
+        score = Strategy_categorizedTemporalRaisedCosine._get_score_static(base_vectors_arrays_dict, x)
+
+        def vjp(r):
+            # the score is linear in x
+            return np.concatenate([
+                np.dot(dereference(base_vectors_arrays_dict[group]), r).ravel()
+                for group in keys])
+
+        return score, vjp
+
 
 class Strategy_ISIcutoff(_Strategy):
     """:skip-doc:"""
@@ -635,6 +747,7 @@ class Strategy_ISIraisedCosine(_Strategy):
         ISI = ISI.astype(int) - 1
         self.ISI = make_weakref(np.array(ISI))
         self._get_score = partial(self._get_score_static, self.RaisedCosineBasis_postspike, self.ISI)
+        self._get_score_and_vjp = partial(self._get_score_and_vjp_static, self.RaisedCosineBasis_postspike, self.ISI)
 
     def _get_x0(self):
         """Get an initial guess for the learnable weights of the basis functions :math:`\mathbf{x}`.
@@ -658,6 +771,20 @@ class Strategy_ISIraisedCosine(_Strategy):
         kernel = RaisedCosineBasis_postspike.get_superposition(x)
         return kernel[dereference(ISI)]
 
+    @staticmethod
+    def _get_score_and_vjp_static(RaisedCosineBasis_postspike, ISI, x, trials=None):
+        if trials is not None:
+            ISI = dereference(ISI)[trials]
+        score = Strategy_ISIraisedCosine._get_score_static(RaisedCosineBasis_postspike, ISI, x)
+        basis = np.array(RaisedCosineBasis_postspike.get())
+
+        def vjp(r):
+            # sum r per kernel bin, then project onto the basis functions
+            r_per_bin = np.bincount(dereference(ISI) % basis.shape[1], weights=r, minlength=basis.shape[1])
+            return np.dot(basis, r_per_bin.astype('f4'))
+
+        return score, vjp
+
     def visualize(self, optimizer_output, normalize=True, only_succesful=True):
         fig = plt.figure()
         ax = fig.add_subplot(111)
@@ -722,9 +849,10 @@ class Strategy_spatiotemporalRaisedCosine(_Strategy):
         """
         self.compute_basis()
         self.groups = sorted(self.base_vectors_arrays_dict.keys())
-        self.len_z, self.len_t, self.len_trials = self.base_vectors_arrays_dict.values()[0].shape
+        self.len_z, self.len_t, self.len_trials = list(self.base_vectors_arrays_dict.values())[0].shape
         self.convert_x = partial(self._convert_x_static, self.groups, self.len_z)
         self._get_score = partial(self._get_score_static, self.convert_x, self.base_vectors_arrays_dict)
+        self._get_score_and_vjp = partial(self._get_score_and_vjp_static, self.convert_x, self.base_vectors_arrays_dict)
 
     def compute_basis(self):
         r'''Compute the basis vectors for the dataset.
@@ -750,28 +878,36 @@ class Strategy_spatiotemporalRaisedCosine(_Strategy):
         def _compute_base_vector_array(spatiotemp_SA):
             r"""
             Args:
-                spatiotemp_SA (array): The spatiotemporal synaptic activation patterns of shape :math:`(n_trials, dim(\mathbf{f}(\\tau)), dim(\mathbf{g}(z)))`.
+                spatiotemp_SA (array | :py:class:`~simrun.modular_reduced_model_inference.data_extractor.ChunkedSpatiotemporalInput`): 
+                    The spatiotemporal synaptic activation patterns of shape :math:`(n_trials, dim(\mathbf{f}(\\tau)), dim(\mathbf{g}(z)))`.
+                    Chunked input patterns are projected onto the basis functions one chunk at a time.
                 
             Returns:
-                array: The basis vector array of shape :math:`(n_trials, dim(\mathbf{f}(\\tau)), dim(\mathbf{g}(z)))`.
+                array: The basis vector array of shape :math:`(dim(\mathbf{g}(z)), dim(\mathbf{f}(\\tau)), n_trials)`.
             """
-            _, time_domain, space_domain = spatiotemp_SA.shape
+            n_trials, time_domain, space_domain = spatiotemp_SA.shape
             self.RaisedCosineBasis_spatial.compute(space_domain)
             self.RaisedCosineBasis_temporal.compute(time_domain)
-            spatial_basis_functions = self.RaisedCosineBasis_spatial.get()  # len(x) x domain
-            temporal_basis_functions = self.RaisedCosineBasis_temporal.get()
-            base_vector_array = []
-            for f_z_i in spatial_basis_functions:
-                base_vector_row = []
-                for f_t_i in temporal_basis_functions:
-                    base_vector_row.append(np.dot(np.dot(spatiotemp_SA, f_z_i), f_t_i))
-                base_vector_array.append(base_vector_row)
-            return np.array(base_vector_array).astype('f4')
+            spatial_basis_functions = np.array(
+                [dereference(f) for f in self.RaisedCosineBasis_spatial.get()])  # len(x) x domain
+            temporal_basis_functions = np.array(
+                [dereference(f) for f in self.RaisedCosineBasis_temporal.get()])
+            base_vector_array = np.empty(
+                (len(spatial_basis_functions), len(temporal_basis_functions), n_trials), dtype='f4')
+            chunks = spatiotemp_SA.iter_chunks() if hasattr(spatiotemp_SA, 'iter_chunks') else [spatiotemp_SA]
+            start = 0
+            for chunk in chunks:
+                chunk = np.asarray(chunk)
+                projection = np.tensordot(chunk, spatial_basis_functions, axes=(2, 1))  # shape: (n_chunk, time, len_z)
+                projection = np.tensordot(projection, temporal_basis_functions, axes=(1, 1))  # shape: (n_chunk, len_z, len_t)
+                base_vector_array[:, :, start:start + len(chunk)] = projection.transpose(1, 2, 0)
+                start += len(chunk)
+            return base_vector_array
 
         base_vectors_arrays_dict = {}
-        for group, spatiotemp_SA in self.data['spatiotemporalSa'].iteritems():
+        for group, spatiotemp_SA in self.data['spatiotemporalSa'].items():
             base_vector_array = _compute_base_vector_array(spatiotemp_SA)
-            base_vectors_arrays_dict[group] = make_weakref(np.array(np.array(base_vector_array).astype('f4')))
+            base_vectors_arrays_dict[group] = make_weakref(base_vector_array)
         self.base_vectors_arrays_dict = base_vectors_arrays_dict
 
     def _get_x0(self):
@@ -817,7 +953,7 @@ class Strategy_spatiotemporalRaisedCosine(_Strategy):
         """
         len_groups = len(groups)
         out = {}
-        x = x.reshape(len_groups, len(x) / len_groups)
+        x = x.reshape(len_groups, len(x) // len_groups)
         for lv, group in enumerate(groups):
             x_z = x[lv, :len_z]
             x_t = x[lv, len_z:]
@@ -852,7 +988,7 @@ class Strategy_spatiotemporalRaisedCosine(_Strategy):
             array: The weighted net input :math:`WNI(t)` of length ``n_trials``.
         """
         outs = []
-        for group, (x_z, x_t) in convert_x(x).iteritems():
+        for group, (x_z, x_t) in convert_x(x).items():
             array = base_vectors_arrays_dict[group]  # shape: (len_z, len_t, n_trials)
             time_weighed_input = np.dot(dereference(x_t), dereference(array)).squeeze()
             spacetime_weighed_input = np.dot(dereference(x_z), dereference(time_weighed_input)).squeeze()
@@ -860,6 +996,43 @@ class Strategy_spatiotemporalRaisedCosine(_Strategy):
         wni = np.vstack(outs).sum(axis=0)
         return wni  # shape: (n_trials,)
 
+    @staticmethod
+    def _get_score_and_vjp_static(convert_x, base_vectors_arrays_dict, x, trials=None):
+        r"""Calculate the weighted net input :math:`WNI(t)`, and its vector-Jacobian product.
+        
+        The weighted net input is bilinear in the spatial weights :math:`\mathbf{y}` and temporal weights :math:`\mathbf{x}`
+        of each group: :math:`WNI = \sum_{groups} \mathbf{y}^T \mathbf{B} \mathbf{x}`, with :math:`\mathbf{B}` the basis vectors of the group.
+        Multiplying a vector :math:`\mathbf{r}` over trials with the transposed Jacobian thus only requires 
+        contracting the basis vectors with :math:`\mathbf{r}` once: :math:`\mathbf{M} = \mathbf{B} \cdot \mathbf{r}`,
+        which yields the gradients :math:`\mathbf{M} \mathbf{x}` and :math:`\mathbf{y}^T \mathbf{M}`.
+        
+        Args:
+            convert_x (callable): The conversion function from the learnable weights to the basis vectors.
+            base_vectors_arrays_dict (dict): The dictionary of basis vectors for each group.
+            x (array): The learnable weights :math:`\mathbf{x}` and :math:`\mathbf{y}` as a single array.
+            trials (array, optional): Only compute the weighted net input of these trials, e.g. for a minibatch.
+            
+        Returns:
+            tuple: The weighted net input :math:`WNI(t)` of length ``n_trials``, and the vector-Jacobian product.
+        """
+        if trials is not None:
+            base_vectors_arrays_dict = {
+                group: dereference(array)[:, :, trials]
+                for group, array in base_vectors_arrays_dict.items()}
+        x_dict = convert_x(x)
+        groups = sorted(x_dict.keys())
+        score = Strategy_spatiotemporalRaisedCosine._get_score_static(convert_x, base_vectors_arrays_dict, x)
+
+        def vjp(r):
+            gradients = []
+            for group in groups:
+                x_z, x_t = x_dict[group]
+                M = np.dot(dereference(base_vectors_arrays_dict[group]), r)  # shape: (len_z, len_t)
+                gradients.extend([np.dot(M, x_t), np.dot(x_z, M)])
+            return np.concatenate(gradients)
+
+        return score, vjp
+
     def normalize(self, x, flipkey=None):
         '''Normalize the kernel basis functions such that sum of all absolute values of all kernels is 1.
         
@@ -965,23 +1138,32 @@ class Strategy_temporalRaisedCosine_spatial_cutoff(_Strategy):
         name, 
         RaisedCosineBasis_spatial,
         RaisedCosineBasis_temporal):
-        super(Strategy_spatiotemporalRaisedCosine, self).__init__(name)
+        super(Strategy_temporalRaisedCosine_spatial_cutoff, self).__init__(name)
         self.RaisedCosineBasis_spatial = RaisedCosineBasis_spatial
         self.RaisedCosineBasis_temporal = RaisedCosineBasis_temporal
 
     def _setup(self):
         self.compute_basis()
         self.groups = sorted(self.base_vectors_arrays_dict.keys())
-        self.len_z, self.len_t, self.len_trials = self.base_vectors_arrays_dict.values()[0].shape
+        self.len_z, self.len_t, self.len_trials = list(self.base_vectors_arrays_dict.values())[0].shape
         self.convert_x = partial(self._convert_x_static, self.groups, self.len_z)
         self._get_score = partial(self._get_score_static, self.convert_x, self.base_vectors_arrays_dict)
+        self._get_score_and_vjp = partial(self._get_score_and_vjp_static, self.convert_x, self.base_vectors_arrays_dict)
 
     def compute_basis(self):
-        '''computes_base_vector_array with shape (spatial, temporal, trials)'''
+        '''computes_base_vector_array with shape (spatial, temporal, trials)
+        
+        Raises:
+            NotImplementedError: If the input patterns are read in chunks, see :py:class:`~simrun.modular_reduced_model_inference.data_extractor.ChunkedSpatiotemporalInput`.
+        '''
         st = self.data['st']
         stSa_dict = self.data['spatiotemporalSa']
         base_vectors_arrays_dict = {}
-        for group, stSa in stSa_dict.iteritems():
+        for group, stSa in stSa_dict.items():
+            if hasattr(stSa, 'iter_chunks'):
+                raise NotImplementedError(
+                    "Strategy {} does not support chunked input patterns. "
+                    "Extract the input patterns without chunk_size, or use Strategy_spatiotemporalRaisedCosine instead.".format(self.name))
             len_trials, len_t, len_z = stSa.shape
             base_vector_array = []
             for z in self.RaisedCosineBasis_spatial.compute(len_z).get():
@@ -1001,7 +1183,7 @@ class Strategy_temporalRaisedCosine_spatial_cutoff(_Strategy):
     def _convert_x_static(groups, len_z, x):
         len_groups = len(groups)
         out = {}
-        x = x.reshape(len_groups, len(x) / len_groups)
+        x = x.reshape(len_groups, len(x) // len_groups)
         for lv, group in enumerate(groups):
             x_z = x[lv, :len_z]
             x_t = x[lv, len_z:]
@@ -1011,13 +1193,19 @@ class Strategy_temporalRaisedCosine_spatial_cutoff(_Strategy):
     @staticmethod
     def _get_score_static(convert_x, base_vectors_arrays_dict, x):
         outs = []
-        for group, (x_z, x_t) in convert_x(x).iteritems():
+        for group, (x_z, x_t) in convert_x(x).items():
             array = base_vectors_arrays_dict[group]
             out = np.dot(dereference(x_t), dereference(array)).squeeze()
             out = np.dot(dereference(x_z), dereference(out)).squeeze()
             outs.append(out)
         return np.vstack(outs).sum(axis=0)
 
+    @staticmethod
+    def _get_score_and_vjp_static(convert_x, base_vectors_arrays_dict, x, trials=None):
+        """See :py:meth:`Strategy_spatiotemporalRaisedCosine._get_score_and_vjp_static`."""
+        return Strategy_spatiotemporalRaisedCosine._get_score_and_vjp_static(
+            convert_x, base_vectors_arrays_dict, x, trials=trials)
+
     def normalize(self, x, flipkey=None):
         '''normalize such that exc and inh peak is at 1 and -1, respectively.
         normalize, such that sum of all absolute values of all kernels is 1'''
@@ -1090,6 +1278,7 @@ class Strategy_linearCombinationOfData(_Strategy):
     def _setup(self):
         self.data_values = np.array([self.data[k] for k in self.data_keys])
         self._get_score = partial(self._get_score_static, self.data_values)
+        self._get_score_and_vjp = partial(self._get_score_and_vjp_static, self.data_values)
 
     def _get_x0(self):
         return np.random.rand(len(self.data_keys)) * 2 - 1
@@ -1098,6 +1287,12 @@ class Strategy_linearCombinationOfData(_Strategy):
     def _get_score_static(data_values, x):
         return np.dot(data_values.T, x)
 
+    @staticmethod
+    def _get_score_and_vjp_static(data_values, x, trials=None):
+        if trials is not None:
+            data_values = data_values[:, trials]
+        return np.dot(data_values.T, x), partial(np.dot, data_values)
+
 
 class CombineStrategies_sum(_Strategy):
     """Combine multiple strategies by summing together their cost function.
@@ -1111,10 +1306,13 @@ class CombineStrategies_sum(_Strategy):
         self.split = None
 
     def setup(self, data, DataSplitEvaluation):
-        super(CombineStrategies_sum, self).setup(data, DataSplitEvaluation)
+        if self.setup_done:
+            return
+        # the combined score functions can only be set up once the individual strategies are set up
         for s in self.strategies:
             s.setup(data, DataSplitEvaluation)
             self.lens.append(len(s._get_x0()))
+        super(CombineStrategies_sum, self).setup(data, DataSplitEvaluation)
 
     def set_split(self, split):
         super(CombineStrategies_sum, self).set_split(split)
@@ -1123,11 +1321,17 @@ class CombineStrategies_sum(_Strategy):
         return self
 
     def _setup(self):
-        score_functions = [strategy.get_score for strategy in self.strategies]
+        # the individual strategies may already be set to a split, which is applied to the combined score instead
+        score_functions = [partial(strategy.get_score_static, strategy._get_score) for strategy in self.strategies]
         self._get_score = partial(
             self._get_score_static, 
             score_functions,
             self.lens)
+        if self.strategies and all(s._get_score_and_vjp is not None for s in self.strategies):
+            self._get_score_and_vjp = partial(
+                self._get_score_and_vjp_static,
+                [strategy._get_score_and_vjp for strategy in self.strategies],
+                self.lens)
 
     def add_strategy(self, s, setup=True):
         self.strategies.append(s)
@@ -1141,6 +1345,22 @@ class CombineStrategies_sum(_Strategy):
             len_ += l
         return out
 
+    @staticmethod
+    def _get_score_and_vjp_static(score_and_vjp_functions, lens, x, trials=None):
+        out = 0
+        vjps = []
+        len_ = 0
+        for sf, l in zip(score_and_vjp_functions, lens):
+            score, vjp = sf(x[len_:len_ + l], trials=trials)
+            out += score
+            vjps.append(vjp)
+            len_ += l
+
+        def vjp(r):
+            return np.concatenate([v(r) for v in vjps])
+
+        return out, vjp
+
     def _get_x0(self):
         out = [s._get_x0() for s in self.strategies]
         return np.concatenate(out)
@@ -494,12 +494,15 @@ class ReducedLdaModel():
         rm = self.get_minimodel_static(model_number)
         return rm(DATA_DICT)
 
-    def get_minimodel_rolling(self, refractory_period=0, model_number=0):
+    def get_minimodel_rolling(self, refractory_period=0, model_number=0, method='direct', chunk_size=None):
         '''returns partial, which can be called with keywords db or data_dict.
         
         The partial is constructed such that it can be serialized fast, allowing
         efficient multiprocessing. This is the recommended way of sending a reduced
-        model through a network connection.'''
+        model through a network connection.
+        
+        method and chunk_size are passed to :py:meth:`~simrun.reduced_model.spiking_output.get_reduced_model`.
+        With chunk_size, the returned model only computes the PSTH, processing chunk_size trials at a time.'''
         from . import spiking_output
         # nonlinearity_LUT has a different format in the spiking output format:
         # the key should be the refractory period, the value a single pd.Series object
@@ -512,7 +515,9 @@ class ReducedLdaModel():
             nonlinearity_LUT,
             refractory_period,
             combine_fun = sum,
-            LUT_resolution = 1)
+            LUT_resolution = 1,
+            method = method,
+            chunk_size = chunk_size)
 
         return rm
 
@@ -545,6 +550,7 @@ def _apply_static_helper(
     kernel_dict,
     data):
     '''optimized to require minimal datatransfer to allow efficient multiprocessing'''
+    from .spiking_output import lookup_nonlinearity
     # preparing data
     lda_value_dict = {
         k: np.dot(data[k][:, min_index:max_index], kernel_dict[k]) 
@@ -552,15 +558,18 @@ def _apply_static_helper(
         }
     lda_values = sum(lda_value_dict.values())
     indices = lda_values.round().astype(int)
-    if max(indices) > max(lookup_series.index):
+    index_min, index_max = lookup_series.index.min(), lookup_series.index.max()
+    if indices.max() > index_max:
         warnings.warn(
             "lda values leave range of training data by more than 30%!")
-        indices[indices > max(lookup_series.index)] = max(lookup_series.index)
-    if min(indices) < min(lookup_series):
+        indices[indices > index_max] = index_max
+    if indices.min() < index_min:
         warnings.warn(
             "lda values leave range of training data by more than 30%!")
-        indices[indices < min(lookup_series.index)] = min(lookup_series.index)
-    p_spike = lookup_series.loc[indices]
+        indices[indices < index_min] = index_min
+    # the index of the lookup series is a regular grid, so interpolation at the indices
+    # is a vectorized equivalent of lookup_series.loc[indices]
+    p_spike = pd.Series(lookup_nonlinearity(lookup_series, indices), index=indices)
     return ReducedLdaModelResult(None, lda_value_dict, lda_values, p_spike)
 
 
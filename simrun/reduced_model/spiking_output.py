@@ -21,32 +21,40 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 
-def convolve_matrix_with_kernel(X, kernel):
+def rolling_window(a, window):
+    '''http://www.rigtorp.se/2011/01/01/rolling-statistics-numpy.html'''
+    shape = a.shape[:-1] + (a.shape[-1] - window + 1, window)
+    strides = a.strides + (a.strides[-1],)
+    return np.lib.stride_tricks.as_strided(a, shape=shape, strides=strides)
+
+
+def convolve_matrix_with_kernel(X, kernel, method='direct'):
+    '''Convolve each trial (row) of X with a kernel.
+
+    The value at timepoint t is the dot product of the kernel with the
+    ``len(kernel)`` timepoints preceding t, i.e. ``X[:, t - len(kernel):t]``.
+    Timepoints before the start of the trial count as 0.
+
+    method: 'direct' computes the dot products on a strided view of X, 'fft' 
+        uses scipy.signal.fftconvolve, which is faster for long kernels.
+    '''
+    kernel = np.asarray(kernel)
+    X = np.asarray(X)
     l_kern = len(kernel)
     l_xrow = X.shape[0]
     l_xcol = X.shape[1]
-    #X = np.c_[np.zeros((l_xrow,l_kern - 1)), X]
-    #np.testing.assert_array_equal(X.shape, [l_xrow, l_xcol + l_kern - 1])
+    if method == 'fft':
+        import scipy.signal
+        # causal filter: the kernel is reversed and delayed by one timepoint
+        h = np.r_[0, kernel[::-1]]
+        return scipy.signal.fftconvolve(X, h[np.newaxis, :], mode='full', axes=1)[:, :l_xcol]
+    elif method != 'direct':
+        raise ValueError("method must be 'direct' or 'fft', not {}".format(method))
     X = np.c_[np.zeros((l_xrow, l_kern)), X]
     np.testing.assert_array_equal(X.shape, [l_xrow, l_xcol + l_kern])
-    ret = np.array([np.dot(X[:, t:t + l_kern], kernel) for t in range(l_xcol)])
-    return np.transpose(ret)
-
-
-#def rolling_window(a, window):
-#    '''http://www.rigtorp.se/2011/01/01/rolling-statistics-numpy.html'''
-#    shape = a.shape[:-1] + (a.shape[-1] - window + 1, window)
-#    strides = a.strides + (a.strides[-1],)
-#    return np.lib.stride_tricks.as_strided(a, shape=shape, strides=strides)
-#
-#def convolve_matrix_with_kernel(X, kernel):
-#    l_kern = len(kernel)
-#    l_xrow = X.shape[0]
-#    l_xcol = X.shape[1]
-#    X = np.c_[np.zeros((l_xrow,l_kern)), X]
-#    np.testing.assert_array_equal(X.shape, [l_xrow, l_xcol + l_kern])
-#    X = rolling_window(X, len(kernel))
-#    return np.dot(X, kernel)
+    X = rolling_window(X, l_kern)[:, :l_xcol]
+    return np.dot(X, kernel)
+
 
 # def synaptic_input_to_lda_values(X, t, start = 0, n = 1000):
 #     #calculate lda values of selected trials (start, n) at selected timepoint (t)
@@ -59,9 +67,9 @@ def convolve_matrix_with_kernel(X, kernel):
 #     return lda_values
 
 
-def data2Convolutions(X_dict, kernel_dict):
+def data2Convolutions(X_dict, kernel_dict, method='direct'):
     return {
-        name: convolve_matrix_with_kernel(X_dict[name], kernel_dict[name])
+        name: convolve_matrix_with_kernel(X_dict[name], kernel_dict[name], method=method)
         for name in list(kernel_dict.keys())
     }
 
@@ -71,20 +79,28 @@ def convolutions2weightedNetInputs(convolutions_dict, combine_fun=sum):
         [convolutions_dict[name] for name in list(convolutions_dict.keys())])
 
 
+def lookup_nonlinearity(nonlinearity, values):
+    '''Evaluate a lookup series (e.g. the nonlinearity) at the given values.
+
+    Values between the entries of the lookup series are interpolated linearly,
+    values outside of its index are mapped to its first or last value.
+    
+    nonlinearity: pd.Series, index: weighted net input, values: spiking probability
+    values: array of any shape
+    '''
+    nonlinearity = nonlinearity.sort_index()
+    return np.interp(
+        values, 
+        nonlinearity.index.values.astype(float),
+        nonlinearity.values.astype(float))
+
+
 def weightedNetInput2spikingProbabilities(weighted_net_input,
                                           nonlinearity,
                                           LUT_resolution=1):
     weighted_net_input = np.round(
-        weighted_net_input / LUT_resolution) * LUT_resolution
-    weighted_net_input[weighted_net_input < nonlinearity.index.min(
-    )] = nonlinearity[nonlinearity.index.min()]
-    weighted_net_input[weighted_net_input > nonlinearity.index.max(
-    )] = nonlinearity[nonlinearity.index.max()]
-    out = np.array([
-        nonlinearity[weighted_net_input[:, n]].values
-        for n in range(weighted_net_input.shape[1])
-    ])
-    return np.transpose(out)
+        np.asarray(weighted_net_input) / LUT_resolution) * LUT_resolution
+    return lookup_nonlinearity(nonlinearity, weighted_net_input)
 
 
 def spikingProbabilities2rawPSTH(spiking_probabilities):
@@ -107,28 +123,36 @@ def calculateFractionAbleToSpike(rawPSTH, refractory_period):
 
 
 def correct_PSTH_by_refractory_period(PSTH, refractory_period):
+    '''Fraction of trials that are able to spike, i.e. that did not spike within the refractory period.
+
+    PSTH: array of shape (time,), or (..., time) to correct many PSTHs at once.
+    
+    Returns an array of shape (..., time + 1). The first timepoint is the initial state, 
+    in which all trials are able to spike.
     '''
-    return_ = 'only_PSTH' or  'PSTH_and_abletospike' 
-    '''
+    PSTH = np.asarray(PSTH, dtype=float)
     if not refractory_period:
-        return np.ones(len(PSTH))
-    able_to_spike = [1]
-    n_deactivated = [0]
-    for e in PSTH:
+        return np.ones(PSTH.shape)
+    n_timepoints = PSTH.shape[-1]
+    able_to_spike = np.ones(PSTH.shape[:-1] + (n_timepoints + 1,))
+    n_deactivated = np.zeros(PSTH.shape[:-1] + (n_timepoints + 1,))
+    # the recursion only runs over time, all PSTHs are updated at once
+    for t in range(n_timepoints):
         # amount of trails that would spike right now
-        diff = able_to_spike[-1] * e  
-        if len(n_deactivated) >= refractory_period:
-            activated = n_deactivated[-refractory_period]
+        diff = able_to_spike[..., t] * PSTH[..., t]
+        if t + 1 >= refractory_period:
+            activated = n_deactivated[..., t + 1 - refractory_period]
         else:
             activated = 0
-        n_deactivated.append(diff)
-        able_to_spike.append(able_to_spike[-1] - diff + activated)
+        n_deactivated[..., t + 1] = diff
+        able_to_spike[..., t + 1] = able_to_spike[..., t] - diff + activated
 
     return able_to_spike
 
 
 def calculatePSTH(rawPSTH, able_to_spike):
-    return [a * b for a, b, in zip(rawPSTH, able_to_spike)]
+    rawPSTH = np.asarray(rawPSTH)
+    return rawPSTH * np.asarray(able_to_spike)[..., :rawPSTH.shape[-1]]
 
 
 def apply_reduced_model(X_dict,
@@ -136,8 +160,9 @@ def apply_reduced_model(X_dict,
                         nonlinearity_LUT=None,
                         refractory_period=None,
                         combine_fun=sum,
-                        LUT_resolution=1):
-    convolutions_dict = data2Convolutions(X_dict, kernel_dict)
+                        LUT_resolution=1,
+                        method='direct'):
+    convolutions_dict = data2Convolutions(X_dict, kernel_dict, method=method)
     weighted_net_input = convolutions2weightedNetInputs(convolutions_dict,
                                                         combine_fun)
     nonlinearity = nonlinearity_LUT[refractory_period]
@@ -152,11 +177,51 @@ def apply_reduced_model(X_dict,
            'able_to_spike': able_to_spike, 'PSTH': PSTH}
 
 
+def apply_reduced_model_batched(X_dict,
+                                kernel_dict=None,
+                                nonlinearity_LUT=None,
+                                refractory_period=None,
+                                combine_fun=sum,
+                                LUT_resolution=1,
+                                method='direct',
+                                chunk_size=10000):
+    '''Same as apply_reduced_model, but only returns the PSTH.
+    
+    Trials are processed in chunks of chunk_size, such that the intermediate per-trial
+    results (convolutions, weighted net inputs, spiking probabilities) never need to be 
+    held in memory for all trials at once. The arrays in X_dict can thus be e.g. memory maps
+    with many millions of trials.
+
+    Returns a dictionary with the keys 'rawPSTH', 'able_to_spike' and 'PSTH'.
+    '''
+    nonlinearity = nonlinearity_LUT[refractory_period]
+    n_trials = len(X_dict[list(kernel_dict.keys())[0]])
+    spiking_probabilities_sum = 0
+    for start in range(0, n_trials, chunk_size):
+        chunk = {
+            name: np.asarray(X_dict[name][start:start + chunk_size])
+            for name in list(kernel_dict.keys())
+        }
+        convolutions_dict = data2Convolutions(chunk, kernel_dict, method=method)
+        weighted_net_input = convolutions2weightedNetInputs(convolutions_dict,
+                                                            combine_fun)
+        spiking_probabilities = weightedNetInput2spikingProbabilities(
+            weighted_net_input, nonlinearity, LUT_resolution)
+        spiking_probabilities_sum = spiking_probabilities_sum + spiking_probabilities.sum(axis=0)
+    rawPSTH = spiking_probabilities_sum / float(n_trials)
+    able_to_spike = correct_PSTH_by_refractory_period(rawPSTH,
+                                                      refractory_period)
+    PSTH = calculatePSTH(rawPSTH, able_to_spike)
+    return {'rawPSTH': rawPSTH, 'able_to_spike': able_to_spike, 'PSTH': PSTH}
+
+
 def get_reduced_model(kernel_dict,
                       nonlinearity_LUT,
                       refractory_period,
                       combine_fun=sum,
-                      LUT_resolution=1):
+                      LUT_resolution=1,
+                      method='direct',
+                      chunk_size=None):
     '''returns a function which you can feed with data and which will return evaluation results of the reduced model.
     
     kernel_dict: dictionary of kernels, e.g. if you have a seperated kernel for EXC and INH input, 
@@ -170,10 +235,19 @@ def get_reduced_model(kernel_dict,
     LUT_resolution: reolution of the nonlinearity_LUT. E.g. in case LUT_resolution == 1, the pd.Series objects 
         in the nonlinearity_LUT are expect to have keys for [...,0,1,2,3, ...], in case of LUT_resolution == 2,
         the pd.Series objects in the nonlinearity_LUT are expect to have keys for [...,0,2,4,6, ...]
+    
+    method: 'direct' or 'fft', see convolve_matrix_with_kernel
+    
+    chunk_size: if set, the returned function only computes the PSTH, processing chunk_size trials 
+        at a time. See apply_reduced_model_batched.
     '''
-
+    if chunk_size is not None:
+        return partial(apply_reduced_model_batched, kernel_dict = kernel_dict, nonlinearity_LUT = nonlinearity_LUT, \
+                       refractory_period = refractory_period, combine_fun = combine_fun, LUT_resolution = LUT_resolution, \
+                       method = method, chunk_size = chunk_size)
     return partial(apply_reduced_model, kernel_dict = kernel_dict, nonlinearity_LUT = nonlinearity_LUT, \
-                   refractory_period = refractory_period, combine_fun = combine_fun, LUT_resolution = LUT_resolution)
+                   refractory_period = refractory_period, combine_fun = combine_fun, LUT_resolution = LUT_resolution, \
+                   method = method)
 
 
 # tests
@@ -112,7 +112,9 @@ def _evoked_activity(
     parameterfiles=None,
     neuron_folder=None,
     network_folder=None,
-    sa=None
+    sa=None,
+    trace_format='csv',
+    trace_dtype='float64'
     ):
     """
     :skip-doc:
@@ -138,6 +140,8 @@ def _evoked_activity(
         neuron_folder (str): Path to the folder containing the neuron parameter files.
         network_folder (str): Path to the folder containing the network parameter files.
         sa (pd.DataFrame): A dataframe containing the :ref:`syn_activation_format` dataframe. Should always be present in a simrun-initialized database under the key ``synapse_activation``.
+        trace_format (str): Output format of the voltage traces. Either ``'csv'`` or ``'npz'``.
+        trace_dtype (str): Floating point precision of ``'npz'`` voltage traces. Either ``'float64'`` or ``'float32'``.
         
     See also:
         :py:mod:`~data_base.db_initializers.init_simrun_general` for initializing a database from raw :py:mod:`simrun` output and its available keys. 
@@ -250,7 +254,8 @@ def _evoked_activity(
         logger.info('computing active synapse properties')
         sca.compute_synapse_distances_times(
             synName, cell, t,
-            synTypes)  #calls scp.write_synapse_activation_file
+            synTypes,
+            binary_sidecar=trace_format == 'npz')  #calls scp.write_synapse_activation_file
         preSynCellsName = outdir_absolute + '/' + fname + '_presynaptic_cells.csv'
         scp.write_presynaptic_spike_times(preSynCellsName, evokedNW.cells)
 
@@ -263,15 +268,18 @@ def _evoked_activity(
     vTraces = np.array(vTraces)
     dendTraces = []
     uniqueID = sti_base.strip('/').split('_')[-1]
-    scp.write_all_traces(
-        outdir_absolute + '/' + uniqueID + '_vm_all_traces.csv', t[:], vTraces)
+    write_voltage_traces(
+        outdir_absolute + '/' + uniqueID + '_vm_all_traces', t[:], vTraces,
+        trace_format=trace_format, trace_dtype=trace_dtype)
     for RSManager in recSiteManagers:
         for recSite in RSManager.recordingSites:
             tmpTraces = []
             for vTrace in recSite.vRecordings:
                 tmpTraces.append(vTrace[:])
-            recSiteName = outdir_absolute + '/' + uniqueID + '_' + recSite.label + '_vm_dend_traces.csv'
-            scp.write_all_traces(recSiteName, t[:], tmpTraces)
+            recSiteName = outdir_absolute + '/' + uniqueID + '_' + recSite.label + '_vm_dend_traces'
+            write_voltage_traces(
+                recSiteName, t[:], tmpTraces,
+                trace_format=trace_format, trace_dtype=trace_dtype)
             dendTraces.append(tmpTraces)
     dendTraces = np.array(dendTraces)
 
@@ -301,7 +309,9 @@ def rerun_db(
     stis=None,
     silent=False,
     additional_network_params=[],
-    child_process=False):
+    child_process=False,
+    trace_format='csv',
+    trace_dtype='float64'):
     """Recreate and resimulate a network-embedded neuron simulation from a simrun-initialized database.
     
     This method recreates the network-embedded neuron simulation from the parameter files in the simrun-initialized database.
@@ -319,6 +329,11 @@ def rerun_db(
         additional_network_params (list): List of additional :ref:`network_parameters_format` files to be used in the simulation.
         silent (bool): If True, suppresses output from the simulation.
         child_process (bool): If True, runs the simulation in a child process.
+        trace_format (str): 
+            Output format of the voltage traces. 
+            Either ``'csv'`` (:ref:`voltage_traces_csv_format`, default) or ``'npz'`` (:ref:`voltage_traces_npz_format`).
+            With ``'npz'``, binary sidecars of the :ref:`syn_activation_format` files are written as well.
+        trace_dtype (str): Floating point precision of ``'npz'`` voltage traces. Either ``'float64'`` (default) or ``'float32'``.
         
     Returns:
         list: A list of dask delayed objects. When computed with a dask scheduler, it writes the simulation results to the specified directory.
@@ -362,6 +377,8 @@ def rerun_db(
             neuron_folder=neuron_folder,
             network_folder=network_folder,
             sa=sa,
-            additional_network_params=additional_network_params)
+            additional_network_params=additional_network_params,
+            trace_format=trace_format,
+            trace_dtype=trace_dtype)
         delayeds.append(d)
     return delayeds
\ No newline at end of file
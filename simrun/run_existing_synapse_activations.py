@@ -50,7 +50,9 @@ def _evoked_activity(
     scale_apical = None, 
     post_hook = {}, 
     auto_organize_results_folder = True,
-    cell_generator = None
+    cell_generator = None,
+    trace_format = 'csv',
+    trace_dtype = 'float64'
     ):
     '''
     :skip-doc:
@@ -68,6 +70,8 @@ def _evoked_activity(
         post_hook (dict): Dictionary of functions that are called after the simulation.
         auto_organize_results_folder (bool): If True, the results are stored in a subfolder of the results folder.
         cell_generator (function): Function that generates a cell object.
+        trace_format (str): Output format of the voltage traces. Either ``'csv'`` or ``'npz'``.
+        trace_dtype (str): Floating point precision of ``'npz'`` voltage traces. Either ``'float64'`` or ``'float32'``.
         
     Returns: 
         dask.delayed: Delayed object. Can be computed with arbitrary scheduler.
@@ -175,7 +179,8 @@ def _evoked_activity(
         logger.info('computing active synapse properties')
         sca.compute_synapse_distances_times(
             synName, cell, t,
-            synTypes)  #calls scp.write_synapse_activation_file
+            synTypes,
+            binary_sidecar=trace_format == 'npz')  #calls scp.write_synapse_activation_file
         preSynCellsName = dirName + '/' + fname + '_presynaptic_cells.csv'
         scp.write_presynaptic_spike_times(preSynCellsName, evokedNW.cells)
 
@@ -194,15 +199,19 @@ def _evoked_activity(
 
     vTraces = np.array(vTraces)
     dendTraces = []
-    scp.write_all_traces(dirName + '/' + uniqueID + '_vm_all_traces.csv',
-                         t[offsetBin:], vTraces)
+    utils.write_voltage_traces(dirName + '/' + uniqueID + '_vm_all_traces',
+                               t[offsetBin:], vTraces,
+                               trace_format=trace_format,
+                               trace_dtype=trace_dtype)
     for RSManager in recSiteManagers:
         for recSite in RSManager.recordingSites:
             tmpTraces = []
             for vTrace in recSite.vRecordings:
                 tmpTraces.append(vTrace[offsetBin:])
-            recSiteName = dirName + '/' + uniqueID + '_' + recSite.label + '_vm_dend_traces.csv'
-            scp.write_all_traces(recSiteName, t[offsetBin:], tmpTraces)
+            recSiteName = dirName + '/' + uniqueID + '_' + recSite.label + '_vm_dend_traces'
+            utils.write_voltage_traces(recSiteName, t[offsetBin:], tmpTraces,
+                                       trace_format=trace_format,
+                                       trace_dtype=trace_dtype)
             dendTraces.append(tmpTraces)
     dendTraces = np.array(dendTraces)
 
@@ -238,7 +247,9 @@ def run_existing_synapse_activations(
     scale_apical = None, 
     post_hook = {}, 
     auto_organize_results_folder = True, 
-    cell_generator = None
+    cell_generator = None,
+    trace_format = 'csv',
+    trace_dtype = 'float64'
     ):
     '''Recreate and resimulate a network-embedded neuron simulation from a list of :ref:`syn_activation_format` files.
     
@@ -255,6 +266,11 @@ def run_existing_synapse_activations(
         post_hook (dict): Dictionary of functions that are called after the simulation.
         auto_organize_results_folder (bool): If True, the results are stored in a subfolder of the results folder.
         cell_generator (function): Function that generates a cell object.
+        trace_format (str): 
+            Output format of the voltage traces. 
+            Either ``'csv'`` (:ref:`voltage_traces_csv_format`, default) or ``'npz'`` (:ref:`voltage_traces_npz_format`).
+            With ``'npz'``, binary sidecars of the :ref:`syn_activation_format` files are written as well.
+        trace_dtype (str): Floating point precision of ``'npz'`` voltage traces. Either ``'float64'`` (default) or ``'float32'``.
         
     Returns: 
         dask.delayed: Delayed object. Can be computed with arbitrary scheduler.
@@ -295,7 +311,9 @@ def run_existing_synapse_activations(
         scale_apical = scale_apical, 
         post_hook = post_hook,
         auto_organize_results_folder = auto_organize_results_folder, 
-        cell_generator = cell_generator
+        cell_generator = cell_generator,
+        trace_format = trace_format,
+        trace_dtype = trace_dtype
         )
     if silent:
         myfun = utils.silence_stdout(myfun)
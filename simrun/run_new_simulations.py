@@ -61,7 +61,10 @@ def _evoked_activity(
         tStim = 245.0, 
         scale_apical = None,
         cell_generator = None, 
-        tar = False
+        tar = False,
+        trace_format = 'csv',
+        trace_dtype = 'float64',
+        keep_network_skeleton = False
         ):
     '''
     :skip-doc:
@@ -85,6 +88,9 @@ def _evoked_activity(
         cell_generator (function): Function to generate the cell. If provided, the cell parameters
             provided by :paramref:`cellParamName` are ignored.
         tar (bool): If True, the output directory is compressed to a tarball after the simulation is finished.
+        trace_format (str): Output format of the voltage traces. Either ``'csv'`` or ``'npz'``.
+        trace_dtype (str): Floating point precision of ``'npz'`` voltage traces. Either ``'float64'`` or ``'float32'``.
+        keep_network_skeleton (bool): If True, the network realization is set up once and only its activity is resampled in each sweep.
 
     Returns:
         str: Path to the output directory containing the simulation results.
@@ -145,17 +151,19 @@ def _evoked_activity(
 
     # 2. Run simulations -------------------------------------------------
     nRun = 0
+    evokedNW = None
     while nRun < nSweeps:
         synParametersEvoked = paramEvokedUp
 
         # 2.1 Setup network from evoked network parameters
         startTime = time.time()
-        evokedNW = scp.NetworkMapper(
-            cell, 
-            synParametersEvoked,
-            neuronParameters.sim)
+        if evokedNW is None or not keep_network_skeleton:
+            evokedNW = scp.NetworkMapper(
+                cell, 
+                synParametersEvoked,
+                neuronParameters.sim)
         logger.info('*' * 500)
-        evokedNW.create_saved_network2()
+        evokedNW.create_saved_network2(keep_skeleton=keep_network_skeleton)
         stopTime = time.time()
         setupdt = stopTime - startTime
         logger.info('Network setup time: {:.2f} s'.format(setupdt))
@@ -195,13 +203,14 @@ def _evoked_activity(
             synName, 
             cell, 
             t,
-            synTypes)  # calls scp.write_synapse_activation_file
+            synTypes,
+            binary_sidecar = trace_format == 'npz')  # calls scp.write_synapse_activation_file
         preSynCellsName = dirName + '/' + fname + '_presynaptic_cells.csv'
         scp.write_presynaptic_spike_times(preSynCellsName, evokedNW.cells)
 
         # 2.5 Prepare next simulation run
         nRun += 1
-        cell.re_init_cell()
+        cell.re_init_cell(disconnect_synapses=not keep_network_skeleton)
         evokedNW.re_init_network()
     logger.info('-------------------------------')
 
@@ -210,17 +219,24 @@ def _evoked_activity(
     vTraces = np.array(vTraces)
     dendTraces = []
 
-    scp.write_all_traces(
-        dirName + '/' + uniqueID + '_vm_all_traces.csv',
+    write_voltage_traces(
+        dirName + '/' + uniqueID + '_vm_all_traces',
         t[offsetBin:], 
-        vTraces)
+        vTraces,
+        trace_format=trace_format,
+        trace_dtype=trace_dtype)
     for RSManager in recSiteManagers:
         for recSite in RSManager.recordingSites:
             tmpTraces = []
             for vTrace in recSite.vRecordings:
                 tmpTraces.append(vTrace[offsetBin:])
-            recSiteName = dirName + '/' + uniqueID + '_' + recSite.label + '_vm_dend_traces.csv'
-            scp.write_all_traces(recSiteName, t[offsetBin:], tmpTraces)
+            recSiteName = dirName + '/' + uniqueID + '_' + recSite.label + '_vm_dend_traces'
+            write_voltage_traces(
+                recSiteName, 
+                t[offsetBin:], 
+                tmpTraces,
+                trace_format=trace_format,
+                trace_dtype=trace_dtype)
             dendTraces.append(tmpTraces)
     dendTraces = np.array(dendTraces)
 
@@ -253,7 +269,10 @@ def run_new_simulations(
         scale_apical = None,
         cell_generator = None,
         child_process = False,
-        tar = False
+        tar = False,
+        trace_format = 'csv',
+        trace_dtype = 'float64',
+        keep_network_skeleton = False
         ):
     '''Create and simulate network-embedded neuron models.
 
@@ -288,6 +307,18 @@ def run_new_simulations(
         scale_apical (callable, DEPRECATED): Function to scale the apical dendrite. Assumes the cell has an apical dendrite - see below.
         cell_generator (callable): Function to generate the cell. If provided, :paramref:`cellParamName` is ignored.
         tar (bool): If True, the output directory is compressed to a tarball after the simulation is finished.
+        trace_format (str): 
+            Output format of the voltage traces. 
+            Either ``'csv'`` (:ref:`voltage_traces_csv_format`, default) or ``'npz'`` (:ref:`voltage_traces_npz_format`).
+            The binary ``'npz'`` format is considerably faster to write and to parse with :py:mod:`~data_base.db_initializers.load_simrun_general`.
+            With ``'npz'``, binary sidecars of the :ref:`syn_activation_format` files are written as well.
+        trace_dtype (str): Floating point precision of ``'npz'`` voltage traces. Either ``'float64'`` (default) or ``'float32'``.
+        keep_network_skeleton (bool):
+            If True, the network realization is read and connected only once per process, 
+            and each sweep only resamples the presynaptic activity, synapse weights and releases
+            (see the ``keep_skeleton`` argument of :py:meth:`~single_cell_parser.network.NetworkMapper.create_saved_network2`).
+            This makes the network setup of each sweep considerably faster, and gives the same results as a network that is set up from scratch.
+            Default: False.
 
     Attention:
         While the random state is set for the network embedding, capturing animal-to-animal and cell-to-cell
@@ -314,7 +345,10 @@ def run_new_simulations(
         tStop = tStop, 
         scale_apical = scale_apical,
         cell_generator = cell_generator,
-        tar = tar
+        tar = tar,
+        trace_format = trace_format,
+        trace_dtype = trace_dtype,
+        keep_network_skeleton = keep_network_skeleton
         )
     if silent:
         myfun = silence_stdout(myfun)
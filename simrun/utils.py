@@ -180,6 +180,46 @@ def tar_folder(source_dir, delete_folder=True):
     os.rename(source_dir + ".tar.running", source_dir + ".tar")
 
 
+def write_voltage_traces(
+    fname, 
+    t, 
+    vTraces, 
+    trace_format="csv", 
+    trace_dtype="float64"
+    ):
+    """Write out voltage traces in either text or binary format.
+
+    Dispatches to :py:meth:`~single_cell_parser.writer.write_all_traces` or
+    :py:meth:`~single_cell_parser.writer.write_all_traces_npz`.
+    Both formats are understood by :py:mod:`data_base.db_initializers.load_simrun_general`.
+
+    Args:
+        fname (str): Output filename without extension. The extension is set according to :paramref:`trace_format`.
+        t (array): The time points of the voltage traces.
+        vTraces (list): A list of voltage traces.
+        trace_format (str): Either ``'csv'`` (:ref:`voltage_traces_csv_format`) or ``'npz'`` (:ref:`voltage_traces_npz_format`).
+        trace_dtype (str): Floating point precision for the ``'npz'`` format. Either ``'float64'`` or ``'float32'``.
+            Ignored for the ``'csv'`` format.
+
+    Returns:
+        str: The path to the written file, including extension.
+
+    Raises:
+        ValueError: If :paramref:`trace_format` is not ``'csv'`` or ``'npz'``.
+    """
+    if trace_format == "csv":
+        fname = fname + ".csv"
+        scp.write_all_traces(fname, t, vTraces)
+    elif trace_format == "npz":
+        fname = fname + ".npz"
+        scp.write_all_traces_npz(fname, t, vTraces, dtype=trace_dtype)
+    else:
+        raise ValueError(
+            "trace_format must be 'csv' or 'npz', got {}".format(trace_format)
+        )
+    return fname
+
+
 def chunkIt(seq, num):
     """Split a sequence in multiple lists which have approximately equal size.
 
@@ -54,11 +54,13 @@ from .parameters import ParameterSet, build_parameters, load_NMODL_parameters
 from .network import NetworkMapper
 from .network_realizations import create_functional_network, create_synapse_realization
 from .reader import (
+    convert_scalar_field_to_binary,
     read_complete_synapse_activation_file,
     read_functional_realization_map,
     read_landmark_file,
     read_scalar_field,
     read_spike_times_file,
+    read_synapse_activation_arrays,
     read_synapse_activation_file,
     read_synapse_realization,
     read_synapse_weight_file,
@@ -66,6 +68,7 @@ from .reader import (
 from .synapse_mapper import SynapseMapper
 from .writer import (
     write_all_traces,
+    write_all_traces_npz,
     write_cell_simulation,
     write_cell_synapse_locations,
     write_landmark_file,
@@ -73,6 +76,7 @@ from .writer import (
     write_PSTH,
     write_sim_results,
     write_spike_times_file,
+    write_synapse_activation_arrays,
     write_synapse_activation_file,
     write_synapse_weight_file,
 )
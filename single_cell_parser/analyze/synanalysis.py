@@ -32,7 +32,7 @@ __author__ = "Robert Egger"
 __date__ = "2012-04-02"
 
 
-def compute_synapse_distances_times(fname, cell, t=None, synTypes=None):
+def compute_synapse_distances_times(fname, cell, t=None, synTypes=None, binary_sidecar=False):
     """Save a :py:class:`single_cell_parser.cell.Cell` object's synapse distances and activation times to a ``.csv`` file.
     
     The following information is saved:
@@ -49,6 +49,9 @@ def compute_synapse_distances_times(fname, cell, t=None, synTypes=None):
         fname (str): The output file name as a ful path, including the file extension. Preferably unique (see e.g. :py:meth:`~simrun.generate_synapse_activations._evoked_activity` for the generation of unique syapse activation filenames)
         cell (:py:class:`single_cell_parser.cell.Cell`): Cell object
         synTypes (list): list of synapse types. Default: the keys of the `cell.synapses` dictionary
+        binary_sidecar (bool): 
+            If True, additionally write a binary ``.npz`` copy of the synapse activation file.
+            See :py:meth:`~single_cell_parser.writer.write_synapse_activation_file`.
         
     Returns:
         None. Writes out the synapse .csv file to :paramref:`fname`.
@@ -78,7 +81,8 @@ def compute_synapse_distances_times(fname, cell, t=None, synTypes=None):
             synCnt += 1
 
     scp.write_synapse_activation_file(
-        fname, cell, synTypes, synDistances, synTimes, activeSyns
+        fname, cell, synTypes, synDistances, synTimes, activeSyns,
+        binary_sidecar=binary_sidecar
         )
 
 
@@ -32,7 +32,6 @@ import neuron
 
 nrn = neuron.nrn
 h = neuron.h
-from itertools import chain
 from . import analyze as sca
 import pandas as pd
 import json
@@ -75,6 +74,9 @@ class Cell(object):
         tVec (neuron.h.Vector): a hoc Vector recording time.
         neuron_param: The :ref:`cell_parameters_format`.
         section_adjacency_map (dict): maps each section (by ID) to its parent sections and children sections.
+        _synapse_table (dict): 
+            Cached per-synapse location info for each synapse type, see :py:meth:`get_synapse_table`.
+            Invalidated when synapses are added or removed.
     '''
     def __init__(self):
         self.hoc_path = None
@@ -93,8 +95,9 @@ class Cell(object):
         self.network_param = None  # TODO: is this used?
         self.network_sim_param = None  # TODO: is this used?
         self.section_adjacency_map = None
+        self._synapse_table = {}
 
-    def re_init_cell(self, replayMode=False):
+    def re_init_cell(self, replayMode=False, disconnect_synapses=True):
         '''Re-initialize for next simulation run.
         
         Cleans up the NEURON vectors and disconnects all synapses.
@@ -103,15 +106,23 @@ class Cell(object):
             replayMode (bool): 
                 If True, the cell is re-initialized for replay mode and all synapses are removed.
                 Useful if a new network realization is to be used for the next simulation.
-                Defaults to False.'''
+                Defaults to False.
+            disconnect_synapses (bool):
+                If False, the synapses keep their NEURON objects, so that a network skeleton can replay new activity on them
+                (see :py:meth:`~single_cell_parser.network.NetworkMapper.create_saved_network2`).
+                Ignored if :paramref:`replayMode` is True.
+                Defaults to True.'''
         for sec in self.sections:
             sec._re_init_vm_recording()
             sec._re_init_range_var_recording()
         for synType in list(self.synapses.keys()):
-            for syn in self.synapses[synType]:
-                syn.disconnect_hoc_synapse()
+            if disconnect_synapses or replayMode:
+                for syn in self.synapses[synType]:
+                    syn.disconnect_hoc_synapse()
             if replayMode:
                 self.synapses[synType] = []
+        if replayMode:
+            self._invalidate_synapse_table()
 
     def record_range_var(self, var, mech=None):
         """Record a range mechanism in all sections.
@@ -293,6 +304,7 @@ class Cell(object):
         newSyn = synapse.Synapse(secID, ptID, ptx, preType, postType)
         newSyn.coordinates = np.array(self.sections[secID].pts[ptID])
         self.synapses[preType].append(newSyn)
+        self._invalidate_synapse_table(preType)
         return self.synapses[preType][-1]
 
     def remove_synapses(self, preType=None):
@@ -308,6 +320,8 @@ class Cell(object):
         """
         if preType is None:
             return
+        self._invalidate_synapse_table(
+            None if preType in ('All', 'all') else preType)
         # remove all
         if preType == 'All' or preType == 'all':
             for synType in list(self.synapses.keys()):
@@ -465,6 +479,51 @@ class Cell(object):
 #                                    syn.netcons[0].weight[0] = recep.weight
     """
 
+    def get_synapse_table(self, preType):
+        """Get the location info of all synapses of type :paramref:`preType` as arrays.
+
+        The table is computed once and cached on the cell, such that the soma distances do not need to be
+        recomputed each time synapse activations are extracted (e.g. after each simulation trial).
+        The cache is invalidated when synapses of this type are added or removed with :py:meth:`add_synapse`
+        or :py:meth:`remove_synapses`.
+
+        Args:
+            preType (str): The presynaptic cell type.
+
+        Returns:
+            dict: Dictionary of arrays with one element per synapse, ordered by synapse ID. 
+            Keys are ``section_ID``, ``section_pt_ID``, ``soma_distance`` and ``dendrite_label``.
+        """
+        synapses = self.synapses[preType]
+        if not hasattr(self, '_synapse_table'):  # cells pickled before the table existed
+            self._synapse_table = {}
+        table = self._synapse_table.get(preType)
+        if table is None or len(table['section_ID']) != len(synapses):
+            secIDs = np.array([syn.secID for syn in synapses], dtype=int)
+            table = {
+                'section_ID': secIDs,
+                'section_pt_ID': np.array([syn.ptID for syn in synapses], dtype=int),
+                'soma_distance': np.array(
+                    [sca.compute_syn_distance(self, syn) for syn in synapses], 
+                    dtype=float),
+                'dendrite_label': np.array(
+                    [self.sections[secID].label for secID in secIDs],
+                    dtype=object),
+            }
+            self._synapse_table[preType] = table
+        return table
+
+    def _invalidate_synapse_table(self, preType=None):
+        """Invalidate the cached synapse table.
+
+        Args:
+            preType (str, optional): The synapse type to invalidate. If None, the tables of all types are invalidated.
+        """
+        if not hasattr(self, '_synapse_table') or preType is None:
+            self._synapse_table = {}
+        else:
+            self._synapse_table.pop(preType, None)
+
     def get_synapse_activation_dataframe(
         self,
         max_spikes=20,
@@ -478,6 +537,9 @@ class Cell(object):
         - Synapse location: soma distance, section ID, section point ID, and dendrite label of the synapse
         - Activation times
         - The simulation trial index
+
+        Synapse locations are taken from the cached :py:meth:`get_synapse_table`, and activation times are
+        written into a preallocated array, so repeated calls (e.g. once per simulation trial) are cheap.
         
         Args:
             max_spikes (int, optional): The maximum number of spikes (i.e. synaptic activations, not necessarily the same as spikes of the presynaptic cell) to write out. Defaults to 20.
@@ -485,55 +547,50 @@ class Cell(object):
             
         Returns:
             pandas.DataFrame: The synapse activation dataframe.
+
+        Raises:
+            ValueError: If a synapse has more than :paramref:`max_spikes` activations.
         """
-        syn_types = []
-        syn_IDs = []
+        syn_types, syn_IDs, tables = [], [], []
         spike_times = []
-        sec_IDs = []
-        pt_IDs = []
-        dend_labels = []
-        soma_distances = []
-
         for celltype in list(self.synapses.keys()):
-            for syn in range(len(self.synapses[celltype])):
-                if self.synapses[celltype][syn].is_active():
-                    ## get list of active synapses' types and IDs
-                    syn_types.append(celltype)
-                    syn_IDs.append(syn)
-
-                    ## get spike times
-                    st_temp = [self.synapses[celltype][syn].releaseSite.spikeTimes[:]]
-                    st_temp.append([np.nan] * (max_spikes - len(st_temp[0])))
-                    st_temp = list(chain.from_iterable(st_temp))
-                    spike_times.append(st_temp)
-
-                    ## get info about synapse location
-                    secID = self.synapses[celltype][syn].secID
-                    sec_IDs.append(secID)
-                    pt_IDs.append(self.synapses[celltype][syn].ptID)
-                    dend_labels.append(self.sections[secID].label)
-
-                    ## calculate synapse somadistances
-                    sec = self.sections[secID]
-                    soma_distances.append(
-                        sca.compute_syn_distance(self,
-                                                 self.synapses[celltype][syn]))
+            synapses = self.synapses[celltype]
+            active = np.array([syn.is_active() for syn in synapses], dtype=bool)
+            active_IDs = np.flatnonzero(active)
+            if not len(active_IDs):
+                continue
+            syn_types.append(np.full(len(active_IDs), celltype, dtype=object))
+            syn_IDs.append(active_IDs)
+            tables.append({k: v[active_IDs] for k, v in self.get_synapse_table(celltype).items()})
+            spike_times.extend(synapses[i].releaseSite.spikeTimes for i in active_IDs)
+
+        ## write activation times into preallocated array
+        n_spikes = np.array([len(st) for st in spike_times], dtype=int)
+        if len(n_spikes) and n_spikes.max() > max_spikes:
+            raise ValueError(
+                'A synapse has {} activations, which is more than max_spikes = {}'.format(
+                    n_spikes.max(), max_spikes))
+        st_array = np.full((len(spike_times), max_spikes), np.nan)
+        rows = np.repeat(np.arange(len(spike_times)), n_spikes)
+        cols = np.arange(n_spikes.sum()) - np.repeat(np.cumsum(n_spikes) - n_spikes, n_spikes)
+        st_array[rows, cols] = [t for st in spike_times for t in st]
 
         ## write synapse activation df
         columns = [
             'synapse_type', 'synapse_ID', 'soma_distance', 'section_ID',
             'section_pt_ID', 'dendrite_label'
         ]
-        sa_pd = dict(
-            list(
-                zip(columns, [
-                    syn_types, syn_IDs, soma_distances, sec_IDs, pt_IDs,
-                    dend_labels
-                ])))
-        sa_pd = pd.DataFrame(sa_pd)[columns]
-
-        st_df = pd.DataFrame(columns=list(range(max_spikes)),
-                             data=np.asarray(spike_times))
+        concat = lambda arrays, dtype: np.concatenate(arrays) if arrays else np.array([], dtype=dtype)
+        sa_pd = pd.DataFrame({
+            'synapse_type': concat(syn_types, object),
+            'synapse_ID': concat(syn_IDs, int),
+            'soma_distance': concat([t['soma_distance'] for t in tables], float),
+            'section_ID': concat([t['section_ID'] for t in tables], int),
+            'section_pt_ID': concat([t['section_pt_ID'] for t in tables], int),
+            'dendrite_label': concat([t['dendrite_label'] for t in tables], object),
+        })[columns]
+
+        st_df = pd.DataFrame(columns=list(range(max_spikes)), data=st_array)
 
         sa_pd = pd.concat([sa_pd, st_df], axis=1)
 
@@ -1011,6 +1068,46 @@ class PointCell(object):
         self.playing = True
         self.spike_source[spikeT] = spike_source
 
+    def append_spike_times(self, spikeTimes, spike_source=None):
+        '''Append multiple spike times to the presynaptic cell at once.
+
+        Equivalent to calling :py:meth:`append` for each spike time, but sorts the spike times only once.
+
+        Args:
+            spikeTimes (array-like): Spike times.
+            spike_source (str): Spike source category (see :py:meth:`single_cell_parser.network.NetworkMapper._create_pointcell_activities`)
+
+        Raises:
+            AssertionError: If the spike source is unknown.
+        '''
+        assert spike_source is not None
+        spikeTimes = np.asarray(spikeTimes, dtype=float).ravel().tolist()
+        if not spikeTimes:
+            return
+        self.spikeTimes.extend(spikeTimes)
+        self.spikeTimes.sort()
+        self.spikeVec.append(h.Vector(spikeTimes))
+        self.spikeVec.sort()
+        self.playing = True
+        for spikeT in spikeTimes:
+            self.spike_source[spikeT] = spike_source
+
+    def set_spike_times(self, spikeTimes):
+        '''Replace the spike times of the presynaptic cell and play them.
+
+        Reuses the existing :py:class:`~neuron.h.VecStim` and :py:class:`~neuron.h.Vector`.
+        Used to replay new release times on a synapse that is already connected 
+        (see :py:meth:`single_cell_parser.network.reactivate_functional_synapse`).
+
+        Args:
+            spikeTimes (list): Spike times.
+        '''
+        self.turn_off()
+        self.spikeTimes = sorted(spikeTimes)
+        if self.spikeTimes:
+            self.spikeVec.append(h.Vector(self.spikeTimes))
+        self.play()
+
     def compute_spike_train_times(
             self,
             interval,
@@ -1043,32 +1140,39 @@ class PointCell(object):
             raise RuntimeError(errstr)
 
         if nSpikes is not None:
-            lastSpike = 0.0
-            for i in range(nSpikes):
-                if i == 0:
-                    tSpike = self.start + self._next_interval(
-                    ) - self.spikeInterval * (1 - self.noiseParam)
-                    if tSpike < 0:
-                        tSpike = 0
-                else:
-                    tSpike = lastSpike + self._next_interval()
-                self.append(tSpike, spike_source=spike_source)
-                lastSpike = tSpike
+            spikeTimes = self._next_intervals(nSpikes)
+            if nSpikes:
+                spikeTimes[0] = max(
+                    self.start + spikeTimes[0] - self.spikeInterval * (1 - self.noiseParam), 0)
+                spikeTimes = np.cumsum(spikeTimes)
+            self.append_spike_times(spikeTimes, spike_source=spike_source)
         elif self.stop > self.start:
+            # intervals are drawn in chunks of roughly the expected number of spikes
+            chunkSize = max(int((self.stop - self.start) / self.spikeInterval) + 1, 1)
+            spikeTimes = []
             lastSpike = 0.0
-            while True:
-                if lastSpike == 0:
-                    tSpike = self.start + self._next_interval(
-                    ) - self.spikeInterval * (1 - self.noiseParam)
-                    if tSpike < 0:
-                        tSpike = 0
-                else:
-                    tSpike = lastSpike + self._next_interval()
-                if tSpike > self.stop:
-                    break
-                self.append(tSpike, spike_source=spike_source)
-                lastSpike = tSpike
-
+            done = False
+            while not done:
+                intervals = self._next_intervals(chunkSize)
+                i = 0
+                while lastSpike == 0 and i < len(intervals):
+                    tSpike = max(
+                        self.start + intervals[i] - self.spikeInterval * (1 - self.noiseParam), 0)
+                    i += 1
+                    if tSpike > self.stop:
+                        done = True
+                        break
+                    spikeTimes.append(tSpike)
+                    lastSpike = tSpike
+                if done or i == len(intervals):
+                    continue
+                tSpikes = np.cumsum(np.concatenate(([lastSpike], intervals[i:])))[1:]
+                exceeded = tSpikes > self.stop
+                nValid = np.argmax(exceeded) if exceeded.any() else len(tSpikes)
+                spikeTimes.extend(tSpikes[:nValid].tolist())
+                done = nValid < len(tSpikes)
+                lastSpike = tSpikes[-1]
+            self.append_spike_times(spikeTimes, spike_source=spike_source)
 
         # if self.spikeVec.size() and not self.playing:
         #     self.spikes.play(self.spikeVec)
@@ -1091,6 +1195,22 @@ class PointCell(object):
         else:
             return (1 - self.noiseParam) * self.spikeInterval + self.noiseParam * self.spikeInterval * self.rand.exponential()
 
+    def _next_intervals(self, n):
+        """Calculate the next :paramref:`n` spike intervals for a simple spike train at once.
+
+        See :py:meth:`_next_interval`.
+
+        Args:
+            n (int): Number of intervals.
+
+        Returns:
+            :py:class:`numpy.ndarray`: The next spike intervals.
+        """
+        if self.noiseParam == 0:
+            return np.full(n, self.spikeInterval, dtype=float)
+        else:
+            return (1 - self.noiseParam) * self.spikeInterval + self.noiseParam * self.spikeInterval * self.rand.exponential(size=n)
+
     def _add_synapse_pointer(self, synapse):
         """Add a reference to a synapse connected to this cell."""
         if self.synapseList is None:
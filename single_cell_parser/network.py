@@ -77,21 +77,32 @@ class NetworkMapper:
         postCell (:py:class:`~single_cell_parser.cell.Cell`): reference to postsynaptic (multi-compartment) cell model.
         nwParam (:py:class:`~single_cell_parser.parameters.ParameterSet`): network parameter set (see :ref:`network_parameters_format` for more info).
         simParam (:py:class:`~single_cell_parser.parameters.ParameterSet`): simulation parameter set.
+        legacy_release_sampling (bool): 
+            If True, synaptic releases are sampled synapse by synapse, in the same random number order as older versions.
+            If False, releases of all synapses of a presynaptic cell type are sampled at once (see :py:meth:`_activate_functional_synapses`).
+        _skeleton (dict): 
+            Connections between synapses and presynaptic cells of a network realization, 
+            kept to replay new activity on the same network (see :py:meth:`create_saved_network2`).
     '''
 
-    def __init__(self, postCell, nwParam, simParam=None):
+    def __init__(self, postCell, nwParam, simParam=None, legacy_release_sampling=False):
         '''Initialize NetworkMapper.      
 
         Args:
             postCell (:py:class:`~single_cell_parser.cell.Cell`): The cell to map synapses onto.
             nwParam (:py:class:`~single_cell_parser.parameters.ParameterSet`): The network parameter set (see :ref:`network_parameters_format` for more info).
             simParam (:py:class:`~single_cell_parser.parameters.ParameterSet`): The simulation parameter set. Default: None.
+            legacy_release_sampling (bool): 
+                Sample synaptic releases synapse by synapse, to reproduce network activations of older versions with the same random seed.
+                Default: False.
         '''
         self.cells = {}
         self.connected_cells = {}
         self.postCell = postCell
         self.nwParam = nwParam
         self.simParam = simParam
+        self.legacy_release_sampling = legacy_release_sampling
+        self._skeleton = None
         postCell.network_param = nwParam
         postCell.network_sim_param = simParam
 
@@ -132,7 +143,7 @@ class NetworkMapper:
         logger.info('network complete!')
         logger.info('***************************')
 
-    def create_saved_network2(self, synWeightName=None, full_network=False):
+    def create_saved_network2(self, synWeightName=None, full_network=False, keep_skeleton=False):
         '''Recreate a saved network embedding and activate it.
 
         Commonly used to assign synapse locations that have been previously generated
@@ -156,8 +167,29 @@ class NetworkMapper:
                 If True, all synapses are created, even if they were not active. 
                 If False, only recreates the synapses that were active, and re-assigns their IDs to be sequential.
                 Default: False.
+            keep_skeleton (bool):
+                If True, keep the network skeleton: the connections between synapses and presynaptic cells, and their NEURON objects.
+                Subsequent calls with :paramref:`keep_skeleton` then only resample presynaptic activity, synapse weights and releases,
+                and replay them on the existing skeleton, without reading and mapping the network realization again.
+                Use :py:meth:`re_init_network` and :py:meth:`~single_cell_parser.cell.Cell.re_init_cell` with ``disconnect_synapses=False`` 
+                in between simulation runs.
+                Default: False.
         
         '''
+        if keep_skeleton and self.legacy_release_sampling:
+            raise ValueError('A network skeleton can not be replayed with legacy release sampling.')
+        if keep_skeleton and self._skeleton is not None:
+            logger.info('***************************')
+            logger.info('replaying saved network')
+            logger.info('***************************')
+            self._activate_presyn_cells()
+            self._replay_network_skeleton()
+            self._apply_network_modify_functions()
+            logger.info('***************************')
+            logger.info('network complete!')
+            logger.info('***************************')
+            return
+
         logger.info('***************************')
         logger.info('creating saved network')
         logger.info('***************************')
@@ -171,7 +203,8 @@ class NetworkMapper:
             weights, locations = reader.read_synapse_weight_file(synWeightName)
         self._map_complete_anatomical_realization(
             weights,
-            full_network=full_network)
+            full_network=full_network,
+            keep_skeleton=keep_skeleton)
         self._apply_network_modify_functions()
         logger.info('***************************')
         logger.info('network complete!')
@@ -351,17 +384,32 @@ class NetworkMapper:
         See also:
             :py:meth:`~single_cell_parser.cell.Cell.turn_off` for more information on turning cells off.
         
+        If a network skeleton is kept (see :py:meth:`create_saved_network2`), 
+        the release sites of its synapses are turned off as well, but their NEURON objects are kept.
+
         Args:
             replayMode (bool): 
                 Whether or not to destroy the presynaptic cells as well. Default: False.
                 Set to False if you want to keep the presynaptic cells for a new simulation run.
-                Set to True if you want to recreate a new network realization (not taken care of in this function)."""
+                Set to True if you want to recreate a new network realization (not taken care of in this function).
+                This also discards the network skeleton."""
         for synType in list(self.cells.keys()):
             for cell in self.cells[synType]:
                 cell.turn_off()
                 # cell.synapseList = None
+                if self._skeleton is not None:
+                    cell.synapseList = None
+                    cell.spike_source = {}
             if replayMode:
                 self.cells[synType] = []
+        if self._skeleton is not None:
+            for connections in self._skeleton['connections'].values():
+                for syn, preSynCell, synID in connections:
+                    if syn.releaseSite is not None:
+                        syn.releaseSite.turn_off()
+                    syn._active = False
+            if replayMode:
+                self._skeleton = None
 
     # Private methods
     
@@ -669,13 +717,71 @@ class NetworkMapper:
         Returns:
             None
         '''
-        nrOfCells = len(self.cells[preCellType])
         try:
             dist = networkParameters.distribution
         except AttributeError:
             logger.warning('Could not find attribute \"distribution\" for \"pointcell\" of cell type {:s}.'.format(preCellType))
             logger.warning('         Support of \"pointcell\" without this attribute is deprecated.')
             dist = 'normal'
+        
+        if dist == 'PSTH_poissontrain':
+            logger.warning('PSTH_poissontrain is deprecated! Use PSTH_poissontrain_v2 instead!')
+            bins = networkParameters.intervals
+            rates = networkParameters.rates
+            offset = networkParameters.offset
+            noise = 1.0
+            start = 0.0
+            stop = -1.0
+            nSpikes = None
+            if len(bins) != len(rates):
+                errstr = 'Time bins and rates of PSTH_poissontrain for cell type %s have unequal length! ' % preCellType
+                errstr += 'len(bins) = %d - len(rates) = %d' % (len(bins),
+                                                                len(rates))
+                raise RuntimeError(errstr)
+
+            for i in range(len(bins)):  ##fill all cells bin after bin
+                tBegin, tEnd = bins[i]
+                try:
+                    interval = 1000. / rates[i]
+                except ZeroDivisionError:
+                    continue
+                logger.info(
+                    'initializing spike trains with mean rate {:.2f} Hz for cell type {:s}'
+                    .format(1000.0 / interval, preCellType))
+                for cell in self.cells[preCellType]:
+                    cell.compute_spike_train_times(
+                        interval,
+                        noise,
+                        tBegin,
+                        tEnd,
+                        nSpikes,
+                        spike_source='pointcell_PSTH_poissontrain')
+        else:
+            offsets, spikeTimes, spike_source = self._sample_pointcell_spike_times(
+                preCellType, networkParameters, dist)
+            for cell, begin, end in zip(self.cells[preCellType], offsets[:-1], offsets[1:]):
+                cell.append_spike_times(spikeTimes[begin:end], spike_source=spike_source)
+        logger.info(
+            'initializing spike times for cell type {:s}'.format(preCellType))
+
+    def _sample_pointcell_spike_times(self, preCellType, networkParameters, dist):
+        '''Sample the spike times of all presynaptic cells of one cell type at once.
+
+        See :py:meth:`_create_pointcell_activities` for the supported distributions and their parameters.
+        The deprecated "PSTH_poissontrain" distribution is not supported here.
+
+        Args:
+            preCellType (str): The presynaptic cell type.
+            networkParameters (:py:class:`~single_cell_parser.parameters.ParameterSet`): The network parameters for the presynaptic cell type.
+            dist (str): The spike time distribution.
+
+        Returns:
+            tuple: Ragged spike times of all cells: 
+            the offsets of each cell's spike times (length: number of cells + 1), 
+            the concatenated spike times, sorted per cell,
+            and the spike source category.
+        '''
+        nrOfCells = len(self.cells[preCellType])
         if dist == 'normal':
             active, = np.where(np.random.uniform(size=nrOfCells) < networkParameters.activeFrac)
             mean = networkParameters.spikeT
@@ -687,22 +793,16 @@ class NetworkMapper:
                 logger.warning('         Support of \"pointcell\" without this attribute is deprecated.')
                 offset = 10.0
             spikeTimes = offset + mean + sigma * np.random.randn(len(active))
-            for i in range(len(active)):
-                if spikeTimes[i] < 0.1:
-                    spikeTimes[i] = 0.1
-                self.cells[preCellType][active[i]].append(
-                    spikeTimes[i], spike_source='pointcell_normal')
+            spikeTimes[spikeTimes < 0.1] = 0.1
+            spike_source = 'pointcell_normal'
         
         elif dist == 'uniform':
             active, = np.where(np.random.uniform(size=nrOfCells) < networkParameters.activeFrac)
             window = networkParameters.window
             offset = networkParameters.offset
             spikeTimes = offset + window * np.random.rand(len(active))
-            for i in range(len(active)):
-                if spikeTimes[i] < 0.1:
-                    spikeTimes[i] = 0.1
-                self.cells[preCellType][active[i]].append(
-                    spikeTimes[i], spike_source='pointcell_uniform')
+            spikeTimes[spikeTimes < 0.1] = 0.1
+            spike_source = 'pointcell_uniform'
         
         elif dist == 'lognormal':
             active, = np.where(np.random.uniform(size=nrOfCells) < networkParameters.activeFrac)
@@ -710,10 +810,8 @@ class NetworkMapper:
             sigma = networkParameters.sigma
             offset = networkParameters.offset
             spikeTimes = offset + np.random.lognormal(mu, sigma, len(active))
-            for i in range(len(active)):
-                if spikeTimes[i] < 0.1:
-                    spikeTimes[i] = 0.1
-                self.cells[preCellType][active[i]].append(spikeTimes[i], spike_source='pointcell_lognormal')
+            spikeTimes[spikeTimes < 0.1] = 0.1
+            spike_source = 'pointcell_lognormal'
         
         elif dist == 'PSTH':
             bins = networkParameters.intervals
@@ -723,101 +821,59 @@ class NetworkMapper:
                 errstr = 'Time bins and probabilities of PSTH for cell type %s have unequal length! ' % preCellType
                 errstr += 'len(bins) = %d - len(probabilities) = %d' % (len(bins), len(probabilities))
                 raise RuntimeError(errstr)
+            active, spikeTimes = [], []
             for i in range(len(bins)):  ##fill all cells bin after bin
                 tBegin, tEnd = bins[i]
                 spikeProb = probabilities[i]
-                active, = np.where(
+                active_, = np.where(
                     np.random.uniform(size=nrOfCells) < spikeProb)
-                spikeTimes = offset + tBegin + (
-                    tEnd - tBegin) * np.random.uniform(size=len(active))
-                for j in range(len(active)):
-                    self.cells[preCellType][active[j]].append(
-                        spikeTimes[j], spike_source='pointcell_PSTH')
+                active.append(active_)
+                spikeTimes.append(offset + tBegin + (
+                    tEnd - tBegin) * np.random.uniform(size=len(active_)))
+            active = np.concatenate(active) if active else np.array([], dtype=int)
+            spikeTimes = np.concatenate(spikeTimes) if spikeTimes else np.array([])
+            spike_source = 'pointcell_PSTH'
         
         elif dist == 'PSTH_absolute_number':
             bins = networkParameters.intervals
             number_active_synapses = networkParameters.number_active_synapses
             offset = networkParameters.offset
             if len(bins) != len(number_active_synapses):
-                errstr = 'Time bins and probabilities of PSTH for cell type {} have unequal length! len(bins) = {} - len(probabilities) = {}'.format(preCellType, len(bins), len(probabilities))
+                errstr = 'Time bins and number of active synapses of PSTH for cell type {} have unequal length! len(bins) = {} - len(number_active_synapses) = {}'.format(preCellType, len(bins), len(number_active_synapses))
                 raise RuntimeError(errstr)
+            active, spikeTimes = [], []
             for i in range(len(bins)):  ##fill all cells bin after bin
                 tBegin, tEnd = bins[i]
                 nas = number_active_synapses[i]
                 try:
-                    active = np.random.choice(
+                    active_ = np.random.choice(
                         list(range(nrOfCells)), nas, replace=False
                     )  # np.where(np.random.uniform(size=nrOfCells) < spikeProb)
                 except ValueError:
                     logger.warning('Number of active synapses larger than number of synapses! ')
                     logger.warning('Switching from drawing without replacement to drawing with replacement.')
                     
-                    active = np.random.choice(
+                    active_ = np.random.choice(
                         list(range(nrOfCells)),
                         nas,
                         replace=True)
-                spikeTimes = offset + tBegin + (
-                    tEnd - tBegin) * np.random.uniform(size=len(active))
-                for j in range(len(active)):
-                    self.cells[preCellType][active[j]].append(
-                        spikeTimes[j],
-                        spike_source='pointcell_PSTH_absolute_number')
-        
-        elif dist == 'PSTH_poissontrain':
-            logger.warning('PSTH_poissontrain is deprecated! Use PSTH_poissontrain_v2 instead!')
-            bins = networkParameters.intervals
-            rates = networkParameters.rates
-            offset = networkParameters.offset
-            noise = 1.0
-            start = 0.0
-            stop = -1.0
-            nSpikes = None
-            if len(bins) != len(rates):
-                errstr = 'Time bins and rates of PSTH_poissontrain for cell type %s have unequal length! ' % preCellType
-                errstr += 'len(bins) = %d - len(rates) = %d' % (len(bins),
-                                                                len(rates))
-                raise RuntimeError(errstr)
-
-            for i in range(len(bins)):  ##fill all cells bin after bin
-                tBegin, tEnd = bins[i]
-                try:
-                    interval = 1000. / rates[i]
-                except ZeroDivisionError:
-                    continue
-                logger.info(
-                    'initializing spike trains with mean rate {:.2f} Hz for cell type {:s}'
-                    .format(1000.0 / interval, preCellType))
-                for cell in self.cells[preCellType]:
-                    #logger.info 'calling compute_spike_train_times with',  'interval', \
-                    #interval, 'noise', noise, 'tBegin', tBegin, 'tEnd', tEnd, \
-                    #'nSpikes', nSpikes
-                    # self.append(tSpike, spike_source = spike_source)
-                    cell.compute_spike_train_times(
-                        interval,
-                        noise,
-                        tBegin,
-                        tEnd,
-                        nSpikes,
-                        spike_source='pointcell_PSTH_poissontrain')
+                active.append(active_)
+                spikeTimes.append(offset + tBegin + (
+                    tEnd - tBegin) * np.random.uniform(size=len(active_)))
+            active = np.concatenate(active) if active else np.array([], dtype=int)
+            spikeTimes = np.concatenate(spikeTimes) if spikeTimes else np.array([])
+            spike_source = 'pointcell_PSTH_absolute_number'
         
         elif dist == 'PSTH_poissontrain_v2':
             bins = networkParameters.bins
             rates = networkParameters.rates
-            offset = networkParameters.offset
-            noise = 1.0
-            start = 0.0
-            stop = -1.0
-            nSpikes = None
             if len(bins) != len(rates) + 1:
                 errstr = 'Time bins must be one element longer than rates!'
                 errstr += 'len(bins) = %d - len(rates) = %d' % (len(bins),
                                                                 len(rates))
                 raise RuntimeError(errstr)
-
-            for cell in self.cells[preCellType]:
-                spikeTimes = sample_times_from_rates(bins, rates)
-                for spike_time in spikeTimes:
-                    cell.append(spike_time, spike_source='PSTH_poissontrain_v2')
+            offsets, spikeTimes = sample_times_from_rates_batch(bins, rates, nrOfCells)
+            return offsets, spikeTimes, 'PSTH_poissontrain_v2'
 
         elif dist == 'poissontrain_modulated':
             # Generates poisson train activity from a modulated PSTH
@@ -843,28 +899,29 @@ class NetworkMapper:
             n_cycles = duration / cycle_duration
 
             if phase_distribution == 'uniform':
-                phase = np.random.uniform(0, 2 * np.pi,
-                                       len(self.cells[preCellType]))
+                phase = np.random.uniform(0, 2 * np.pi, nrOfCells)
             elif phase_distribution == 'normal':
                 mean_phase = networkParameters.mean_phase
                 std_phase = networkParameters.std_phase
-                phase = np.random.normal(mean_phase, std_phase,
-                                         len(self.cells[preCellType]))
+                phase = np.random.normal(mean_phase, std_phase, nrOfCells)
             else:
-                phase = np.zeros(len(self.cells[preCellType]))
+                phase = np.zeros(nrOfCells)
             
-            for i,cell in enumerate(self.cells[preCellType]):
-                rates = np.full(n_bins,mean_rate)*(1+ M*np.sin(np.linspace(0,2*np.pi*n_cycles,n_bins)+phase[i]))
-                rates[0] = rate_before_t_offset
-                spikeTimes = sample_times_from_rates(bins, rates)
-                for spike_time in spikeTimes:
-                    cell.append(spike_time, spike_source='poissontrain_modulated')
+            # one row of rates per cell
+            rates = mean_rate * (1 + M * np.sin(
+                np.linspace(0, 2 * np.pi * n_cycles, n_bins) + phase[:, np.newaxis]))
+            rates[:, 0] = rate_before_t_offset
+            offsets, spikeTimes = sample_times_from_rates_batch(bins, rates, nrOfCells)
+            return offsets, spikeTimes, 'poissontrain_modulated'
 
         else:
             errstr = 'Unknown spike time distribution: %s' % dist
             raise RuntimeError(errstr)
-        logger.info(
-            'initializing spike times for cell type {:s}'.format(preCellType))
+
+        # sort spike times by cell
+        order = np.lexsort((spikeTimes, active))
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(active, minlength=nrOfCells))))
+        return offsets, spikeTimes[order], spike_source
 
     def _connect_functional_synapses(self):
         '''Connects anatomical synapses to spike generators (PointCells).
@@ -886,7 +943,6 @@ class NetworkMapper:
             logger.info(
                 'setting up functional connectivity for cell type {:s}'.format(
                     synType))
-            activeSyn = 0
             connectedCells = set()
             nrPreCells = len(self.cells[synType])
             convergence = self.nwParam[synType].convergence
@@ -906,22 +962,27 @@ class NetworkMapper:
                 connectionIndex = list(np.random.permutation(len(connected)))
                 for i in range(len(connected), len(synapses[synType])):
                     connectionIndex.append(np.random.randint(len(connected)))
+            synParameters = self.nwParam[synType].synapses
+            connectedSyns, connectedPreSynCells = [], []
             for i in range(len(connectionIndex)):
                 con = connected[connectionIndex[i]]
                 preSynCell = self.cells[synType][con]
                 connectedCells.add(con)
                 syn = synapses[synType][i]
-                synParameters = self.nwParam[synType].synapses
                 for recepStr in list(synParameters.receptors.keys()):
                     receptor = synParameters.receptors[recepStr]
                     self._assign_synapse_weights(receptor, recepStr, syn)
                 if preSynCell.is_active():
-                    if not syn.pruned:
+                    connectedSyns.append(syn)
+                    connectedPreSynCells.append(preSynCell)
+                    if self.legacy_release_sampling and not syn.pruned:
                         activate_functional_synapse(syn, self.postCell,
                                                     preSynCell, synParameters)
-                    if syn.is_active():
-                        activeSyn += 1
                     preSynCell._add_synapse_pointer(syn)
+            if not self.legacy_release_sampling:
+                self._activate_functional_synapses(
+                    connectedSyns, connectedPreSynCells, synParameters)
+            activeSyn = sum(syn.is_active() for syn in connectedSyns)
             self.connected_cells[synType] = connectedCells
             logger.info('    connected cells: {:d}'.format(len(connectedCells)))
             logger.info('    active {:s} synapses: {:d}'.format(
@@ -1054,7 +1115,8 @@ class NetworkMapper:
     def _map_complete_anatomical_realization(
         self,
         weights=None,
-        full_network=False
+        full_network=False,
+        keep_skeleton=False
         ):
         '''Connect synapses to active presynaptic cells.
 
@@ -1072,7 +1134,12 @@ class NetworkMapper:
             full_network (bool): Defines which cell IDS to use.
                 If True: (non-sequential) cell ids from the network embedding are used. 
                 If False, single_cell network embedding from single_cell_input_mapper is used, in which cell ids are sequential.
+            keep_skeleton (bool): 
+                If True, keep the connections between synapses and presynaptic cells to replay new activity on them later.
+                See :py:meth:`create_saved_network2`.
         '''
+        if keep_skeleton:
+            self._skeleton = {'weights': weights, 'connections': {}}
         previousConnectionFile = ''
         synapses = self.postCell.synapses
         # previousConnections = {}
@@ -1100,7 +1167,6 @@ class NetworkMapper:
             # 2. Connect synapses
             
             logger.info('setting up functional connectivity for cell type %s'.format(synType))
-            activeSyn = 0
             connectedCells = set()
             
             try:
@@ -1137,6 +1203,10 @@ class NetworkMapper:
                         pass
             log_cell_count(self.nwParam, self.cells)
             
+            synParameters = self.nwParam[synType].synapses
+            connectedSyns, connectedPreSynCells = [], []
+            if keep_skeleton:
+                self._skeleton['connections'][synType] = skeletonConnections = []
             for con in functionalMap:
                 cellType, cellID, synID = con
                 if cellType != synType:
@@ -1156,12 +1226,13 @@ class NetworkMapper:
                     preSynCell = self.cells[synType][cell_index]
                     syn = synapses[synType][synapse_counter]
                     synapse_counter += 1
+                if keep_skeleton:
+                    skeletonConnections.append((syn, preSynCell, synID))
 
                 # if cellType not in visTest.keys():
                 #      visTest[cellType] = []
                 #  visTest[cellType].append((cellType, cellID, synID))
 
-                synParameters = self.nwParam[synType].synapses
                 if weights:
                     syn.weight = weights[synType][synID]
                 else:
@@ -1169,11 +1240,15 @@ class NetworkMapper:
                         receptor = synParameters.receptors[recepStr]
                         self._assign_synapse_weights(receptor, recepStr, syn)
                 if preSynCell.is_active():
-                    if not syn.pruned:
+                    connectedSyns.append(syn)
+                    connectedPreSynCells.append(preSynCell)
+                    if self.legacy_release_sampling and not syn.pruned:
                         activate_functional_synapse(syn, self.postCell,preSynCell, synParameters)
-                    if syn.is_active():
-                        activeSyn += 1
                     preSynCell._add_synapse_pointer(syn)
+            if not self.legacy_release_sampling:
+                self._activate_functional_synapses(
+                    connectedSyns, connectedPreSynCells, synParameters)
+            activeSyn = sum(syn.is_active() for syn in connectedSyns)
             self.connected_cells[synType] = connectedCells
 
             # previousConnections = connections
@@ -1188,6 +1263,61 @@ class NetworkMapper:
         logger.info('total active synapses: {:d}'.format(totalActiveSyns))
         logger.info('---------------------------')
 
+    def _replay_network_skeleton(self):
+        '''Replay new presynaptic activity on the kept network skeleton.
+
+        Resamples synapse weights and releases for all connections of the skeleton, as in :py:meth:`_map_complete_anatomical_realization`,
+        but without reading the network realization or creating new NEURON objects for synapses that are already connected.
+        '''
+        weights = self._skeleton['weights']
+        totalActiveSyns = 0
+        for synType, connections in self._skeleton['connections'].items():
+            synParameters = self.nwParam[synType].synapses
+            connectedSyns, connectedPreSynCells = [], []
+            for syn, preSynCell, synID in connections:
+                if weights:
+                    syn.weight = weights[synType][synID]
+                else:
+                    syn.weight = None
+                    for recepStr in list(synParameters.receptors.keys()):
+                        receptor = synParameters.receptors[recepStr]
+                        self._assign_synapse_weights(receptor, recepStr, syn)
+                if preSynCell.is_active():
+                    connectedSyns.append(syn)
+                    connectedPreSynCells.append(preSynCell)
+                    preSynCell._add_synapse_pointer(syn)
+            self._activate_functional_synapses(
+                connectedSyns, connectedPreSynCells, synParameters)
+            totalActiveSyns += sum(syn.is_active() for syn in connectedSyns)
+        logger.info('total active synapses: {:d}'.format(totalActiveSyns))
+        logger.info('---------------------------')
+
+    def _activate_functional_synapses(self, syns, preSynCells, synParameters):
+        '''Activate all synapses of one presynaptic cell type at once.
+
+        The releases of all synapses are sampled in one go using :py:meth:`sample_release_times`,
+        after which each synapse is activated with its release times using :py:meth:`activate_functional_synapse`.
+        Synapses that are still connected from a previous run of a network skeleton are reactivated 
+        with :py:meth:`reactivate_functional_synapse` instead.
+        Pruned synapses are not activated.
+
+        Args:
+            syns (list): The synapses to activate.
+            preSynCells (list): The presynaptic cell of each synapse.
+            synParameters (:py:class:`~single_cell_parser.parameters.ParameterSet`): Synapse parameters of this presynaptic cell type.
+        '''
+        unpruned = [i for i, syn in enumerate(syns) if not syn.pruned]
+        releaseTimes = sample_release_times(
+            [preSynCells[i] for i in unpruned], synParameters)
+        for i, releaseTimes_ in zip(unpruned, releaseTimes):
+            if syns[i].netcons:
+                reactivate_functional_synapse(
+                    syns[i], preSynCells[i], synParameters, releaseTimes_)
+            else:
+                activate_functional_synapse(
+                    syns[i], self.postCell, preSynCells[i], synParameters,
+                    releaseTimes=releaseTimes_)
+
     def _assign_synapse_weights(self, receptor, recepStr, syn):
         """Assign synapse weights according to distribution specified in network parameters.
         
@@ -1434,6 +1564,70 @@ def activate_functional_synapse(
             exec(paramStr)
 
 
+def reactivate_functional_synapse(syn, preSynCell, synParameters, releaseTimes):
+    '''Activate a synapse that is already connected with new release times.
+
+    Reuses the release site, receptors and :py:class:`~neuron.h.NetCon` objects 
+    that have been created by :py:meth:`activate_functional_synapse` in a previous simulation run,
+    and only updates the release times and synaptic weights.
+
+    Args:
+        syn (:py:class:`~single_cell_parser.synapse.Synapse`): Synapse object.
+        preSynCell (:py:class:`~single_cell_parser.cell.PointCell`): Presynaptic cell.
+        synParameters (:py:class:`~single_cell_parser.parameters.ParameterSet`): Synapse parameters, see also the ``synapses`` key in the :ref:`network_parameters_format` file.
+        releaseTimes (list): List of synaptic release times.
+    '''
+    if not len(releaseTimes):
+        return
+    releaseSite = syn.releaseSite
+    releaseSite.set_spike_times(releaseTimes)
+    releaseSite.spike_source = preSynCell.spike_source
+    syn.spike_source = preSynCell.spike_source
+    syn.preCell = preSynCell
+
+    receptors = synParameters.receptors
+    # NetCons are created in the order of the receptors, see Synapse.activate_hoc_syn
+    for recepStr, netcon in zip(list(receptors.keys()), syn.netcons):
+        for i in range(len(syn.weight[recepStr])):
+            netcon.weight[i] = syn.weight[recepStr][i]
+    syn._active = True
+    if 'releaseProb' in synParameters and synParameters.releaseProb == 'dynamic':
+        syn.hocRNG = h.Random(int(1000000 * np.random.rand()))
+        syn.hocRNG.negexp(1)
+        for recepStr in list(receptors.keys()):
+            syn.receptors[recepStr].setRNG(syn.hocRNG)
+
+
+def sample_release_times(preSynCells, synParameters):
+    '''Sample the synaptic release times of multiple synapses at once.
+
+    Release times are sampled as in :py:meth:`activate_functional_synapse`, 
+    but the random numbers for all presynaptic spikes of all synapses are drawn in a single call.
+
+    Args:
+        preSynCells (list): The presynaptic :py:class:`~single_cell_parser.cell.PointCell` of each synapse.
+        synParameters (:py:class:`~single_cell_parser.parameters.ParameterSet`): Synapse parameters, see also the ``synapses`` key in the :ref:`network_parameters_format` file.
+
+    Returns:
+        list: A sorted list of release times for each synapse.
+    '''
+    conductance_delay = 0.0
+    nrOfSpikes = np.array([len(c.spikeTimes) for c in preSynCells], dtype=int)
+    spikeTimes = np.array(
+        [t for c in preSynCells for t in c.spikeTimes], dtype=float)
+    if 'releaseProb' in synParameters and synParameters.releaseProb != 'dynamic':
+        released = np.random.rand(len(spikeTimes)) < synParameters.releaseProb
+    else:
+        released = np.ones(len(spikeTimes), dtype=bool)
+    synapseIndex = np.repeat(np.arange(len(preSynCells)), nrOfSpikes)
+    offsets = np.concatenate(
+        ([0], np.cumsum(np.bincount(synapseIndex[released], minlength=len(preSynCells)))))
+    releaseTimes = spikeTimes[released] + conductance_delay
+    return [
+        sorted(releaseTimes[begin:end].tolist())
+        for begin, end in zip(offsets[:-1], offsets[1:])]
+
+
 # backup by arco
 # def activate_functional_synapse(syn, cell, preSynCell, synParameters, tChange=None, synParametersChange=None):
 #     '''Default method to activate single synapse.
@@ -1554,28 +1748,71 @@ def functional_connectivity_visualization(functionalMap, cell):
 def sample_times_from_rates(bins, rate):
     """Sample spike times from spike rates.
     
-    Used in :py:meth:`~_create_presyn_cells` to generate spike times for a Poisson spike train."""
-    cum_bin_width_weighted_with_rate = np.cumsum(np.diff(bins) * rate)
-    cum_bin_width = np.cumsum(np.diff(bins))
-
-    # generate a poisson spike train, add additional spikes until length is sufficient to fill all bins
-    size = int(np.ceil(cum_bin_width_weighted_with_rate.max() * 1.)) + 1
-    inter_spike_intervals = np.random.exponential(
-        1000, size=size)  # 1000 corresponds to 1Hz, since time is in ms
-    while sum(inter_spike_intervals) <= max(cum_bin_width_weighted_with_rate):
-        inter_spike_intervals2 = np.random.exponential(1000, size=size)
-        inter_spike_intervals = np.concatenate(
-            [inter_spike_intervals, inter_spike_intervals2])
-    constant_rate_spikes = np.cumsum(inter_spike_intervals)
+    Used in :py:meth:`~_create_presyn_cells` to generate spike times for a Poisson spike train.
+    See :py:meth:`sample_times_from_rates_batch` to sample multiple spike trains at once."""
+    offsets, spikes = sample_times_from_rates_batch(bins, rate, 1)
+    return spikes
+
+
+def sample_times_from_rates_batch(bins, rates, nTrains):
+    """Sample the spike times of multiple Poisson spike trains from spike rates.
+
+    A Poisson spike train with a constant rate of 1 Hz is generated for each spike train,
+    and its time axis is warped such that it follows the time dependent rate.
+
+    Args:
+        bins (array-like): Bin edges in ms.
+        rates (array-like): 
+            Spike rate in Hz for each bin. 
+            Either one rate per bin that is shared by all spike trains, 
+            or an array of shape (:paramref:`nTrains`, number of bins) with the rates of each spike train.
+        nTrains (int): Number of spike trains.
+
+    Returns:
+        tuple: The offsets of each spike train's spike times (length: :paramref:`nTrains` + 1), 
+        and the concatenated spike times.
+    """
+    bins = np.asarray(bins, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+    bin_width = np.diff(bins)
+    cum_bin_width = np.concatenate(([0], np.cumsum(bin_width)))
+    cum_bin_width_weighted_with_rate = np.cumsum(bin_width * rates, axis=-1)
+    cum_bin_width_weighted_with_rate = np.concatenate(
+        (np.zeros(rates.shape[:-1] + (1,)), cum_bin_width_weighted_with_rate), axis=-1)
+    total = np.broadcast_to(cum_bin_width_weighted_with_rate[..., -1], (nTrains,))
+
+    # generate poisson spike trains with enough spikes to fill all bins in most cases
+    expected_n_spikes = total.max() / 1000. if nTrains else 0.
+    size = int(np.ceil(expected_n_spikes + 5 * np.sqrt(expected_n_spikes))) + 1
+    constant_rate_spikes = np.cumsum(
+        np.random.exponential(1000, size=(nTrains, size)),
+        axis=1)  # 1000 corresponds to 1Hz, since time is in ms
+    # add additional spikes until all spike trains are long enough
+    while np.any(constant_rate_spikes[:, -1] <= total):
+        additional_spikes = constant_rate_spikes[:, -1:] + np.cumsum(
+            np.random.exponential(1000, size=(nTrains, size)), axis=1)
+        constant_rate_spikes = np.concatenate(
+            [constant_rate_spikes, additional_spikes], axis=1)
 
     # warp time axis such that constant_rate_spikes transform into the time dependent rate
-    spikes = np.interp(constant_rate_spikes,
-                       [0] + list(cum_bin_width_weighted_with_rate),
-                       [0] + list(cum_bin_width),
-                       right=np.nan,
-                       left=np.nan)
+    if rates.ndim == 1:
+        spikes = np.interp(constant_rate_spikes,
+                           cum_bin_width_weighted_with_rate,
+                           cum_bin_width,
+                           right=np.nan,
+                           left=np.nan)
+    else:
+        spikes = np.empty_like(constant_rate_spikes)
+        for i in range(nTrains):
+            spikes[i] = np.interp(constant_rate_spikes[i],
+                                  cum_bin_width_weighted_with_rate[i],
+                                  cum_bin_width,
+                                  right=np.nan,
+                                  left=np.nan)
 
     # shift bins such that they start when first interval stats
     spikes = spikes + bins[0]
 
-    return spikes[~np.isnan(spikes)]
+    valid = ~np.isnan(spikes)
+    offsets = np.concatenate(([0], np.cumsum(valid.sum(axis=1))))
+    return offsets, spikes[valid]
@@ -5,6 +5,7 @@ from collections.abc import MutableMapping
 import json, re, neuron, os
 from data_base.dbopen import dbopen, resolve_modular_db_path, resolve_db_path
 from data_base.data_base import is_data_base
+from .parsed_file_cache import cached_file_parser
 
 def _read_params_to_dict(filename):
     filename = resolve_modular_db_path(filename)
@@ -36,6 +37,7 @@ def _read_params_to_dict(filename):
     return params_dict
 
 
+@cached_file_parser(include_path=True)
 def build_parameters(filename):
     """Read in a :ref:`param_file_format` file and return a ParameterSet object.
 
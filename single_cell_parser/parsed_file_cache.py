@@ -0,0 +1,205 @@
+# In Silico Framework
+# Copyright (C) 2025  Max Planck Institute for Neurobiology of Behavior - CAESAR
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# The full license text is also available in the LICENSE file in the root of this repository.
+"""Cache for parsed input files, keyed by file content.
+
+Simulation tasks often parse the same :ref:`param_file_format`, :ref:`hoc_file_format`,
+:ref:`syn_file_format` and :ref:`con_file_format` files over and over again.
+Readers decorated with :py:meth:`cached_file_parser` only parse a file once per process:
+subsequent calls with a file of the same content return a copy of the cached result.
+
+The cache has two tiers:
+
+1. An in-process least-recently-used cache, holding the pickled parse results.
+2. An optional on-disk cache of pickle files, shared between processes (e.g. dask workers) on the same file system.
+   It is enabled by setting the environment variable ``ISF_PARSED_FILE_CACHE_DIR`` to a directory,
+   or with :py:meth:`configure_parsed_file_cache`.
+
+Each call returns an independent copy of the parse result, so callers can safely modify it.
+Files are only hashed again if their modification time or size changed.
+
+Warning:
+    Entries of the on-disk cache are unpickled without further checks.
+    Unpickling can execute arbitrary code, so the cache directory must only be writable by trusted users,
+    just like e.g. a :py:class:`~data_base.data_base.DataBase` containing pickled objects.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from data_base.dbopen import resolve_db_path
+import logging
+
+logger = logging.getLogger("ISF").getChild(__name__)
+
+_CACHE_VERSION = 1
+_lock = threading.RLock()
+_memory_cache = OrderedDict()
+# (path, mtime, size) -> content hash, least recently used first
+_file_digests = OrderedDict()
+_MAX_FILE_DIGESTS = 4096
+_config = {
+    'enabled': True,
+    'maxsize': 64,
+    'cache_dir': os.environ.get('ISF_PARSED_FILE_CACHE_DIR'),
+}
+
+
+def configure_parsed_file_cache(enabled=None, maxsize=None, cache_dir=None):
+    """Configure the parsed file cache of this process.
+
+    Args:
+        enabled (bool, optional): Enable or disable the cache. Default: unchanged (enabled).
+        maxsize (int, optional): Maximum number of parse results in the in-process cache. Default: unchanged (64).
+        cache_dir (str, optional):
+            Directory of the on-disk cache. Set to ``''`` to disable the on-disk cache.
+            Default: unchanged (the environment variable ``ISF_PARSED_FILE_CACHE_DIR``, if set).
+            Files in this directory are unpickled, so it must only be writable by trusted users.
+    """
+    with _lock:
+        if enabled is not None:
+            _config['enabled'] = enabled
+        if maxsize is not None:
+            _config['maxsize'] = maxsize
+            _evict()
+        if cache_dir is not None:
+            _config['cache_dir'] = cache_dir or None
+
+
+def clear_parsed_file_cache():
+    """Clear the in-process cache. The on-disk cache is left untouched."""
+    with _lock:
+        _memory_cache.clear()
+        _file_digests.clear()
+
+
+def cached_file_parser(include_path=False):
+    """Decorator to cache the results of a file parser by file content.
+
+    The decorated parser must take the file name as its first argument.
+    Files that can not be hashed (e.g. files within ``.tar`` archives) are parsed without caching.
+
+    Args:
+        include_path (bool):
+            Whether the parse result also depends on the location of the file, e.g. due to relative paths within the file.
+            If True, the file path is part of the cache key.
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(parser):
+        @functools.wraps(parser)
+        def wrapper(fname, *args, **kwargs):
+            if not _config['enabled'] or not isinstance(fname, str):
+                return parser(fname, *args, **kwargs)
+            try:
+                digest = _get_file_digest(fname)
+            except Exception:
+                # let the parser raise an informative error, or parse without caching
+                return parser(fname, *args, **kwargs)
+            key = hashlib.sha1(pickle.dumps((
+                _CACHE_VERSION,
+                parser.__module__,
+                parser.__name__,
+                os.path.splitext(fname)[1],
+                fname if include_path else None,
+                digest,
+                args,
+                sorted(kwargs.items())
+                ))).hexdigest()
+            blob = _get(key)
+            if blob is None:
+                result = parser(fname, *args, **kwargs)
+                blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+                _put(key, blob)
+                return result
+            return pickle.loads(blob)
+        return wrapper
+    return decorator
+
+
+def _get_file_digest(fname):
+    """Get the content hash of a file, rehashing only if it has been modified."""
+    path = resolve_db_path(fname)
+    if '.tar/' in path:
+        raise ValueError('Can not hash files within tar archives.')
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        digest = _file_digests.get(key)
+        if digest is not None:
+            _file_digests.move_to_end(key)
+            return digest
+    sha = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    digest = sha.hexdigest()
+    with _lock:
+        _file_digests[key] = digest
+        while len(_file_digests) > _MAX_FILE_DIGESTS:
+            _file_digests.popitem(last=False)
+    return digest
+
+
+def _get(key):
+    """Get a pickled parse result from the in-process or on-disk cache."""
+    with _lock:
+        blob = _memory_cache.get(key)
+        if blob is not None:
+            _memory_cache.move_to_end(key)
+            return blob
+    cache_dir = _config['cache_dir']
+    if cache_dir is None:
+        return None
+    try:
+        with open(os.path.join(cache_dir, key + '.pickle'), 'rb') as f:
+            blob = f.read()
+    except OSError:
+        return None
+    with _lock:
+        _memory_cache[key] = blob
+        _evict()
+    return blob
+
+
+def _put(key, blob):
+    """Add a pickled parse result to the in-process and on-disk cache."""
+    with _lock:
+        _memory_cache[key] = blob
+        _evict()
+    cache_dir = _config['cache_dir']
+    if cache_dir is None:
+        return
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, key + '.pickle')
+        # write to a temporary file first, so that other processes never read incomplete files
+        tmp_path = '{}.{}.{}.tmp'.format(path, os.getpid(), threading.get_ident())
+        with open(tmp_path, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning('Could not write to parsed file cache {}: {}'.format(cache_dir, e))
+
+
+def _evict():
+    """Remove the least recently used entries from the in-process cache."""
+    while len(_memory_cache) > max(_config['maxsize'], 0):
+        _memory_cache.popitem(last=False)
@@ -26,9 +26,11 @@
         :py:mod:`data_base.IO.LoaderDumper` for dask and pandas related IO.
 '''
 
+import os
 import numpy as np
 from . import scalar_field
-from data_base.dbopen import dbopen
+from data_base.dbopen import dbopen, resolve_db_path
+from .parsed_file_cache import cached_file_parser
 import logging
 
 __author__  = 'Robert Egger'
@@ -85,6 +87,7 @@ class _Edge(object):
         return True
 
 
+@cached_file_parser()
 def read_hoc_file(fname=''):
     """Reads a hoc file and returns a list of Edge objects.
     
@@ -263,20 +266,44 @@ def read_hoc_file(fname=''):
         return cell
 
 
-def read_scalar_field(fname=''):
+def read_scalar_field(fname='', use_binary=False):
     """Read AMIRA scalar fields.
     
+    Parsing large :ref:`am_file_format` files is slow. 
+    Scalar fields can be converted once to a binary format with :py:meth:`convert_scalar_field_to_binary`,
+    which is loaded lazily as a memory-mapped array (see :py:meth:`~single_cell_parser.scalar_field.ScalarField.from_binary`).
+    
     Args:
-        fname (str): The name of the file to be read.
+        fname (str): 
+            The name of the file to be read. 
+            Either an :ref:`am_file_format` file, or a binary scalar field file with suffix :py:attr:`~single_cell_parser.scalar_field.BINARY_SUFFIX`.
+        use_binary (bool):
+            If True, read the binary version of an :ref:`am_file_format` file, i.e. the file with the same name and suffix 
+            :py:attr:`~single_cell_parser.scalar_field.BINARY_SUFFIX`.
+            The binary file is created on first use, and recreated if the :ref:`am_file_format` file is newer.
+            Default: False.
 
     Raises:
-        IOError: If the input file does not have a `.am` or `.AM` suffix.
+        IOError: If the input file does not have a `.am`, `.AM` or binary scalar field suffix.
 
     Returns:
         :py:class:`~single_cell_parser.scalar_field.ScalarField`: A scalar field object.
     """
+    if fname.endswith(scalar_field.BINARY_SUFFIX):
+        return scalar_field.ScalarField.from_binary(resolve_db_path(fname))
     if not fname.endswith('.am') and not fname.endswith('.AM'):
         raise IOError('Input file is not an Amira Mesh file!')
+    if use_binary:
+        amName = resolve_db_path(fname)
+        binaryName = _get_binary_scalar_field_name(amName)
+        if not os.path.exists(binaryName) or os.path.getmtime(binaryName) < os.path.getmtime(amName):
+            scalarField = read_scalar_field(fname)
+            try:
+                scalarField.save_binary(binaryName)
+            except OSError as e:
+                logger.warning('Could not convert {} to a binary scalar field: {}'.format(fname, e))
+                return scalarField
+        return scalar_field.ScalarField.from_binary(binaryName)
 
     with dbopen(fname, 'r') as meshFile:
         # logger.info "Reading Amira Mesh file", fname
@@ -327,6 +354,33 @@ def read_scalar_field(fname=''):
         return scalar_field.ScalarField(mesh, origin, extent, spacing, bounds)
 
 
+def _get_binary_scalar_field_name(fname):
+    """Get the name of the binary version of an :ref:`am_file_format` file."""
+    return os.path.splitext(fname)[0] + scalar_field.BINARY_SUFFIX
+
+
+def convert_scalar_field_to_binary(fname, outName=None):
+    """Convert an :ref:`am_file_format` scalar field to the binary scalar field format.
+    
+    See :py:meth:`~single_cell_parser.scalar_field.ScalarField.save_binary` for details on the format.
+    
+    Args:
+        fname (str): The name of the :ref:`am_file_format` file to convert.
+        outName (str, optional): 
+            The name of the binary output file. 
+            Default: :paramref:`fname` with suffix :py:attr:`~single_cell_parser.scalar_field.BINARY_SUFFIX`.
+            
+    Returns:
+        str: The name of the binary output file.
+    """
+    if outName is None:
+        outName = _get_binary_scalar_field_name(resolve_db_path(fname))
+    read_scalar_field(fname).save_binary(outName)
+    logger.info('Converted scalar field {} to {}'.format(fname, outName))
+    return outName
+
+
+@cached_file_parser()
 def read_synapse_realization(fname):
     """Read a :ref:`syn_file_format` file and returns a dictionary of synapse locations.
     
@@ -453,6 +507,7 @@ def read_pruned_synapse_realization(fname):
     return synapses
 
 
+@cached_file_parser()
 def read_functional_realization_map(fname):
     '''Read in a :ref:`con_file_format` file and return a dictionary of functional connections.
 
@@ -562,6 +617,93 @@ def read_synapse_activation_file(fname):
     return synapses
 
 
+def read_synapse_activation_arrays(fname):
+    '''Reads a synapse activation file into flat arrays.
+
+    Array-backed counterpart of :py:meth:`read_synapse_activation_file`.
+    Reads either the text format or the binary ``.npz`` format, depending on the file extension.
+    Instead of parsing the file synapse by synapse, all columns are converted at once, and the activation times
+    of all synapses are parsed in a single call.
+    
+    Args:
+        fname (str): 
+            Filename of a synapse activation file.
+            Such a file can be generated with :py:meth:`single_cell_parser.writer.write_synapse_activation_file`
+            or :py:meth:`single_cell_parser.writer.write_synapse_activation_arrays`.
+
+    Returns:
+        dict: Dictionary of numpy arrays, as described in :py:meth:`~single_cell_parser.writer.get_synapse_activation_arrays`.
+
+    See also:
+        :py:meth:`synapse_activation_arrays_to_dict` to convert the result to the output format of :py:meth:`read_synapse_activation_file`.
+    '''
+    if fname.endswith('.npz'):
+        with dbopen(fname, 'rb') as synFile:
+            with np.load(synFile) as npz:
+                return {k: npz[k] for k in npz.files}
+
+    with dbopen(fname, 'r') as synFile:
+        lines = synFile.read().split('\n')[1:]
+    # only strip line endings: a trailing tab denotes an empty list of activation times
+    splitLines = [l.rstrip('\r\n').split('\t') for l in lines if l.strip()]
+    # clunky support for old format synapse activation files without synapse ID
+    splitLines = [
+        l if len(l) != 6 else [l[0], '-1'] + l[1:] 
+        for l in splitLines
+        ]
+    if splitLines:
+        columns = list(zip(*[l[:6] for l in splitLines]))
+    else:
+        columns = [()] * 6
+    timeStrs = [l[6] if len(l) > 6 else '' for l in splitLines]
+    timeStrs = [ts if not ts or ts.endswith(',') else ts + ',' for ts in timeStrs]
+    nrOfTimes = [ts.count(',') for ts in timeStrs]
+    allTimes = ''.join(timeStrs)[:-1]
+
+    synapseTypes, synapseTypeCodes = np.unique(np.array(columns[0], dtype=str), return_inverse=True)
+    dendriteLabels, dendriteLabelCodes = np.unique(np.array(columns[5], dtype=str), return_inverse=True)
+    return {
+        'synapse_types': synapseTypes,
+        'synapse_type_codes': synapseTypeCodes.astype(np.int32),
+        'synapse_IDs': np.array(columns[1], dtype=np.int64),
+        'soma_distances': np.array(columns[2], dtype=np.float64),
+        'section_IDs': np.array(columns[3], dtype=np.int64),
+        'section_pt_IDs': np.array(columns[4], dtype=np.int64),
+        'dendrite_labels': dendriteLabels,
+        'dendrite_label_codes': dendriteLabelCodes.astype(np.int32),
+        'activation_offsets': np.cumsum([0] + nrOfTimes, dtype=np.int64),
+        'activation_times': np.array(allTimes.split(',') if allTimes else [], dtype=np.float64)
+        }
+
+
+def synapse_activation_arrays_to_dict(synapseActivationArrays):
+    '''Convert synapse activation arrays to the output format of :py:meth:`read_synapse_activation_file`.
+
+    Args:
+        synapseActivationArrays (dict): Synapse activation arrays, as returned by :py:meth:`read_synapse_activation_arrays`.
+
+    Returns:
+        dict: dictionary with cell types as keys and list of synapse locations and activation times, coded as tuples: (synapse ID, section ID, section pt ID, [t1, t2, ... , tn], soma distance)
+    '''
+    a = synapseActivationArrays
+    types = a['synapse_types'][a['synapse_type_codes']].tolist()
+    offsets = a['activation_offsets'].tolist()
+    times = a['activation_times'].tolist()
+    synapses = {}
+    for cellType, synID, secID, ptID, t0, t1, somaDist in zip(
+            types,
+            a['synapse_IDs'].tolist(),
+            a['section_IDs'].tolist(),
+            a['section_pt_IDs'].tolist(),
+            offsets[:-1],
+            offsets[1:],
+            a['soma_distances'].tolist()):
+        if cellType not in synapses:
+            synapses[cellType] = []
+        synapses[cellType].append((synID, secID, ptID, times[t0:t1], somaDist))
+    return synapses
+
+
 def read_complete_synapse_activation_file(fname):
     '''Reads list of all functional synapses and their activation times.
     
@@ -52,6 +52,8 @@ class SynapseMapper(object):
             The synapse distribution to map onto the cell.
         isDensity (bool): Flag for distribution type: (1) density or (0) realization.
         voxelEdgeMap (dict): Dictionary that maps voxel edges to (sectionID, pointID) pairs.
+        _relPts (dict): Cached relative point coordinates of each section, see :py:meth:`_get_relPts`.
+        _sectionStartDistances (dict): Cached path length from the soma to the start of each section.
     '''
     def __init__(self, cell=None, synDist=None, isDensity=True):
         '''
@@ -71,6 +73,8 @@ class SynapseMapper(object):
         self.synDist = synDist
         self.isDensity = isDensity
         self.voxelEdgeMap = {}
+        self._relPts = {}
+        self._sectionStartDistances = {}
         # seed = 1234567890
         # self.ranGen = np.random.RandomState(seed)
 
@@ -85,21 +89,16 @@ class SynapseMapper(object):
         - :py:meth:`~single_cell_parser.reader.read_synapse_realization`
         - The :ref:`syn_file_format` file type.
         '''
-        sections = self.cell.sections
         synDist = self.synDist
         for synType in list(synDist.keys()):
-            for syn in synDist[synType]:
+            syns = synDist[synType]
+            #                find pt ID of point closest to sectionx
+            #                better do it approximately than rely on
+            #                exact match of floating point numbers...
+            closestPtIDs = self._find_closest_pt_IDs(
+                [syn[0] for syn in syns], [syn[1] for syn in syns])
+            for syn, closestPtID in zip(syns, closestPtIDs):
                 sectionID, sectionx = syn
-                #                find pt ID of point closest to sectionx
-                #                better do it approximately than rely on
-                #                exact match of floating point numbers...
-                closestPtID = 0
-                mindx = abs(sectionx - sections[sectionID].relPts[0])
-                for i in range(1, sections[sectionID].nrOfPts):
-                    tmpdx = abs(sectionx - sections[sectionID].relPts[i])
-                    if tmpdx < mindx:
-                        mindx = tmpdx
-                        closestPtID = i
                 self.cell.add_synapse(sectionID, closestPtID, sectionx, synType)
 
     def map_pruned_synapse_realization(self):
@@ -116,21 +115,16 @@ class SynapseMapper(object):
         - :py:meth:`~single_cell_parser.reader.read_pruned_synapse_realization`
         - The :ref:`syn_file_format` file type.
         '''
-        sections = self.cell.sections
         synDist = self.synDist
         for synType in list(synDist.keys()):
-            for syn in synDist[synType]:
+            syns = synDist[synType]
+            #                find pt ID of point closest to sectionx
+            #                better do it approximately than rely on
+            #                exact match of floating point numbers...
+            closestPtIDs = self._find_closest_pt_IDs(
+                [syn[0] for syn in syns], [syn[1] for syn in syns])
+            for syn, closestPtID in zip(syns, closestPtIDs):
                 sectionID, sectionx, pruned = syn
-                #                find pt ID of point closest to sectionx
-                #                better do it approximately than rely on
-                #                exact match of floating point numbers...
-                closestPtID = 0
-                mindx = abs(sectionx - sections[sectionID].relPts[0])
-                for i in range(1, sections[sectionID].nrOfPts):
-                    tmpdx = abs(sectionx - sections[sectionID].relPts[i])
-                    if tmpdx < mindx:
-                        mindx = tmpdx
-                        closestPtID = i
                 newSyn = self.cell.add_synapse(sectionID, closestPtID, sectionx,
                                                synType)
                 newSyn.pruned = pruned
@@ -160,33 +154,31 @@ class SynapseMapper(object):
                 if sec.label == 'Dendrite' or sec.label == 'ApicalDendrite':
                     secIDs.append(i)
 
-        # not very elegant/efficient, but ok for now...
+        secIDs = np.array(secIDs, dtype=int)
+        secStarts = np.array(
+            [self._get_section_start_distance(ID) for ID in secIDs], dtype=float)
+        secLengths = np.array(
+            [self.cell.sections[ID].L for ID in secIDs], dtype=float)
+
+        sectionIDs, synxs = [], []
         for synD in self.synDist:
             # all cell sections that contain a distance of synD
-            candidateSections = []  
-            for ID in secIDs:
-                sec = self.cell.sections[ID]
-                dist = self._compute_path_length(sec, 0.0)
-                if dist + eps <= synD <= dist + sec.L - eps:
-                    candidateSections.append(ID)
+            candidates = np.flatnonzero(
+                (secStarts + eps <= synD) & (synD <= secStarts + secLengths - eps))
             
             # select section
-            n = np.random.randint(len(candidateSections))
-            sectionID = candidateSections[n]
+            n = candidates[np.random.randint(len(candidates))]
+            sectionID = int(secIDs[n])
             # select point along section
-            sec = self.cell.sections[sectionID]
-            dist = self._compute_path_length(sec, 0.0)
-            synx = (synD - dist) / sec.L
+            synx = (synD - secStarts[n]) / secLengths[n]
             if synx < 0:
                 errstr = 'SynapseMapper: synx < 0 - this should not happen!'
                 raise RuntimeError(errstr)
-            closestPtID = 0
-            mindx = abs(synx - sec.relPts[0])
-            for i in range(1, sec.nrOfPts):
-                tmpdx = abs(synx - sec.relPts[i])
-                if tmpdx < mindx:
-                    mindx = tmpdx
-                    closestPtID = i
+            sectionIDs.append(sectionID)
+            synxs.append(float(synx))
+
+        closestPtIDs = self._find_closest_pt_IDs(sectionIDs, synxs)
+        for sectionID, synx, closestPtID in zip(sectionIDs, synxs, closestPtIDs):
             self.cell.add_synapse(sectionID, closestPtID, synx, synType)
 
     def create_synapses(self, preType='Generic'):
@@ -241,31 +233,149 @@ class SynapseMapper(object):
         
         - keys: voxel indices
         - values: list of (sectionID, pointID) pairs of points within that voxel
+
+        All morphology points are binned into the voxel grid of :paramref:`synDist` at once,
+        rather than testing every point against every non-zero voxel.
+        Voxel bounds are inclusive, so that points on a voxel boundary are assigned to all adjacent voxels.
         '''
-        sections = self.cell.sections
         synDist = self.synDist
         voxelEdgeMap = self.voxelEdgeMap
+        mesh = synDist.mesh
 
         noSynStructures = ['Soma', 'Axon', 'AIS', 'Myelin', 'Node']
         '''array with all non-zero voxel indices'''
-        synVoxels = np.array(synDist.mesh.nonzero()).transpose()
-        '''loop over all non-zero voxels'''
+        synVoxels = np.array(mesh.nonzero()).transpose()
         for vxIndex in synVoxels:
-            vxIndexT = tuple(vxIndex)
-            voxelEdgeMap[vxIndexT] = []
-            voxelBBox = synDist.get_voxel_bounds(vxIndex)
-            for i in range(len(sections)):
-                '''only check section points if section bounding box
-                overlaps with voxel bounding box'''
-                sec = sections[i]
-                #                if sec.label == 'Axon' or sec.label == 'Soma':
-                if sec.label in noSynStructures:
-                    continue
-                if self._intersect_bboxes(voxelBBox, sec.bounds):
-                    for n in range(sec.nrOfPts):
-                        pt = sec.pts[n]
-                        if self._pt_in_box(pt, voxelBBox):
-                            voxelEdgeMap[vxIndexT].append((i, n))
+            voxelEdgeMap[tuple(vxIndex)] = []
+
+        secIDs, ptIDs, pts = self._get_stacked_points(noSynStructures)
+        if not len(pts):
+            return
+        origin = np.array(synDist.origin, dtype=float)
+        spacing = np.array(synDist.spacing, dtype=float)
+        baseIndex = synDist.get_mesh_coordinates_batch(pts)
+
+        '''a point on a voxel boundary lies in both adjacent voxels:
+        check membership of the neighbouring voxels along each axis'''
+        offsets = (-1, 0, 1)
+        axisIndices, axisMembers = [], []
+        for axis in range(3):
+            indices = [baseIndex[:, axis] + d for d in offsets]
+            members = [
+                (origin[axis] + ind * spacing[axis] <= pts[:, axis]) &
+                (pts[:, axis] <= origin[axis] + (ind + 1) * spacing[axis]) &
+                (ind >= 0) & (ind < mesh.shape[axis])
+                for ind in indices]
+            axisIndices.append(indices)
+            axisMembers.append(members)
+
+        ptOrder, voxelIndices = [], []
+        for dx in range(3):
+            for dy in range(3):
+                for dz in range(3):
+                    member = axisMembers[0][dx] & axisMembers[1][dy] & axisMembers[2][dz]
+                    ijk = (
+                        axisIndices[0][dx][member],
+                        axisIndices[1][dy][member],
+                        axisIndices[2][dz][member])
+                    nonzero = mesh[ijk] != 0
+                    ptOrder.append(np.flatnonzero(member)[nonzero])
+                    voxelIndices.append(np.column_stack(ijk)[nonzero])
+        ptOrder = np.concatenate(ptOrder)
+        voxelIndices = np.concatenate(voxelIndices)
+
+        '''sort by voxel, then by section and point ID'''
+        linearIndex = np.ravel_multi_index(voxelIndices.T, mesh.shape)
+        order = np.lexsort((ptOrder, linearIndex))
+        ptOrder = ptOrder[order]
+        voxelIndices = voxelIndices[order]
+        linearIndex = linearIndex[order]
+        boundaries = np.flatnonzero(np.diff(linearIndex)) + 1
+        starts = np.concatenate(([0], boundaries))
+        stops = np.concatenate((boundaries, [len(linearIndex)]))
+        edges = list(zip(secIDs[ptOrder].tolist(), ptIDs[ptOrder].tolist()))
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            voxelEdgeMap[tuple(voxelIndices[start].tolist())] = edges[start:stop]
+
+    def _get_stacked_points(self, excludeLabels=()):
+        '''Stack the 3D points of all sections into a single array.
+
+        Args:
+            excludeLabels (list): Section labels to exclude.
+
+        Returns:
+            tuple: Arrays of section IDs, point IDs and 3D coordinates (N x 3) of all points.
+        '''
+        secIDs, ptIDs, pts = [], [], []
+        for i, sec in enumerate(self.cell.sections):
+            if sec.label in excludeLabels or not sec.nrOfPts:
+                continue
+            secIDs.append(np.full(sec.nrOfPts, i, dtype=int))
+            ptIDs.append(np.arange(sec.nrOfPts, dtype=int))
+            pts.append(np.asarray(sec.pts, dtype=float)[:, :3])
+        if not pts:
+            return np.array([], dtype=int), np.array([], dtype=int), np.empty((0, 3))
+        return np.concatenate(secIDs), np.concatenate(ptIDs), np.concatenate(pts)
+
+    def _get_relPts(self, sectionID):
+        '''Get the relative point coordinates of a section as an array.
+
+        Args:
+            sectionID (int): Index of the section in the cell.
+
+        Returns:
+            tuple: The relative point coordinates (:py:class:`numpy.ndarray`),
+            and whether they are sorted in ascending order.
+        '''
+        if sectionID not in self._relPts:
+            sec = self.cell.sections[sectionID]
+            relPts = np.asarray(sec.relPts[:sec.nrOfPts], dtype=float)
+            self._relPts[sectionID] = relPts, bool(np.all(np.diff(relPts) >= 0))
+        return self._relPts[sectionID]
+
+    def _find_closest_pt_IDs(self, sectionIDs, xs):
+        '''Find the IDs of the points closest to relative coordinates on sections.
+
+        Relative point coordinates are cumulative along a section, so the closest point
+        is found with a binary search per section.
+        If several points are equally close, the one with the lowest ID is returned.
+
+        Args:
+            sectionIDs (list): Section index for each location.
+            xs (list): Relative coordinate along the section for each location.
+
+        Returns:
+            list: The ID of the closest point for each location.
+        '''
+        sectionIDs = np.asarray(sectionIDs, dtype=int)
+        xs = np.asarray(xs, dtype=float)
+        closestPtIDs = np.zeros(len(xs), dtype=int)
+        for sectionID in np.unique(sectionIDs):
+            mask = sectionIDs == sectionID
+            x = xs[mask]
+            relPts, isSorted = self._get_relPts(sectionID)
+            if not isSorted:
+                closestPtIDs[mask] = np.abs(x[:, np.newaxis] - relPts).argmin(axis=1)
+                continue
+            right = np.searchsorted(relPts, x, side='left').clip(0, len(relPts) - 1)
+            left = np.searchsorted(relPts, relPts[(right - 1).clip(0)], side='left')
+            closestPtIDs[mask] = np.where(
+                np.abs(x - relPts[left]) <= np.abs(x - relPts[right]), left, right)
+        return closestPtIDs.tolist()
+
+    def _get_section_start_distance(self, sectionID):
+        '''Get the path length from the soma to the start of a section.
+
+        Args:
+            sectionID (int): Index of the section in the cell.
+
+        Returns:
+            float: The path length to the soma.
+        '''
+        if sectionID not in self._sectionStartDistances:
+            sec = self.cell.sections[sectionID]
+            self._sectionStartDistances[sectionID] = self._compute_path_length(sec, 0.0)
+        return self._sectionStartDistances[sectionID]
 
     def _intersect_bboxes(self, bbox1, bbox2):
         '''Check if two bounding boxes overlap
@@ -21,6 +21,7 @@
 from data_base.dbopen import dbopen
 from matplotlib import cm
 from matplotlib.colors import Normalize
+import numpy as np
 import os
 
 __author__  = 'Robert Egger'
@@ -194,6 +195,52 @@ def write_all_traces(fname, t, vTraces):
             outputFile.write(line)
 
 
+def write_all_traces_npz(fname, t, vTraces, dtype='float64'):
+    """Write out a list of voltage traces in binary :ref:`voltage_traces_npz_format`.
+
+    Binary counterpart of :py:meth:`write_all_traces`. The data is saved as a single
+    array under the key ``arr_0``, with the same column layout as the ``.csv`` format:
+    the first column contains the time points, each subsequent column one voltage trace.
+    The time points are additionally saved in double precision under the key ``t``,
+    so that the time axis is exact even if :paramref:`dtype` is ``'float32'``.
+    This avoids formatting every float as text, which is considerably faster and more compact.
+
+    Args:
+        fname (str): The name of the file to write to. ``.npz`` is appended if not present.
+        t (array): The time points of the voltage traces.
+        vTraces (list): A list of voltage traces.
+        dtype (str): Floating point precision of the written data. Either ``'float64'`` or ``'float32'``.
+
+    Returns:
+        None. Writes out the voltage traces to :paramref:`fname`.
+
+    Raises:
+        ValueError: If :paramref:`dtype` is not ``'float32'`` or ``'float64'``.
+
+    Example:
+
+        >>> t = [0.0, 0.1, 0.2]
+        >>> vTraces = [[-65.0, -64.9, -64.8], [-70.0, -69.9, -69.8]]
+        >>> write_all_traces_npz('voltage_traces.npz', t, vTraces, dtype='float32')
+
+    See also:
+        :py:meth:`~data_base.db_initializers.load_simrun_general.data_parsing.read_voltage_traces_from_npz`
+        for the corresponding reader.
+    """
+    if np.dtype(dtype) not in (np.dtype('float32'), np.dtype('float64')):
+        raise ValueError(
+            'dtype must be float32 or float64, got {}'.format(dtype))
+    if not fname.endswith('.npz'):
+        fname += '.npz'
+    t = np.asarray(t, dtype='float64')
+    data = np.empty((len(t), len(vTraces) + 1), dtype=dtype)
+    data[:, 0] = t
+    for i, vTrace in enumerate(vTraces):
+        data[:, i + 1] = np.asarray(vTrace)[:len(t)]
+    with dbopen(fname, 'wb') as outputFile:
+        np.savez(outputFile, data, t=t)
+
+
 def write_cell_synapse_locations(fname=None, synapses=None, cellID=None):
     '''Write a :ref:`syn_file_format` file.
      
@@ -336,13 +383,149 @@ def write_functional_realization_map(
             outputFile.write(line)
 
 
+def get_synapse_activation_arrays(
+    cell,
+    synTypes,
+    synDistances,
+    synTimes,
+    activeSyns):
+    """Collect the active synapses of a cell in flat arrays.
+
+    Array-backed representation of a :ref:`syn_activation_format` file.
+    Per-synapse properties are stored in flat arrays of equal length.
+    The activation times of all synapses are concatenated in a single array,
+    and ``activation_offsets`` marks where the activation times of each synapse start and end, i.e.
+    the activation times of synapse ``i`` are ``activation_times[activation_offsets[i]:activation_offsets[i+1]]``.
+
+    Synapse types and dendrite labels are stored as integer codes into the arrays
+    ``synapse_types`` and ``dendrite_labels`` respectively.
+
+    Args:
+        cell (:py:class:`single_cell_parser.cell.Cell`): Cell object.
+        synTypes (list): list of synapse types.
+        synDistances (dict): dictionary of synapse distances per synapse type.
+        synTimes (dict): dictionary of synapse activation times per synapse type.
+        activeSyns (dict): dictionary of active synapses per synapse type.
+
+    Returns:
+        dict: Dictionary of numpy arrays with the keys ``synapse_types``, ``synapse_type_codes``, ``synapse_IDs``,
+        ``soma_distances``, ``section_IDs``, ``section_pt_IDs``, ``dendrite_labels``, ``dendrite_label_codes``,
+        ``activation_offsets`` and ``activation_times``.
+
+    See also:
+        :py:meth:`write_synapse_activation_arrays` to write these arrays to a file, and
+        :py:meth:`~single_cell_parser.reader.read_synapse_activation_arrays` for the corresponding reader.
+    """
+    typeCodes, synIDs, distances, secIDs, ptIDs, labelCodes = [], [], [], [], [], []
+    nrOfTimes = [0]
+    times = []
+    dendLabels = []
+    dendLabelCodes = {}
+    for typeCode, synType in enumerate(synTypes):
+        active = np.flatnonzero(np.asarray(activeSyns[synType], dtype=bool))
+        for i in active:
+            syn = cell.synapses[synType][i]
+            dendLabel = str(cell.sections[syn.secID].label)
+            if dendLabel not in dendLabelCodes:
+                dendLabelCodes[dendLabel] = len(dendLabels)
+                dendLabels.append(dendLabel)
+            typeCodes.append(typeCode)
+            synIDs.append(i)
+            distances.append(synDistances[synType][i])
+            secIDs.append(syn.secID)
+            ptIDs.append(syn.ptID)
+            labelCodes.append(dendLabelCodes[dendLabel])
+            synTimesI = synTimes[synType][i]
+            nrOfTimes.append(len(synTimesI))
+            times.extend(synTimesI)
+    return {
+        'synapse_types': np.array(list(synTypes), dtype=str),
+        'synapse_type_codes': np.array(typeCodes, dtype=np.int32),
+        'synapse_IDs': np.array(synIDs, dtype=np.int64),
+        'soma_distances': np.array(distances, dtype=np.float64),
+        'section_IDs': np.array(secIDs, dtype=np.int64),
+        'section_pt_IDs': np.array(ptIDs, dtype=np.int64),
+        'dendrite_labels': np.array(dendLabels, dtype=str),
+        'dendrite_label_codes': np.array(labelCodes, dtype=np.int32),
+        'activation_offsets': np.cumsum(nrOfTimes, dtype=np.int64),
+        'activation_times': np.array(times, dtype=np.float64)
+        }
+
+
+def write_synapse_activation_arrays(fname, synapseActivationArrays):
+    """Write out synapse activation arrays as a :ref:`syn_activation_format` file.
+
+    If :paramref:`fname` ends with ``.npz``, the arrays are saved in binary format.
+    Otherwise, the text format of :py:meth:`write_synapse_activation_file` is written.
+    Both can be read with :py:meth:`~single_cell_parser.reader.read_synapse_activation_arrays`.
+
+    Args:
+        fname (str): The output file name, including the file extension.
+        synapseActivationArrays (dict): Synapse activation arrays, as returned by :py:meth:`get_synapse_activation_arrays`.
+
+    Returns:
+        None. Writes out the synapse activation file to :paramref:`fname`.
+    """
+    a = synapseActivationArrays
+    if fname.endswith('.npz'):
+        with dbopen(fname, 'wb') as outputFile:
+            np.savez(outputFile, **a)
+        return
+
+    types = a['synapse_types'][a['synapse_type_codes']].tolist()
+    labels = a['dendrite_labels'][a['dendrite_label_codes']].tolist()
+    offsets = a['activation_offsets'].tolist()
+    times = [str(t) + ',' for t in a['activation_times'].tolist()]
+    lines = [
+        '\t'.join((synType, str(synID), str(dist), str(secID), str(ptID), label, ''.join(times[t0:t1])))
+        for synType, synID, dist, secID, ptID, label, t0, t1 in zip(
+            types,
+            a['synapse_IDs'].tolist(),
+            a['soma_distances'].tolist(),
+            a['section_IDs'].tolist(),
+            a['section_pt_IDs'].tolist(),
+            labels,
+            offsets[:-1],
+            offsets[1:])
+        ]
+    with dbopen(fname, 'w') as outputFile:
+        header = '# synapse type\t'
+        header += 'synapse ID\t'
+        header += 'soma distance\t'
+        header += 'section ID\t'
+        header += 'section pt ID\t'
+        header += 'dendrite label\t'
+        header += 'activation times\n'
+        outputFile.write(header)
+        if lines:
+            outputFile.write('\n'.join(lines) + '\n')
+
+
+def get_synapse_activation_sidecar_path(fname):
+    """Get the path of the binary sidecar of a :ref:`syn_activation_format` file.
+
+    Args:
+        fname (str): Path to the synapse activation ``.csv`` file.
+
+    Returns:
+        str: The path of the binary ``.npz`` sidecar.
+
+    Example:
+
+        >>> get_synapse_activation_sidecar_path('simulation_run0000_synapses.csv')
+        'simulation_run0000_synapses.npz'
+    """
+    return os.path.splitext(fname)[0] + '.npz'
+
+
 def write_synapse_activation_file(
     fname=None,
     cell=None,
     synTypes=None,
     synDistances=None,
     synTimes=None,
-    activeSyns=None):
+    activeSyns=None,
+    binary_sidecar=False):
     """Write out a :ref:`syn_activation_format` file.
 
     Used in :py:meth:`~single_cell_parser.analyze.synanalysis.compute_synapse_distances_times` 
@@ -365,6 +548,10 @@ def write_synapse_activation_file(
         synDistances (dict): dictionary of synapse distances per synapse type.
         synTimes (dict): dictionary of synapse activation times per synapse type. Values are a list of the activation times for each synapse within that type.
         activeSyns (dict): dictionary of active synapses per synapse type. Values are a list of booleans indicating whether each synapse of that type is active.
+        binary_sidecar (bool): 
+            If True, additionally write the same data in binary format next to :paramref:`fname` 
+            (see :py:meth:`get_synapse_activation_sidecar_path`). 
+            :py:mod:`~data_base.db_initializers.load_simrun_general` reads these sidecars instead of the text files if present.
 
     Returns:
         None. Writes out the synapse activation file to :paramref:`fname`.
@@ -384,44 +571,20 @@ def write_synapse_activation_file(
         ...     activeSyns
         ... )
 
+    See also:
+        :py:meth:`get_synapse_activation_arrays` and :py:meth:`write_synapse_activation_arrays`, which are used to write the file.
     """
     if fname is None or cell is None or synTypes is None or synDistances is None or synTimes is None or activeSyns is None:
         err_str = 'Incomplete data! Cannot write functional realization file'
         raise RuntimeError(err_str)
 
-    with dbopen(fname, 'w') as outputFile:
-        header = '# synapse type\t'
-        header += 'synapse ID\t'
-        header += 'soma distance\t'
-        header += 'section ID\t'
-        header += 'section pt ID\t'
-        header += 'dendrite label\t'
-        header += 'activation times\n'
-        outputFile.write(header)
-        for synType in synTypes:
-            for i in range(len(cell.synapses[synType])):
-                if not activeSyns[synType][i]:
-                    continue
-                secID = cell.synapses[synType][i].secID
-                ptID = cell.synapses[synType][i].ptID
-                dendLabel = cell.sections[secID].label
-                line = synType
-                line += '\t'
-                line += str(i)
-                line += '\t'
-                line += str(synDistances[synType][i])
-                line += '\t'
-                line += str(secID)
-                line += '\t'
-                line += str(ptID)
-                line += '\t'
-                line += str(dendLabel)
-                line += '\t'
-                for t in synTimes[synType][i]:
-                    line += str(t)
-                    line += ','
-                line += '\n'
-                outputFile.write(line)
+    synapseActivationArrays = get_synapse_activation_arrays(
+        cell, synTypes, synDistances, synTimes, activeSyns)
+    write_synapse_activation_arrays(fname, synapseActivationArrays)
+    if binary_sidecar:
+        write_synapse_activation_arrays(
+            get_synapse_activation_sidecar_path(fname), 
+            synapseActivationArrays)
 
 
 def write_synapse_weight_file(fname=None, cell=None):
@@ -51,7 +51,7 @@ This happens according to the following pipeline:
 
 1. The bouton density field and PST density fields are converted to scalar fields with defined voxel resolution.
 2. Calculates the overlap between these voxels and the dendrites of the postsynaptic neuron morphology 
-   using Liang-Barsky clipping :cite:`liang1984new`. Only these voxels are further considered for potential synapses.
+   using voxel traversal :cite:`amanatides1987fast`. Only these voxels are further considered for potential synapses.
 3. Calculates a synapse density field by multiplying the bouton density field with the PST density fields
    at these voxels.
 4. Normalizes the previous synapse density fields using cell-type specific PST length/area constraints and the number of 
@@ -60,6 +60,10 @@ This happens according to the following pipeline:
    These are randomly placed onto the dendritic branch within that voxel. One such sample is called an "anatomical realization".
 6. (optional) Repeat steps 4 and 5 to create a collection of anatomical realizations. 
 
+The synapse densities of steps 2-4 can be cached on disk 
+(see :py:mod:`~singlecell_input_mapper.singlecell_input_mapper.synapse_density_cache`),
+such that repeated runs with the same input files only perform step 5.
+
 Density meshes are accessed using :py:class:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.ScalarField`.
 :py:class:`~singlecell_input_mapper.singlecell_input_mapper.synapse_mapper.SynapseMapper` makes use of 
 :py:class:`~singlecell_input_mapper.singlecell_input_mapper.synapse_mapper.SynapseDensity` for steps 2, 3 and 4,
@@ -146,6 +150,8 @@ def map_singlecell_inputs(
     ExPSTDensityName=ExPSTDensityName,
     InhPSTDensityName=InhPSTDensityName,
     boutonDensityFolderName=boutonDensityFolderName,
+    synapseDensityCacheDir=None,
+    useBinaryScalarFields=False,
 ):
     r"""Map inputs to a single cell morphology.
 
@@ -197,6 +203,16 @@ def map_singlecell_inputs(
         boutonDensityFolderName:
             A directory containing the following subdirectory structure:
             anatomical_area/presynaptic_cell_type/\*.am
+        synapseDensityCacheDir (str, optional):
+            Directory to cache the synapse densities in.
+            If the synapse densities of the same input files have been cached before,
+            the PST and bouton densities are not loaded, and the synapse densities are not recomputed.
+            Default: None (no caching).
+        useBinaryScalarFields (bool):
+            Whether to read the PST and bouton densities from binary copies of the :ref:`am_file_format` files,
+            which are created next to them on first use.
+            See :py:meth:`~singlecell_input_mapper.singlecell_input_mapper.reader.read_scalar_field`.
+            Default: False.
 
     Returns:
         None. Writes the results to disk.
@@ -228,38 +244,71 @@ def map_singlecell_inputs(
     connectionsSpreadsheet = sim.read_connections_spreadsheet(
         connectionsSpreadsheetName
     )
-    logger.info("    Loading PST density {:s}".format(ExPSTDensityName))
-    ExPSTDensity = sim.read_scalar_field(ExPSTDensityName)
-    ExPSTDensity.resize_mesh()
-    logger.info("    Loading PST density {:s}".format(InhPSTDensityName))
-    InhPSTDensity = sim.read_scalar_field(InhPSTDensityName)
-    InhPSTDensity.resize_mesh()
-    boutonDensities = {}
     anatomical_areas = list(numberOfCellsSpreadsheet.keys())
     preCellTypes = numberOfCellsSpreadsheet[anatomical_areas[0]]
-
-    # --------------------- Load bouton densities ---------------------
+    boutonDensityNames = {}
     for anatomical_area in anatomical_areas:
-        # boutonDensities is a dictionary with anatomical areas as keys
-        # and as value another dictionary mapping the presyn celltype to
-        # scalar fields of boutons
-        boutonDensities[anatomical_area] = {}
+        boutonDensityNames[anatomical_area] = {}
         for preCellType in preCellTypes:
-            boutonDensities[anatomical_area][preCellType] = []
             boutonDensityFolder = os.path.join(
                 boutonDensityFolderName, anatomical_area, preCellType
             )
             assert os.path.exists(boutonDensityFolder), "Could not find bouton density folders of the barrel cortex model. Did you download and extract the barrel cortex model?"
-            boutonDensityNames = glob.glob(os.path.join(boutonDensityFolder, "*"))
-            logger.debug(
-                "    Loading {:d} bouton densities from {:s}".format(
-                    len(boutonDensityNames), boutonDensityFolder
-                )
+            boutonDensityNames[anatomical_area][preCellType] = glob.glob(
+                os.path.join(boutonDensityFolder, "*")
             )
-            for densityName in boutonDensityNames:
-                boutonDensity = sim.read_scalar_field(densityName)
-                boutonDensity.resize_mesh()
-                boutonDensities[anatomical_area][preCellType].append(boutonDensity)
+
+    synapseDensities = None
+    if synapseDensityCacheDir is not None:
+        logger.info("Hashing input files for the synapse density cache...")
+        cacheKey = sim.get_synapse_density_cache_key(
+            [cellName, connectionsSpreadsheetName, ExPSTDensityName, InhPSTDensityName]
+            + [
+                densityName
+                for anatomical_area in anatomical_areas
+                for preCellType in preCellTypes
+                for densityName in boutonDensityNames[anatomical_area][preCellType]
+            ],
+            postCellType=cellTypeName,
+            exTypes=list(exTypes),
+            inhTypes=list(inhTypes),
+            boutonDensityLayout=[
+                [anatomical_area, preCellType, len(boutonDensityNames[anatomical_area][preCellType])]
+                for anatomical_area in anatomical_areas
+                for preCellType in preCellTypes
+            ],
+        )
+        synapseDensities = sim.load_synapse_densities(synapseDensityCacheDir, cacheKey)
+
+    ExPSTDensity, InhPSTDensity = None, None
+    boutonDensities = None
+    if synapseDensities is None:
+        logger.info("    Loading PST density {:s}".format(ExPSTDensityName))
+        ExPSTDensity = sim.read_scalar_field(ExPSTDensityName, use_binary=useBinaryScalarFields)
+        ExPSTDensity.resize_mesh()
+        logger.info("    Loading PST density {:s}".format(InhPSTDensityName))
+        InhPSTDensity = sim.read_scalar_field(InhPSTDensityName, use_binary=useBinaryScalarFields)
+        InhPSTDensity.resize_mesh()
+
+        # --------------------- Load bouton densities ---------------------
+        boutonDensities = {}
+        for anatomical_area in anatomical_areas:
+            # boutonDensities is a dictionary with anatomical areas as keys
+            # and as value another dictionary mapping the presyn celltype to
+            # scalar fields of boutons
+            boutonDensities[anatomical_area] = {}
+            for preCellType in preCellTypes:
+                boutonDensities[anatomical_area][preCellType] = []
+                logger.debug(
+                    "    Loading {:d} bouton densities from {:s}".format(
+                        len(boutonDensityNames[anatomical_area][preCellType]),
+                        os.path.join(boutonDensityFolderName, anatomical_area, preCellType),
+                    )
+                )
+                for densityName in boutonDensityNames[anatomical_area][preCellType]:
+                    boutonDensity = sim.read_scalar_field(densityName, use_binary=useBinaryScalarFields)
+                    boutonDensity.resize_mesh()
+                    boutonDensities[anatomical_area][preCellType].append(boutonDensity)
 
     inputMapper = sim.NetworkMapper(
         singleCell,
@@ -271,8 +320,16 @@ def map_singlecell_inputs(
     )
     inputMapper.exCellTypes = exTypes
     inputMapper.inhCellTypes = inhTypes
+    if synapseDensities is None and synapseDensityCacheDir is not None:
+        synapseDensities = inputMapper._precompute_anatomical_area_celltype_synapse_densities(
+            boutonDensities
+        )
+        sim.save_synapse_densities(synapseDensityCacheDir, cacheKey, synapseDensities)
     inputMapper.create_network_embedding(
-        cellName, boutonDensities, nrOfSamples=nrOfSamples
+        cellName,
+        boutonDensities,
+        nrOfSamples=nrOfSamples,
+        synapseDensities=synapseDensities,
     )
 
     endTime = time.time()
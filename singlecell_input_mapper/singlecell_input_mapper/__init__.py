@@ -38,6 +38,7 @@ from .writer import *
 from .network_embedding import *
 from .synapse_mapper import *
 from .scalar_field import *
+from .synapse_density_cache import *
 from .cell import CellParser
 
 __author__ = 'Robert Egger'
@@ -24,16 +24,43 @@ from __future__ import absolute_import
 import os
 import sys
 import time
+import multiprocessing
 import numpy as np
 from .cell import PointCell
 from . import writer
 from .synapse_mapper import SynapseMapper, SynapseDensity
+from .synapse_density_cache import load_synapse_densities
 from data_base.dbopen import dbopen
 import logging
 __author__ = 'Robert Egger'
 __date__ = '2012-11-17'
 logger = logging.getLogger("ISF").getChild(__name__)
 
+# NetworkMapper, postCellName and synapse densities shared with forked worker processes.
+# See NetworkMapper._create_realizations_in_pool
+_pool_state = None
+
+
+def _create_realization_in_worker(args):
+    """Create a single network realization in a worker process.
+    
+    Args:
+        args (tuple): Index and seed of the realization.
+        
+    Returns:
+        tuple: Index and cell type summary table of the realization.
+    """
+    i, seed = args
+    networkMapper, postCellName, cellTypeSynapseDensities = _pool_state
+    # The process ID is not unique for realizations created by the same worker.
+    outputID = '{:d}-{:d}'.format(os.getpid(), i)
+    cellTypeSummaryTable = networkMapper._create_realization(
+        postCellName, 
+        cellTypeSynapseDensities, 
+        seed=seed, 
+        outputID=outputID)
+    return i, cellTypeSummaryTable
+
 
 class NetworkMapper:
     '''Connect presynaptic cells to a postsynaptic cell model.
@@ -94,7 +121,8 @@ class NetworkMapper:
         self,
         postCellName,
         boutonDensities,
-        nrOfSamples=50):
+        nrOfSamples=50,
+        synapseDensities=None):
         '''Create a single network realization from a bouton density field.
 
         This is the main method to create anatomical realizations of connectivity.
@@ -106,10 +134,17 @@ class NetworkMapper:
         Args:
             postCellName (str):
                 Path to the postsynaptic :ref:`hoc_file_format` morphology file.
-            boutonDensities (dict):
+            boutonDensities (dict | None):
                 Dictionary of bouton densities, ordered by anatomical area and cell type.
+                Not used, and may be None, if :paramref:`synapseDensities` are given.
             nrOfSamples (int):
                 Number of network realizations to create.
+            synapseDensities (dict, optional):
+                Precomputed synapse densities, e.g. loaded with :py:meth:`~singlecell_input_mapper.singlecell_input_mapper.synapse_density_cache.load_synapse_densities`.
+                If given, :paramref:`boutonDensities` is ignored.
+                
+        Raises:
+            ValueError: If neither :paramref:`boutonDensities` nor :paramref:`synapseDensities` are given.
         
         Warning:
             Give this network realization a (somewhat) unique name!   
@@ -122,11 +157,16 @@ class NetworkMapper:
         Returns:
             None. Writes output files to disk.
         '''
+        if boutonDensities is None and synapseDensities is None:
+            raise ValueError('Either boutonDensities or synapseDensities must be given.')
         self._create_presyn_cells()
         anatomical_areas = list(self.cells.keys())
         preCellTypes = self.cells[anatomical_areas[0]]
-        cellTypeSynapseDensities = self._precompute_anatomical_area_celltype_synapse_densities(
-            boutonDensities)
+        if synapseDensities is None:
+            cellTypeSynapseDensities = self._precompute_anatomical_area_celltype_synapse_densities(
+                boutonDensities)
+        else:
+            cellTypeSynapseDensities = synapseDensities
         sampleConnectivityData = []
         cellTypeSpecificPopulation = []
         for i in range(nrOfSamples):
@@ -187,13 +227,21 @@ class NetworkMapper:
         self, 
         postCellName,
         boutonDensities,
-        nrOfRealizations):
+        nrOfRealizations,
+        nprocs=1,
+        seed=None,
+        synapseDensities=None):
         '''Create multiple network realizations from a bouton density field.
         
         Main method used for creating fixed network connectivity for use in Monte Carlo simulations.
         Same principle as :py:meth:`~create_network_embedding`, but rather than taking
         the most representative sample, this method saves all :paramref:`nrOfRealizations` network 
         realizations to allow investigating the effects of anatomical variability on neuron responses.
+        
+        Realizations can be created in parallel with :paramref:`nprocs` worker processes.
+        The synapse densities are computed once in the parent process, 
+        and shared with the workers by forking, such that they are not copied or pickled.
+        Each worker writes the output files of its realizations as soon as they are created.
 
         Warning:
             Give this network realization a (somewhat) unique name!     
@@ -206,86 +254,65 @@ class NetworkMapper:
         Args:
             postCellName (str):
                 Path to the postsynaptic :ref:`hoc_file_format` morphology file.
-            boutonDensities (dict):
+            boutonDensities (dict | None):
                 Dictionary of bouton densities, ordered by anatomical area and cell type.
+                Not used, and may be None, if :paramref:`synapseDensities` are given.
             nrOfRealizations (int):
                 Number of network realizations to create.
+            nprocs (int):
+                Number of worker processes. 
+                Default is ``1``: create all realizations serially in the current process.
+                Parallel realizations require the ``fork`` start method, i.e. are not available on Windows.
+            seed (int, optional):
+                Seed to derive an independent random seed for each realization from.
+                If ``None`` (default), serial realizations use the current state of ``numpy.random``,
+                and parallel realizations are seeded with fresh entropy from the operating system.
+                Given a seed, the realizations are the same for any number of processes.
+            synapseDensities (dict, optional):
+                Precomputed synapse densities, e.g. loaded with :py:meth:`~singlecell_input_mapper.singlecell_input_mapper.synapse_density_cache.load_synapse_densities`.
+                If given, :paramref:`boutonDensities` is ignored.
+                
+        Raises:
+            ValueError: If neither :paramref:`boutonDensities` nor :paramref:`synapseDensities` are given.
 
         Returns:
             None. Writes output files to disk.
         '''
+        if boutonDensities is None and synapseDensities is None:
+            raise ValueError('Either boutonDensities or synapseDensities must be given.')
         self._create_presyn_cells()
-        anatomical_areas = list(self.cells.keys())
-        preCellTypes = self.cells[anatomical_areas[0]]
-        cellTypeSynapseDensities = \
-            self._precompute_anatomical_area_celltype_synapse_densities(
-                boutonDensities)
+        if synapseDensities is None:
+            cellTypeSynapseDensities = \
+                self._precompute_anatomical_area_celltype_synapse_densities(
+                    boutonDensities)
+        else:
+            cellTypeSynapseDensities = synapseDensities
+        
+        if seed is not None or nprocs > 1:
+            seeds = [
+                int(s.generate_state(1)[0]) 
+                for s in np.random.SeedSequence(seed).spawn(nrOfRealizations)]
+        else:
+            seeds = [None] * nrOfRealizations
 
-        cellTypeSpecificPopulation = []
-        for i in range(nrOfRealizations):
-            logger.info('Creating realization {:d} of {:d}'.format(
-                i + 1, nrOfRealizations))
-            self.postCell.remove_synapses('All')
-            for anatomical_area in anatomical_areas:
-                for preCellType in preCellTypes:
-                    for preCell in self.cells[anatomical_area][preCellType]:
-                        preCell.synapseList = None
-            # for anatomical_area in anatomical_areas:
-            #     for preCellType in preCellTypes:
-            #         nrOfDensities = len(cellTypeSynapseDensities[anatomical_area][preCellType])
-            #         if not nrOfDensities:
-            #             continue
-            #         #=======================================================================
-            #         # for testing purposes: write 3D synapse density
-            #         #=======================================================================
-            ##          for structure in self.postCell.structures.keys():
-            ##              for i in range(nrOfDensities):
-            ##                  outDensity = cellTypeSynapseDensities[anatomical_area][preCellType][i][structure]
-            ##                  outNamePrefix = postCellName[:-4]
-            ##                  synapseDensityName = '_'.join((outNamePrefix,'synapse_density',structure,anatomical_area,preCellType,str(i)))
-            ##                  writer.write_scalar_field(synapseDensityName, outDensity)
-
-            #         print '---------------------------'
-            #         print 'Computed %d synapse densities of type %s in anatomical_area %s!' % (nrOfDensities,preCellType,anatomical_area)
-            #         print 'Assigning synapses from cell type %s in anatomical_area %s' % (preCellType, anatomical_area)
-            #         totalNumber = len(self.cells[anatomical_area][preCellType])
-            #         densityIDs = np.random.randint(0, nrOfDensities, totalNumber)
-            #         count = 0
-            #         skipCount = 0
-            #         for i in range(totalNumber):
-            #             preCell = self.cells[anatomical_area][preCellType][i]
-            #             count += 1
-            #             print '    Computing synapses for presynaptic cell %d of %d...\r' %  (count,totalNumber),
-            #             sys.stdout.flush()
-            #             densityID = densityIDs[i]
-            #             synapseDensity = cellTypeSynapseDensities[anatomical_area][preCellType][densityID]
-            #             if synapseDensity is None:
-            #                 skipCount += 1
-            #                 continue
-            #             self.mapper.synDist = synapseDensity
-            #             synapseType = '_'.join((preCellType,anatomical_area))
-            #             preCell.synapseList = self.mapper.create_synapses(synapseType)
-            #             for newSyn in preCell.synapseList:
-            #                 newSyn.preCell = preCell
-            #         print ''
-            #         print '    Skipped %d empty synapse densities...' % skipCount
-
-            # connectivityMap, connectedCells, connectedCellsPerStructure = self._create_anatomical_connectivity_map()
-            connectivityMap, connectedCells, connectedCellsPerStructure = \
-                self._create_anatomical_realization(cellTypeSynapseDensities)
-            self._generate_output_files(
+        if nprocs > 1:
+            cellTypeSpecificPopulation = self._create_realizations_in_pool(
                 postCellName, 
-                connectivityMap,
-                connectedCells,
-                connectedCellsPerStructure)
-            (synapseLocations,  # unused 
-             cellSynapseLocations,  # unused
-             cellTypeSummaryTable, 
-             anatomicalAreaSummaryTable  # unused
-             ) = self._compute_summary_tables(
-                connectedCells, connectedCellsPerStructure)
-            cellTypeSpecificPopulation.append(cellTypeSummaryTable)
-            logger.info('---------------------------')
+                cellTypeSynapseDensities, 
+                seeds, 
+                nprocs)
+        else:
+            cellTypeSpecificPopulation = []
+            for i in range(nrOfRealizations):
+                logger.info('Creating realization {:d} of {:d}'.format(
+                    i + 1, nrOfRealizations))
+                # The process ID alone is not unique for realizations created within the same minute.
+                cellTypeSpecificPopulation.append(
+                    self._create_realization(
+                        postCellName, 
+                        cellTypeSynapseDensities, 
+                        seed=seeds[i],
+                        outputID='{:d}-{:d}'.format(os.getpid(), i)))
 
         # print '    Writing output files...'
         # populationDistribution = self._compute_parameter_distribution(cellTypeSpecificPopulation)
@@ -293,6 +320,101 @@ class NetworkMapper:
         # summaryName = outNamePrefix + '_synapses_%d_realizations_summary' % nrOfRealizations
         # writer.write_population_connectivity_summary(summaryName, populationDistribution)
 
+    def _create_realization(
+        self, 
+        postCellName, 
+        cellTypeSynapseDensities, 
+        seed=None, 
+        outputID=None):
+        '''Create a single network realization and write its output files.
+        
+        Used by :py:meth:`~create_network_embedding_for_simulations`.
+        
+        Args:
+            postCellName (str):
+                Path to the postsynaptic :ref:`hoc_file_format` morphology file.
+            cellTypeSynapseDensities (dict):
+                Synapse densities, ordered by anatomical area and cell type.
+                See :py:meth:`~_precompute_anatomical_area_celltype_synapse_densities`.
+            seed (int, optional): Seed for ``numpy.random``. If ``None``, ``numpy.random`` is not seeded.
+            outputID (str, optional): 
+                Unique identifier of the output files. 
+                Default: the process ID, see :py:meth:`~_generate_output_files`.
+                
+        Returns:
+            dict: The cell type summary table of this realization. See :py:meth:`~_compute_summary_tables`.
+        '''
+        if seed is not None:
+            np.random.seed(seed)
+        anatomical_areas = list(self.cells.keys())
+        preCellTypes = self.cells[anatomical_areas[0]]
+        self.postCell.remove_synapses('All')
+        for anatomical_area in anatomical_areas:
+            for preCellType in preCellTypes:
+                for preCell in self.cells[anatomical_area][preCellType]:
+                    preCell.synapseList = None
+        connectivityMap, connectedCells, connectedCellsPerStructure = \
+            self._create_anatomical_realization(cellTypeSynapseDensities)
+        self._generate_output_files(
+            postCellName, 
+            connectivityMap,
+            connectedCells,
+            connectedCellsPerStructure,
+            outputID=outputID)
+        (synapseLocations,  # unused 
+         cellSynapseLocations,  # unused
+         cellTypeSummaryTable, 
+         anatomicalAreaSummaryTable  # unused
+         ) = self._compute_summary_tables(
+            connectedCells, connectedCellsPerStructure)
+        logger.info('---------------------------')
+        return cellTypeSummaryTable
+
+    def _create_realizations_in_pool(
+        self, 
+        postCellName, 
+        cellTypeSynapseDensities, 
+        seeds, 
+        nprocs):
+        '''Create network realizations in parallel worker processes.
+        
+        The workers are forked from the current process, and thus share this :py:class:`NetworkMapper`
+        and the synapse densities copy-on-write. 
+        Only the seed and the index of each realization are sent to the workers,
+        and only the (small) cell type summary tables are sent back.
+        
+        Args:
+            postCellName (str):
+                Path to the postsynaptic :ref:`hoc_file_format` morphology file.
+            cellTypeSynapseDensities (dict):
+                Synapse densities, ordered by anatomical area and cell type.
+            seeds (list): One seed per realization.
+            nprocs (int): Number of worker processes.
+            
+        Returns:
+            list: The cell type summary tables of all realizations, in order.
+        '''
+        global _pool_state
+        try:
+            context = multiprocessing.get_context('fork')
+        except ValueError:
+            raise RuntimeError(
+                'Parallel network realizations require the fork start method, which is not available on this platform. Use nprocs=1.')
+        _pool_state = (self, postCellName, cellTypeSynapseDensities)
+        nrOfRealizations = len(seeds)
+        cellTypeSpecificPopulation = [None] * nrOfRealizations
+        try:
+            with context.Pool(min(nprocs, nrOfRealizations)) as pool:
+                for n, (i, cellTypeSummaryTable) in enumerate(pool.imap_unordered(
+                    _create_realization_in_worker, 
+                    enumerate(seeds))):
+                    logger.info('Created realization {:d} of {:d}'.format(
+                        n + 1, nrOfRealizations))
+                    cellTypeSpecificPopulation[i] = cellTypeSummaryTable
+        finally:
+            _pool_state = None
+        return cellTypeSpecificPopulation
+
     def create_network_embedding_from_synapse_densities(
         self, 
         postCellName,
@@ -312,13 +434,16 @@ class NetworkMapper:
         Args:
             postCellName (str):
                 Path to the postsynaptic :ref:`hoc_file_format` morphology file.
-            synapseDensities (dict):
-                Dictionary of synapse densities, ordered by anatomical area and cell type.
+            synapseDensities (dict | str):
+                Dictionary of synapse densities, ordered by anatomical area and cell type,
+                or the path to a cache entry created with :py:meth:`~singlecell_input_mapper.singlecell_input_mapper.synapse_density_cache.save_synapse_densities`.
         '''
 
         self._create_presyn_cells()
         anatomical_areas = list(self.cells.keys())
         preCellTypes = self.cells[anatomical_areas[0]]
+        if isinstance(synapseDensities, str):
+            synapseDensities = load_synapse_densities(synapseDensities)
         cellTypeSynapseDensities = synapseDensities
         for anatomical_area in anatomical_areas:
             for preCellType in preCellTypes:
@@ -1169,7 +1294,8 @@ class NetworkMapper:
             connectivityMap,
             connectedCells, 
             connectedCellsPerStructure,
-            writeLandmarkFiles=False):
+            writeLandmarkFiles=False,
+            outputID=None):
         '''Generates all summary files and writes output files.
 
         Generates and writes out summary files using 
@@ -1188,13 +1314,17 @@ class NetworkMapper:
                 Created by :py:meth:`_create_anatomical_connectivity_map`.
             connectedCells (dict): Dictionary of connected cells.
             connectedCellsPerStructure (dict): Dictionary of connected cells per structure.
+            writeLandmarkFiles (bool): Whether to write out landmark files of the synapse locations.
+            outputID (str, optional): 
+                Unique identifier of the output files, appended to the time stamp. 
+                Default: the process ID.
 
         Returns:
             None. Writes output files to disk.
         '''
 
         id1 = time.strftime('%Y%m%d-%H%M')
-        id2 = str(os.getpid())
+        id2 = str(os.getpid()) if outputID is None else outputID
         outNamePrefix = postCellName[:-4]
         cellName = postCellName[:-4].split('/')[-1]
         dirName = outNamePrefix + '_synapses_%s_%s/' % (id1, id2)
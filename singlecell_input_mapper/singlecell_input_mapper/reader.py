@@ -18,12 +18,15 @@
 '''Read in hoc files, Amira Mesh files, and spreadsheets with connection probabilities.
 '''
 
+import os
 import numpy as np
 from . import scalar_field
-from data_base.dbopen import dbopen
+from data_base.dbopen import dbopen, resolve_db_path
+import logging
 
 __author__ = 'Robert Egger'
 __date__ = '2012-03-08'
+logger = logging.getLogger("ISF").getChild(__name__)
 
 class _Edge(object):
     '''Convenience class around NEURON's section objects.
@@ -222,20 +225,44 @@ def read_hoc_file(fname=''):
         return cell
 
 
-def read_scalar_field(fname=''):
+def read_scalar_field(fname='', use_binary=False):
     """Read AMIRA scalar fields.
     
+    Parsing large :ref:`am_file_format` files is slow. 
+    Scalar fields can be converted once to a binary format with :py:meth:`convert_scalar_field_to_binary`,
+    which is loaded lazily as a memory-mapped array (see :py:meth:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.ScalarField.from_binary`).
+    
     Args:
-        fname (str): The name of the file to be read.
+        fname (str): 
+            The name of the file to be read. 
+            Either an :ref:`am_file_format` file, or a binary scalar field file with suffix :py:attr:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.BINARY_SUFFIX`.
+        use_binary (bool):
+            If True, read the binary version of an :ref:`am_file_format` file, i.e. the file with the same name and suffix 
+            :py:attr:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.BINARY_SUFFIX`.
+            The binary file is created on first use, and recreated if the :ref:`am_file_format` file is newer.
+            Default: False.
 
     Raises:
-        IOError: If the input file does not have a `.am` or `.AM` suffix.
+        IOError: If the input file does not have a `.am`, `.AM` or binary scalar field suffix.
 
     Returns:
         :py:class:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.ScalarField`: A scalar field object.
     """
+    if fname.endswith(scalar_field.BINARY_SUFFIX):
+        return scalar_field.ScalarField.from_binary(resolve_db_path(fname))
     if not fname.endswith('.am') and not fname.endswith('.AM'):
         raise IOError('Input file is not an Amira Mesh file!')
+    if use_binary:
+        amName = resolve_db_path(fname)
+        binaryName = _get_binary_scalar_field_name(amName)
+        if not os.path.exists(binaryName) or os.path.getmtime(binaryName) < os.path.getmtime(amName):
+            scalarField = read_scalar_field(fname)
+            try:
+                scalarField.save_binary(binaryName)
+            except OSError as e:
+                logger.warning('Could not convert {} to a binary scalar field: {}'.format(fname, e))
+                return scalarField
+        return scalar_field.ScalarField.from_binary(binaryName)
 
     with dbopen(fname, 'r') as meshFile:
         #            print "Reading Amira Mesh file", fname
@@ -292,6 +319,32 @@ def read_scalar_field(fname=''):
         return scalar_field.ScalarField(mesh, origin, extent, spacing, bounds)
 
 
+def _get_binary_scalar_field_name(fname):
+    """Get the name of the binary version of an :ref:`am_file_format` file."""
+    return os.path.splitext(fname)[0] + scalar_field.BINARY_SUFFIX
+
+
+def convert_scalar_field_to_binary(fname, outName=None):
+    """Convert an :ref:`am_file_format` scalar field to the binary scalar field format.
+    
+    See :py:meth:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.ScalarField.save_binary` for details on the format.
+    
+    Args:
+        fname (str): The name of the :ref:`am_file_format` file to convert.
+        outName (str, optional): 
+            The name of the binary output file. 
+            Default: :paramref:`fname` with suffix :py:attr:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.BINARY_SUFFIX`.
+            
+    Returns:
+        str: The name of the binary output file.
+    """
+    if outName is None:
+        outName = _get_binary_scalar_field_name(resolve_db_path(fname))
+    read_scalar_field(fname).save_binary(outName)
+    logger.info('Converted scalar field {} to {}'.format(fname, outName))
+    return outName
+
+
 def read_connections_spreadsheet(fname):
     """Reads a spreadsheet with connection probabilities between cell types
 
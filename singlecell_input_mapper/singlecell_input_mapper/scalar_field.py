@@ -21,11 +21,19 @@ Implementation of 3D scalar fields based on numpy arrays.
 Note that this class is identical to :py:class:`single_cell_parser.scalar_field.ScalarField`.
 It is duplicated here for package independence.
 '''
+import json
+import os
 import numpy as np
 
 __author__ = 'Robert Egger'
 __date__ = '2012-03-27'
 
+#: File suffix of the binary scalar field format. See :py:meth:`ScalarField.save_binary`.
+BINARY_SUFFIX = '.sfb'
+_BINARY_FORMAT = 'ISF ScalarField'
+_BINARY_VERSION = 1
+_BINARY_ALIGNMENT = 64
+
 class ScalarField(object):
     '''3D scalar fields based on numpy arrays
     
@@ -231,3 +239,161 @@ class ScalarField(object):
         y = self.origin[1] + (j + 0.5) * self.spacing[1]
         z = self.origin[2] + (k + 0.5) * self.spacing[2]
         return x, y, z
+
+    def get_mesh_coordinates_batch(self, xyz):
+        '''Fetch the mesh indices of the voxels containing multiple points.
+
+        Vectorized version of :py:meth:`get_mesh_coordinates`.
+
+        Warning:
+            This method does not perform range checking.
+            Use :py:meth:`is_in_bounds_batch` to find the points within the bounding box.
+
+        Args:
+            xyz (array-like): The 3D coordinates of the points, of shape (N, 3).
+
+        Returns:
+            numpy.ndarray: The :py:attr:`mesh` indices of the voxels containing the points, of shape (N, 3).
+        '''
+        xyz = np.asarray(xyz, dtype=float).reshape(-1, 3)
+        return np.floor_divide(xyz - np.asarray(self.origin, dtype=float), np.asarray(self.spacing, dtype=float)).astype(int)
+
+    def is_in_bounds_batch(self, xyz):
+        '''Check if multiple points are within the bounding box of the mesh.
+
+        Vectorized version of :py:meth:`is_in_bounds`.
+
+        Args:
+            xyz (array-like): The 3D coordinates of the points, of shape (N, 3).
+
+        Returns:
+            numpy.ndarray: Boolean mask of shape (N,). True where the point is within the bounding box.
+        '''
+        xyz = np.asarray(xyz, dtype=float).reshape(-1, 3)
+        delta = 1.0e-6
+        bBox = np.asarray(self.boundingBox, dtype=float)
+        return np.all((xyz >= bBox[0::2] + delta) & (xyz <= bBox[1::2] - delta), axis=1)
+
+    def get_scalar_batch(self, xyz, interpolation='nearest', fill_value=np.nan):
+        '''Fetch the scalar values at multiple points.
+
+        With ``interpolation='nearest'``, this is a vectorized version of :py:meth:`get_scalar`:
+        the value of the voxel containing each point.
+        With ``interpolation='linear'``, the values are trilinearly interpolated between voxel centers.
+        Within half a voxel of the bounding box, the values are extrapolated as constant.
+
+        Args:
+            xyz (array-like): The 3D coordinates of the points, of shape (N, 3).
+            interpolation (str): Either ``'nearest'`` (default) or ``'linear'``.
+            fill_value (float): Value for points outside the bounding box. Default: ``numpy.nan``.
+
+        Returns:
+            numpy.ndarray: The scalar values at the points, of shape (N,).
+        '''
+        xyz = np.asarray(xyz, dtype=float).reshape(-1, 3)
+        inBounds = self.is_in_bounds_batch(xyz)
+        values = np.full(len(xyz), fill_value, dtype=np.result_type(self.mesh.dtype, type(fill_value)))
+        if not inBounds.any():
+            return values
+        xyz = xyz[inBounds]
+        if interpolation == 'nearest':
+            ijk = self.get_mesh_coordinates_batch(xyz)
+            values[inBounds] = self.mesh[ijk[:, 0], ijk[:, 1], ijk[:, 2]]
+        elif interpolation == 'linear':
+            # continuous mesh coordinates, relative to the voxel centers
+            uvw = (xyz - np.asarray(self.origin, dtype=float)) / np.asarray(self.spacing, dtype=float) - 0.5
+            lower = np.floor(uvw).astype(int)
+            weights = uvw - lower
+            maxIndex = np.array(self.mesh.shape) - 1
+            interpolated = np.zeros(len(xyz))
+            for corner in np.ndindex(2, 2, 2):
+                ijk = np.clip(lower + corner, 0, maxIndex)
+                cornerWeights = np.prod(np.where(corner, weights, 1.0 - weights), axis=1)
+                interpolated += cornerWeights * self.mesh[ijk[:, 0], ijk[:, 1], ijk[:, 2]]
+            values[inBounds] = interpolated
+        else:
+            raise ValueError('Unknown interpolation {}. Use "nearest" or "linear".'.format(interpolation))
+        return values
+
+    def save_binary(self, fname):
+        '''Save the scalar field in a binary format that can be memory-mapped.
+        
+        The file consists of a single line JSON header, padded to 64 bytes, containing
+        :py:attr:`origin`, :py:attr:`extent`, :py:attr:`spacing`, :py:attr:`boundingBox`,
+        and the data type and shape of the :py:attr:`mesh`.
+        The header is followed by the raw :py:attr:`mesh` data in C order.
+        
+        The file is written to a temporary file first, such that other processes never read incomplete files.
+        
+        See also:
+            :py:meth:`from_binary` to load the scalar field.
+        
+        Args:
+            fname (str): Path to the output file. Should end with :py:attr:`BINARY_SUFFIX`.
+        '''
+        mesh = np.ascontiguousarray(self.mesh)
+        header = {
+            'format': _BINARY_FORMAT,
+            'version': _BINARY_VERSION,
+            'dtype': mesh.dtype.str,
+            'shape': [int(n) for n in mesh.shape],
+            'origin': [float(v) for v in self.origin],
+            'extent': [int(v) for v in self.extent],
+            'spacing': [float(v) for v in self.spacing],
+            'boundingBox': [float(v) for v in self.boundingBox],
+        }
+        header = json.dumps(header).encode('ascii')
+        # pad the header such that the mesh data is aligned
+        padding = -(len(header) + 1) % _BINARY_ALIGNMENT
+        header = header + b' ' * padding + b'\n'
+        tmpName = '{}.{:d}.tmp'.format(fname, os.getpid())
+        with open(tmpName, 'wb') as f:
+            f.write(header)
+            f.write(mesh.tobytes(order='C'))
+        os.replace(tmpName, fname)
+
+    @classmethod
+    def from_binary(cls, fname, mmap_mode='r'):
+        '''Load a scalar field saved with :py:meth:`save_binary`.
+        
+        The :py:attr:`mesh` is memory-mapped, i.e. only read from disk when accessed.
+        Processes that read the same file share its pages in memory via the page cache.
+        
+        Args:
+            fname (str): Path to the binary scalar field file.
+            mmap_mode (str | None): 
+                Mode of the memory-map, see :py:class:`numpy.memmap`. 
+                Default: ``'r'`` (read-only). 
+                Use ``'c'`` for a writable copy-on-write mesh, or None to read the mesh into memory.
+            
+        Raises:
+            IOError: If the file is not a binary scalar field file.
+        
+        Returns:
+            :py:class:`ScalarField`: The scalar field.
+        '''
+        with open(fname, 'rb') as f:
+            headerLine = f.readline()
+        try:
+            header = json.loads(headerLine.decode('ascii'))
+        except ValueError:
+            header = {}
+        if header.get('format') != _BINARY_FORMAT:
+            raise IOError('Input file {} is not a binary scalar field file!'.format(fname))
+        if header['version'] > _BINARY_VERSION:
+            raise IOError('Binary scalar field file {} has unsupported version {}'.format(fname, header['version']))
+        shape = tuple(header['shape'])
+        if mmap_mode is None:
+            with open(fname, 'rb') as f:
+                f.seek(len(headerLine))
+                mesh = np.fromfile(f, dtype=header['dtype'], count=int(np.prod(shape))).reshape(shape)
+        else:
+            mesh = np.memmap(fname, dtype=header['dtype'], mode=mmap_mode, offset=len(headerLine), shape=shape, order='C')
+        # bypass __init__, which copies the mesh
+        scalarField = cls.__new__(cls)
+        scalarField.mesh = mesh
+        scalarField.origin = tuple(header['origin'])
+        scalarField.extent = tuple(header['extent'])
+        scalarField.spacing = tuple(header['spacing'])
+        scalarField.boundingBox = tuple(header['boundingBox'])
+        return scalarField
@@ -0,0 +1,184 @@
+# In Silico Framework
+# Copyright (C) 2025  Max Planck Institute for Neurobiology of Behavior - CAESAR
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# The full license text is also available in the LICENSE file in the root of this repository.
+'''On-disk cache of synapse densities, keyed by the content of the input files.
+
+Computing the synapse densities of all presynaptic cell types
+(see :py:meth:`~singlecell_input_mapper.singlecell_input_mapper.network_embedding.NetworkMapper._precompute_anatomical_area_celltype_synapse_densities`)
+is the most expensive step of creating anatomical realizations.
+The synapse densities only depend on the postsynaptic morphology, the connections spreadsheet,
+and the PST and bouton density fields.
+This module saves them to a single compressed ``.npz`` file per combination of input files,
+such that new realizations of the same inputs can skip this step entirely.
+
+Cache entries are named after a hash of the content of all input files (see :py:meth:`get_synapse_density_cache_key`),
+not their path or modification time.
+
+Example:
+
+    >>> key = get_synapse_density_cache_key([cellName, connectionsSpreadsheetName, ExPSTDensityName, InhPSTDensityName] + boutonDensityNames)
+    >>> synapseDensities = load_synapse_densities(cacheDir, key)
+    >>> if synapseDensities is None:
+    ...     synapseDensities = networkMapper._precompute_anatomical_area_celltype_synapse_densities(boutonDensities)
+    ...     save_synapse_densities(cacheDir, key, synapseDensities)
+    >>> networkMapper.create_network_embedding_from_synapse_densities(cellName, synapseDensities)
+'''
+
+import hashlib
+import json
+import os
+import numpy as np
+from .scalar_field import ScalarField
+from data_base.dbopen import dbopen
+import logging
+logger = logging.getLogger("ISF").getChild(__name__)
+
+__all__ = [
+    'get_synapse_density_cache_key',
+    'get_synapse_density_cache_path',
+    'save_synapse_densities',
+    'load_synapse_densities'
+    ]
+
+_CACHE_VERSION = 1
+
+
+def get_synapse_density_cache_key(fnames, **params):
+    '''Hash the content of the input files of the synapse density computation.
+
+    Args:
+        fnames (list):
+            Paths to the input files, i.e. the :ref:`hoc_file_format` morphology, the connections spreadsheet,
+            and the PST and bouton density fields. The order matters.
+        **params: Additional parameters that the synapse densities depend on, e.g. the postsynaptic cell type. Must be JSON serializable.
+
+    Returns:
+        str: The cache key.
+    '''
+    sha = hashlib.sha1()
+    sha.update(json.dumps([_CACHE_VERSION, sorted(params.items())]).encode())
+    for fname in fnames:
+        fileSha = hashlib.sha1()
+        with dbopen(fname, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                fileSha.update(chunk)
+        sha.update(fileSha.digest())
+    return sha.hexdigest()
+
+
+def get_synapse_density_cache_path(cacheDir, key):
+    '''Get the path of a cache entry.
+
+    Args:
+        cacheDir (str): Directory of the cache.
+        key (str): The cache key, see :py:meth:`get_synapse_density_cache_key`.
+
+    Returns:
+        str: Path to the ``.npz`` file of the cache entry.
+    '''
+    return os.path.join(cacheDir, 'synapse_densities_{}.npz'.format(key))
+
+
+def save_synapse_densities(cacheDir, key, synapseDensities):
+    '''Save synapse densities to the cache.
+
+    The meshes of all scalar fields are saved as compressed arrays in a single ``.npz`` file.
+    The remaining attributes of the scalar fields, and the structure of :paramref:`synapseDensities`,
+    are saved as a JSON index within the same file.
+
+    Args:
+        cacheDir (str): Directory of the cache. Created if it does not exist.
+        key (str): The cache key, see :py:meth:`get_synapse_density_cache_key`.
+        synapseDensities (dict):
+            Synapse densities, ordered by anatomical area and presynaptic cell type.
+            See :py:meth:`~singlecell_input_mapper.singlecell_input_mapper.network_embedding.NetworkMapper._precompute_anatomical_area_celltype_synapse_densities`.
+
+    Returns:
+        str: Path to the cache entry.
+    '''
+    meshes = {}
+    index = {}
+    for anatomical_area in synapseDensities:
+        index[anatomical_area] = {}
+        for preCellType in synapseDensities[anatomical_area]:
+            index[anatomical_area][preCellType] = []
+            for synapseDensity in synapseDensities[anatomical_area][preCellType]:
+                if synapseDensity is None:
+                    index[anatomical_area][preCellType].append(None)
+                    continue
+                structures = {}
+                for structure, scalarField in synapseDensity.items():
+                    meshName = 'mesh_{:d}'.format(len(meshes))
+                    meshes[meshName] = scalarField.mesh
+                    structures[structure] = {
+                        'mesh': meshName,
+                        'origin': [float(v) for v in scalarField.origin],
+                        'extent': [int(v) for v in scalarField.extent],
+                        'spacing': [float(v) for v in scalarField.spacing],
+                        'boundingBox': [float(v) for v in scalarField.boundingBox],
+                    }
+                index[anatomical_area][preCellType].append(structures)
+
+    if not os.path.exists(cacheDir):
+        os.makedirs(cacheDir)
+    path = get_synapse_density_cache_path(cacheDir, key)
+    # write to a temporary file first, so that other processes never read incomplete files
+    tmpPath = '{}.{:d}.tmp.npz'.format(path[:-len('.npz')], os.getpid())
+    np.savez_compressed(tmpPath, index=np.array(json.dumps(index)), **meshes)
+    os.replace(tmpPath, path)
+    logger.info('Saved synapse densities to {:s}'.format(path))
+    return path
+
+
+def load_synapse_densities(cacheDir, key=None):
+    '''Load synapse densities from the cache.
+
+    Args:
+        cacheDir (str):
+            Directory of the cache.
+            If :paramref:`key` is None, the path to the cache entry itself.
+        key (str, optional): The cache key, see :py:meth:`get_synapse_density_cache_key`.
+
+    Returns:
+        dict | None:
+            Synapse densities, ordered by anatomical area and presynaptic cell type,
+            or None if there is no such cache entry.
+    '''
+    path = cacheDir if key is None else get_synapse_density_cache_path(cacheDir, key)
+    if not os.path.exists(path):
+        return None
+    synapseDensities = {}
+    with np.load(path) as data:
+        index = json.loads(str(data['index']))
+        for anatomical_area in index:
+            synapseDensities[anatomical_area] = {}
+            for preCellType in index[anatomical_area]:
+                synapseDensities[anatomical_area][preCellType] = []
+                for structures in index[anatomical_area][preCellType]:
+                    if structures is None:
+                        synapseDensities[anatomical_area][preCellType].append(None)
+                        continue
+                    synapseDensities[anatomical_area][preCellType].append({
+                        structure: ScalarField(
+                            data[s['mesh']],
+                            s['origin'],
+                            s['extent'],
+                            s['spacing'],
+                            s['boundingBox'])
+                        for structure, s in structures.items()
+                        })
+    logger.info('Loaded synapse densities from {:s}'.format(path))
+    return synapseDensities
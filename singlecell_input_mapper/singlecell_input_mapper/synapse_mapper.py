@@ -23,7 +23,6 @@ Consult the module :py:mod:`~singlecell_input_mapper.map_singlecell_inputs` for
 '''
 import numpy as np
 from .scalar_field import ScalarField
-import sys
 import logging
 logger = logging.getLogger("ISF").getChild(__name__)
 
@@ -342,21 +341,17 @@ class SynapseDensity(object):
                 cellBoundingBox)
             
             x_start, x_end, y_start, y_end, z_start, z_end = synapseDensity[anatomical_area].extent
-            for i in range(x_start, x_end + 1):
-                for j in range(y_start, y_end + 1):
-                    for k in range(z_start, z_end + 1):
-                        ijk = i, j, k
-                        voxelCenter = synapseDensity[anatomical_area].get_voxel_center(ijk)
-                        boutons = boutonDensity.get_scalar(voxelCenter)
-                        normPST = normPSTDensity.get_scalar(voxelCenter)
-                        cellPST = cellPSTDensity[anatomical_area].mesh[ijk]
-                        if (
-                            boutons is not None and 
-                            normPST is not None and 
-                            normPST > 0.0
-                            ):
-                            synapseDensity[anatomical_area].mesh[ijk] = \
-                                boutons * cellPST / normPST
+            voxelCenters = [
+                cellOrigin[axis] + (np.arange(start, end + 1) + 0.5) * cellSpacing[axis]
+                for axis, (start, end) in enumerate(((x_start, x_end), (y_start, y_end), (z_start, z_end)))
+                ]
+            boutons, boutonsValid = self._resample_to_grid(boutonDensity, *voxelCenters)
+            normPST, normPSTValid = self._resample_to_grid(normPSTDensity, *voxelCenters)
+            cellPST = cellPSTDensity[anatomical_area].mesh[x_start:x_end + 1, y_start:y_end + 1, z_start:z_end + 1]
+            valid = boutonsValid & normPSTValid & (normPST > 0.0)
+            synapseMesh = np.zeros(shape=valid.shape)
+            synapseMesh[valid] = boutons[valid] * cellPST[valid] / normPST[valid]
+            synapseDensity[anatomical_area].mesh[x_start:x_end + 1, y_start:y_end + 1, z_start:z_end + 1] = synapseMesh
 
         for anatomical_area in list(synapseDensity.keys()):
             keep = False
@@ -470,8 +465,6 @@ class SynapseDensity(object):
         likeAmira=0):
         '''Fills the scalar fields :paramref:`lengthDensity` and :paramref:`surfaceDensity` to contain length and area per structure per voxel.
         
-        This method is an implementation of line segment clipping using the 
-        Liang-barsky algorithm (http://en.wikipedia.org/wiki/Liang%E2%80%93Barsky_algorithm).
         This makes use of the fact that end points of individual sections are beginning points 
         of connected sections and represented in each section separately.
         This way, sections can be treated separately from each other.
@@ -479,7 +472,8 @@ class SynapseDensity(object):
         The methods runs in two steps:
         
         1. Compute length between all pairs of points that are located in the same grid cell (vast majority)
-        2. Use Liang-Barsky for clipping line segments between remaining points that are not located within same grid cell
+        2. Clip the line segments between remaining points that are not located within the same grid cell
+           to the voxels they cross, using :py:meth:`~SynapseDensity._clip_segments_to_grid`.
         
         Args:
             lengthDensity (dict): 
@@ -503,150 +497,128 @@ class SynapseDensity(object):
                 .format(structure))
             density1 = lengthDensity[structure]
             density2 = surfaceAreaDensity[structure]
+            pts1, pts2, radii1, radii2 = [], [], [], []
+            for sec in self.cell.structures[structure]:
+                if sec.nrOfPts < 2:
+                    continue
+                pts = np.array(sec.pts, dtype=float)
+                # Amira Bug: uses diameter instead of radius
+                # (doesn't matter for end result, but it's affecting
+                # the INH PST density -> need to be consistent...)
+                radii = np.array(sec.diamList, dtype=float) * (1.0 if likeAmira else 0.5)
+                pts1.append(pts[:-1])
+                pts2.append(pts[1:])
+                radii1.append(radii[:-1])
+                radii2.append(radii[1:])
+            if not pts1:
+                continue
+            pts1 = np.concatenate(pts1)
+            pts2 = np.concatenate(pts2)
+            radii1 = np.concatenate(radii1)
+            radii2 = np.concatenate(radii2)
+            
             #===================================================================
             # Two steps:
             # 1. Compute length between all pairs of points that are located
             # in the same grid cell (vast majority)
-            # 2. Use Liang-Barsky for clipping line segments between remaining
-            # points that are not located within same grid cell
+            # 2. Clip line segments between remaining points that are not
+            # located within same grid cell to the voxels they cross
             #===================================================================
-            clipSegments = []
-            clipSegmentsRadius = []
-            for sec in self.cell.structures[structure]:
-                for i in range(sec.nrOfPts - 1):
-                    pt1 = np.array(sec.pts[i])
-                    pt2 = np.array(sec.pts[i + 1])
-                    if not likeAmira:
-                        r1 = sec.diamList[i] * 0.5
-                        r2 = sec.diamList[i + 1] * 0.5
-                    # Amira Bug: uses diameter instead of radius
-                    # (doesn't matter for end result, but it's affecting
-                    # the INH PST density -> need to be consistent...)
-                    if likeAmira:
-                        r1 = sec.diamList[i]
-                        r2 = sec.diamList[i + 1]
-                    gridCell1 = density1.get_mesh_coordinates(pt1)
-                    gridCell2 = density1.get_mesh_coordinates(pt2)
-                    if gridCell1 == gridCell2:
-                        diff = pt2 - pt1
-                        length = np.sqrt(np.dot(diff, diff))
-                        area = self._get_truncated_cone_area(length, r1, r2)
-                        density1.mesh[gridCell1] += length
-                        density2.mesh[gridCell1] += area
-                        totalLength += length
-                    else:
-                        clipSegments.append((pt1, pt2))
-                        clipSegmentsRadius.append((r1, r2))
-
-
-            # dims = density1.extent[1]+1, density1.extent[3]+1, density1.extent[5]+1
-            # nrOfVoxels = dims[0]*dims[1]*dims[2]
-            count = 0
-            #            print 'Checking %dx%dx%d = %d voxels...' % (dims[0],dims[1],dims[2],nrOfVoxels)
-            nrOfSegments = len(clipSegments)
-            #            print 'Clipping %d segments...' % (nrOfSegments)
-            #            for segment in clipSegments:
-            for n in range(len(clipSegments)):
-                segment = clipSegments[n]
-                segmentRadius = clipSegmentsRadius[n]
-                logger.debug('{:d} of {:d} done...\r'.format(
-                    count, nrOfSegments))  #, end=' ')
-                sys.stdout.flush()
-                count += 1
-                for i in range(density1.extent[0], density1.extent[1] + 1):
-                    for j in range(density1.extent[2], density1.extent[3] + 1):
-                        for k in range(density1.extent[4],
-                                       density1.extent[5] + 1):
-                            #                            print '%d of %d done...\r' % (count,nrOfVoxels),
-                            #                            sys.stdout.flush()
-                            #                            count += 1
-                            ijk = i, j, k
-                            voxelBounds = density1.get_voxel_bounds(ijk)
-                            pt1 = segment[0]
-                            pt2 = segment[1]
-                            dx_ = pt2 - pt1
-
-                            dx = dx_[0]
-                            dy = dx_[1]
-                            dz = dx_[2]
-                            p1 = -dx
-                            p2 = dx
-                            p3 = -dy
-                            p4 = dy
-                            p5 = -dz
-                            p6 = dz
-                            q1 = pt1[0] - voxelBounds[0]
-                            q2 = voxelBounds[1] - pt1[0]
-                            q3 = pt1[1] - voxelBounds[2]
-                            q4 = voxelBounds[3] - pt1[1]
-                            q5 = pt1[2] - voxelBounds[4]
-                            q6 = voxelBounds[5] - pt1[2]
-
-                            u1 = 0
-                            u2 = 1
-                            pq1 = [p1, q1]
-                            pq2 = [p2, q2]
-                            pq3 = [p3, q3]
-                            pq4 = [p4, q4]
-                            pq5 = [p5, q5]
-                            pq6 = [p6, q6]
-                            u1u2 = [u1, u2]
-                            if self._clip_u(pq1, u1u2) and self._clip_u(pq2, u1u2)\
-                                and self._clip_u(pq3, u1u2) and self._clip_u(pq4, u1u2)\
-                                and self._clip_u(pq5, u1u2) and self._clip_u(pq6, u1u2):
-                                u1 = u1u2[0]
-                                u2 = u1u2[1]
-                            else:
-                                continue
-
-                            if u2 < u1:
-                                continue
-
-                            clipPt1 = pt1 + u1 * dx_
-                            clipPt2 = pt1 + u2 * dx_
-                            #                            diff = clipPt2 - clipPt1
-                            diff = (u2 - u1) * dx_
-                            length = np.sqrt(np.dot(diff, diff))
-                            r1 = segmentRadius[0]
-                            r2 = segmentRadius[1]
-                            r1Interpolated = self._interpolate_radius(
-                                pt1, pt2, r1, r2, clipPt1)
-                            r2Interpolated = self._interpolate_radius(
-                                pt1, pt2, r1, r2, clipPt2)
-                            area = self._get_truncated_cone_area(
-                                length, r1Interpolated, r2Interpolated)
-                            density1.mesh[ijk] += length
-                            density2.mesh[ijk] += area
-                            totalLength += length
+            gridCells1 = density1.get_mesh_coordinates_batch(pts1)
+            gridCells2 = density1.get_mesh_coordinates_batch(pts2)
+            sameCell = np.all(gridCells1 == gridCells2, axis=1)
+            diff = pts2[sameCell] - pts1[sameCell]
+            lengths = np.sqrt(np.sum(diff * diff, axis=1))
+            areas = self._get_truncated_cone_area(lengths, radii1[sameCell], radii2[sameCell])
+            ijk = tuple(gridCells1[sameCell].T)
+            np.add.at(density1.mesh, ijk, lengths)
+            np.add.at(density2.mesh, ijk, areas)
+            totalLength += np.sum(lengths)
+
+            clip = ~sameCell
+            logger.debug('Clipping {:d} segments...'.format(int(np.sum(clip))))
+            totalLength += self._clip_segments_to_grid(
+                density1, density2, 
+                pts1[clip], pts2[clip], 
+                radii1[clip], radii2[clip])
         logger.info('Total clipped length = {:f}'.format(totalLength))
         logger.info('---------------------------')
 
-    def _clip_u(self, pq, u1u2):
-        '''Liang-Barsky clipping algorithm :cite:`liang1984new` for line segments in 3D.
+    def _clip_segments_to_grid(self, lengthDensity, surfaceAreaDensity, pts1, pts2, radii1, radii2):
+        '''Clip line segments to the voxels of a grid and add their length and area to the voxels.
+        
+        Voxel traversal in the spirit of :cite:`amanatides1987fast`, vectorized over segments:
+        each segment is split at the parameters where it crosses the voxel boundary planes between its end points,
+        such that every piece lies within a single voxel.
+        Only voxels that are actually crossed by a segment are visited.
+        The area of each piece is the area of a truncated cone with linearly interpolated radii.
+        Pieces outside of the grid are ignored.
         
-        Used in :py:meth:`~SynapseDensity._compute_length_surface_area_density` to clip line segments to scalar field meshes.
+        Args:
+            lengthDensity (:py:class:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.ScalarField`): 
+                Length density to add the clipped lengths to.
+            surfaceAreaDensity (:py:class:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.ScalarField`):
+                Surface area density to add the clipped areas to. Must have the same grid as :paramref:`lengthDensity`.
+            pts1 (numpy.ndarray): Start points of the segments, shape (N, 3).
+            pts2 (numpy.ndarray): End points of the segments, shape (N, 3).
+            radii1 (numpy.ndarray): Radii at the start points, shape (N,).
+            radii2 (numpy.ndarray): Radii at the end points, shape (N,).
+            
+        Returns:
+            float: Total length of all clipped segments within the grid.
         '''
-        p = pq[0]
-        q = pq[1]
-        u1 = u1u2[0]
-        u2 = u1u2[1]
-        if p < 0:
-            tmp = q / p
-            if tmp > u2:
-                return False
-            elif tmp > u1:
-                u1 = tmp
-        elif p > 0:
-            tmp = q / p
-            if tmp < u1:
-                return False
-            elif tmp < u2:
-                u2 = tmp
-        elif self._is_zero(p) and q < 0:
-            return False
-        u1u2[0] = u1
-        u1u2[1] = u2
-        return True
+        if not len(pts1):
+            return 0.0
+        origin = np.array(lengthDensity.origin, dtype=float)
+        spacing = np.array(lengthDensity.spacing, dtype=float)
+        delta = pts2 - pts1
+        gridCells1 = lengthDensity.get_mesh_coordinates_batch(pts1)
+        gridCells2 = lengthDensity.get_mesh_coordinates_batch(pts2)
+        
+        # parameters u in [0, 1] where the segments cross voxel boundary planes
+        segmentIDs = [np.arange(len(pts1)), np.arange(len(pts1))]
+        us = [np.zeros(len(pts1)), np.ones(len(pts1))]
+        for axis in range(3):
+            nrOfCrossings = np.abs(gridCells2[:, axis] - gridCells1[:, axis])
+            crossingSegmentIDs = np.repeat(np.arange(len(pts1)), nrOfCrossings)
+            # k-th crossing of each segment, starting at 1
+            k = np.arange(len(crossingSegmentIDs)) - np.repeat(np.cumsum(nrOfCrossings) - nrOfCrossings, nrOfCrossings) + 1
+            direction = np.sign(gridCells2[crossingSegmentIDs, axis] - gridCells1[crossingSegmentIDs, axis])
+            # moving up, the k-th plane is the lower bound of voxel c1+k, moving down it is the lower bound of voxel c1-k+1
+            planeIDs = gridCells1[crossingSegmentIDs, axis] + direction * k + (direction < 0)
+            planes = origin[axis] + planeIDs * spacing[axis]
+            segmentIDs.append(crossingSegmentIDs)
+            us.append((planes - pts1[crossingSegmentIDs, axis]) / delta[crossingSegmentIDs, axis])
+        segmentIDs = np.concatenate(segmentIDs)
+        us = np.clip(np.concatenate(us), 0.0, 1.0)
+        order = np.lexsort((us, segmentIDs))
+        segmentIDs = segmentIDs[order]
+        us = us[order]
+        
+        # consecutive parameters of the same segment delimit pieces within a single voxel
+        pieceMask = (segmentIDs[1:] == segmentIDs[:-1]) & (us[1:] > us[:-1])
+        pieceSegmentIDs = segmentIDs[:-1][pieceMask]
+        u1 = us[:-1][pieceMask]
+        u2 = us[1:][pieceMask]
+        midPts = pts1[pieceSegmentIDs] + (0.5 * (u1 + u2))[:, np.newaxis] * delta[pieceSegmentIDs]
+        voxels = lengthDensity.get_mesh_coordinates_batch(midPts)
+        inGrid = np.all((voxels >= 0) & (voxels < np.array(lengthDensity.mesh.shape)), axis=1)
+        pieceSegmentIDs, u1, u2, voxels = pieceSegmentIDs[inGrid], u1[inGrid], u2[inGrid], voxels[inGrid]
+        
+        segmentLengths = np.sqrt(np.sum(delta * delta, axis=1))
+        lengths = (u2 - u1) * segmentLengths[pieceSegmentIDs]
+        r1 = radii1[pieceSegmentIDs]
+        r2 = radii2[pieceSegmentIDs]
+        r1Interpolated = u1 * r2 + (1.0 - u1) * r1
+        r2Interpolated = u2 * r2 + (1.0 - u2) * r1
+        # see _interpolate_radius
+        isShort = segmentLengths[pieceSegmentIDs] < 1e-4
+        r1Interpolated[isShort] = r2Interpolated[isShort] = 0.5 * (r1[isShort] + r2[isShort])
+        areas = self._get_truncated_cone_area(lengths, r1Interpolated, r2Interpolated)
+        ijk = tuple(voxels.T)
+        np.add.at(lengthDensity.mesh, ijk, lengths)
+        np.add.at(surfaceAreaDensity.mesh, ijk, areas)
+        return np.sum(lengths)
 
     def _get_truncated_cone_area(self, height, radius1, radius2):
         """Calculate the are of a truncated cone.
@@ -696,25 +668,20 @@ class SynapseDensity(object):
         jMax = self.exPST.extent[2]
         kMin = self.exPST.extent[5]
         kMax = self.exPST.extent[4]
-        for i in range(self.exPST.extent[0], self.exPST.extent[1] + 1):
-            for j in range(self.exPST.extent[2], self.exPST.extent[3] + 1):
-                for k in range(self.exPST.extent[4], self.exPST.extent[5] + 1):
-                    ijk = i, j, k
-                    voxelBounds = self.exPST.get_voxel_bounds(ijk)
-                    if not self._intersect_bboxes(cellBounds, voxelBounds):
-                        continue
-                    if i < iMin:
-                        iMin = i
-                    if i > iMax:
-                        iMax = i
-                    if j < jMin:
-                        jMin = j
-                    if j > jMax:
-                        jMax = j
-                    if k < kMin:
-                        kMin = k
-                    if k > kMax:
-                        kMax = k
+        # Voxel bounds intersect the cell bounds if they do so along every axis,
+        # so the intersecting voxel indices can be found per axis.
+        intersectingIDs = []
+        for axis in range(3):
+            ids = np.arange(self.exPST.extent[2 * axis], self.exPST.extent[2 * axis + 1] + 1)
+            voxelMin = self.exPST.origin[axis] + ids * self.exPST.spacing[axis]
+            voxelMax = self.exPST.origin[axis] + (ids + 1) * self.exPST.spacing[axis]
+            intersect = self._intersect_intervals(
+                cellBounds[2 * axis], cellBounds[2 * axis + 1], voxelMin, voxelMax)
+            intersectingIDs.append(ids[intersect])
+        if all(len(ids) for ids in intersectingIDs):
+            iMin, iMax = int(intersectingIDs[0][0]), int(intersectingIDs[0][-1])
+            jMin, jMax = int(intersectingIDs[1][0]), int(intersectingIDs[1][-1])
+            kMin, kMax = int(intersectingIDs[2][0]), int(intersectingIDs[2][-1])
 
         cellExtent = 0, iMax - iMin, 0, jMax - jMin, 0, kMax - kMin
         cellDims = cellExtent[1] + 1, cellExtent[3] + 1, cellExtent[5] + 1
@@ -743,6 +710,46 @@ class SynapseDensity(object):
 
         return cellMesh, cellOrigin, cellExtent, cellSpacing, cellBoundingBox
 
+    def _resample_to_grid(self, scalarField, xs, ys, zs):
+        """Fetch the scalar values of a scalar field at all points of a rectilinear grid.
+        
+        Equivalent to calling :py:meth:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.ScalarField.get_scalar`
+        for each point ``(x, y, z)`` of the grid, but without looping over the points
+        (see :py:meth:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.ScalarField.get_scalar_batch`).
+        
+        Args:
+            scalarField (:py:class:`~singlecell_input_mapper.singlecell_input_mapper.scalar_field.ScalarField`): The scalar field to sample.
+            xs (numpy.ndarray): x-coordinates of the grid points.
+            ys (numpy.ndarray): y-coordinates of the grid points.
+            zs (numpy.ndarray): z-coordinates of the grid points.
+            
+        Returns:
+            tuple: Tuple containing:
+            
+                - values (numpy.ndarray): The scalar values, of shape (len(xs), len(ys), len(zs)).
+                - valid (numpy.ndarray): Boolean mask of the same shape. False where the point is outside the bounding box of the scalar field.
+        """
+        shape = len(xs), len(ys), len(zs)
+        grid = np.stack(np.meshgrid(xs, ys, zs, indexing='ij'), axis=-1).reshape(-1, 3)
+        valid = scalarField.is_in_bounds_batch(grid).reshape(shape)
+        values = scalarField.get_scalar_batch(grid, fill_value=0.0).reshape(shape)
+        return values, valid
+
+    def _intersect_intervals(self, min1, max1, min2, max2):
+        """Check if intervals overlap along one axis. Vectorized equivalent of :py:meth:`_intersect_bboxes`.
+        
+        Args:
+            min1 (float | numpy.ndarray): Lower bound(s) of the first interval(s).
+            max1 (float | numpy.ndarray): Upper bound(s) of the first interval(s).
+            min2 (float | numpy.ndarray): Lower bound(s) of the second interval(s).
+            max2 (float | numpy.ndarray): Upper bound(s) of the second interval(s).
+            
+        Returns:
+            numpy.ndarray: True where the intervals overlap, False otherwise.
+        """
+        return ((min1 >= min2) & (min1 <= max2)) | ((min2 >= min1) & (min2 <= max1)) | \
+            ((max1 <= max2) & (max1 >= min2)) | ((max2 <= max1) & (max2 >= min1))
+
     def _is_zero(self, number):
         """Check if a number is close to zero (tolerance of 1e-10)
         
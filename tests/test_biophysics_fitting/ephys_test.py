@@ -1,6 +1,7 @@
 import numpy as np
 
-from biophysics_fitting.ephys import find_crossing, find_crossing_old
+from biophysics_fitting import ephys
+from biophysics_fitting.ephys import find_crossing, find_crossing_old, VoltageTraceBatch
 
 
 def test_find_crossing_and_find_crossing_old_are_equivalent():
@@ -16,3 +17,47 @@ def test_find_crossing():
     assert find_crossing(l, 2) == [[3, 8, 14], [6, 9, 15]]
     assert find_crossing(l, 2.5) == [[3, 8, 14], [6, 9, 15]]
     # assert find_crossing(l + [3], 2.5) == [[], []]
+
+
+def _get_spiking_traces(t, spike_counts, seed=0):
+    rng = np.random.RandomState(seed)
+    vs = []
+    for n in spike_counts:
+        v = np.full(len(t), -75.0) + rng.normal(0, 0.3, len(t))
+        for spike_time in np.sort(rng.uniform(300, 650, n)):
+            v += 100 * np.exp(-((t - spike_time) / 0.5)**2)
+            v -= 8 * np.exp(-np.clip(t - spike_time, 0, None) / 10) * (t > spike_time)
+        vs.append(v)
+    return np.array(vs)
+
+
+def test_VoltageTraceBatch_is_equivalent_to_single_trace_features():
+    t = np.arange(0, 700, 0.1)
+    vs = _get_spiking_traces(t, [0, 1, 2, 3, 5, 10])
+    batch = VoltageTraceBatch(t, vs)
+    features = [
+        ('spike_count', dict(thresh=-30), ()),
+        ('AP_height', dict(thresh=-30), ()),
+        ('AP_width', dict(thresh=-30), ()),
+        ('AHP_depth_abs', dict(thresh=-30), ()),
+        ('BAC_ISI', dict(thresh=-30), ()),
+        ('STEP_adaptation_index', dict(thresh=-30), (690,)),
+        ('STEP_coef_var', dict(thresh=-30), (690,)),
+        ('STEP_fast_ahp_depth', dict(thresh=-30), ()),
+        ('STEP_slow_ahp_depth', dict(thresh=-30), ()),
+        ('STEP_slow_ahp_time', dict(thresh=-30), ()),
+        ('BPAPatt', dict(thresh='+2mV', stim_onset=295), ()),
+    ]
+    for name, kwargs, args in features:
+        result = getattr(batch, name)(*args, **kwargs)
+        if isinstance(result, ephys.RaggedFeature):
+            result = result.to_object_array()
+        for v, r in zip(vs, result):
+            try:
+                expected = getattr(ephys, name)(t, v, *args, **kwargs)
+            except Exception:
+                expected = np.nan
+            np.testing.assert_allclose(
+                np.asarray(r, dtype=float),
+                np.asarray(expected, dtype=float),
+                err_msg=name)
@@ -0,0 +1,53 @@
+import numpy as np
+
+from biophysics_fitting.hay.evaluation import BAC, StepOne, bAP
+
+
+def _get_spiking_traces(t, spike_counts, start, end, amplitude=100, seed=0):
+    rng = np.random.RandomState(seed)
+    vs = []
+    for n in spike_counts:
+        v = np.full(len(t), -75.0) + rng.normal(0, 0.3, len(t))
+        for spike_time in np.sort(rng.uniform(start, end, n)):
+            v += amplitude * np.exp(-((t - spike_time) / 0.5)**2)
+            v -= 8 * np.exp(-np.clip(t - spike_time, 0, None) / 10) * (t > spike_time)
+        vs.append(v)
+    return np.array(vs)
+
+
+def _assert_get_batch_is_equivalent_to_get(evaluator, t, vList):
+    batch = evaluator.get_batch(tVec=t, vList=vList)
+    for lv in range(len(vList[0])):
+        single = evaluator.get(tVec=t, vList=[v[lv] for v in vList])
+        assert set(single) == set(batch)
+        for k, v in single.items():
+            np.testing.assert_allclose(
+                np.asarray(batch[k][lv], dtype=float),
+                np.asarray(v, dtype=float),
+                err_msg=k)
+
+
+def test_BAC_get_batch_is_equivalent_to_get():
+    t = np.arange(0, 600, 0.025)
+    soma = _get_spiking_traces(t, [0, 1, 2, 3, 4, 2], 296, 345)
+    dend = _get_spiking_traces(t, [0, 1, 1, 2, 1, 1], 296, 360, amplitude=50, seed=1)
+    _assert_get_batch_is_equivalent_to_get(BAC(), t, [soma, dend])
+
+
+def test_bAP_get_batch_is_equivalent_to_get():
+    t = np.arange(0, 600, 0.025)
+    # spikes before the deadline of 300.25 ms, except for the last traces, which spike before the stimulus
+    soma = np.concatenate([
+        _get_spiking_traces(t, [0, 1, 1, 1, 2, 1], 296, 300),
+        _get_spiking_traces(t, [1], 200, 290, seed=1)])
+    dend1 = np.concatenate([
+        _get_spiking_traces(t, [0, 1, 1, 1, 1, 0], 296.5, 300, amplitude=60, seed=2),
+        _get_spiking_traces(t, [1], 200, 290, amplitude=60, seed=3)])
+    dend2 = _get_spiking_traces(t, [0, 1, 1, 0, 1, 1, 1], 297, 300, amplitude=40, seed=4)
+    _assert_get_batch_is_equivalent_to_get(bAP(), t, [soma, dend1, dend2])
+
+
+def test_Step_get_batch_is_equivalent_to_get():
+    t = np.arange(0, 3000, 0.05)
+    soma = _get_spiking_traces(t, [0, 1, 2, 3, 5, 8, 20], 700, 2700)
+    _assert_get_batch_is_equivalent_to_get(StepOne(), t, [soma])
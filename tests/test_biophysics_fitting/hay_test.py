@@ -1,4 +1,5 @@
 import neuron
+import numpy as np
 
 import mechanisms.l5pt
 from biophysics_fitting.hay.default_setup import get_Combiner
@@ -30,5 +31,18 @@ def test_hay_simulation_evaluation(step=True):
             cutoff, stim, ev
         )
 
+def test_reuse_cell_gives_identical_traces():
+    """Test that simulating all stimuli on a single cell gives the same traces as setting up a new cell per stimulus"""
+    s = get_test_simulator_89(step=False)
+    params = get_example_models_89().iloc[0]
+    voltage_traces = s.run(params)
+    voltage_traces_reused = s.run(params, reuse_cell=True)
+    assert voltage_traces.keys() == voltage_traces_reused.keys()
+    for name in voltage_traces:
+        for key in voltage_traces[name]:
+            np.testing.assert_array_equal(
+                np.asarray(voltage_traces[name][key]),
+                np.asarray(voltage_traces_reused[name][key]))
+
 if __name__ == "__main__":
     test_hay_simulation_evaluation(step=True)
\ No newline at end of file
@@ -12,7 +12,7 @@ import pytest
 import single_cell_parser as scp
 from biophysics_fitting import L5tt_parameter_setup
 from biophysics_fitting.hay import default_setup as hay_default_setup
-from biophysics_fitting.optimizer import get_max_generation, start_run
+from biophysics_fitting.optimizer import get_max_generation, get_mymap, start_run
 from data_base import utils
 from data_base.data_base import DataBase
 from data_base.IO.LoaderDumper import pandas_to_pickle, to_cloudpickle
@@ -212,6 +212,80 @@ def test_get_max_generation():
     assert get_max_generation({"3": 1, "10_ckeckpoint": 2}) == 3
 
 
+class FakeClient:
+    """Evaluates locally, but raises a RuntimeError on the first :paramref:`n_failures` gathers."""
+
+    def __init__(self, n_failures):
+        self.n_failures = n_failures
+        self.n_maps = 0
+
+    def map(self, fun, iterable, pure=True):
+        self.n_maps += 1
+        return [fun(x) for x in iterable]
+
+    def gather(self, futures):
+        if self.n_failures > 0:
+            self.n_failures -= 1
+            raise RuntimeError("gather failed")
+        return futures
+
+
+class FakeDataBase(dict):
+    def set(self, key, value, dumper=None):
+        self[key] = value
+
+
+def get_fake_db_setup():
+    class Simulator:
+        def run(self, p):
+            return p
+
+    class Evaluator:
+        def evaluate(self, s):
+            return {"x": s["x"] ** 2}
+
+    class Combiner:
+        class setup:
+            names = ["x"]
+
+        def combine(self, features):
+            return features
+
+    db_setup = FakeDataBase()
+    db_setup["params"] = pd.DataFrame({"min": [0], "max": [1]}, index=["x"])
+    db_setup["get_Simulator"] = lambda db_setup: Simulator()
+    db_setup["get_Evaluator"] = lambda db_setup: Evaluator()
+    db_setup["get_Combiner"] = lambda db_setup: Combiner()
+    return db_setup
+
+
+@pytest.mark.parametrize("n_failures", [0, 1, 2])
+def test_mymap_reschedules_on_runtime_error(n_failures):
+    c = FakeClient(n_failures)
+    db_run = FakeDataBase()
+    mymap = get_mymap(get_fake_db_setup(), db_run, c, n_reschedule_on_runtime_error=2)
+    objectives = mymap(None, [[1], [2], [3]])
+    assert objectives.tolist() == [[1], [4], [9]]
+    assert c.n_maps == n_failures + 1
+    assert list(db_run.keys()) == ["0"]
+
+
+def test_mymap_raises_after_n_reschedule_on_runtime_error():
+    c = FakeClient(3)
+    mymap = get_mymap(get_fake_db_setup(), FakeDataBase(), c, n_reschedule_on_runtime_error=2)
+    with pytest.raises(RuntimeError):
+        mymap(None, [[1], [2], [3]])
+    assert c.n_maps == 3
+
+
+def test_mymap_with_worker_pool(client):
+    db_run = FakeDataBase()
+    mymap = get_mymap(get_fake_db_setup(), db_run, client, worker_pool_kwargs={"n_workers": 2})
+    objectives = mymap(None, [[1], [2], [3]])
+    assert objectives.tolist() == [[1], [4], [9]]
+    assert list(db_run.keys()) == ["0"]
+
+
 def test_mini_optimization_run(capsys, client):
     c = client
     db = set_up_db(step=False)
@@ -240,3 +314,17 @@ def test_mini_optimization_run(capsys, client):
     except:
         shutil.rmtree(db.basedir)
         raise
+
+
+def test_mini_optimization_run_in_batches(client):
+    db = set_up_db(step=False)
+    try:
+        start_run(db["86"], 1, client=client, offspring_size=3, max_ngen=2, batch_size=2)
+        keys = [
+            int(k) for k in list(db["86"]["1"].keys()) if utils.convertible_to_int(k)
+        ]
+        assert max(keys) == 2
+        assert len(db["86"]["1"]["1"]) == 3
+    except:
+        shutil.rmtree(db.basedir)
+        raise
@@ -0,0 +1,46 @@
+import os
+import pytest
+from biophysics_fitting.worker_pool import SimulationWorkerPool, get_worker_pool, get_worker_pool_key, close_worker_pools
+
+
+def _get_objective_function():
+    pid = os.getpid()
+
+    def objective_function(x):
+        if x == 'crash':
+            os._exit(11)
+        if x == 'raise':
+            raise ValueError(x)
+        return x**2, pid
+
+    return objective_function
+
+
+def test_worker_pool_keeps_workers_alive():
+    with SimulationWorkerPool(_get_objective_function, n_workers=2, batch_size=3) as pool:
+        results = pool.map(range(20))
+        assert [r[0] for r in results] == [x**2 for x in range(20)]
+        pids = set(r[1] for r in results)
+        assert len(pids) <= 2
+        results = pool.map(range(5))
+        assert set(r[1] for r in results) <= pids
+
+
+def test_worker_pool_recovers_from_crashes():
+    with SimulationWorkerPool(_get_objective_function, n_workers=2, batch_size=4, max_retries=1) as pool:
+        with pytest.raises(RuntimeError):
+            pool.map([1, 2, 'crash', 3])
+        with pytest.raises(RuntimeError):
+            pool.map([1, 'raise'])
+        # the pool can still be used
+        assert [r[0] for r in pool.map([1, 2, 3])] == [1, 4, 9]
+
+
+def test_get_worker_pool_with_precomputed_key():
+    try:
+        key = get_worker_pool_key(_get_objective_function, n_workers=1, batch_size=2)
+        pool = get_worker_pool(_get_objective_function, n_workers=1, batch_size=2)
+        assert get_worker_pool(_get_objective_function, n_workers=1, key=key, batch_size=2) is pool
+        assert get_worker_pool(_get_objective_function, n_workers=2, batch_size=2) is not pool
+    finally:
+        close_worker_pools()
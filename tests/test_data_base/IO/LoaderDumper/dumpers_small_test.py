@@ -90,6 +90,33 @@ def test_pandas_to_parquet_small(empty_db, pdf):
 def test_dask_to_parquet_small(empty_db, pdf, ddf, client):
     small_data_frame_test(empty_db, pdf, ddf, dask_to_parquet, client=client)
 
+@pytest.mark.skipif(isf_is_using_mdb(), reason="Filter pushdown is only implemented for isf_data_base.")
+def test_dask_to_parquet_filters(empty_db, pdf, client):
+    clean_up(empty_db)
+    pdf = pdf.rename_axis('idx')
+    ddf = dask.dataframe.from_pandas(pdf, npartitions=2)
+    empty_db.set('test', ddf, dumper=dask_to_parquet, client=client)
+    filters = [('idx', 'in', [4, 5])]
+    dummy = empty_db.get('test', filters=filters)
+    assert dummy.npartitions == 1
+    a = dummy.compute()
+    b = pdf.loc[[4, 5]]
+    assert_frame_equal(a, b)
+    # filters on the index and on columns are combined
+    dummy = empty_db.get('test', filters=[('idx', '>=', 1), ('myname', '==', 'bla')])
+    assert_frame_equal(dummy.compute(), pdf.loc[1:])
+
+@pytest.mark.skipif(isf_is_using_mdb(), reason="Filter pushdown is only implemented for isf_data_base.")
+def test_dask_to_parquet_select_partitions():
+    from data_base.isf_data_base.IO.LoaderDumper.dask_to_parquet import _select_partitions
+    divisions = (0, 10, 20, 30, 40)
+    assert _select_partitions(divisions, [[('idx', 'in', [35, 5, 36])]], 'idx') == [0, 3]
+    assert _select_partitions(divisions, [[('idx', 'in', [20])]], 'idx') == [1, 2]
+    assert _select_partitions(divisions, [[('idx', 'in', [-1, 41])]], 'idx') == []
+    assert _select_partitions(divisions, [[('idx', 'in', [])]], 'idx') == []
+    # values that can not be compared to the divisions match all partitions
+    assert _select_partitions(divisions, [[('idx', 'in', [1, 'a'])]], 'idx') == [0, 1, 2, 3]
+
 def test_pandas_to_pickle_small(empty_db, pdf):
     small_data_frame_test(empty_db, pdf, pdf.copy(), pandas_to_pickle)
 
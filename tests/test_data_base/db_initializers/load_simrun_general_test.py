@@ -50,3 +50,21 @@ def test_every_entry_in_initialized_db_can_be_serialized(fresh_db):
     for k in e.keys():
         v = e[k]
         cloudpickle.dumps(v)  # would raise an error if not picklable
+
+
+def test_npz_voltage_traces_match_csv_voltage_traces(tmpdir):
+    from single_cell_parser.writer import write_all_traces, write_all_traces_npz
+    from data_base.db_initializers.load_simrun_general.data_parsing import (
+        read_voltage_traces_from_csv, read_voltage_traces_from_npz)
+    t = np.arange(0, 10, 0.025)
+    vTraces = np.random.rand(3, len(t)) - 70
+    subdir = tmpdir.mkdir('results_seed1_pid1')
+    for i in range(len(vTraces)):
+        subdir.join('simulation_run%04d_synapses.csv' % i).write('')
+    write_all_traces(str(subdir.join('vm_all_traces.csv')), t, vTraces)
+    write_all_traces_npz(str(subdir.join('vm_all_traces.npz')), t, vTraces)
+    df_csv = read_voltage_traces_from_csv(str(tmpdir), 'results_seed1_pid1/vm_all_traces.csv')
+    df_npz = read_voltage_traces_from_npz(str(tmpdir), 'results_seed1_pid1/vm_all_traces.npz')
+    assert list(df_csv.index) == list(df_npz.index)
+    np.testing.assert_allclose(df_csv.columns.values, df_npz.columns.values)
+    np.testing.assert_allclose(df_csv.values, df_npz.values)
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+from simrun.modular_reduced_model_inference import Rm, RaisedCosineBasis, \
+    Strategy_spatiotemporalRaisedCosine, Strategy_temporalRaisedCosine_spatial_cutoff, \
+    Strategy_categorizedTemporalRaisedCosine, Strategy_linearCombinationOfData, CombineStrategies_sum
+from simrun.modular_reduced_model_inference.data_extractor import _DataExtractor
+
+GROUPS = [('EXC',), ('INH',)]
+STRATEGIES = ['spatiotemporal', 'spatial_cutoff', 'categorized', 'combined']
+
+
+class DataExtractor_array(_DataExtractor):
+    '''Provides in-memory data to a reduced model.'''
+    def __init__(self, data):
+        self.data = data
+
+    def get(self):
+        return self.data
+
+
+def get_synthetic_data(n_trials=2000, n_time=40, n_space=8, seed=0):
+    '''Random spatiotemporal synapse activation patterns, and spikes that are driven by proximal synapses in the last 10 time bins.'''
+    rng = np.random.RandomState(seed)
+    spatiotemporalSa = {
+        group: rng.poisson(0.3, size=(n_trials, n_time, n_space)).astype('f4')
+        for group in GROUPS}
+    wni = spatiotemporalSa[('EXC',)][:, -10:, :n_space // 2].sum(axis=(1, 2)) - \
+        spatiotemporalSa[('INH',)][:, -10:, :n_space // 2].sum(axis=(1, 2))
+    p_spike = 1 / (1 + np.exp(-(wni - wni.mean())))
+    return {
+        'spatiotemporalSa': spatiotemporalSa,
+        'categorizedTemporalSa': {group: sa.sum(axis=2) for group, sa in spatiotemporalSa.items()},
+        'st': None,
+        'y': pd.Series((rng.rand(n_trials) < p_spike).astype(int)),
+        'n_spikes': rng.poisson(1, size=n_trials).astype('f4'),
+        'ISI': pd.Series(-rng.randint(1, 50, size=n_trials).astype(float))}
+
+
+def get_synapse_activation_dbs(n_dbs=2, n_trials=300, n_time=60, n_space=8, seed=0):
+    '''Mimic databases with binned synapse activation arrays of the shape (trial, time), one per group and spatial bin.
+    
+    Returns:
+        tuple: The databases, and the key of the binned synapse activations.
+    '''
+    rng = np.random.RandomState(seed)
+    key = ('spatiotemporal', 'synapse_activation__binned_somadist')
+    dbs = []
+    for _ in range(n_dbs):
+        dbs.append({key: {
+            group + ('{}to{}'.format(50 * z, 50 * (z + 1)),): rng.poisson(0.3, size=(n_trials, n_time)).astype('f4')
+            for group in GROUPS for z in range(n_space)}})
+    return dbs, key
+
+
+def get_reduced_model(data):
+    rm = Rm('test', None)
+    for key, value in data.items():
+        rm.add_data_extractor(key, DataExtractor_array(value))
+    return rm
+
+
+def get_strategy(kind, name=None):
+    name = name or kind
+    temporal = RaisedCosineBasis(width=40)
+    spatial = RaisedCosineBasis(width=8, phis=np.arange(1, 6))
+    if kind == 'spatiotemporal':
+        return Strategy_spatiotemporalRaisedCosine(name, spatial, temporal)
+    elif kind == 'spatial_cutoff':
+        return Strategy_temporalRaisedCosine_spatial_cutoff(name, spatial, temporal)
+    elif kind == 'categorized':
+        return Strategy_categorizedTemporalRaisedCosine(name, temporal)
+    elif kind == 'combined':
+        strategy = CombineStrategies_sum(name)
+        strategy.add_strategy(Strategy_spatiotemporalRaisedCosine(name + '_spatiotemporal', spatial, temporal))
+        strategy.add_strategy(Strategy_linearCombinationOfData(name + '_linear', ['n_spikes']))
+        return strategy
+    raise ValueError(kind)
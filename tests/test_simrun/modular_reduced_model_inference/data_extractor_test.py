@@ -0,0 +1,35 @@
+import numpy as np
+from simrun.modular_reduced_model_inference import Rm, ChunkedSpatiotemporalInput, \
+    DataExtractor_spatiotemporalSynapseActivation
+from . import GROUPS, get_synapse_activation_dbs
+
+
+def test_chunked_spatiotemporal_input():
+    rng = np.random.RandomState(0)
+    arrays = [rng.rand(100, 60) for _ in range(4)]
+    rows = np.sort(rng.choice(100, 30, replace=False))
+    sa = ChunkedSpatiotemporalInput([(arrays, None), (arrays, rows)], 10, 50, chunk_size=16)
+    expected = np.concatenate([
+        np.dstack([a[:, 10:50] for a in arrays]),
+        np.dstack([a[rows, 10:50] for a in arrays])])
+    assert sa.shape == expected.shape == (130, 40, 4)
+    assert len(sa) == 130
+    chunks = list(sa.iter_chunks())
+    assert max(len(chunk) for chunk in chunks) == 16
+    np.testing.assert_array_equal(np.concatenate(chunks), expected)
+
+
+def test_chunked_extractor_equals_in_memory_extractor():
+    dbs, key = get_synapse_activation_dbs()
+    selected_indices = [np.arange(0, 300, 2), np.arange(100, 250)]
+    data = {}
+    for chunk_size in [None, 64]:
+        rm = Rm('test', dbs, tmax=50, width=40, selected_indices=selected_indices)
+        rm.add_data_extractor(
+            'spatiotemporalSa', DataExtractor_spatiotemporalSynapseActivation(key, chunk_size=chunk_size))
+        data[chunk_size] = rm.extract('spatiotemporalSa')
+    assert sorted(data[None]) == sorted(data[64]) == GROUPS
+    for group in GROUPS:
+        assert isinstance(data[64][group], ChunkedSpatiotemporalInput)
+        assert data[None][group].shape == data[64][group].shape == (300, 40, 8)
+        np.testing.assert_array_equal(np.concatenate(list(data[64][group].iter_chunks())), data[None][group])
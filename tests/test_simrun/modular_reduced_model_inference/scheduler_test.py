@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from simrun.modular_reduced_model_inference import Solver_COBYLA, Solver_LBFGSB, Solver_Adam
+from simrun.modular_reduced_model_inference.scheduler import optimize_all_splits_remote
+from . import get_synthetic_data, get_reduced_model, get_strategy
+
+
+@pytest.mark.parametrize('kind', ['spatiotemporal', 'combined'])
+def test_remote_optimization_equals_local_optimization(client, kind):
+    rm = get_reduced_model(get_synthetic_data(n_trials=1000))
+    strategy = get_strategy(kind)
+    if kind == 'combined':
+        # the individual strategies are evaluated on a split before they are combined
+        for s in strategy.strategies:
+            rm.add_strategy(s)
+            s.set_split(np.arange(0, 1000, 2))
+    rm.add_strategy(strategy)
+    solvers = [
+        Solver_COBYLA('cobyla'),
+        Solver_LBFGSB('lbfgsb', maxiter=20),
+        Solver_Adam('adam', batch_size=200, n_epochs=2, seed=0)]
+    for solver in solvers:
+        strategy.add_solver(solver)
+    np.random.seed(0)
+    rm.DataSplitEvaluation.add_random_split('random_1', percentage_train=.7)
+    rm.DataSplitEvaluation.add_random_split('random_2', percentage_train=.5)
+
+    # the strategy is set to a split before its data is sent to the workers
+    strategy.set_split(rm.DataSplitEvaluation.splits['random_2']['train'])
+    # both draw the initial guesses in the same order
+    np.random.seed(1)
+    remote = client.gather(optimize_all_splits_remote(client, solvers))
+    np.random.seed(1)
+    local = [solver.optimize_all_splits() for solver in solvers]
+    for remote_results, local_results in zip(remote, local):
+        assert sorted(remote_results) == sorted(local_results) == ['random_1', 'random_2']
+        for name in local_results:
+            np.testing.assert_allclose(
+                remote_results[name].x, local_results[name].x, rtol=1e-5, atol=1e-6)
+            if 'intercept' in local_results[name]:
+                np.testing.assert_allclose(
+                    remote_results[name].intercept, local_results[name].intercept, rtol=1e-5, atol=1e-6)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from simrun.modular_reduced_model_inference import Solver_Adam, Solver_LBFGSB, Solver_trustConstr, \
+    Strategy_ISIcutoff
+from . import get_synthetic_data, get_reduced_model, get_strategy
+
+
+@pytest.mark.parametrize('kind', ['spatiotemporal', 'categorized'])
+@pytest.mark.parametrize('solver', [Solver_LBFGSB('lbfgsb'), Solver_trustConstr('trust_constr', maxiter=200)])
+def test_gradient_solver_improves_auroc(kind, solver):
+    rm = get_reduced_model(get_synthetic_data(n_trials=4000))
+    strategy = get_strategy(kind)
+    rm.add_strategy(strategy)
+    strategy.set_split(np.arange(0, 4000, 2))
+    strategy.add_solver(solver)
+    np.random.seed(0)
+    x0 = strategy._get_x0()
+    out = solver.optimize(x0=x0)
+    assert out.x.shape == x0.shape
+    assert np.isfinite(out.intercept)
+    # the objective is the negative smooth AUROC
+    auroc_x0, auroc = -strategy._objective_function(x0), -strategy._objective_function(out.x)
+    assert auroc > auroc_x0 + 0.1
+    assert auroc > 0.8
+
+
+def test_gradient_solver_requires_gradient():
+    rm = get_reduced_model(get_synthetic_data(n_trials=100))
+    strategy = Strategy_ISIcutoff('ISIcutoff')
+    rm.add_strategy(strategy)
+    with pytest.raises(ValueError):
+        strategy.add_solver(Solver_LBFGSB('lbfgsb'))
+
+
+def test_reduced_model_run_with_gradient_solver():
+    rm = get_reduced_model(get_synthetic_data(n_trials=1000))
+    strategy = get_strategy('spatiotemporal')
+    rm.add_strategy(strategy)
+    strategy.add_solver(Solver_LBFGSB('lbfgsb'))
+    np.random.seed(0)
+    rm.DataSplitEvaluation.add_random_split('random', percentage_train=.7)
+    rm.run()
+    results = rm.get_results()
+    assert len(results) == 4
+    scores = results.score.xs(('spatiotemporal', 'lbfgsb', 'random'))
+    # the score is the negative smooth AUROC
+    assert -scores.xs('test').iloc[0] > 0.75
+
+
+def test_adam_loss_decreases():
+    rm = get_reduced_model(get_synthetic_data(n_trials=4000))
+    strategy = get_strategy('spatiotemporal')
+    rm.add_strategy(strategy)
+    strategy.set_split(np.arange(0, 4000, 2))
+    solver = Solver_Adam('adam', batch_size=250, n_epochs=10, learning_rate=0.05, seed=0)
+    strategy.add_solver(solver)
+    np.random.seed(0)
+    x0 = strategy._get_x0()
+    out = solver.optimize(x0=x0)
+    assert out.x.shape == x0.shape
+    assert out.nit == 10 * 2000 // 250
+    assert len(out.loss_per_epoch) == 10
+    assert out.loss_per_epoch[-1] < 0.5 * out.loss_per_epoch[0]
+    assert out.loss_per_epoch[-1] == min(out.loss_per_epoch)
+    assert -strategy._objective_function(out.x) > -strategy._objective_function(x0) + 0.1
+    # minibatches are reproducible
+    np.testing.assert_array_equal(solver.optimize(x0=x0).x, out.x)
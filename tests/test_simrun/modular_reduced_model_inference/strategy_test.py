@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pytest
+from simrun.modular_reduced_model_inference import Rm, dereference, make_weakref, \
+    DataExtractor_spatiotemporalSynapseActivation
+from . import GROUPS, STRATEGIES, DataExtractor_array, get_synthetic_data, get_synapse_activation_dbs, \
+    get_reduced_model, get_strategy
+
+
+def _get_reduced_model_from_dbs(chunk_size=None):
+    dbs, key = get_synapse_activation_dbs()
+    selected_indices = [np.arange(0, 300, 2), np.arange(100, 250)]
+    rm = Rm('test', dbs, tmax=50, width=40, selected_indices=selected_indices)
+    rm.add_data_extractor(
+        'spatiotemporalSa', DataExtractor_spatiotemporalSynapseActivation(key, chunk_size=chunk_size))
+    rm.add_data_extractor('st', DataExtractor_array(None))
+    rm.add_data_extractor('y', DataExtractor_array(pd.Series(np.arange(300) % 2)))
+    return rm
+
+
+def test_chunked_compute_basis_equals_in_memory():
+    base_vectors = {}
+    for chunk_size in [None, 64]:
+        strategy = get_strategy('spatiotemporal')
+        _get_reduced_model_from_dbs(chunk_size=chunk_size).add_strategy(strategy)
+        base_vectors[chunk_size] = {
+            group: np.array(dereference(array)) for group, array in strategy.base_vectors_arrays_dict.items()}
+    assert sorted(base_vectors[64]) == GROUPS
+    for group in GROUPS:
+        assert base_vectors[64][group].shape == (5, 20, 300)
+        np.testing.assert_allclose(base_vectors[64][group], base_vectors[None][group], rtol=1e-5)
+
+
+def test_chunked_compute_basis_equals_basis_function_loop():
+    strategy = get_strategy('spatiotemporal')
+    rm = _get_reduced_model_from_dbs(chunk_size=64)
+    rm.add_strategy(strategy)
+    spatiotemporal_SA = np.concatenate(list(rm.extract('spatiotemporalSa')[GROUPS[0]].iter_chunks()))
+    expected = np.array([[
+        np.dot(np.dot(spatiotemporal_SA, dereference(f_z)), dereference(f_t))
+        for f_t in strategy.RaisedCosineBasis_temporal.get()]
+        for f_z in strategy.RaisedCosineBasis_spatial.get()])
+    np.testing.assert_allclose(
+        dereference(strategy.base_vectors_arrays_dict[GROUPS[0]]), expected, rtol=1e-4, atol=1e-4)
+
+
+def test_spatial_cutoff_does_not_support_chunked_input():
+    with pytest.raises(NotImplementedError):
+        _get_reduced_model_from_dbs(chunk_size=64).add_strategy(get_strategy('spatial_cutoff'))
+    # without chunks, the basis vectors are the same as for the spatiotemporal strategy
+    strategies = [get_strategy('spatiotemporal'), get_strategy('spatial_cutoff')]
+    rm = _get_reduced_model_from_dbs()
+    for strategy in strategies:
+        rm.add_strategy(strategy)
+    for group in GROUPS:
+        np.testing.assert_allclose(
+            dereference(strategies[1].base_vectors_arrays_dict[group]), 
+            dereference(strategies[0].base_vectors_arrays_dict[group]), 
+            rtol=1e-4, atol=1e-4)
+
+
+def _setup_strategy(kind, n_trials=300):
+    rm = get_reduced_model(get_synthetic_data(n_trials=n_trials))
+    strategy = get_strategy(kind)
+    rm.add_strategy(strategy)
+    return strategy
+
+
+def _finite_difference_gradient(f, x, eps):
+    return np.array([(f(x + e) - f(x - e)) / (2 * eps) for e in np.eye(len(x)) * eps])
+
+
+@pytest.mark.parametrize('kind', STRATEGIES)
+def test_vjp_matches_finite_differences(kind):
+    strategy = _setup_strategy(kind)
+    np.random.seed(0)
+    x = strategy._get_x0()
+    r = np.random.normal(size=strategy.get_y().shape)
+    score, vjp = strategy.get_score_and_vjp(x)
+    np.testing.assert_allclose(score, strategy.get_score(x), rtol=1e-5, atol=1e-4)
+    gradient = vjp(r.astype('f4'))
+    assert gradient.shape == x.shape
+    # the scores are (bi)linear in x, so central differences are exact up to rounding
+    fd = _finite_difference_gradient(lambda x: np.dot(strategy.get_score(x).astype('f8'), r), x, 0.1)
+    np.testing.assert_allclose(gradient, fd, rtol=0, atol=1e-3 * np.abs(fd).max())
+
+
+@pytest.mark.parametrize('kind', STRATEGIES)
+def test_objective_and_gradient_matches_finite_differences(kind):
+    strategy = _setup_strategy(kind)
+    strategy.set_split(np.arange(0, 300, 2))
+    np.random.seed(0)
+    # scale down to stay in the smooth range of the logistic loss
+    x = np.append(strategy._get_x0() * 0.01, 0.1)
+    loss, gradient = strategy._objective_and_gradient(x)
+    assert gradient.shape == x.shape
+    fd = _finite_difference_gradient(lambda x: strategy._objective_and_gradient(x)[0], x, 1e-3)
+    np.testing.assert_allclose(gradient, fd, rtol=0, atol=1e-2 * np.abs(fd).max())
+
+
+@pytest.mark.parametrize('kind', STRATEGIES)
+def test_get_score_and_vjp_static_with_split_and_batch(kind):
+    strategy = _setup_strategy(kind)
+    np.random.seed(0)
+    x = strategy._get_x0()
+    score, vjp = strategy.get_score_and_vjp_static(strategy._get_score_and_vjp, x)
+    split = np.sort(np.random.choice(300, 200, replace=False))
+    r = np.random.normal(size=200).astype('f4')
+    r_all = np.zeros(300, dtype='f4')
+    r_all[split] = r
+
+    score_split, vjp_split = strategy.get_score_and_vjp_static(
+        strategy._get_score_and_vjp, x, cupy_split=make_weakref(split))
+    np.testing.assert_allclose(score_split, score[split], rtol=1e-5, atol=1e-4)
+    np.testing.assert_allclose(vjp_split(r), vjp(r_all), rtol=1e-4, atol=1e-3)
+
+    # minibatches index the trials of the split
+    batch = np.arange(0, 200, 3)
+    score_batch, vjp_batch = strategy.get_score_and_vjp_static(
+        strategy._get_score_and_vjp, x, cupy_split=make_weakref(split), batch=batch)
+    r_split = np.zeros(200, dtype='f4')
+    r_split[batch] = r[batch]
+    np.testing.assert_allclose(score_batch, score_split[batch], rtol=1e-5, atol=1e-4)
+    np.testing.assert_allclose(vjp_batch(r[batch]), vjp_split(r_split), rtol=1e-4, atol=1e-3)
@@ -0,0 +1,69 @@
+from __future__ import absolute_import
+import numpy as np
+import pandas as pd
+import pytest
+from simrun.reduced_model.spiking_output import convolve_matrix_with_kernel, \
+    weightedNetInput2spikingProbabilities, correct_PSTH_by_refractory_period, \
+    apply_reduced_model, get_reduced_model
+
+
+def _convolve_matrix_with_kernel_loop(X, kernel):
+    l_kern = len(kernel)
+    X = np.c_[np.zeros((X.shape[0], l_kern)), X]
+    return np.transpose(
+        np.array([np.dot(X[:, t:t + l_kern], kernel) for t in range(X.shape[1] - l_kern)]))
+
+
+def _correct_PSTH_by_refractory_period_loop(PSTH, refractory_period):
+    able_to_spike = [1]
+    n_deactivated = [0]
+    for e in PSTH:
+        diff = able_to_spike[-1] * e
+        if len(n_deactivated) >= refractory_period:
+            activated = n_deactivated[-refractory_period]
+        else:
+            activated = 0
+        n_deactivated.append(diff)
+        able_to_spike.append(able_to_spike[-1] - diff + activated)
+    return able_to_spike
+
+
+@pytest.mark.parametrize('method', ['direct', 'fft'])
+def test_convolve_matrix_with_kernel(method):
+    X = np.random.poisson(1, size=(50, 120))
+    kernel = np.random.rand(30)
+    np.testing.assert_almost_equal(
+        convolve_matrix_with_kernel(X, kernel, method=method),
+        _convolve_matrix_with_kernel_loop(X, kernel))
+
+
+def test_weightedNetInput2spikingProbabilities():
+    nonlinearity = pd.Series(np.linspace(0, 1, 21), index=np.arange(-10, 11))
+    wni = np.array([[-20, -10, -2.4, 0.6, 10, 30]])
+    np.testing.assert_almost_equal(
+        weightedNetInput2spikingProbabilities(wni, nonlinearity),
+        [[0, 0, 0.4, 0.55, 1, 1]])
+
+
+@pytest.mark.parametrize('refractory_period', [1, 3, 10])
+def test_correct_PSTH_by_refractory_period(refractory_period):
+    PSTHs = np.random.rand(4, 50) * 0.2
+    out = correct_PSTH_by_refractory_period(PSTHs, refractory_period)
+    for PSTH, able_to_spike in zip(PSTHs, out):
+        np.testing.assert_almost_equal(
+            able_to_spike, _correct_PSTH_by_refractory_period_loop(PSTH, refractory_period))
+    np.testing.assert_almost_equal(
+        correct_PSTH_by_refractory_period(PSTHs[0], refractory_period), out[0])
+
+
+def test_batched_reduced_model_equals_reduced_model():
+    X_dict = {
+        'EXC': np.random.poisson(2, size=(1000, 100)),
+        'INH': np.random.poisson(1, size=(1000, 100))
+    }
+    kernel_dict = {'EXC': np.linspace(0, 1, 20), 'INH': -np.linspace(0, 1, 20)}
+    nonlinearity_LUT = {5: pd.Series(np.linspace(0, 1, 41), index=np.arange(-20, 21))}
+    out = get_reduced_model(kernel_dict, nonlinearity_LUT, 5)(X_dict)
+    out_batched = get_reduced_model(kernel_dict, nonlinearity_LUT, 5, chunk_size=300)(X_dict)
+    for key in ['rawPSTH', 'able_to_spike', 'PSTH']:
+        np.testing.assert_almost_equal(out[key], out_batched[key])
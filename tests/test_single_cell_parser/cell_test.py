@@ -0,0 +1,82 @@
+from __future__ import absolute_import
+import numpy as np
+import pandas as pd
+from single_cell_parser import analyze as sca
+from .context import *
+
+
+def _get_synapse_activation_dataframe_loop(cell, max_spikes=20, sim_trial_index=0):
+    '''Previous implementation of :py:meth:`~single_cell_parser.cell.Cell.get_synapse_activation_dataframe`.'''
+    rows, spike_times = [], []
+    for celltype in list(cell.synapses.keys()):
+        for syn in range(len(cell.synapses[celltype])):
+            synapse = cell.synapses[celltype][syn]
+            if synapse.is_active():
+                st = list(synapse.releaseSite.spikeTimes[:])
+                spike_times.append(st + [np.nan] * (max_spikes - len(st)))
+                rows.append([
+                    celltype, syn, sca.compute_syn_distance(cell, synapse), synapse.secID,
+                    synapse.ptID, cell.sections[synapse.secID].label])
+    columns = [
+        'synapse_type', 'synapse_ID', 'soma_distance', 'section_ID',
+        'section_pt_ID', 'dendrite_label'
+    ]
+    sa_pd = pd.DataFrame(rows, columns=columns)
+    st_df = pd.DataFrame(columns=list(range(max_spikes)), data=np.asarray(spike_times))
+    sa_pd = pd.concat([sa_pd, st_df], axis=1)
+    sa_pd.index = [sim_trial_index] * len(sa_pd)
+    return sa_pd
+
+
+def _get_simulated_cell(tStop=50):
+    import getting_started
+    import single_cell_parser as scp
+    neup = scp.ParameterSet(getting_started.neuronParam)
+    netp = scp.ParameterSet(getting_started.networkParam)
+    neup.sim.tStop = tStop
+    np.random.seed(1234)
+    cell = scp.create_cell(neup.neuron)
+    evokedNW = scp.NetworkMapper(cell, netp.network, neup.sim)
+    evokedNW.create_saved_network2()
+    scp.init_neuron_run(neup.sim, vardt=False)
+    return cell
+
+
+def test_synapse_activation_dataframe_matches_loop():
+    cell = _get_simulated_cell()
+    sa = cell.get_synapse_activation_dataframe(max_spikes=100, sim_trial_index=3)
+    assert len(sa) > 0
+    assert sa.synapse_type.nunique() > 1
+    reference = _get_synapse_activation_dataframe_loop(cell, max_spikes=100, sim_trial_index=3)
+    pd.testing.assert_frame_equal(sa, reference, check_dtype=False)
+    # the second call reads the synapse locations from the cache
+    pd.testing.assert_frame_equal(cell.get_synapse_activation_dataframe(max_spikes=100, sim_trial_index=3), sa)
+
+
+def test_synapse_table_is_invalidated_after_adding_synapses():
+    cell = _get_simulated_cell()
+    preType = sorted(cell.synapses)[0]
+    nSynapses = len(cell.synapses[preType])
+    table = cell.get_synapse_table(preType)
+    assert len(table['section_ID']) == nSynapses
+
+    # replace the synapses by the same number of synapses at different locations
+    cell.remove_synapses(preType)
+    secIDs = [secID for secID, sec in enumerate(cell.sections) if sec.label != 'Soma'][:nSynapses]
+    for lv in range(nSynapses):
+        secID = secIDs[lv % len(secIDs)]
+        cell.add_synapse(secID, 0, 0.0, preType=preType)
+    table = cell.get_synapse_table(preType)
+    np.testing.assert_array_equal(table['section_ID'], [syn.secID for syn in cell.synapses[preType]])
+    np.testing.assert_array_equal(table['section_pt_ID'], np.zeros(nSynapses))
+    np.testing.assert_allclose(
+        table['soma_distance'], [sca.compute_syn_distance(cell, syn) for syn in cell.synapses[preType]])
+
+    # adding a synapse to the same type invalidates the table again
+    secID = secIDs[-1]
+    cell.add_synapse(secID, 1, 0.5, preType=preType)
+    table = cell.get_synapse_table(preType)
+    assert len(table['section_ID']) == nSynapses + 1
+    assert table['section_ID'][-1] == secID
+    assert table['section_pt_ID'][-1] == 1
+    assert table['dendrite_label'][-1] == cell.sections[secID].label
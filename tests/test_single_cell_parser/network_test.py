@@ -0,0 +1,82 @@
+from __future__ import absolute_import
+import numpy as np
+import pandas as pd
+from single_cell_parser.network import sample_times_from_rates_batch
+from .context import *
+
+
+def test_sample_times_from_rates_batch_is_reproducible_and_respects_rates():
+    bins = [0., 100., 200., 500.]
+    rates = [0., 50., 20.]  # Hz
+    np.random.seed(42)
+    offsets, spikeTimes = sample_times_from_rates_batch(bins, rates, 2000)
+    np.random.seed(42)
+    offsets2, spikeTimes2 = sample_times_from_rates_batch(bins, rates, 2000)
+    np.testing.assert_array_equal(offsets, offsets2)
+    np.testing.assert_array_equal(spikeTimes, spikeTimes2)
+
+    assert len(offsets) == 2001
+    assert offsets[-1] == len(spikeTimes)
+    assert not np.any(spikeTimes < 100.)
+    assert not np.any(spikeTimes > 500.)
+    # expected number of spikes per train: 0.1 s * 50 Hz + 0.3 s * 20 Hz = 11
+    assert abs(np.diff(offsets).mean() - 11.) < 0.5
+
+
+def test_sample_release_times_matches_release_probability():
+    from types import SimpleNamespace
+    from single_cell_parser.network import sample_release_times
+    from single_cell_parser.parameters import ParameterSet
+    preSynCells = [
+        SimpleNamespace(spikeTimes=list(np.arange(100.))),
+        SimpleNamespace(spikeTimes=[]),
+        SimpleNamespace(spikeTimes=[5., 10.])]
+    np.random.seed(0)
+    releaseTimes = sample_release_times(
+        preSynCells * 100, ParameterSet({'releaseProb': 0.6}))
+    assert len(releaseTimes) == 300
+    assert all(not times for times in releaseTimes[1::3])
+    assert all(set(times) <= {5., 10.} for times in releaseTimes[2::3])
+    assert all(times == sorted(times) for times in releaseTimes)
+    nReleases = sum(len(times) for times in releaseTimes[0::3])
+    assert abs(nReleases / 10000. - 0.6) < 0.03
+
+    releaseTimes = sample_release_times(
+        preSynCells, ParameterSet({'releaseProb': 'dynamic'}))
+    assert releaseTimes == [list(np.arange(100.)), [], [5., 10.]]
+
+
+def _run_sweeps(keep_skeleton, nSweeps=2, seed=1234):
+    '''Simulate the example network as :py:meth:`simrun.run_new_simulations._evoked_activity` does.'''
+    import getting_started
+    import single_cell_parser as scp
+    neup = scp.ParameterSet(getting_started.neuronParam)
+    netp = scp.ParameterSet(getting_started.networkParam)
+    np.random.seed(seed)
+    cell = scp.create_cell(neup.neuron)
+    evokedNW = None
+    sweeps = []
+    for _ in range(nSweeps):
+        if evokedNW is None or not keep_skeleton:
+            evokedNW = scp.NetworkMapper(cell, netp.network, neup.sim)
+        evokedNW.create_saved_network2(keep_skeleton=keep_skeleton)
+        scp.init_neuron_run(neup.sim, vardt=False)
+        sweeps.append((
+            np.array(cell.soma.recVList[0]),
+            cell.get_synapse_activation_dataframe(max_spikes=100)))
+        cell.re_init_cell(disconnect_synapses=not keep_skeleton)
+        evokedNW.re_init_network()
+    return sweeps
+
+
+def test_network_skeleton_equals_network_from_scratch():
+    sweeps_skeleton = _run_sweeps(keep_skeleton=True)
+    sweeps = _run_sweeps(keep_skeleton=False)
+    for (vm_skeleton, sa_skeleton), (vm, sa) in zip(sweeps_skeleton, sweeps):
+        assert len(sa) > 0
+        pd.testing.assert_frame_equal(sa_skeleton, sa)
+        # synaptic currents are summed in a different order
+        np.testing.assert_allclose(vm_skeleton, vm, rtol=0, atol=1e-6)
+    # each sweep resamples the presynaptic activity
+    assert not sweeps[0][1].equals(sweeps[1][1])
+    assert not np.array_equal(sweeps[0][0], sweeps[1][0])
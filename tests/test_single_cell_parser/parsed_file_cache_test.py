@@ -0,0 +1,86 @@
+from __future__ import absolute_import
+import os
+import pytest
+from single_cell_parser import parsed_file_cache
+from single_cell_parser.parameters import build_parameters
+from single_cell_parser.reader import read_synapse_realization, read_functional_realization_map
+from tests.context import TEST_DATA_FOLDER
+
+PARAM_FILE = os.path.join(TEST_DATA_FOLDER, 'biophysical_constraints', '86_C2_center.param')
+EMBEDDING_DIR = os.path.join(TEST_DATA_FOLDER, 'anatomical_constraints', 'example_embedding_86_C2_center')
+SYN_FILE = os.path.join(EMBEDDING_DIR, 'example_embedding_86_C2_center.syn')
+CON_FILE = os.path.join(EMBEDDING_DIR, 'example_embedding_86_C2_center.con')
+
+
+@pytest.fixture
+def parsed_file_cache_dir(tmpdir):
+    config = dict(parsed_file_cache._config)
+    parsed_file_cache.clear_parsed_file_cache()
+    parsed_file_cache.configure_parsed_file_cache(enabled=True, cache_dir=str(tmpdir))
+    yield str(tmpdir)
+    parsed_file_cache._config.update(config)
+    parsed_file_cache.clear_parsed_file_cache()
+
+
+def _parse_uncached(parser, fname):
+    parsed_file_cache.configure_parsed_file_cache(enabled=False)
+    try:
+        return parser(fname)
+    finally:
+        parsed_file_cache.configure_parsed_file_cache(enabled=True)
+
+
+def _parse_from_all_tiers(parser, fname):
+    """Parse a file on a cache miss, on an in-process cache hit and on an on-disk cache hit."""
+    miss = parser(fname)
+    memory_hit = parser(fname)
+    parsed_file_cache.clear_parsed_file_cache()
+    disk_hit = parser(fname)
+    return miss, memory_hit, disk_hit
+
+
+def test_cached_parameters_equal_fresh_parse(parsed_file_cache_dir):
+    fresh = _parse_uncached(build_parameters, PARAM_FILE)
+    for params in _parse_from_all_tiers(build_parameters, PARAM_FILE):
+        assert params == fresh
+        assert params.neuron.filename == fresh.neuron.filename
+        assert params.neuron.Soma.properties.ions.ek == fresh.neuron.Soma.properties.ions.ek
+        assert params.neuron.Soma.mechanisms.range.pas == fresh.neuron.Soma.mechanisms.range.pas
+        assert params['neuron.Soma.mechanisms.range.pas.g'] == fresh.neuron.Soma.mechanisms.range.pas.g
+    assert len(os.listdir(parsed_file_cache_dir)) == 1
+
+
+def test_cache_hits_are_independent_copies(parsed_file_cache_dir):
+    params = build_parameters(PARAM_FILE)
+    params.neuron.filename = 'modified.hoc'
+    params.neuron.Soma.properties.ions.ek = 0
+    assert build_parameters(PARAM_FILE) == _parse_uncached(build_parameters, PARAM_FILE)
+
+
+@pytest.mark.parametrize('parser, fname', [
+    (read_synapse_realization, SYN_FILE),
+    (read_functional_realization_map, CON_FILE)])
+def test_cached_realizations_equal_fresh_parse(parsed_file_cache_dir, parser, fname):
+    fresh = _parse_uncached(parser, fname)
+    for result in _parse_from_all_tiers(parser, fname):
+        assert result == fresh
+
+
+def test_modified_file_is_parsed_again(parsed_file_cache_dir, tmpdir):
+    fname = str(tmpdir.join('test.param'))
+    with open(fname, 'w') as f:
+        f.write('{"a": {"b": 1}}')
+    assert build_parameters(fname).a.b == 1
+    with open(fname, 'w') as f:
+        f.write('{"a": {"b": 22}}')
+    assert build_parameters(fname).a.b == 22
+
+
+def test_file_digests_are_bounded(parsed_file_cache_dir, tmpdir, monkeypatch):
+    monkeypatch.setattr(parsed_file_cache, '_MAX_FILE_DIGESTS', 3)
+    for lv in range(5):
+        fname = str(tmpdir.join('{}.param'.format(lv)))
+        with open(fname, 'w') as f:
+            f.write('{"a": %d}' % lv)
+        assert build_parameters(fname).a == lv
+    assert len(parsed_file_cache._file_digests) == 3
@@ -12,3 +12,84 @@ def test_can_load_hoc_file_with_label_BasalDendrite():
         assert True
     except:
         assert False
+
+
+def _synapse_activation_arrays():
+    import numpy as np
+    return {
+        'synapse_types': np.array(['L4ss_C2', 'VPM_C2']),
+        'synapse_type_codes': np.array([0, 0, 1], dtype=np.int32),
+        'synapse_IDs': np.array([3, 17, 0]),
+        'soma_distances': np.array([150.25, 201.0, 432.125]),
+        'section_IDs': np.array([12, 40, 101]),
+        'section_pt_IDs': np.array([2, 0, 7]),
+        'dendrite_labels': np.array(['ApicalDendrite', 'Dendrite']),
+        'dendrite_label_codes': np.array([1, 0, 0], dtype=np.int32),
+        'activation_offsets': np.array([0, 2, 3, 5]),
+        'activation_times': np.array([100.1, 140.2, 245.3, 250.75, 300.0])
+    }
+
+
+def test_synapse_activation_arrays_roundtrip(tmpdir):
+    import numpy as np
+    from single_cell_parser.reader import read_synapse_activation_file, \
+        read_synapse_activation_arrays, synapse_activation_arrays_to_dict
+    from single_cell_parser.writer import write_synapse_activation_arrays
+    arrays = _synapse_activation_arrays()
+    for fname in ('synapses.csv', 'synapses.npz'):
+        path = str(tmpdir.join(fname))
+        write_synapse_activation_arrays(path, arrays)
+        arrays_reloaded = read_synapse_activation_arrays(path)
+        for k in ('synapse_IDs', 'soma_distances', 'section_IDs', 'section_pt_IDs',
+                  'activation_offsets', 'activation_times'):
+            np.testing.assert_array_equal(arrays[k], arrays_reloaded[k])
+        for labels, codes in (('synapse_types', 'synapse_type_codes'),
+                              ('dendrite_labels', 'dendrite_label_codes')):
+            np.testing.assert_array_equal(
+                arrays[labels][arrays[codes]],
+                arrays_reloaded[labels][arrays_reloaded[codes]])
+    assert read_synapse_activation_file(str(tmpdir.join('synapses.csv'))) == \
+        synapse_activation_arrays_to_dict(arrays)
+
+
+def test_read_synapse_realization_returns_independent_cached_copies(tmpdir):
+    from single_cell_parser.reader import read_synapse_realization
+    path = str(tmpdir.join('test.syn'))
+    with open(path, 'w') as f:
+        f.write('# Synapse distribution file\nVPM_C2\t12\t0.5\nVPM_C2\t40\t0.25\n')
+    synapses = read_synapse_realization(path)
+    synapses.pop('VPM_C2')
+    assert read_synapse_realization(path) == {'VPM_C2': [(12, 0.5), (40, 0.25)]}
+
+    # modified files are parsed again
+    with open(path, 'a') as f:
+        f.write('L4ss_C2\t3\t1.0\n')
+    os.utime(path, (0, 0))
+    assert read_synapse_realization(path)['L4ss_C2'] == [(3, 1.0)]
+
+
+def test_read_scalar_field_from_binary(tmpdir):
+    import numpy as np
+    from single_cell_parser.reader import read_scalar_field
+    from single_cell_parser.scalar_field import BINARY_SUFFIX
+    path = str(tmpdir.join('field.am'))
+    values = np.arange(1, 13, dtype=float)
+    with open(path, 'w') as f:
+        f.write('# AmiraMesh 3D ASCII 2.0\n\n')
+        f.write('define Lattice 3 2 2\n\n')
+        f.write('Parameters {\n    BoundingBox 0 100 0 50 0 50,\n    CoordType "uniform"\n}\n\n')
+        f.write('Lattice { float Data } @1\n\n')
+        f.write('@1\n')
+        f.write('\n'.join(str(v) for v in values) + '\n')
+    ascii_field = read_scalar_field(path)
+    binary_field = read_scalar_field(path, use_binary=True)
+    binary_path = str(tmpdir.join('field' + BINARY_SUFFIX))
+    assert os.path.exists(binary_path)
+    assert isinstance(binary_field.mesh, np.memmap)
+    for field in (binary_field, read_scalar_field(binary_path)):
+        np.testing.assert_array_equal(field.mesh, ascii_field.mesh)
+        assert field.origin == ascii_field.origin
+        assert field.extent == ascii_field.extent
+        assert field.spacing == ascii_field.spacing
+        assert field.boundingBox == ascii_field.boundingBox
+        assert field.get_scalar((60, 10, 40)) == ascii_field.get_scalar((60, 10, 40))
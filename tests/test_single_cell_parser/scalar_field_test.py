@@ -0,0 +1,45 @@
+from __future__ import absolute_import
+from .context import *
+import numpy as np
+from single_cell_parser.scalar_field import ScalarField
+
+
+def _linear_field():
+    # values at the voxel centers are a linear function of the coordinates
+    spacing = 10.
+    origin = np.array([-20., 0., 35.])
+    shape = (4, 5, 6)
+    centers = [origin[axis] + (np.arange(shape[axis]) + 0.5) * spacing for axis in range(3)]
+    x, y, z = np.meshgrid(*centers, indexing='ij')
+    mesh = 1. + 2. * x - 0.5 * y + 0.25 * z
+    extent = (0, shape[0] - 1, 0, shape[1] - 1, 0, shape[2] - 1)
+    bBox = tuple(v for axis in range(3) for v in (origin[axis], origin[axis] + shape[axis] * spacing))
+    field = ScalarField(mesh, tuple(origin), extent, (spacing,) * 3, bBox)
+    return field, lambda xyz: 1. + 2. * xyz[:, 0] - 0.5 * xyz[:, 1] + 0.25 * xyz[:, 2]
+
+
+def test_batched_queries_match_single_point_queries():
+    field, _ = _linear_field()
+    bBox = np.array(field.boundingBox)
+    xyz = np.random.RandomState(0).uniform(bBox[0::2] - 5., bBox[1::2] + 5., size=(200, 3))
+    in_bounds = field.is_in_bounds_batch(xyz)
+    assert in_bounds.tolist() == [field.is_in_bounds(p) for p in xyz]
+    ijk = field.get_mesh_coordinates_batch(xyz)
+    assert [tuple(e) for e in ijk.tolist()] == [field.get_mesh_coordinates(p) for p in xyz]
+    values = field.get_scalar_batch(xyz)
+    assert np.all(np.isnan(values[~in_bounds]))
+    assert values[in_bounds].tolist() == [field.get_scalar(p) for p in xyz[in_bounds]]
+    assert field.get_scalar_batch(xyz, fill_value=0.)[~in_bounds].tolist() == [0.] * int(np.sum(~in_bounds))
+
+
+def test_trilinear_interpolation_is_exact_for_linear_fields():
+    field, f = _linear_field()
+    bBox = np.array(field.boundingBox)
+    spacing = np.array(field.spacing)
+    # stay between the outermost voxel centers, where interpolation is not extrapolated
+    xyz = np.random.RandomState(1).uniform(bBox[0::2] + 0.5 * spacing, bBox[1::2] - 0.5 * spacing, size=(200, 3))
+    np.testing.assert_allclose(field.get_scalar_batch(xyz, interpolation='linear'), f(xyz))
+    centers = np.array([field.get_voxel_center((1, 2, 3)), field.get_voxel_center((2, 3, 4))])
+    np.testing.assert_allclose(
+        field.get_scalar_batch(centers, interpolation='linear'),
+        [field.mesh[1, 2, 3], field.mesh[2, 3, 4]])
@@ -0,0 +1,146 @@
+from __future__ import absolute_import
+import numpy as np
+import pytest
+from single_cell_parser.cell import Cell, PySection
+from single_cell_parser.scalar_field import ScalarField
+from single_cell_parser.synapse_mapper import SynapseMapper
+from .context import *
+
+
+def _create_voxel_edge_map_loop(synapse_mapper):
+    '''Previous implementation: test every point against every non-zero voxel.'''
+    sections = synapse_mapper.cell.sections
+    synDist = synapse_mapper.synDist
+    voxelEdgeMap = {}
+    noSynStructures = ['Soma', 'Axon', 'AIS', 'Myelin', 'Node']
+    for vxIndex in np.array(synDist.mesh.nonzero()).transpose():
+        vxIndexT = tuple(vxIndex)
+        voxelEdgeMap[vxIndexT] = []
+        voxelBBox = synDist.get_voxel_bounds(vxIndex)
+        for i in range(len(sections)):
+            sec = sections[i]
+            if sec.label in noSynStructures:
+                continue
+            if synapse_mapper._intersect_bboxes(voxelBBox, sec.bounds):
+                for n in range(sec.nrOfPts):
+                    if synapse_mapper._pt_in_box(sec.pts[n], voxelBBox):
+                        voxelEdgeMap[vxIndexT].append((i, n))
+    return voxelEdgeMap
+
+
+def _get_random_cell(n_sections=8, n_pts=30, seed=0):
+    '''Random walk neurites on a grid with spacing 5, such that many points lie on voxel boundaries.'''
+    rng = np.random.RandomState(seed)
+    cell = Cell()
+    for lv in range(n_sections):
+        label = ['Soma', 'Dendrite', 'ApicalDendrite', 'Axon'][lv % 4]
+        steps = 5 * rng.randint(-1, 2, size=(n_pts, 3))
+        pts = np.clip(np.cumsum(steps, axis=0) + 5 * rng.randint(2, 10, size=3), 0, 60).astype(float)
+        # some points off the grid
+        pts[::3] += rng.uniform(0, 1, size=pts[::3].shape)
+        sec = PySection(label=label)
+        sec.set_3d_geometry([list(pt) for pt in pts], list(rng.uniform(0.5, 3, size=n_pts)))
+        cell.sections.append(sec)
+    return cell
+
+
+@pytest.mark.parametrize('origin', [(0., 0., 0.), (-5., 5., 0.5)])
+def test_voxel_edge_map_matches_loop(origin):
+    cell = _get_random_cell()
+    rng = np.random.RandomState(1)
+    mesh = rng.exponential(1., size=(6, 6, 6))
+    mesh[rng.uniform(size=mesh.shape) < 0.3] = 0
+    spacing = (10., 10., 10.)
+    synDist = ScalarField(
+        mesh=mesh,
+        origin=origin,
+        extent=(0, 5, 0, 5, 0, 5),
+        spacing=spacing,
+        bBox=tuple(x for o, s in zip(origin, spacing) for x in (o, o + 6 * s)))
+    synapse_mapper = SynapseMapper(cell, synDist)
+    synapse_mapper._create_voxel_edge_map()
+    reference = _create_voxel_edge_map_loop(synapse_mapper)
+
+    # same voxel order, and same point order within each voxel
+    assert list(synapse_mapper.voxelEdgeMap.keys()) == list(reference.keys())
+    assert synapse_mapper.voxelEdgeMap == reference
+    # points on voxel faces, edges and corners are mapped to all adjacent voxels
+    counts = {}
+    for edges in reference.values():
+        for edge in edges:
+            counts[edge] = counts.get(edge, 0) + 1
+    assert max(counts.values()) >= 4
+
+
+def _find_closest_pt_ID_loop(sec, x):
+    '''Previous implementation: linear search, the first of equally close points wins.'''
+    closestPtID = 0
+    mindx = abs(x - sec.relPts[0])
+    for i in range(1, sec.nrOfPts):
+        tmpdx = abs(x - sec.relPts[i])
+        if tmpdx < mindx:
+            mindx = tmpdx
+            closestPtID = i
+    return closestPtID
+
+
+def _map_synapse_model_distribution_loop(synapse_mapper, synType, structLabel=None):
+    '''Previous implementation of :py:meth:`~single_cell_parser.synapse_mapper.SynapseMapper.map_synapse_model_distribution`.'''
+    eps = 1e-6
+    cell = synapse_mapper.cell
+    labels = [structLabel] if structLabel is not None else ['Dendrite', 'ApicalDendrite']
+    secIDs = [i for i, sec in enumerate(cell.sections) if sec.label in labels]
+    for synD in synapse_mapper.synDist:
+        candidateSections = []
+        for ID in secIDs:
+            sec = cell.sections[ID]
+            dist = synapse_mapper._compute_path_length(sec, 0.0)
+            if dist + eps <= synD <= dist + sec.L - eps:
+                candidateSections.append(ID)
+        sectionID = candidateSections[np.random.randint(len(candidateSections))]
+        sec = cell.sections[sectionID]
+        synx = (synD - synapse_mapper._compute_path_length(sec, 0.0)) / sec.L
+        cell.add_synapse(sectionID, _find_closest_pt_ID_loop(sec, synx), synx, synType)
+
+
+def test_find_closest_pt_IDs_matches_loop():
+    cell = _get_random_cell(n_sections=5, n_pts=9)
+    relPts = [
+        # equally spaced: midpoints are ties, the lower ID wins
+        [0., .125, .25, .375, .5, .625, .75, .875, 1.],
+        # duplicate points
+        [0., .25, .25, .25, .5, .5, .75, 1., 1.],
+        # not sorted: falls back to argmin
+        [0., .5, .25, .75, .125, 1., .875, .375, .625],
+        [0., 0., 0., .5, .5, .5, 1., 1., 1.],
+        [0., .1, .2, .3, .5, .6, .8, .9, 1.]]
+    for sec, pts in zip(cell.sections, relPts):
+        sec.relPts = pts
+    xs = np.concatenate([
+        np.arange(-0.25, 1.25, 1 / 64.),  # ties, and out of range
+        np.random.RandomState(0).uniform(-0.1, 1.1, size=200)])
+    sectionIDs = np.tile(np.arange(len(relPts)), len(xs))
+    xs = np.repeat(xs, len(relPts))
+    synapse_mapper = SynapseMapper(cell)
+    closestPtIDs = synapse_mapper._find_closest_pt_IDs(sectionIDs, xs)
+    reference = [
+        _find_closest_pt_ID_loop(cell.sections[sectionID], x) for sectionID, x in zip(sectionIDs, xs)]
+    assert closestPtIDs == reference
+    assert synapse_mapper._find_closest_pt_IDs([], []) == []
+
+
+@pytest.mark.parametrize('structLabel', [None, 'ApicalDendrite'])
+def test_map_synapse_model_distribution_matches_loop(structLabel):
+    from single_cell_parser.cell_parser import CellParser
+    synapses = []
+    for mapSynapses in [
+            lambda synapse_mapper: synapse_mapper.map_synapse_model_distribution('EXC', structLabel),
+            lambda synapse_mapper: _map_synapse_model_distribution_loop(synapse_mapper, 'EXC', structLabel)]:
+        parser = CellParser(fname)
+        parser.spatialgraph_to_cell()
+        np.random.seed(0)
+        synDist = np.random.uniform(50, 400, size=500)
+        mapSynapses(SynapseMapper(parser.cell, synDist))
+        synapses.append([(syn.secID, syn.ptID, syn.x) for syn in parser.cell.synapses['EXC']])
+    assert len(synapses[0]) == 500
+    assert synapses[0] == synapses[1]
@@ -0,0 +1,66 @@
+import os
+import shutil
+import numpy as np
+from singlecell_input_mapper.singlecell_input_mapper.cell import CellParser
+from singlecell_input_mapper.singlecell_input_mapper.network_embedding import NetworkMapper
+from singlecell_input_mapper.singlecell_input_mapper.scalar_field import ScalarField
+from tests.context import TEST_DATA_FOLDER
+
+HOC_FILE = os.path.join(TEST_DATA_FOLDER, 'anatomical_constraints', '86_C2_center.hoc')
+ANATOMICAL_AREAS = ['C2', 'D2']
+# the summary files list all of these cell types
+PRE_CELL_TYPES = [
+    'L2', 'L34', 'L4py', 'L4sp', 'L4ss', 'L5st', 'L5tt', 'L6cc', 'L6ccinv', 'L6ct', 'VPM',
+    'L1', 'L23Trans', 'L45Peak', 'L45Sym', 'L56Trans',
+    'SymLocal1', 'SymLocal2', 'SymLocal3', 'SymLocal4', 'SymLocal5', 'SymLocal6']
+STRUCTURES = ['Soma', 'Dendrite', 'ApicalDendrite']
+
+
+def get_synthetic_synapse_densities(seed=0, nrOfDensities=2):
+    '''Random synapse densities on a coarse grid around the morphology of :py:data:`HOC_FILE`.
+
+    Each cell type has :paramref:`nrOfDensities` densities, and one empty density (None).
+    '''
+    rng = np.random.RandomState(seed)
+    synapseDensities = {}
+    for anatomical_area in ANATOMICAL_AREAS:
+        synapseDensities[anatomical_area] = {}
+        for preCellType in PRE_CELL_TYPES:
+            synapseDensities[anatomical_area][preCellType] = [{
+                structure: ScalarField(
+                    mesh=rng.exponential(0.01, size=(7, 6, 13)),
+                    origin=(-400, 100, -550),
+                    extent=(0, 6, 0, 5, 0, 12),
+                    spacing=(100, 100, 100),
+                    bBox=(-400, 300, 100, 700, -550, 750))
+                for structure in STRUCTURES
+                } for _ in range(nrOfDensities)] + [None]
+    return synapseDensities
+
+
+def get_network_mapper(tmpdir, nrOfCells=2):
+    '''A :py:class:`NetworkMapper` for a copy of :py:data:`HOC_FILE` in :paramref:`tmpdir`.
+
+    Returns:
+        tuple: The network mapper, and the path to the copy of the morphology.
+    '''
+    postCellName = str(tmpdir.join(os.path.basename(HOC_FILE)))
+    shutil.copy(HOC_FILE, postCellName)
+    parser = CellParser(postCellName)
+    parser.spatialgraph_to_cell()
+    cellTypeNumbersSpreadsheet = {
+        anatomical_area: {preCellType: nrOfCells for preCellType in PRE_CELL_TYPES}
+        for anatomical_area in ANATOMICAL_AREAS}
+    networkMapper = NetworkMapper(
+        parser.get_cell(), 'L5tt', cellTypeNumbersSpreadsheet, {}, None, None)
+    return networkMapper, postCellName
+
+
+def assert_scalar_fields_equal(field, reference):
+    '''Check that two :py:class:`ScalarField` objects have the same mesh and geometry.'''
+    np.testing.assert_array_equal(field.mesh, reference.mesh)
+    assert field.mesh.dtype == reference.mesh.dtype
+    assert field.origin == tuple(reference.origin)
+    assert field.extent == tuple(reference.extent)
+    assert field.spacing == tuple(reference.spacing)
+    assert field.boundingBox == tuple(reference.boundingBox)
@@ -0,0 +1,36 @@
+import glob
+import os
+import pytest
+from . import get_synthetic_synapse_densities, get_network_mapper
+
+
+def _read_realizations(outDir):
+    '''Read the .syn and .con files of all realizations in :paramref:`outDir`, by realization index.'''
+    realizations = {}
+    for dirName in glob.glob(os.path.join(outDir, '*_synapses_*')):
+        i = int(dirName.rsplit('-', 1)[1])
+        realizations[i] = []
+        for ext in ['.syn', '.con']:
+            fname, = glob.glob(os.path.join(dirName, '*' + ext))
+            with open(fname) as f:
+                # file names contain the time and process ID, and are written to the header of the .con file
+                realizations[i].append(f.read().replace(os.path.basename(fname)[:-len(ext)], 'ID'))
+    return realizations
+
+
+@pytest.mark.parametrize('nprocs', [2, 3])
+def test_parallel_realizations_equal_serial_realizations(tmpdir, nprocs):
+    synapseDensities = get_synthetic_synapse_densities()
+    outDirs = {}
+    for n in [1, nprocs]:
+        outDir = tmpdir.mkdir('nprocs_{}'.format(n))
+        networkMapper, postCellName = get_network_mapper(outDir)
+        networkMapper.create_network_embedding_for_simulations(
+            postCellName, None, 4, nprocs=n, seed=42, synapseDensities=synapseDensities)
+        outDirs[n] = str(outDir)
+    serial = _read_realizations(outDirs[1])
+    parallel = _read_realizations(outDirs[nprocs])
+    assert sorted(serial) == list(range(4))
+    assert serial == parallel
+    # realizations are seeded independently
+    assert serial[0][0] != serial[1][0]
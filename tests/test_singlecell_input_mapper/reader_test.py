@@ -0,0 +1,50 @@
+import os
+import numpy as np
+from singlecell_input_mapper.singlecell_input_mapper.reader import read_scalar_field, convert_scalar_field_to_binary
+from singlecell_input_mapper.singlecell_input_mapper.scalar_field import BINARY_SUFFIX
+from . import assert_scalar_fields_equal
+
+
+def _write_scalar_field(fname, values, dims=(3, 2, 2)):
+    with open(fname, 'w') as f:
+        f.write('# AmiraMesh 3D ASCII 2.0\n\n')
+        f.write('define Lattice {} {} {}\n\n'.format(*dims))
+        f.write('Parameters {\n')
+        f.write('    BoundingBox 25 75 25 50 25 50,\n')
+        f.write('    Spacing 25 25 25,\n')
+        f.write('    CoordType "uniform"\n}\n\n')
+        f.write('Lattice { float Data } @1\n\n')
+        f.write('@1\n')
+        f.write('\n'.join(str(v) for v in values) + '\n')
+
+
+def test_read_scalar_field_from_binary(tmpdir):
+    path = str(tmpdir.join('field.am'))
+    binary_path = str(tmpdir.join('field' + BINARY_SUFFIX))
+    _write_scalar_field(path, np.arange(1, 13, dtype=float))
+    ascii_field = read_scalar_field(path)
+    assert ascii_field.mesh[2, 1, 1] == 12
+
+    # the binary file is created on first use
+    binary_field = read_scalar_field(path, use_binary=True)
+    assert os.path.exists(binary_path)
+    assert isinstance(binary_field.mesh, np.memmap)
+    for field in (binary_field, read_scalar_field(binary_path)):
+        assert_scalar_fields_equal(field, ascii_field)
+        assert field.get_scalar((60, 30, 40)) == ascii_field.get_scalar((60, 30, 40))
+
+    # and recreated if the ascii file is newer
+    os.utime(binary_path, (0, 0))
+    _write_scalar_field(path, np.arange(12, 0, -1, dtype=float))
+    assert_scalar_fields_equal(read_scalar_field(path, use_binary=True), read_scalar_field(path))
+    assert read_scalar_field(binary_path).mesh[2, 1, 1] == 1
+
+
+def test_convert_scalar_field_to_binary(tmpdir):
+    path = str(tmpdir.join('field.am'))
+    _write_scalar_field(path, np.linspace(0, 1, 12))
+    assert convert_scalar_field_to_binary(path) == str(tmpdir.join('field' + BINARY_SUFFIX))
+    outName = str(tmpdir.join('other' + BINARY_SUFFIX))
+    assert convert_scalar_field_to_binary(path, outName) == outName
+    for fname in [str(tmpdir.join('field' + BINARY_SUFFIX)), outName]:
+        assert_scalar_fields_equal(read_scalar_field(fname), read_scalar_field(path))
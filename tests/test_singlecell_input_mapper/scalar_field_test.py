@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from singlecell_input_mapper.singlecell_input_mapper.scalar_field import ScalarField, BINARY_SUFFIX
+from . import assert_scalar_fields_equal, get_synthetic_synapse_densities
+
+
+@pytest.mark.parametrize('dtype', ['f8', 'f4'])
+def test_binary_scalar_field_round_trip(tmpdir, dtype):
+    reference = get_synthetic_synapse_densities()['C2']['L5tt'][0]['Dendrite']
+    reference.mesh = reference.mesh.astype(dtype)
+    fname = str(tmpdir.join('field' + BINARY_SUFFIX))
+    reference.save_binary(fname)
+    assert tmpdir.listdir() == [tmpdir.join('field' + BINARY_SUFFIX)]
+
+    field = ScalarField.from_binary(fname)
+    assert isinstance(field.mesh, np.memmap)
+    assert not field.mesh.flags.writeable
+    assert_scalar_fields_equal(field, reference)
+    rng = np.random.RandomState(0)
+    xyz = rng.uniform(np.array(reference.boundingBox[0::2]) - 50, np.array(reference.boundingBox[1::2]) + 50, size=(100, 3))
+    assert [field.get_scalar(pt) for pt in xyz] == [reference.get_scalar(pt) for pt in xyz]
+
+    # read into memory, and copy-on-write
+    field = ScalarField.from_binary(fname, mmap_mode=None)
+    assert not isinstance(field.mesh, np.memmap)
+    assert_scalar_fields_equal(field, reference)
+    field = ScalarField.from_binary(fname, mmap_mode='c')
+    field.mesh[0, 0, 0] = -1
+    assert_scalar_fields_equal(ScalarField.from_binary(fname), reference)
+
+
+def test_from_binary_rejects_other_files(tmpdir):
+    fname = str(tmpdir.join('field' + BINARY_SUFFIX))
+    with open(fname, 'w') as f:
+        f.write('# AmiraMesh 3D ASCII 2.0\n')
+    with pytest.raises(IOError):
+        ScalarField.from_binary(fname)
@@ -0,0 +1,90 @@
+import glob
+import os
+import shutil
+import numpy as np
+import pytest
+from singlecell_input_mapper.singlecell_input_mapper.synapse_density_cache import \
+    get_synapse_density_cache_key, get_synapse_density_cache_path, \
+    save_synapse_densities, load_synapse_densities
+from . import HOC_FILE, get_synthetic_synapse_densities, get_network_mapper
+
+
+def _assert_synapse_densities_equal(synapseDensities, reference):
+    assert sorted(synapseDensities) == sorted(reference)
+    for anatomical_area in reference:
+        assert sorted(synapseDensities[anatomical_area]) == sorted(reference[anatomical_area])
+        for preCellType in reference[anatomical_area]:
+            densities = synapseDensities[anatomical_area][preCellType]
+            referenceDensities = reference[anatomical_area][preCellType]
+            assert len(densities) == len(referenceDensities)
+            for density, referenceDensity in zip(densities, referenceDensities):
+                if referenceDensity is None:
+                    assert density is None
+                    continue
+                assert sorted(density) == sorted(referenceDensity)
+                for structure in referenceDensity:
+                    field, referenceField = density[structure], referenceDensity[structure]
+                    np.testing.assert_array_equal(field.mesh, referenceField.mesh)
+                    for attr in ['origin', 'extent', 'spacing', 'boundingBox']:
+                        np.testing.assert_array_equal(
+                            getattr(field, attr), getattr(referenceField, attr))
+
+
+def test_synapse_densities_round_trip(tmpdir):
+    cacheDir = str(tmpdir.join('cache'))
+    synapseDensities = get_synthetic_synapse_densities()
+    path = save_synapse_densities(cacheDir, 'key', synapseDensities)
+    assert path == get_synapse_density_cache_path(cacheDir, 'key')
+    assert os.listdir(cacheDir) == [os.path.basename(path)]
+    _assert_synapse_densities_equal(load_synapse_densities(cacheDir, 'key'), synapseDensities)
+    _assert_synapse_densities_equal(load_synapse_densities(path), synapseDensities)
+    assert load_synapse_densities(cacheDir, 'other_key') is None
+
+
+def test_synapse_density_cache_key_depends_on_content_and_params(tmpdir):
+    fnames = []
+    for lv in range(2):
+        fname = str(tmpdir.join('{}.txt'.format(lv)))
+        with open(fname, 'w') as f:
+            f.write('content {}'.format(lv))
+        fnames.append(fname)
+    key = get_synapse_density_cache_key(fnames, postCellType='L5tt')
+    assert key == get_synapse_density_cache_key(fnames, postCellType='L5tt')
+
+    # the key only depends on the content of the files, not their location
+    copies = []
+    for fname in fnames:
+        copies.append(fname + '.copy')
+        shutil.copy(fname, copies[-1])
+    assert key == get_synapse_density_cache_key(copies, postCellType='L5tt')
+
+    assert key != get_synapse_density_cache_key(fnames[::-1], postCellType='L5tt')
+    assert key != get_synapse_density_cache_key(fnames, postCellType='L6cc')
+    assert key != get_synapse_density_cache_key(fnames)
+    with open(fnames[1], 'a') as f:
+        f.write(' modified')
+    assert key != get_synapse_density_cache_key(fnames, postCellType='L5tt')
+
+
+def test_network_embedding_from_cached_synapse_densities(tmpdir):
+    cacheDir = str(tmpdir.join('cache'))
+    key = get_synapse_density_cache_key([HOC_FILE])
+    save_synapse_densities(cacheDir, key, get_synthetic_synapse_densities())
+    networkMapper, postCellName = get_network_mapper(tmpdir)
+    # on a cache hit, no bouton densities are loaded
+    networkMapper.create_network_embedding(
+        postCellName, None, nrOfSamples=2,
+        synapseDensities=load_synapse_densities(cacheDir, key))
+    synFiles = glob.glob(str(tmpdir.join('*_synapses_*', '*.syn')))
+    assert len(synFiles) == 1
+    assert len(glob.glob(str(tmpdir.join('*_synapses_*', '*.con')))) == 1
+    with open(synFiles[0]) as f:
+        assert any(line.strip() and not line.startswith('#') for line in f)
+
+
+def test_network_embedding_requires_densities(tmpdir):
+    networkMapper, postCellName = get_network_mapper(tmpdir)
+    with pytest.raises(ValueError):
+        networkMapper.create_network_embedding(postCellName, None)
+    with pytest.raises(ValueError):
+        networkMapper.create_network_embedding_for_simulations(postCellName, None, 1)
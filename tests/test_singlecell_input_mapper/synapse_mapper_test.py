@@ -0,0 +1,202 @@
+import numpy as np
+import pytest
+from singlecell_input_mapper.singlecell_input_mapper.cell import Cell, CellParser, PySection2
+from singlecell_input_mapper.singlecell_input_mapper.scalar_field import ScalarField
+from singlecell_input_mapper.singlecell_input_mapper.synapse_mapper import SynapseDensity
+from . import HOC_FILE, STRUCTURES, get_synthetic_synapse_densities
+
+
+def _clip_u(pq, u1u2):
+    '''Liang-Barsky clipping, as previously used in SynapseDensity.'''
+    p, q = pq
+    u1, u2 = u1u2
+    if p < 0:
+        tmp = q / p
+        if tmp > u2:
+            return False
+        elif tmp > u1:
+            u1 = tmp
+    elif p > 0:
+        tmp = q / p
+        if tmp < u1:
+            return False
+        elif tmp < u2:
+            u2 = tmp
+    elif -1e-10 < p < 1e-10 and q < 0:
+        return False
+    u1u2[0] = u1
+    u1u2[1] = u2
+    return True
+
+
+def _compute_length_surface_area_density_liang_barsky(
+        synapse_density, lengthDensity, surfaceAreaDensity, likeAmira=0):
+    '''Previous implementation: clip every crossing segment against every voxel of the grid.'''
+    for structure in lengthDensity:
+        density1 = lengthDensity[structure]
+        density2 = surfaceAreaDensity[structure]
+        clipSegments = []
+        for sec in synapse_density.cell.structures[structure]:
+            for i in range(sec.nrOfPts - 1):
+                pt1 = np.array(sec.pts[i])
+                pt2 = np.array(sec.pts[i + 1])
+                r1 = sec.diamList[i] * (1.0 if likeAmira else 0.5)
+                r2 = sec.diamList[i + 1] * (1.0 if likeAmira else 0.5)
+                gridCell1 = density1.get_mesh_coordinates(pt1)
+                gridCell2 = density1.get_mesh_coordinates(pt2)
+                if gridCell1 == gridCell2:
+                    length = np.sqrt(np.dot(pt2 - pt1, pt2 - pt1))
+                    density1.mesh[gridCell1] += length
+                    density2.mesh[gridCell1] += synapse_density._get_truncated_cone_area(length, r1, r2)
+                else:
+                    clipSegments.append((pt1, pt2, r1, r2))
+        for pt1, pt2, r1, r2 in clipSegments:
+            dx = pt2 - pt1
+            for i in range(density1.extent[0], density1.extent[1] + 1):
+                for j in range(density1.extent[2], density1.extent[3] + 1):
+                    for k in range(density1.extent[4], density1.extent[5] + 1):
+                        bounds = density1.get_voxel_bounds((i, j, k))
+                        u1u2 = [0, 1]
+                        if not all(_clip_u(pq, u1u2) for pq in [
+                                (-dx[0], pt1[0] - bounds[0]), (dx[0], bounds[1] - pt1[0]),
+                                (-dx[1], pt1[1] - bounds[2]), (dx[1], bounds[3] - pt1[1]),
+                                (-dx[2], pt1[2] - bounds[4]), (dx[2], bounds[5] - pt1[2])]):
+                            continue
+                        u1, u2 = u1u2
+                        if u2 < u1:
+                            continue
+                        length = np.sqrt(np.dot((u2 - u1) * dx, (u2 - u1) * dx))
+                        r1Interpolated = synapse_density._interpolate_radius(pt1, pt2, r1, r2, pt1 + u1 * dx)
+                        r2Interpolated = synapse_density._interpolate_radius(pt1, pt2, r1, r2, pt1 + u2 * dx)
+                        density1.mesh[i, j, k] += length
+                        density2.mesh[i, j, k] += synapse_density._get_truncated_cone_area(
+                            length, r1Interpolated, r2Interpolated)
+
+
+def _get_random_cell(n_sections=6, n_pts=15, seed=0):
+    '''Random walk neurites within the box [0, 60]^3, including an axis-aligned section.'''
+    rng = np.random.RandomState(seed)
+    cell = Cell()
+    cell.structures = {'Dendrite': [], 'ApicalDendrite': []}
+    for lv in range(n_sections):
+        steps = rng.normal(scale=6, size=(n_pts, 3))
+        pts = np.clip(np.cumsum(steps, axis=0) + rng.uniform(15, 45, size=3), 0.5, 59.5)
+        sec = PySection2(label='Dendrite' if lv % 2 else 'ApicalDendrite')
+        sec.set_3d_geometry([list(pt) for pt in pts], list(rng.uniform(0.5, 3, size=n_pts)))
+        cell.structures[sec.label].append(sec)
+    sec = PySection2(label='Dendrite')
+    sec.set_3d_geometry([[5.0, 25.0, 25.0], [33.0, 25.0, 25.0], [55.0, 25.0, 25.0]], [2.0, 1.0, 1.5])
+    cell.structures['Dendrite'].append(sec)
+    return cell
+
+
+def _get_empty_densities(cell):
+    return {
+        structure: ScalarField(
+            mesh=np.zeros((6, 6, 6)),
+            origin=(0, 0, 0),
+            extent=(0, 5, 0, 5, 0, 5),
+            spacing=(10, 10, 10),
+            bBox=(0, 60, 0, 60, 0, 60))
+        for structure in cell.structures}
+
+
+@pytest.mark.parametrize('likeAmira', [0, 1])
+def test_length_surface_area_density_matches_liang_barsky(likeAmira):
+    cell = _get_random_cell()
+    synapse_density = SynapseDensity(cell, 'L5tt', {}, [], [], None, None)
+    lengthDensity, surfaceAreaDensity = _get_empty_densities(cell), _get_empty_densities(cell)
+    synapse_density._compute_length_surface_area_density(
+        lengthDensity, surfaceAreaDensity, likeAmira=likeAmira)
+    lengthDensityRef, surfaceAreaDensityRef = _get_empty_densities(cell), _get_empty_densities(cell)
+    _compute_length_surface_area_density_liang_barsky(
+        synapse_density, lengthDensityRef, surfaceAreaDensityRef, likeAmira=likeAmira)
+    for structure in cell.structures:
+        assert np.sum(lengthDensity[structure].mesh > 0) > 1
+        np.testing.assert_allclose(
+            lengthDensity[structure].mesh, lengthDensityRef[structure].mesh, rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(
+            surfaceAreaDensity[structure].mesh, surfaceAreaDensityRef[structure].mesh, rtol=1e-9, atol=1e-9)
+
+
+def _compute_cell_density_grid_loop(synapse_density):
+    '''Previous implementation: test every voxel of the exPST grid against the cell bounding box.'''
+    cellBounds = synapse_density.cell.get_bounding_box()
+    exPST = synapse_density.exPST
+    iMin, iMax, jMin, jMax, kMin, kMax = exPST.extent[1], exPST.extent[0], \
+        exPST.extent[3], exPST.extent[2], exPST.extent[5], exPST.extent[4]
+    for i in range(exPST.extent[0], exPST.extent[1] + 1):
+        for j in range(exPST.extent[2], exPST.extent[3] + 1):
+            for k in range(exPST.extent[4], exPST.extent[5] + 1):
+                if not synapse_density._intersect_bboxes(cellBounds, exPST.get_voxel_bounds((i, j, k))):
+                    continue
+                iMin, iMax = min(iMin, i), max(iMax, i)
+                jMin, jMax = min(jMin, j), max(jMax, j)
+                kMin, kMax = min(kMin, k), max(kMax, k)
+    dx, dy, dz = exPST.spacing
+    cellOrigin = exPST.origin[0] + iMin * dx, exPST.origin[1] + jMin * dy, exPST.origin[2] + kMin * dz
+    cellExtent = 0, iMax - iMin, 0, jMax - jMin, 0, kMax - kMin
+    cellBoundingBox = \
+        cellOrigin[0], exPST.origin[0] + (iMax + 1) * dx, \
+        cellOrigin[1], exPST.origin[1] + (jMax + 1) * dy, \
+        cellOrigin[2], exPST.origin[2] + (kMax + 1) * dz
+    return cellOrigin, cellExtent, cellBoundingBox
+
+
+def _compute_synapse_density_loop(synapse_density, boutonDensity, preCellType):
+    '''Previous implementation: sample the bouton and normalization PST density at every voxel center.'''
+    if preCellType in synapse_density.exTypes:
+        normPSTDensity, cellPSTDensity = synapse_density.exPST, synapse_density.cellPST['EXC']
+    else:
+        normPSTDensity, cellPSTDensity = synapse_density.inhPST, synapse_density.cellPST['INH']
+    synapseDensity = {}
+    for structure, cellPST in cellPSTDensity.items():
+        mesh = np.zeros(shape=cellPST.mesh.shape)
+        for ijk in np.ndindex(*mesh.shape):
+            voxelCenter = cellPST.get_voxel_center(ijk)
+            boutons = boutonDensity.get_scalar(voxelCenter)
+            normPST = normPSTDensity.get_scalar(voxelCenter)
+            if boutons is not None and normPST is not None and normPST > 0.0:
+                mesh[ijk] = boutons * cellPST.mesh[ijk] / normPST
+        synapseDensity[structure] = mesh
+    return synapseDensity
+
+
+@pytest.mark.parametrize('origin', [(-400, 100, -550), (-151.5, 250, -230), None])
+def test_synapse_density_matches_loop(origin):
+    parser = CellParser(HOC_FILE)
+    parser.spatialgraph_to_cell()
+    if origin is None:
+        # the cell touches a voxel face
+        xMax = parser.get_cell().get_bounding_box()[1]
+        origin = (xMax - 500, 100, -550)
+        assert origin[0] + 500 == xMax
+    densities = get_synthetic_synapse_densities(nrOfDensities=3)['C2']['L5tt']
+    exPST, inhPST, boutonDensity = [density['Dendrite'] for density in densities[:3]]
+    for field in [exPST, inhPST]:
+        field.origin = origin
+        field.boundingBox = tuple(
+            o + lv * s * n for o, s, n in zip(origin, field.spacing, field.mesh.shape) for lv in range(2))
+        field.mesh[field.mesh < 0.005] = 0.0
+    # the bouton density is shifted by a fraction of a voxel
+    boutonDensity.origin = (-350, 130, -520)
+    boutonDensity.boundingBox = (-350, 350, 130, 730, -520, 780)
+    constants = {
+        key: lv + 1 for lv, key in enumerate([
+            'SOMA_LENGTH', 'SOMA_AREA', 'APICAL_LENGTH', 'APICAL_AREA', 'BASAL_LENGTH', 'BASAL_AREA'])}
+    connectionSpreadsheet = {'EXC': {'L5tt': constants}, 'INH': {'L5tt': constants}}
+    synapse_density = SynapseDensity(
+        parser.get_cell(), 'L5tt', connectionSpreadsheet, ['L4ss'], ['SymLocal1'], exPST, inhPST)
+
+    cellMesh, cellOrigin, cellExtent, cellSpacing, cellBoundingBox = synapse_density._compute_cell_density_grid()
+    assert (cellOrigin, cellExtent, cellBoundingBox) == _compute_cell_density_grid_loop(synapse_density)
+    assert cellMesh.shape == (cellExtent[1] + 1, cellExtent[3] + 1, cellExtent[5] + 1)
+    assert cellSpacing == exPST.spacing
+
+    for preCellType in ['L4ss', 'SymLocal1']:
+        synapseDensity = synapse_density.compute_synapse_density(boutonDensity, preCellType)
+        reference = _compute_synapse_density_loop(synapse_density, boutonDensity, preCellType)
+        assert sorted(synapseDensity) == sorted(reference) == sorted(STRUCTURES)
+        assert any(np.any(reference[structure] > 0) for structure in STRUCTURES)
+        for structure in STRUCTURES:
+            np.testing.assert_array_equal(synapseDensity[structure].mesh, reference[structure])
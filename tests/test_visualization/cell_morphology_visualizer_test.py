@@ -5,6 +5,30 @@ from tests import setup_synapse_activation_experiment
 import six
 import pytest
 import distributed
+import numpy as np
+
+
+def _get_data_per_section_loop(cmv, get_recordings, n_sim_point):
+    '''Look up the recording of each point of the morphology one by one, as the visualizer did previously.'''
+    n_soma_points = len(cmv.morphology[cmv.morphology['sec_n'] == 0])
+    data_per_section = [[get_recordings(cmv.soma)[0][n_sim_point]] * n_soma_points]
+    for sec in cmv.cell.sections:
+        if sec.label in ("Soma", "Myelin", "AIS"):
+            continue
+        n_segs = len([seg for seg in sec])
+        n_pts = len(sec.pts)
+        recordings = get_recordings(sec)
+        if len(recordings) == 0:
+            data_per_section.append([np.nan] * (n_pts + 1))
+            continue
+        # First point of this section is last point of prev section
+        parent_recordings = get_recordings(sec.parent)
+        data = [parent_recordings[-1][n_sim_point] if len(parent_recordings) > 0 else np.nan]
+        for n in range(n_pts):
+            seg_n = int(n * n_segs / (n_pts - 1)) if n != n_pts - 1 else n_segs - 1
+            data.append(recordings[seg_n][n_sim_point])
+        data_per_section.append(data)
+    return data_per_section
 
 
 class TestCellMorphologyVisualizer:
@@ -87,6 +111,24 @@ class TestCellMorphologyVisualizer:
             images_path=outdir, 
             client=client)
 
+    @pytest.mark.skipif(
+        six.PY2,
+        reason="The cell_morphology_visualizer methods are not available on Py2")
+    def test_voltage_timeseries_matches_recordings(self):
+        self.cmv._calc_voltage_timeseries()
+        voltages = self.cmv._get_voltage_timeseries(self.cmv.times_to_show)
+        assert voltages.shape[0] == len(self.cmv.times_to_show)
+        for frame, time_point in enumerate(self.cmv.times_to_show):
+            n_sim_point = np.argmin(np.abs(self.cmv.simulation_times - time_point))
+            data_per_section = self.cmv.voltage_timeseries[frame]
+            assert len(data_per_section) == self.cmv.n_sections
+            np.testing.assert_array_equal(sum(data_per_section, []), voltages[frame])
+            # the first point is the soma
+            assert voltages[frame][0] == self.cell.soma.recVList[0][n_sim_point]
+            reference = _get_data_per_section_loop(self.cmv, lambda sec: sec.recVList, n_sim_point)
+            assert [len(e) for e in data_per_section] == [len(e) for e in reference]
+            np.testing.assert_array_equal(voltages[frame], sum(reference, []))
+
 
 class TestCellMorphologyInteractiveVisualizer:
     def setup_class(self):
@@ -111,6 +153,24 @@ class TestCellMorphologyInteractiveVisualizer:
         assert len(self.cmiv.ion_dynamics_timeseries[self.ion_keyword][0]
             ) == self.cmiv.n_sections
 
+    @pytest.mark.skipif(
+        six.PY2, reason="Interactive visualizations are not available on Py2")
+    def test_ion_dynamics_timeseries_matches_recordings(self):
+        get_recordings = lambda sec: sec.recordVars.get(self.ion_keyword, [])
+        # e.g. basal dendrites have no NaTa_t channels
+        assert any(
+            len(get_recordings(sec)) == 0 for sec in self.cell.sections 
+            if sec.label not in ("Soma", "Myelin", "AIS"))
+        self.cmiv._calc_ion_dynamics_timeseries(ion_keyword=self.ion_keyword)
+        for frame, time_point in enumerate(self.cmiv.times_to_show):
+            n_sim_point = np.argmin(np.abs(self.cmiv.simulation_times - time_point))
+            data_per_section = self.cmiv.ion_dynamics_timeseries[self.ion_keyword][frame]
+            reference = _get_data_per_section_loop(self.cmiv, get_recordings, n_sim_point)
+            # the soma does not show values of exactly 0
+            reference[0] = [np.nan if e == 0 else e for e in reference[0]]
+            assert [len(e) for e in data_per_section] == [len(e) for e in reference]
+            np.testing.assert_array_equal(sum(data_per_section, []), sum(reference, []))
+
     @pytest.mark.skipif(
         six.PY2, reason="Interactive visualizations are not available on Py2")
     def test_display_interactive_morphology_3d(self):
@@ -61,6 +61,13 @@ except ImportError as e:
     logger.warning(e)
 
 
+def _recording_as_array(recording):
+    """View a recording, e.g. a :py:class:`neuron.h.Vector`, as numpy array without copying it if possible."""
+    if hasattr(recording, 'as_numpy'):
+        return recording.as_numpy()
+    return np.asarray(recording)
+
+
 class CMVDataParser:
     """Parse data from a :py:class:`~single_cell_parser.cell.Cell` object to a format that is easier to work with for visualization purposes.
     
@@ -173,6 +180,7 @@ class CMVDataParser:
         self.synapses_timeseries = None
         self.ion_dynamics_timeseries = None
         self.time_show_syn_activ = 2  # ms
+        self._point_segment_index = None  # initialised when simulation data is first parsed
         if self._has_simulation_data():
             self._init_simulation_data()
 
@@ -324,6 +332,122 @@ class CMVDataParser:
     
         self._morphology_unconnected = self.morphology = self._morphology_connected[self.n_sections-1:]
     
+    def _get_point_segment_index(self):
+        '''Map each point of the per-section simulation data to the segment it is recorded from.
+        
+        Simulation data is organized per section: the soma, followed by all sections that are not soma, AIS or myelin.
+        The data of each section starts with the last segment of its parent section, followed by one value per point in the section.
+        This method computes that mapping once, so that the data of all points and time points can be fetched at once.
+        See :py:meth:`_get_point_data_timeseries`.
+        
+        Returns:
+            dict: Dictionary with the keys:
+            
+                - ``segments``: array of shape (n_segments, 2), containing the unique ``(section index, segment index)`` pairs that are recorded from.
+                - ``point_to_segment``: array of length n_points, mapping each point to a row in ``segments``.
+                - ``point_to_section``: array of length n_points, containing the index of the section each point belongs to.
+                - ``n_points_per_section``: list containing the amount of points in the data of each section.
+        '''
+        if self._point_segment_index is not None:
+            return self._point_segment_index
+        section_indices = {id(sec): sec_n for sec_n, sec in enumerate(self.cell.sections)}
+        n_segments = [len([seg for seg in sec]) for sec in self.cell.sections]
+        soma_n = section_indices[id(self.soma)]
+        n_soma_points = len(self.morphology[self.morphology['sec_n'] == 0])
+        sec_ns, seg_ns, owner_ns = [[soma_n] * n_soma_points], [[0] * n_soma_points], [[soma_n] * n_soma_points]
+        n_points_per_section = [n_soma_points]
+        for sec in self.cell.sections:
+            if sec.label in ("Soma", "Myelin", "AIS"):
+                continue
+            sec_n = section_indices[id(sec)]
+            parent_n = section_indices[id(sec.parent)]
+            n_segs = n_segments[sec_n]
+            n_pts = len(sec.pts)
+            # First point of this section is last point of prev section
+            pts = np.arange(n_pts)
+            seg_n_per_pt = pts * n_segs // max(n_pts - 1, 1)
+            if n_pts > 0:
+                seg_n_per_pt[-1] = n_segs - 1
+            sec_ns.append([parent_n] + [sec_n] * n_pts)
+            seg_ns.append([n_segments[parent_n] - 1] + list(seg_n_per_pt))
+            owner_ns.append([sec_n] * (n_pts + 1))
+            n_points_per_section.append(n_pts + 1)
+        sec_ns = np.concatenate(sec_ns).astype(int)
+        seg_ns = np.concatenate(seg_ns).astype(int)
+        segments, point_to_segment = np.unique(
+            np.stack([sec_ns, seg_ns], axis=1), axis=0, return_inverse=True)
+        self._point_segment_index = {
+            'segments': segments,
+            'point_to_segment': point_to_segment.ravel(),
+            'point_to_section': np.concatenate(owner_ns).astype(int),
+            'n_points_per_section': n_points_per_section}
+        return self._point_segment_index
+
+    def _get_simulation_time_indices(self, time_points):
+        '''Get the indices of the simulation time points closest to :paramref:`time_points`.
+        
+        Args:
+            time_points (array): time points
+        
+        Returns:
+            np.ndarray: indices in :paramref:`simulation_times`
+        '''
+        time_points = np.atleast_1d(np.asarray(time_points, dtype=float))
+        t = self.simulation_times
+        indices = np.clip(np.searchsorted(t, time_points), 1, len(t) - 1)
+        # prefer the earlier time point if both are equally close
+        indices -= (time_points - t[indices - 1]) <= (t[indices] - time_points)
+        return indices
+
+    def _get_point_data_timeseries(self, get_recordings, time_points):
+        '''Fetch simulation data for all points of the cell morphology at all :paramref:`time_points`.
+        
+        The recordings of each segment are only read once, at the requested time points,
+        and then distributed to the points with a single indexing operation.
+        
+        Args:
+            get_recordings (callable): 
+                Maps a section to its list of recordings, one per segment, e.g. ``lambda sec: sec.recVList``. 
+                Sections without recordings are filled with NaN.
+            time_points (array): time points from which we want to gather the data.
+            
+        Returns:
+            np.ndarray: array of shape (n_time_points, n_points) containing the data for each point at each time point.
+        '''
+        index = self._get_point_segment_index()
+        time_indices = self._get_simulation_time_indices(time_points)
+        data_per_segment = np.full((len(index['segments']), len(time_indices)), np.nan)
+        for row, (sec_n, seg_n) in enumerate(index['segments']):
+            recordings = get_recordings(self.cell.sections[sec_n])
+            if len(recordings) > 0:
+                data_per_segment[row] = _recording_as_array(recordings[seg_n])[time_indices]
+        return data_per_segment[index['point_to_segment']].T
+
+    def _point_data_to_data_per_section(self, point_data):
+        '''Split data per point into a list of data per section.
+        
+        Inverse of :py:meth:`_data_per_section_to_data_per_point`, for data as returned by :py:meth:`_get_point_data_timeseries`.
+        
+        Args:
+            point_data (np.ndarray): data per point. Shape: (n_points,)
+            
+        Returns:
+            list: List of lists of data per section. Shape: (n_sections, n_points_in_section)
+        '''
+        bounds = np.cumsum(self._get_point_segment_index()['n_points_per_section'])[:-1]
+        return [list(e) for e in np.split(point_data, bounds)]
+
+    def _get_voltage_timeseries(self, time_points):
+        '''Retrieves the voltage along the whole cell morphology at multiple time points.
+        
+        Args:
+            time_points (array): time points from which we want to gather the voltage
+        
+        Returns:
+            np.ndarray: array of shape (n_time_points, n_points) containing the voltage at each point.
+        '''
+        return self._get_point_data_timeseries(lambda sec: sec.recVList, time_points)
+
     def _get_voltages_at_timepoint(self, time_point):
         '''Retrieves the coltage along the whole cell morphology from cell object at a particular time point.
         Each voltage is defined per section in the morphology. 
@@ -337,18 +461,7 @@ class CMVDataParser:
         Returns:
             voltage_point (list): list of voltage points for each morphological point in the cell at :paramref:`time_point`.
         '''
-        n_sim_point = np.argmin(np.abs(self.simulation_times - time_point))
-        voltage_points = [[self.soma.recVList[0][n_sim_point]] * len(self.morphology[self.morphology['sec_n'] == 0])]
-        for _, sec in enumerate([sec for sec in self.cell.sections if sec.label not in ("Soma", "Myelin", "AIS")]):
-            n_segs = len([seg for seg in sec])
-            n_pts = len(sec.pts)
-            # First point of this section is last point of prev section
-            voltage_points_this_section = [sec.parent.recVList[-1][n_sim_point]]
-            for n, _ in enumerate(sec.pts):
-                seg_n = int(n* n_segs / (n_pts-1)) if n != n_pts-1 else n_segs-1
-                voltage_points_this_section.append(sec.recVList[seg_n][n_sim_point])
-            voltage_points.append(voltage_points_this_section)
-        return voltage_points
+        return self._point_data_to_data_per_section(self._get_voltage_timeseries([time_point])[0])
 
     def _data_per_section_to_data_per_point(self, data_per_section):
         """Unravel a list of lists of data per section to a flat list of data per point.
@@ -365,7 +478,30 @@ class CMVDataParser:
         for data in data_per_section[1:]:
             d_per_point.extend(data[1:])
         return d_per_point
-    
+
+    def _get_ion_dynamics_timeseries(self, time_points, ion_keyword):
+        '''Retrieves the ion dynamics along the whole cell morphology at multiple time points.
+        
+        Sections without recordings of :paramref:`ion_keyword` are filled with NaN.
+        
+        Args:
+            time_points (array): time points from which we want to gather the ion dynamics
+            ion_keyword (str): keyword for the ion dynamics we want to retrieve.
+            
+        Returns:
+            np.ndarray: array of shape (n_time_points, n_points) containing the ion dynamics at each point.
+        '''
+        get_recordings = lambda sec: sec.recordVars.get(ion_keyword, [])
+        data = self._get_point_data_timeseries(get_recordings, time_points)
+        index = self._get_point_segment_index()
+        has_recordings = np.array([len(get_recordings(sec)) > 0 for sec in self.cell.sections])
+        data[:, ~has_recordings[index['point_to_section']]] = np.nan
+        # the soma does not show values of exactly 0
+        n_soma_points = index['n_points_per_section'][0]
+        soma_data = data[:, :n_soma_points]
+        soma_data[soma_data == 0] = np.nan
+        return data
+
     def _get_ion_dynamics_at_timepoint(self, time_point, ion_keyword):
         '''Retrieves the ion dynamics along the whole cell morphology from cell object at a particular time point.
         Note that the array of data per section each time starts with the last point of its parent section.
@@ -376,21 +512,8 @@ class CMVDataParser:
         Returns:
             ion_points (list): list of ion dynamics points for each morphological point in the cell at :paramref:`time_point`.
         '''
-        n_sim_point = np.argmin(np.abs(self.simulation_times - time_point))
-        ion_points = [[self.soma.recordVars[ion_keyword][0][n_sim_point] or np.nan]]
-        for sec_n, sec in enumerate([sec for sec in self.cell.sections if sec.label not in ("Soma", "Myelin", "AIS")]):
-            n_segs = len([seg for seg in sec])
-            n_pts = len(sec.pts)
-            if len(sec.recordVars[ion_keyword]) > 0:
-                ion_points_this_section = [sec.parent.recordVars[ion_keyword][-1][n_sim_point]]
-            else:
-                ion_points_this_section = [np.nan]
-            for n, pt in enumerate(sec.pts):
-                seg_n = int(n* n_segs / (n_pts-1)) if n != n_pts-1 else n_segs-1
-                if len(sec.recordVars[ion_keyword]) > 0:
-                    ion_points_this_section.append(sec.recordVars[ion_keyword][seg_n][n_sim_point])
-            ion_points.append(ion_points_this_section)
-        return ion_points
+        return self._point_data_to_data_per_section(
+            self._get_ion_dynamics_timeseries([time_point], ion_keyword)[0])
     
     def _calc_voltage_timeseries(self):
         '''Retrieves voltage data along the whole cell body during a set of time points (specified in :paramref:`self.times_to_show`).
@@ -407,17 +530,17 @@ class CMVDataParser:
 
         logger.info("Fetching voltage timeseries...")
         t1 = time.time()
-        for time_point in self.times_to_show:  # For each frame of the video/animation
-            voltage = self._get_voltages_at_timepoint(time_point)
-            self.voltage_timeseries.append(voltage)
+        # one row for each frame of the video/animation
+        voltage_timeseries = self._get_voltage_timeseries(self.times_to_show)
+        self.voltage_timeseries = [self._point_data_to_data_per_section(v) for v in voltage_timeseries]
         t2 = time.time()
         logger.info('Voltage retrieval runtime (s): ' + str(np.around(t2 - t1, 2)))
         
         # Update cmap if necessary
         self.set_cmap(
             self.cmap, 
-            vmin=min(min([min(e) for e in self.voltage_timeseries])) if self.vmin is None else self.vmin, 
-            vmax=max(max([max(e) for e in self.voltage_timeseries])) if self.vmax is None else self.vmax)
+            vmin=np.nanmin(voltage_timeseries) if self.vmin is None else self.vmin, 
+            vmax=np.nanmax(voltage_timeseries) if self.vmax is None else self.vmax)
 
     def _calc_ion_dynamics_timeseries(self, ion_keyword):
         '''
@@ -440,15 +563,13 @@ class CMVDataParser:
 
         if ion_keyword in self.ion_dynamics_timeseries.keys():
             return  # We have already calculated the ion_dynamics_timeseries
-        else:
-            self.ion_dynamics_timeseries[ion_keyword] = []
 
         logger.info("Fetching ion dynamics timeseries...")
         t1 = time.time()
-        for time_point in self.times_to_show:  # For each frame of the video/animation
-            ion_dynamics = self._get_ion_dynamics_at_timepoint(
-                time_point, ion_keyword)
-            self.ion_dynamics_timeseries[ion_keyword].append(ion_dynamics)
+        # one row for each frame of the video/animation
+        ion_dynamics_timeseries = self._get_ion_dynamics_timeseries(self.times_to_show, ion_keyword)
+        self.ion_dynamics_timeseries[ion_keyword] = [
+            self._point_data_to_data_per_section(e) for e in ion_dynamics_timeseries]
         t2 = time.time()
         logger.info('Ion dynamics retrieval runtime (s): ' +
               str(np.around(t2 - t1, 2)))
@@ -456,8 +577,8 @@ class CMVDataParser:
         # Update cmap if necessary
         self.set_cmap(
             self.cmap, 
-            vmin=min(min([min(e) for e in self.ion_dynamics_timeseries[ion_keyword]])) if self.vmin is None else self.vmin, 
-            vmax=max(max([max(e) for e in self.ion_dynamics_timeseries[ion_keyword]])) if self.vmax is None else self.vmax)
+            vmin=np.nanmin(ion_dynamics_timeseries) if self.vmin is None else self.vmin, 
+            vmax=np.nanmax(ion_dynamics_timeseries) if self.vmax is None else self.vmax)
 
     def _get_synapses_at_timepoint(self, time_point):
         '''Retrieves the active synapses at a particular time point.